@@ -0,0 +1,545 @@
+#!/usr/bin/env python3
+"""
+Rotas assíncronas (ASGI) dos endpoints de maior fan-out
+
+``/api/metrics``, ``/api/technicians/ranking`` e ``/api/tickets/recent`` são
+atendidos por handlers Starlette que aguardam o ``AsyncGLPIClient`` no event
+loop do servidor, sem ocupar uma thread do adaptador WSGI durante as dezenas
+de chamadas ao GLPI, assim como ``/api/dashboard`` (as três seções juntas).
+``/api/stream/dashboard`` (SSE) também fica no event loop, para que cada
+wallboard conectado não prenda uma thread. As demais rotas continuam no Flask
+(``WsgiToAsgi``).
+
+Os handlers reutilizam o ``glpi_service`` das rotas Flask (mesmos caches de
+serviço e mesmo último payload válido) e produzem as mesmas respostas.
+Variantes com filtros ainda não têm versão assíncrona e rodam em uma thread.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from api.routes import (
+    _dashboard_payload,
+    _last_known_good_payload,
+    _payload_within_deadline,
+    dashboard_snapshot,
+    dashboard_stream,
+    glpi_service,
+)
+
+from config.performance import STREAM_CONFIG
+from config.settings import active_config
+from services.glpi_circuit_breaker import glpi_circuit_breakers
+from services.glpi_dashboard_snapshot import parse_sections
+from services.glpi_dashboard_stream import AsyncSubscription, StreamLimitExceeded, topic_from_args
+from services.glpi_retry import start_retry_budget
+from utils.conditional_response import etag_matches, representation_cache
+from utils.deadline import budget_for_endpoint, start_deadline
+from utils.performance import parse_filter_params, performance_monitor
+from utils.response_formatter import ResponseFormatter
+from utils.structured_logging import api_logger
+
+try:
+    from starlette.applications import Starlette
+    from starlette.middleware import Middleware
+    from starlette.middleware.cors import CORSMiddleware
+    from starlette.responses import JSONResponse, Response, StreamingResponse
+    from starlette.routing import Route
+
+    STARLETTE_AVAILABLE = True
+except ImportError:
+    STARLETTE_AVAILABLE = False
+
+logger = logging.getLogger("api.async")
+
+# Caminhos atendidos pelas rotas assíncronas; o resto segue para o Flask
+ASYNC_ROUTE_PATHS = (
+    "/api/metrics",
+    "/api/technicians/ranking",
+    "/api/tickets/recent",
+    "/api/stream/dashboard",
+    "/api/dashboard",
+)
+
+
+def _start_request_budgets(endpoint: str) -> None:
+    """Prazo e orçamento de retry da requisição (equivalente ao ``before_request`` do Flask)"""
+    start_deadline(budget_for_endpoint(endpoint), endpoint)
+    start_retry_budget()
+
+
+def _bounded_limit(value: Optional[int], default: int, maximum: int) -> int:
+    return max(1, min(value, maximum)) if value else default
+
+
+def _warn_if_slow(response_time: float, correlation_id: Optional[str] = None) -> None:
+    try:
+        target_p95 = active_config().PERFORMANCE_TARGET_P95
+    except (AttributeError, ImportError):
+        target_p95 = 300
+    if response_time > target_p95:
+        prefix = f"[{correlation_id}] " if correlation_id else ""
+        logger.warning(f"{prefix}Resposta lenta: {response_time:.2f}ms")
+
+
+def _degraded_response(endpoint: str, correlation_id: str, args: Mapping[str, str]):
+    payload = _last_known_good_payload(endpoint, correlation_id, args)
+    return JSONResponse(payload) if payload is not None else None
+
+
+def _representation_args(request) -> Dict[str, Any]:
+    """Parâmetros que identificam a representação (mesma chave das rotas Flask)"""
+    return {**request.query_params, **request.path_params}
+
+
+def _conditional_response(
+    request, representation, correlation_id: Optional[str] = None, cached: bool = True
+) -> "Response":
+    """200 com o corpo já serializado, ou 304 se o cliente já tem esse ETag"""
+    headers = {
+        "ETag": representation.etag,
+        "Cache-Control": "no-cache",
+        "X-Correlation-ID": correlation_id or api_logger.generate_correlation_id(),
+        "X-Cache": "HIT" if cached else "MISS",
+    }
+    if etag_matches(request.headers.get("if-none-match"), representation.etag):
+        representation_cache.record_not_modified()
+        return Response(status_code=304, headers=headers)
+    return Response(representation.body, media_type="application/json", headers=headers)
+
+
+def _cached_representation(request, endpoint: str) -> Optional["Response"]:
+    """Resposta da representação ainda válida do endpoint, sem executar o handler"""
+    representation = representation_cache.lookup(endpoint, _representation_args(request))
+    return _conditional_response(request, representation) if representation is not None else None
+
+
+def _representation_or_json(request, endpoint: str, payload: Dict[str, Any]) -> "Response":
+    """Resposta com ETag quando o payload é completo; parciais e degradados seguem sem cache"""
+    representation = representation_cache.store(endpoint, _representation_args(request), payload)
+    if representation is None:
+        return JSONResponse(payload)
+    return _conditional_response(request, representation, payload.get("correlation_id"), cached=False)
+
+
+def _connection_error_response() -> "JSONResponse":
+    logger.error("Falha na comunicação com o GLPI")
+    return JSONResponse(
+        ResponseFormatter.format_error_response(
+            "Não foi possível conectar ao GLPI", ["Erro de conexão"]
+        ),
+        status_code=503,
+    )
+
+
+async def get_metrics(request) -> "JSONResponse":
+    """Métricas do dashboard (versão assíncrona de ``GET /api/metrics``)"""
+    _start_request_budgets("get_metrics")
+    correlation_id = api_logger.generate_correlation_id()
+    args = request.query_params
+    start_time = time.time()
+
+    try:
+        cached_response = _cached_representation(request, "metrics")
+        if cached_response is not None:
+            return cached_response
+
+        filters = parse_filter_params(args)
+        start_date = filters["start_date"]
+        end_date = filters["end_date"]
+
+        # Circuito de busca aberto: responder imediatamente com o último payload válido
+        if glpi_circuit_breakers.is_open("search"):
+            degraded_response = _degraded_response("metrics", correlation_id, args)
+            if degraded_response is not None:
+                return degraded_response
+
+        if start_date or end_date:
+            if filters["filter_type"] == "modification":
+                method = glpi_service.get_dashboard_metrics_with_modification_date_filter
+            else:
+                method = glpi_service.get_dashboard_metrics_with_date_filter
+            metrics_data = await asyncio.to_thread(
+                method, start_date=start_date, end_date=end_date, correlation_id=correlation_id
+            )
+        elif any(filters[k] for k in ("status", "priority", "level", "technician", "category")):
+            metrics_data = await asyncio.to_thread(
+                glpi_service.get_dashboard_metrics_with_filters,
+                start_date=start_date,
+                end_date=end_date,
+                status=filters["status"],
+                priority=filters["priority"],
+                level=filters["level"],
+                technician=filters["technician"],
+                category=filters["category"],
+                correlation_id=correlation_id,
+            )
+        else:
+            metrics_data = await glpi_service.get_dashboard_metrics_async(correlation_id)
+
+        if not metrics_data or (
+            isinstance(metrics_data, dict) and metrics_data.get("success") is False
+        ):
+            degraded_response = _degraded_response("metrics", correlation_id, args)
+            if degraded_response is not None:
+                return degraded_response
+            if metrics_data:
+                return JSONResponse(metrics_data, status_code=500)
+            return _connection_error_response()
+
+        response_time = (time.time() - start_time) * 1000
+        logger.info(f"[{correlation_id}] Métricas obtidas com sucesso em {response_time:.2f}ms")
+        _warn_if_slow(response_time, correlation_id)
+
+        if isinstance(metrics_data, dict) and "data" in metrics_data:
+            metrics_data["correlation_id"] = correlation_id
+            metrics_data["cached"] = False
+            metrics_data["degraded"] = False
+
+        return _representation_or_json(
+            request, "metrics", _payload_within_deadline("metrics", metrics_data, correlation_id, args)
+        )
+
+    except Exception as e:
+        logger.error(f"[{correlation_id}] Erro inesperado ao buscar métricas: {e}", exc_info=True)
+        return JSONResponse(
+            ResponseFormatter.format_error_response(
+                f"Erro interno no servidor: {str(e)}", [str(e)], correlation_id=correlation_id
+            ),
+            status_code=500,
+        )
+    finally:
+        performance_monitor.record_request_time(time.time() - start_time, "get_metrics")
+
+
+async def get_technician_ranking(request) -> "JSONResponse":
+    """Ranking de técnicos (versão assíncrona de ``GET /api/technicians/ranking``)"""
+    _start_request_budgets("get_technician_ranking")
+    correlation_id = api_logger.generate_correlation_id()
+    args = request.query_params
+    start_time = time.time()
+
+    try:
+        cached_response = _cached_representation(request, "technician_ranking")
+        if cached_response is not None:
+            return cached_response
+
+        filters = parse_filter_params(args)
+        start_date = filters["start_date"]
+        end_date = filters["end_date"]
+        level = filters["level"]
+        entity_id = filters["entity_id"]
+        limit = _bounded_limit(filters["limit"], 100, 200)
+        filters_applied = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "level": level,
+            "limit": limit,
+            "entity_id": entity_id,
+        }
+
+        # Circuito de busca aberto: responder imediatamente com o último payload válido
+        if glpi_circuit_breakers.is_open("search"):
+            degraded_response = _degraded_response("technician_ranking", correlation_id, args)
+            if degraded_response is not None:
+                return degraded_response
+
+        if any([start_date, end_date, level, entity_id]):
+            ranking_data = await asyncio.to_thread(
+                glpi_service.get_technician_ranking_with_filters,
+                start_date=start_date,
+                end_date=end_date,
+                level=level,
+                limit=limit,
+                correlation_id=correlation_id,
+                entity_id=entity_id,
+            )
+        else:
+            ranking_data = await glpi_service.get_technician_ranking_async(limit=limit)
+
+        if ranking_data is None:
+            degraded_response = _degraded_response("technician_ranking", correlation_id, args)
+            if degraded_response is not None:
+                return degraded_response
+            return _connection_error_response()
+
+        if not ranking_data:
+            logger.info(f"[{correlation_id}] Nenhum técnico encontrado com os filtros aplicados")
+            return JSONResponse(
+                {
+                    "success": True,
+                    "data": [],
+                    "message": "Nenhum técnico encontrado com os filtros aplicados",
+                    "correlation_id": correlation_id,
+                    "filters_applied": filters_applied,
+                }
+            )
+
+        response_time = (time.time() - start_time) * 1000
+        logger.info(
+            f"[{correlation_id}] Ranking obtido: {len(ranking_data)} técnicos em {response_time:.2f}ms"
+        )
+        _warn_if_slow(response_time, correlation_id)
+
+        response_data = {
+            "success": True,
+            "data": ranking_data,
+            "response_time_ms": round(response_time, 2),
+            "correlation_id": correlation_id,
+            "cached": False,
+            "degraded": False,
+            "filters_applied": filters_applied,
+        }
+        return _representation_or_json(
+            request,
+            "technician_ranking",
+            _payload_within_deadline("technician_ranking", response_data, correlation_id, args),
+        )
+
+    except Exception as e:
+        logger.error(f"Erro inesperado ao buscar ranking de técnicos: {e}", exc_info=True)
+        return JSONResponse(
+            ResponseFormatter.format_error_response(
+                f"Erro interno do servidor: {str(e)}", [str(e)]
+            ),
+            status_code=500,
+        )
+    finally:
+        performance_monitor.record_request_time(time.time() - start_time, "get_technician_ranking")
+
+
+async def get_new_tickets(request) -> "JSONResponse":
+    """Tickets recentes (versão assíncrona de ``GET /api/tickets/recent``)"""
+    _start_request_budgets("get_new_tickets")
+    correlation_id = api_logger.generate_correlation_id()
+    args = request.query_params
+    start_time = time.time()
+
+    try:
+        cached_response = _cached_representation(request, "new_tickets")
+        if cached_response is not None:
+            return cached_response
+
+        filters = parse_filter_params(args)
+        limit = _bounded_limit(filters["limit"], 5, 50)
+        filters_applied = {
+            "limit": limit,
+            "priority": filters["priority"],
+            "category": filters["category"],
+            "technician": filters["technician"],
+            "start_date": filters["start_date"],
+            "end_date": filters["end_date"],
+        }
+
+        # Circuito de busca aberto: responder imediatamente com o último payload válido
+        if glpi_circuit_breakers.is_open("search"):
+            degraded_response = _degraded_response("new_tickets", correlation_id, args)
+            if degraded_response is not None:
+                return degraded_response
+
+        if any(value for key, value in filters_applied.items() if key != "limit"):
+            new_tickets = await asyncio.to_thread(
+                glpi_service.get_new_tickets_with_filters, **filters_applied
+            )
+        else:
+            new_tickets = await glpi_service.get_new_tickets_async(limit)
+
+        if new_tickets is None:
+            degraded_response = _degraded_response("new_tickets", correlation_id, args)
+            if degraded_response is not None:
+                return degraded_response
+            return _connection_error_response()
+
+        if not new_tickets:
+            logger.info("Nenhum ticket novo encontrado com os filtros aplicados")
+            return JSONResponse(
+                {
+                    "success": True,
+                    "data": [],
+                    "message": "Nenhum ticket novo encontrado com os filtros aplicados",
+                    "correlation_id": correlation_id,
+                    "filters_applied": filters_applied,
+                }
+            )
+
+        response_time = (time.time() - start_time) * 1000
+        logger.info(f"Tickets novos obtidos: {len(new_tickets)} tickets em {response_time:.2f}ms")
+        _warn_if_slow(response_time, correlation_id)
+
+        response_data = {
+            "success": True,
+            "data": new_tickets,
+            "response_time_ms": round(response_time, 2),
+            "correlation_id": correlation_id,
+            "cached": False,
+            "degraded": False,
+            "filters_applied": filters_applied,
+        }
+        return _representation_or_json(
+            request, "new_tickets", _payload_within_deadline("new_tickets", response_data, correlation_id, args)
+        )
+
+    except Exception as e:
+        logger.error(f"Erro inesperado ao buscar tickets novos: {e}", exc_info=True)
+        return JSONResponse(
+            ResponseFormatter.format_error_response(
+                f"Erro interno do servidor: {str(e)}", [str(e)]
+            ),
+            status_code=500,
+        )
+    finally:
+        performance_monitor.record_request_time(time.time() - start_time, "get_new_tickets")
+
+
+async def get_dashboard(request) -> "JSONResponse":
+    """Métricas, ranking e tickets recentes juntos (versão assíncrona de ``GET /api/dashboard``)"""
+    _start_request_budgets("get_dashboard")
+    correlation_id = api_logger.generate_correlation_id()
+    args = request.query_params
+    start_time = time.time()
+
+    try:
+        cached_response = _cached_representation(request, "dashboard")
+        if cached_response is not None:
+            return cached_response
+
+        try:
+            sections = parse_sections(args.get("sections"))
+        except ValueError as e:
+            return JSONResponse(ResponseFormatter.format_error_response(str(e), [str(e)]), status_code=400)
+        topic = topic_from_args(args)
+
+        # Circuito de busca aberto: responder imediatamente com o último payload válido
+        if glpi_circuit_breakers.is_open("search"):
+            degraded_response = _degraded_response("dashboard", correlation_id, args)
+            if degraded_response is not None:
+                return degraded_response
+
+        results = await dashboard_snapshot.collect_async(topic, sections)
+        response_data = _dashboard_payload(results, topic, correlation_id, start_time)
+
+        if response_data["failed_sections"]:
+            degraded_response = _degraded_response("dashboard", correlation_id, args)
+            if degraded_response is not None:
+                return degraded_response
+            if not response_data["success"]:
+                return _connection_error_response()
+            response_data["partial"] = True
+            return JSONResponse(response_data)
+
+        logger.info(
+            f"[{correlation_id}] Dashboard ({', '.join(sections)}) obtido em {response_data['response_time_ms']:.2f}ms"
+        )
+        _warn_if_slow(response_data["response_time_ms"], correlation_id)
+        return _representation_or_json(
+            request, "dashboard", _payload_within_deadline("dashboard", response_data, correlation_id, args)
+        )
+
+    except Exception as e:
+        logger.error(f"[{correlation_id}] Erro inesperado ao montar o dashboard: {e}", exc_info=True)
+        return JSONResponse(
+            ResponseFormatter.format_error_response(
+                f"Erro interno no servidor: {str(e)}", [str(e)], correlation_id=correlation_id
+            ),
+            status_code=500,
+        )
+    finally:
+        performance_monitor.record_request_time(time.time() - start_time, "get_dashboard")
+
+
+async def stream_dashboard(request):
+    """Atualizações do dashboard por SSE (versão assíncrona de ``GET /api/stream/dashboard``)"""
+    if not STREAM_CONFIG.get("ENABLED", True):
+        return JSONResponse(ResponseFormatter.format_error_response("Stream desabilitado", []), status_code=404)
+
+    try:
+        subscription = dashboard_stream.subscribe(
+            topic_from_args(request.query_params),
+            AsyncSubscription(dashboard_stream.max_pending, asyncio.get_running_loop()),
+        )
+    except StreamLimitExceeded as e:
+        logger.warning(f"Conexão SSE recusada: {e}")
+        return JSONResponse(
+            ResponseFormatter.format_error_response("Muitas conexões abertas", [str(e)]), status_code=503
+        )
+
+    async def generate():
+        try:
+            async for chunk in subscription.events(dashboard_stream.keepalive):
+                yield chunk
+        finally:
+            dashboard_stream.unsubscribe(subscription)
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+class AsyncRoutesDispatcher:
+    """Aplicação ASGI que envia os caminhos assíncronos ao Starlette e o resto ao fallback
+
+    Args:
+        async_app: Aplicação Starlette com as rotas assíncronas
+        fallback: Aplicação ASGI das demais rotas (Flask via ``WsgiToAsgi``)
+        paths: Caminhos atendidos por ``async_app``
+    """
+
+    def __init__(self, async_app, fallback, paths: Iterable[str] = ASYNC_ROUTE_PATHS):
+        self.async_app = async_app
+        self.fallback = fallback
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            # WsgiToAsgi não trata lifespan; o Starlette fecha o cliente HTTP no shutdown
+            await self.async_app(scope, receive, send)
+        elif scope["type"] == "http" and scope["path"].rstrip("/") in self.paths:
+            await self.async_app(scope, receive, send)
+        else:
+            await self.fallback(scope, receive, send)
+
+
+@asynccontextmanager
+async def _lifespan(app):
+    yield
+    if glpi_service.async_client is not None:
+        await glpi_service.async_client.aclose()
+
+
+def create_async_app(fallback, cors_origins: Iterable[str]) -> AsyncRoutesDispatcher:
+    """Monta as rotas assíncronas na frente da aplicação ``fallback``
+
+    Args:
+        fallback: Aplicação ASGI das demais rotas
+        cors_origins: Origens permitidas (as mesmas do CORS do Flask)
+    """
+    if not STARLETTE_AVAILABLE:
+        raise RuntimeError("Rotas assíncronas requerem o pacote 'starlette'")
+
+    async_app = Starlette(
+        routes=[
+            Route("/api/metrics", get_metrics, methods=["GET"]),
+            Route("/api/technicians/ranking", get_technician_ranking, methods=["GET"]),
+            Route("/api/tickets/recent", get_new_tickets, methods=["GET"]),
+            Route("/api/stream/dashboard", stream_dashboard, methods=["GET"]),
+            Route("/api/dashboard", get_dashboard, methods=["GET"]),
+        ],
+        middleware=[
+            Middleware(
+                CORSMiddleware,
+                allow_origins=list(cors_origins),
+                allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+                allow_headers=["Content-Type", "Authorization", "If-None-Match"],
+                expose_headers=["ETag", "X-Correlation-ID", "X-Cache"],
+                allow_credentials=True,
+            )
+        ],
+        lifespan=_lifespan,
+    )
+    logger.info(f"Rotas assíncronas habilitadas: {', '.join(ASYNC_ROUTE_PATHS)}")
+    return AsyncRoutesDispatcher(async_app, fallback)
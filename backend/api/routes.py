@@ -7,20 +7,39 @@ Versão limpa e otimizada após refatoração
 import logging
 import time
 from datetime import datetime
+from functools import wraps
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
 from pydantic import ValidationError
 from schemas.dashboard import DashboardMetrics
 
 from config.settings import active_config
 
 # Removed api_service import - service deleted
+from config.performance import STREAM_CONFIG
+from services.glpi_circuit_breaker import glpi_circuit_breakers
+from services.glpi_concurrency import glpi_concurrency_limiter
+from services.glpi_dashboard_snapshot import create_dashboard_snapshot, parse_sections
+from services.glpi_dashboard_stream import (
+    StreamLimitExceeded,
+    ThreadSubscription,
+    create_dashboard_stream,
+    topic_from_args,
+)
+from services.glpi_query_planner import glpi_query_planner
+from services.glpi_retry import start_retry_budget
 from services.glpi_service import GLPIService
-from services.simple_dict_cache import cached, simple_cache
+from services.glpi_transfer_stats import glpi_transfer_stats
+from services.simple_dict_cache import cached, last_known_good_cache, simple_cache
 
 # Removed unused import: alerting_system
 # Removed date_decorators import - module deleted
-from utils.performance import monitor_performance
+from utils.conditional_response import etag_matches, representation_cache
+from utils.deadline import budget_for_endpoint, deadline_exceeded, get_deadline, start_deadline
+from utils.executor_service import executor_service
+from utils.latency_sketch import latency_recorder
+from utils.log_facade import get_logging_stats
+from utils.performance import extract_filter_params, monitor_performance, performance_monitor
 from utils.response_formatter import ResponseFormatter
 from utils.simple_decorators import monitor_api_endpoint
 from utils.structured_logging import api_logger
@@ -36,6 +55,12 @@ api_bp = Blueprint("api", __name__, url_prefix="/api")
 # Inicializa serviços
 glpi_service = GLPIService()
 
+# Atualizações do dashboard por SSE (uma thread de recálculo para todas as conexões)
+dashboard_stream = create_dashboard_stream(glpi_service)
+
+# /api/dashboard: seções calculadas juntas, reaproveitando o estado do stream
+dashboard_snapshot = create_dashboard_snapshot(glpi_service, dashboard_stream)
+
 # Obtém logger configurado
 logger = logging.getLogger("api")
 
@@ -45,6 +70,125 @@ logger = logging.getLogger("api")
 # Cache inteligente será inicializado pelo app.py
 
 
+@api_bp.before_request
+def _start_request_budgets():
+    """Cada requisição da API recebe seu próprio prazo e orçamento de retry para o GLPI"""
+    start_deadline(budget_for_endpoint(request.endpoint), request.endpoint or "")
+    start_retry_budget()
+
+
+def _last_known_good_key(endpoint: str, args=None) -> str:
+    """Chave do último payload válido para o endpoint e parâmetros (padrão: ``request.args``)"""
+    if args is None:
+        args = request.args
+    args = "&".join(f"{k}={v}" for k, v in sorted(args.items()))
+    return f"lkg:{endpoint}:{args}"
+
+
+def _store_last_known_good(endpoint: str, payload: dict, args=None) -> None:
+    """Guarda o payload de uma resposta bem-sucedida para uso em modo degradado"""
+    last_known_good_cache.set(_last_known_good_key(endpoint, args), dict(payload))
+
+
+def _last_known_good_payload(endpoint: str, correlation_id: str = None, args=None):
+    """Último payload válido marcado como degradado, ou None se não houver"""
+    payload = last_known_good_cache.get(_last_known_good_key(endpoint, args))
+    if payload is None:
+        return None
+
+    logger.warning(f"[{correlation_id}] Servindo último payload válido de {endpoint} (degradado)")
+    response_data = dict(payload)
+    deadline = get_deadline()
+    response_data.update(
+        {
+            "degraded": True,
+            "cached": True,
+            "correlation_id": correlation_id,
+            "circuit_breakers": glpi_circuit_breakers.get_stats(),
+            "deadline": deadline.to_dict() if deadline else None,
+        }
+    )
+    return response_data
+
+
+def _serve_last_known_good(endpoint: str, correlation_id: str = None):
+    """Resposta com o último payload válido marcada como degradada, ou None se não houver"""
+    payload = _last_known_good_payload(endpoint, correlation_id)
+    return jsonify(payload) if payload is not None else None
+
+
+def _payload_within_deadline(
+    endpoint: str, response_data: dict, correlation_id: str = None, args=None
+) -> dict:
+    """Payload final respeitando o prazo da requisição
+
+    Se o prazo interrompeu parte do trabalho, prefere o último payload válido
+    (stale) e, na falta dele, devolve o resultado parcial marcado com
+    ``partial=True``. Resultados completos viram o novo último payload válido.
+    """
+    if deadline_exceeded():
+        degraded_payload = _last_known_good_payload(endpoint, correlation_id, args)
+        if degraded_payload is not None:
+            return degraded_payload
+        response_data["partial"] = True
+        response_data["deadline"] = get_deadline().to_dict()
+        return response_data
+
+    response_data["partial"] = False
+    _store_last_known_good(endpoint, response_data, args)
+    return response_data
+
+
+def _representation_args() -> dict:
+    """Parâmetros que identificam a representação: query string e parâmetros da rota"""
+    return {**request.args.to_dict(), **(request.view_args or {})}
+
+
+def _conditional_response(representation, correlation_id: str = None, cached: bool = True):
+    """200 com o corpo já serializado, ou 304 se o cliente já tem esse ETag"""
+    if etag_matches(request.headers.get("If-None-Match"), representation.etag):
+        representation_cache.record_not_modified()
+        response = Response(status=304)
+    else:
+        response = Response(representation.body, mimetype="application/json")
+    response.headers["ETag"] = representation.etag
+    # Campos da resposta fora do corpo, para o corpo de cada ETag não mudar
+    response.headers["X-Correlation-ID"] = correlation_id or api_logger.generate_correlation_id()
+    response.headers["X-Cache"] = "HIT" if cached else "MISS"
+    # O navegador pode guardar a resposta, mas revalida antes de cada uso
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+def _conditional_get(endpoint: str):
+    """Serve a representação ainda válida do endpoint (ou 304) sem executar a rota"""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            representation = representation_cache.lookup(endpoint, _representation_args())
+            if representation is not None:
+                return _conditional_response(representation)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _representation_or_json(endpoint: str, payload: dict):
+    """Resposta com ETag quando o payload é completo; parciais e degradados seguem sem cache"""
+    representation = representation_cache.store(endpoint, _representation_args(), payload)
+    if representation is None:
+        return jsonify(payload)
+    return _conditional_response(representation, payload.get("correlation_id"), cached=False)
+
+
+def _finish_within_deadline(endpoint: str, response_data: dict, correlation_id: str = None):
+    """Resposta Flask de ``_payload_within_deadline``"""
+    return _representation_or_json(endpoint, _payload_within_deadline(endpoint, response_data, correlation_id))
+
+
 # ============================================================================
 # ROTAS ESSENCIAIS - HEALTH CHECK
 # ============================================================================
@@ -75,6 +219,25 @@ def health_check():
         )
 
 
+def _glpi_runtime_stats() -> dict:
+    """Estado dos componentes de acesso ao GLPI, comum às respostas do health check"""
+    return {
+        "concurrency": glpi_concurrency_limiter.get_stats(),
+        "circuit_breakers": glpi_circuit_breakers.get_stats(),
+        "session_pool": glpi_service.session_pool.get_stats() if glpi_service.session_pool else None,
+        "async_client": glpi_service.async_client.get_stats() if glpi_service.async_client else None,
+        "transfer": glpi_transfer_stats.get_stats(),
+        "planner": glpi_query_planner.get_stats(),
+        "technician_roster": glpi_service.technician_roster.get_stats(),
+        "search_options": glpi_service.search_options.get_stats(),
+        "executors": executor_service.get_stats(),
+        "stream": dashboard_stream.get_stats(),
+        "dashboard": dashboard_snapshot.get_stats(),
+        "etag": representation_cache.get_stats(),
+        "logging": get_logging_stats(),
+    }
+
+
 @api_bp.route("/health/glpi")
 def glpi_health_check():
     """Health check da conexão GLPI"""
@@ -87,6 +250,7 @@ def glpi_health_check():
                     "glpi_connection": "healthy",
                     "timestamp": datetime.now().isoformat(),
                     "message": "Conexão GLPI funcionando corretamente",
+                    **_glpi_runtime_stats(),
                 }
             )
         else:
@@ -96,6 +260,7 @@ def glpi_health_check():
                         "glpi_connection": "unhealthy",
                         "timestamp": datetime.now().isoformat(),
                         "message": "Falha na autenticação GLPI",
+                        **_glpi_runtime_stats(),
                     }
                 ),
                 503,
@@ -115,6 +280,142 @@ def glpi_health_check():
         )
 
 
+@api_bp.route("/performance")
+def get_performance():
+    """Latências p50/p95/p99 por endpoint da API e por família de consulta ao GLPI
+
+    Query params:
+        group: "endpoints" ou "upstream" (padrão: ambos)
+    """
+    group = request.args.get("group") or None
+    return jsonify(
+        {
+            "timestamp": datetime.now().isoformat(),
+            "requests": performance_monitor.get_stats(),
+            "relative_accuracy": latency_recorder.relative_accuracy,
+            "windows": latency_recorder.windows,
+            "latency": latency_recorder.get_stats(group),
+        }
+    )
+
+
+@api_bp.route("/stream/dashboard")
+def stream_dashboard():
+    """Atualizações do dashboard por Server-Sent Events
+
+    Eventos ``metrics``, ``ranking`` e ``tickets`` com o mesmo ``data`` das rotas
+    REST, enviados quando o conteúdo muda. Cada conexão ocupa uma thread do
+    servidor WSGI; com o ASGI (``asgi.py``) a rota é atendida no event loop.
+
+    Query params:
+        start_date, end_date, filter_type: Filtros das métricas e do ranking
+        ranking_limit, tickets_limit: Tamanho do ranking e da lista de tickets
+    """
+    if not STREAM_CONFIG.get("ENABLED", True):
+        return jsonify(ResponseFormatter.format_error_response("Stream desabilitado", [])), 404
+
+    try:
+        subscription = dashboard_stream.subscribe(
+            topic_from_args(request.args), ThreadSubscription(dashboard_stream.max_pending)
+        )
+    except StreamLimitExceeded as e:
+        logger.warning(f"Conexão SSE recusada: {e}")
+        return jsonify(ResponseFormatter.format_error_response("Muitas conexões abertas", [str(e)])), 503
+
+    def generate():
+        try:
+            yield from subscription.events(dashboard_stream.keepalive)
+        finally:
+            dashboard_stream.unsubscribe(subscription)
+
+    return Response(
+        generate(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# ============================================================================
+# ROTAS ESSENCIAIS - DASHBOARD COMBINADO
+# ============================================================================
+
+
+def _dashboard_payload(results: dict, topic, correlation_id: str, start_time: float) -> dict:
+    """Resposta de ``/api/dashboard``: seções calculadas em ``data`` e as que falharam à parte"""
+    failed = [section for section, data in results.items() if data is None]
+    return {
+        "success": len(failed) < len(results),
+        "data": {section: data for section, data in results.items() if data is not None},
+        "failed_sections": failed,
+        "filters_applied": topic._asdict(),
+        "response_time_ms": round((time.time() - start_time) * 1000, 2),
+        "correlation_id": correlation_id,
+        "cached": False,
+        "degraded": False,
+    }
+
+
+@api_bp.route("/dashboard")
+@monitor_api_endpoint("get_dashboard")
+@monitor_performance
+@_conditional_get("dashboard")
+def get_dashboard():
+    """Métricas, ranking e tickets recentes numa única resposta
+
+    Substitui as chamadas separadas do carregamento do dashboard: filtros
+    normalizados uma vez, uma autenticação e as seções calculadas em paralelo
+    (ou lidas do stream SSE, quando ele já mantém os mesmos filtros).
+
+    Query params:
+        sections: Seções separadas por vírgula (metrics, ranking, tickets); padrão: todas
+        start_date, end_date, filter_type: Filtros das métricas e do ranking
+        ranking_limit, tickets_limit: Tamanho do ranking (50) e da lista de tickets (8)
+    """
+    correlation_id = api_logger.generate_correlation_id()
+    start_time = time.time()
+
+    try:
+        sections = parse_sections(request.args.get("sections"))
+    except ValueError as e:
+        return jsonify(ResponseFormatter.format_error_response(str(e), [str(e)])), 400
+    topic = topic_from_args(request.args)
+
+    try:
+        # Circuito de busca aberto: responder imediatamente com o último payload válido
+        if glpi_circuit_breakers.is_open("search"):
+            degraded_response = _serve_last_known_good("dashboard", correlation_id)
+            if degraded_response is not None:
+                return degraded_response
+
+        results = dashboard_snapshot.collect(topic, sections)
+        response_data = _dashboard_payload(results, topic, correlation_id, start_time)
+
+        if response_data["failed_sections"]:
+            degraded_response = _serve_last_known_good("dashboard", correlation_id)
+            if degraded_response is not None:
+                return degraded_response
+            if not response_data["success"]:
+                error_response = ResponseFormatter.format_error_response(
+                    "Não foi possível conectar ao GLPI", ["Erro de conexão"], correlation_id=correlation_id
+                )
+                return jsonify(error_response), 503
+            # As seções que responderam seguem; o cliente busca as demais pelas rotas individuais
+            response_data["partial"] = True
+            return jsonify(response_data)
+
+        logger.info(
+            f"[{correlation_id}] Dashboard ({', '.join(sections)}) obtido em {response_data['response_time_ms']:.2f}ms"
+        )
+        return _finish_within_deadline("dashboard", response_data, correlation_id)
+
+    except Exception as e:
+        logger.error(f"[{correlation_id}] Erro inesperado ao montar o dashboard: {e}", exc_info=True)
+        error_response = ResponseFormatter.format_error_response(
+            f"Erro interno no servidor: {str(e)}", [str(e)], correlation_id=correlation_id
+        )
+        return jsonify(error_response), 500
+
+
 # ============================================================================
 # ROTAS ESSENCIAIS - MÉTRICAS
 # ============================================================================
@@ -123,8 +424,8 @@ def glpi_health_check():
 @api_bp.route("/metrics")
 @monitor_api_endpoint("get_metrics")
 @monitor_performance
-@cached(ttl=300)
-def get_metrics(validated_start_date=None, validated_end_date=None, validated_filters=None):
+@_conditional_get("metrics")
+def get_metrics():
     """Endpoint para obter métricas do dashboard do GLPI"""
     import hashlib
     import json
@@ -133,12 +434,12 @@ def get_metrics(validated_start_date=None, validated_end_date=None, validated_fi
     observability_logger = api_logger
     start_time = time.time()
 
-    # Cache é gerenciado pelo decorator @cached
+    # Resposta reaproveitada pelo decorator @_conditional_get enquanto válida
 
     try:
-        start_date = validated_start_date
-        end_date = validated_end_date
-        filters = validated_filters or {}
+        filters = extract_filter_params()
+        start_date = filters["start_date"]
+        end_date = filters["end_date"]
 
         # Obter parâmetros de filtro
         filter_type = filters.get("filter_type", "creation")
@@ -161,6 +462,12 @@ def get_metrics(validated_start_date=None, validated_end_date=None, validated_fi
             f"[{correlation_id}] Buscando métricas do GLPI com filtros: data={start_date} até {end_date}"
         )
 
+        # Circuito de busca aberto: responder imediatamente com o último payload válido
+        if glpi_circuit_breakers.is_open("search"):
+            degraded_response = _serve_last_known_good("metrics", correlation_id)
+            if degraded_response is not None:
+                return degraded_response
+
         # Usar método apropriado baseado nos filtros
         if start_date or end_date:
             if filter_type == "modification":
@@ -190,6 +497,13 @@ def get_metrics(validated_start_date=None, validated_end_date=None, validated_fi
             metrics_data = glpi_service.get_dashboard_metrics(correlation_id=correlation_id)
 
         # Verificar se houve erro no serviço
+        if not metrics_data or (
+            isinstance(metrics_data, dict) and metrics_data.get("success") is False
+        ):
+            degraded_response = _serve_last_known_good("metrics", correlation_id)
+            if degraded_response is not None:
+                return degraded_response
+
         if isinstance(metrics_data, dict) and metrics_data.get("success") is False:
             return jsonify(metrics_data), 500
 
@@ -233,10 +547,9 @@ def get_metrics(validated_start_date=None, validated_end_date=None, validated_fi
         if isinstance(metrics_data, dict) and "data" in metrics_data:
             metrics_data["correlation_id"] = correlation_id
             metrics_data["cached"] = False
+            metrics_data["degraded"] = False
 
-        # Cache é gerenciado automaticamente pelo decorator @cached
-
-        return jsonify(metrics_data)
+        return _finish_within_deadline("metrics", metrics_data, correlation_id)
 
     except Exception as e:
         logger.error(f"[{correlation_id}] Erro inesperado ao buscar métricas: {e}", exc_info=True)
@@ -285,20 +598,10 @@ def get_technicians():
             except (ValueError, TypeError):
                 entity_id = None
 
-        # Buscar técnicos
-        technician_ids, technician_names = glpi_service._get_all_technician_ids_and_names(
-            entity_id=entity_id
-        )
-
-        # Converter para formato de lista
-        technicians = []
-        for tech_id in technician_ids:
-            tech_name = technician_names.get(tech_id, f"Técnico {tech_id}")
-            technicians.append({"id": tech_id, "name": tech_name})
-
-        # Limitar resultados
-        if len(technicians) > limit:
-            technicians = technicians[:limit]
+        # Técnicos ativos do índice (nome, grupos, nível e entidades)
+        technicians = [
+            tech.as_dict() for tech in glpi_service.technician_roster.technicians(entity_id)[:limit]
+        ]
 
         # Formatar resposta
         response_data = {
@@ -324,19 +627,17 @@ def get_technicians():
 @api_bp.route("/technicians/ranking")
 @monitor_api_endpoint("get_technician_ranking")
 @monitor_performance
-@cached(ttl=300)
-def get_technician_ranking(
-    validated_start_date=None, validated_end_date=None, validated_filters=None
-):
+@_conditional_get("technician_ranking")
+def get_technician_ranking():
     """Endpoint para obter ranking de técnicos por nível"""
     start_time = time.time()
     obs_logger = api_logger
     correlation_id = obs_logger.generate_correlation_id()
 
     try:
-        start_date = validated_start_date
-        end_date = validated_end_date
-        filters = validated_filters or {}
+        filters = extract_filter_params()
+        start_date = filters["start_date"]
+        end_date = filters["end_date"]
 
         # Obter parâmetros de filtro
         level = filters.get("level")
@@ -350,7 +651,7 @@ def get_technician_ranking(
         except (ValueError, TypeError):
             limit = 100
 
-        # Cache é gerenciado pelo decorator @cached
+        # Resposta reaproveitada pelo decorator @_conditional_get enquanto válida
 
         # Log início do pipeline
         obs_logger.log_operation_start(
@@ -367,6 +668,12 @@ def get_technician_ranking(
             f"[{correlation_id}] Buscando ranking de técnicos: dates={start_date}-{end_date}, level={level}"
         )
 
+        # Circuito de busca aberto: responder imediatamente com o último payload válido
+        if glpi_circuit_breakers.is_open("search"):
+            degraded_response = _serve_last_known_good("technician_ranking", correlation_id)
+            if degraded_response is not None:
+                return degraded_response
+
         # Buscar ranking com ou sem filtros
         if any([start_date, end_date, level, entity_id]):
             ranking_data = glpi_service.get_technician_ranking_with_filters(
@@ -382,6 +689,10 @@ def get_technician_ranking(
 
         # Verificar resultado
         if ranking_data is None:
+            degraded_response = _serve_last_known_good("technician_ranking", correlation_id)
+            if degraded_response is not None:
+                return degraded_response
+
             logger.error("Falha na comunicação com o GLPI")
             error_response = ResponseFormatter.format_error_response(
                 "Não foi possível conectar ao GLPI", ["Erro de conexão"]
@@ -434,6 +745,7 @@ def get_technician_ranking(
             "response_time_ms": round(response_time, 2),
             "correlation_id": correlation_id,
             "cached": False,
+            "degraded": False,
             "filters_applied": {
                 "start_date": start_date,
                 "end_date": end_date,
@@ -443,9 +755,7 @@ def get_technician_ranking(
             },
         }
 
-        # Cache é gerenciado automaticamente pelo decorator @cached
-
-        return jsonify(response_data)
+        return _finish_within_deadline("technician_ranking", response_data, correlation_id)
 
     except Exception as e:
         logger.error(f"Erro inesperado ao buscar ranking de técnicos: {e}", exc_info=True)
@@ -463,15 +773,16 @@ def get_technician_ranking(
 @api_bp.route("/tickets/recent")
 @monitor_api_endpoint("get_new_tickets")
 @monitor_performance
-@cached(ttl=300)
-def get_new_tickets(validated_start_date=None, validated_end_date=None, validated_filters=None):
+@_conditional_get("new_tickets")
+def get_new_tickets():
     """Endpoint para obter tickets recentes"""
     start_time = time.time()
+    correlation_id = api_logger.generate_correlation_id()
 
     try:
-        start_date = validated_start_date
-        end_date = validated_end_date
-        filters = validated_filters or {}
+        filters = extract_filter_params()
+        start_date = filters["start_date"]
+        end_date = filters["end_date"]
 
         # Obter parâmetros de filtro
         limit = filters.get("limit", 5) or 5
@@ -486,7 +797,13 @@ def get_new_tickets(validated_start_date=None, validated_end_date=None, validate
         except (ValueError, TypeError):
             limit = 5
 
-        logger.debug(f"Buscando {limit} tickets novos com filtros")
+        logger.debug(f"[{correlation_id}] Buscando {limit} tickets novos com filtros")
+
+        # Circuito de busca aberto: responder imediatamente com o último payload válido
+        if glpi_circuit_breakers.is_open("search"):
+            degraded_response = _serve_last_known_good("new_tickets", correlation_id)
+            if degraded_response is not None:
+                return degraded_response
 
         # Buscar tickets novos com ou sem filtros
         if any([priority, category, technician, start_date, end_date]):
@@ -503,6 +820,10 @@ def get_new_tickets(validated_start_date=None, validated_end_date=None, validate
 
         # Verificar resultado
         if new_tickets is None:
+            degraded_response = _serve_last_known_good("new_tickets", correlation_id)
+            if degraded_response is not None:
+                return degraded_response
+
             logger.error("Falha na comunicação com o GLPI")
             error_response = ResponseFormatter.format_error_response(
                 "Não foi possível conectar ao GLPI", ["Erro de conexão"]
@@ -516,6 +837,7 @@ def get_new_tickets(validated_start_date=None, validated_end_date=None, validate
                     "success": True,
                     "data": [],
                     "message": "Nenhum ticket novo encontrado com os filtros aplicados",
+                    "correlation_id": correlation_id,
                     "filters_applied": {
                         "limit": limit,
                         "priority": priority,
@@ -541,21 +863,24 @@ def get_new_tickets(validated_start_date=None, validated_end_date=None, validate
         if response_time > target_p95:
             logger.warning(f"Resposta lenta: {response_time:.2f}ms")
 
-        return jsonify(
-            {
-                "success": True,
-                "data": new_tickets,
-                "response_time_ms": round(response_time, 2),
-                "filters_applied": {
-                    "limit": limit,
-                    "priority": priority,
-                    "category": category,
-                    "technician": technician,
-                    "start_date": start_date,
-                    "end_date": end_date,
-                },
-            }
-        )
+        response_data = {
+            "success": True,
+            "data": new_tickets,
+            "response_time_ms": round(response_time, 2),
+            "correlation_id": correlation_id,
+            "cached": False,
+            "degraded": False,
+            "filters_applied": {
+                "limit": limit,
+                "priority": priority,
+                "category": category,
+                "technician": technician,
+                "start_date": start_date,
+                "end_date": end_date,
+            },
+        }
+
+        return _finish_within_deadline("new_tickets", response_data, correlation_id)
 
     except Exception as e:
         logger.error(f"Erro inesperado ao buscar tickets novos: {e}", exc_info=True)
@@ -568,7 +893,7 @@ def get_new_tickets(validated_start_date=None, validated_end_date=None, validate
 @api_bp.route("/tickets/<int:ticket_id>")
 @monitor_api_endpoint("get_ticket_details")
 @monitor_performance
-@cached(ttl=300)
+@_conditional_get("ticket_details")
 def get_ticket_details(ticket_id):
     """Endpoint para obter detalhes de um ticket específico"""
     start_time = time.time()
@@ -604,7 +929,7 @@ def get_ticket_details(ticket_id):
         processing_time = (time.time() - start_time) * 1000
         logger.info(f"Detalhes do ticket {ticket_id} obtidos em {processing_time:.2f}ms")
 
-        return jsonify(response_data), 200
+        return _representation_or_json("ticket_details", response_data)
 
     except Exception as e:
         logger.error(f"Erro ao buscar detalhes do ticket {ticket_id}: {e}", exc_info=True)
@@ -23,6 +23,16 @@ from utils.structured_logging import system_logger
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, parent_dir)
 
+# Origens do frontend liberadas no CORS da API (Flask e rotas assíncronas)
+API_CORS_ORIGINS = [
+    "http://localhost:3000",
+    "http://localhost:3001",
+    "http://localhost:3002",
+    "http://localhost:3003",
+    "http://localhost:5173",
+    "http://localhost:5174",
+]
+
 # Instâncias globais
 cache = Cache()
 redis_client = None
@@ -128,16 +138,10 @@ def _setup_cors(app: Flask) -> None:
         app,
         resources={
             r"/api/*": {
-                "origins": [
-                    "http://localhost:3000",
-                    "http://localhost:3001",
-                    "http://localhost:3002",
-                    "http://localhost:3003",
-                    "http://localhost:5173",
-                    "http://localhost:5174",
-                ],
+                "origins": API_CORS_ORIGINS,
                 "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-                "allow_headers": ["Content-Type", "Authorization"],
+                "allow_headers": ["Content-Type", "Authorization", "If-None-Match"],
+                "expose_headers": ["ETag", "X-Correlation-ID", "X-Cache"],
                 "supports_credentials": True,
             }
         },
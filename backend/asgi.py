@@ -2,13 +2,26 @@
 """
 Adaptador ASGI para a aplicação Flask GLPI Dashboard
 Permite executar Flask com servidores ASGI como Uvicorn
+
+Com ``starlette`` e ``httpx`` instalados, os endpoints de maior fan-out
+(métricas, ranking de técnicos e tickets recentes) são servidos por rotas
+assíncronas nativas (``api.async_routes``); as demais rotas seguem no Flask.
 """
 
-from app import app
+from api.async_routes import STARLETTE_AVAILABLE, create_async_app
+from app import API_CORS_ORIGINS, app
 from asgiref.wsgi import WsgiToAsgi
 
+from config.performance import CONCURRENCY_CONFIG
+from services.glpi_async_client import HTTPX_AVAILABLE
+
 # Converte a aplicação Flask WSGI para ASGI
-asgi_app = WsgiToAsgi(app)
+wsgi_asgi_app = WsgiToAsgi(app)
+
+if CONCURRENCY_CONFIG.get("ASYNC_ROUTES", True) and STARLETTE_AVAILABLE and HTTPX_AVAILABLE:
+    asgi_app = create_async_app(wsgi_asgi_app, API_CORS_ORIGINS)
+else:
+    asgi_app = wsgi_asgi_app
 
 if __name__ == "__main__":
     import uvicorn
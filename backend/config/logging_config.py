@@ -8,6 +8,9 @@ import logging.config
 import os
 from typing import Any, Dict, Optional
 
+from config.performance import LOGGING_CONFIG
+from utils.log_facade import enable_queue_logging
+
 # from utils.structured_logger import JSONFormatter  # Não utilizado
 
 
@@ -129,6 +132,10 @@ def configure_structured_logging(log_level: str = "INFO", log_file: Optional[str
         config = get_logging_config(log_level, log_file)
         logging.config.dictConfig(config)
 
+        # Formatação e I/O dos handlers na thread do QueueListener
+        if LOGGING_CONFIG.get("QUEUE", True):
+            enable_queue_logging()
+
         # Testar se o logging está funcionando
         logger = logging.getLogger("logging_config")
         logger.info(f"Sistema de logging configurado com sucesso. Nível: {log_level}")
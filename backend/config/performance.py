@@ -10,6 +10,7 @@ CACHE_CONFIG = {
     "METRICS_TTL": 180,  # 3 minutos
     "RANKING_TTL": 300,  # 5 minutos
     "TICKETS_TTL": 60,  # 1 minuto
+    "TREND_WINDOW_TTL": 3600,  # Totais de janelas de tendência já encerradas (1 hora)
     "MAX_CACHE_SIZE": 1000,
 }
 
@@ -21,6 +22,25 @@ API_CONFIG = {
     "MAX_RETRIES": 3,  # Máximo 3 tentativas (aumentado)
     "BATCH_SIZE": 30,  # Processar em lotes menores de 30
     "MAX_RANGE": 500,  # Máximo 500 registros por consulta (reduzido)
+    "MAX_URL_LENGTH": 8000,  # Limite da URL de busca (Apache/nginx: 8 KiB) antes do 414
+    "RETRY_BASE_DELAY": 0.5,  # Base do backoff com full jitter (segundos)
+    "RETRY_MAX_DELAY": 4.0,  # Teto de espera entre tentativas (segundos)
+    "RETRY_BUDGET_RETRIES": 6,  # Novas tentativas por requisição da API
+    "RETRY_BUDGET_SLEEP": 8.0,  # Espera total máxima por requisição da API (segundos)
+    "TOKEN_STORE": "file",  # Store do Session-Token compartilhado: file | redis | memory
+    "TOKEN_STORE_PATH": None,  # None = arquivo no diretório temporário do sistema
+    "TOKEN_REFRESH_MARGIN": 120,  # Renovar o token quando faltar menos que isso (segundos)
+    "COMPRESSION": True,  # Pedir respostas gzip/br ao GLPI (desligar se o proxy não comprime)
+    # Sessões GLPI simultâneas por processo. 1 = sem pool: todas as requisições usam o token do
+    # TOKEN_STORE, aberto uma vez e renovado em conjunto por todos os workers. Com N > 1 cada
+    # requisição em andamento usa uma sessão própria (o GLPI serializa requisições do mesmo token),
+    # mas essas sessões são do processo e ficam fora do TOKEN_STORE: cada worker abre e renova as
+    # suas, até workers * N sessões no GLPI. N abaixo de ADAPTIVE_MAX_LIMIT também limita as
+    # requisições em andamento a N; None = ADAPTIVE_MAX_LIMIT
+    "SESSION_POOL_SIZE": 1,
+    "CIRCUIT_FAILURE_THRESHOLD": 5,  # Falhas consecutivas para abrir o circuito
+    "CIRCUIT_RECOVERY_TIMEOUT": 30,  # Segundos em aberto antes de testar novamente
+    "LAST_KNOWN_GOOD_TTL": 3600,  # Payloads servidos em modo degradado por até 1 hora
 }
 
 # Configurações de Performance
@@ -30,6 +50,106 @@ PERFORMANCE_CONFIG = {
     "SLOW_QUERY_THRESHOLD": 300,  # 300ms
     "ENABLE_MONITORING": True,
     "ENABLE_PROFILING": False,
+    # Prazo total (segundos) de cada requisição da API, propagado até o GLPI
+    "DEFAULT_REQUEST_DEADLINE": 15,
+    "ENDPOINT_DEADLINES": {
+        "get_metrics": 10,
+        "get_technicians": 15,
+        "get_technician_ranking": 20,
+        "get_new_tickets": 8,
+        "get_ticket_details": 8,
+        "get_dashboard": 20,  # Seções em paralelo, cada uma com o prazo do seu endpoint
+        "glpi_health_check": 10,
+    },
+}
+
+# Planejador de contagens: contagens range=0-0 em paralelo x varredura única
+PLANNER_CONFIG = {
+    "ENABLED": True,  # Desligado, as métricas sempre usam contagens paralelas
+    "FORCE_STRATEGY": None,  # "counts" | "scan" para fixar a estratégia
+    "REQUEST_COST": 0.25,  # Latência inicial estimada de uma requisição (segundos)
+    "ROW_COST": 0.0005,  # Custo inicial estimado por linha varrida (segundos)
+    "PAGE_SIZE": 1000,  # Linhas por página da varredura
+    "SMOOTHING": 0.2,  # Peso de cada execução observada nas estimativas
+}
+
+# Cache persistido dos IDs de campos de busca (listSearchOptions), por URL e versão do GLPI
+SEARCH_OPTIONS_CONFIG = {
+    "CACHE_PATH": None,  # None = arquivo por URL do GLPI no diretório temporário do sistema
+    "REVALIDATE_INTERVAL": 3600,  # Conferência da versão do GLPI em segundo plano (segundos)
+    "MAX_AGE": 604800,  # Sem versão conhecida, redescobrir após 7 dias (segundos)
+    "BACKGROUND": True,  # Desligado, só revalida na descoberta inicial
+}
+
+# Índice de técnicos ativos (ranking e /api/technicians)
+ROSTER_CONFIG = {
+    "REFRESH_INTERVAL": 300,  # Atualização incremental em segundo plano (segundos)
+    "FULL_REFRESH_INTERVAL": 3600,  # Recarga completa: entradas/saídas de grupos e exclusões
+    "GROUP_IDS": None,  # Grupos de técnicos; None = grupos dos níveis de atendimento (N1-N4)
+    "PROFILE_IDS": [],  # Perfis que também definem técnicos (ex.: [6] = Technician)
+    "BACKGROUND": True,  # Desligado, o índice só é carregado no primeiro uso
+}
+
+# Pools de threads compartilhados pelo código de fan-out (utils/executor_service.py)
+EXECUTOR_CONFIG = {
+    "POOLS": {
+        # Requisições individuais ao GLPI; o limitador adaptativo decide quantas seguem ao mesmo tempo
+        "glpi_requests": {"MAX_WORKERS": 16, "MAX_QUEUE": 64},
+        # Tarefas que disparam outras (ex.: totais de uma janela de tendência)
+        "aggregations": {"MAX_WORKERS": 4, "MAX_QUEUE": 16},
+    },
+    "DEFAULT_MAX_WORKERS": 4,  # Pools não configurados
+    "DEFAULT_MAX_QUEUE": 16,
+    "SHUTDOWN_TIMEOUT": 10,  # Espera pelas tarefas pendentes ao encerrar o processo (segundos)
+}
+
+# Logging nos caminhos quentes (utils/log_facade.py)
+LOGGING_CONFIG = {
+    "QUEUE": True,  # Handlers atrás de QueueHandler/QueueListener: I/O fora da thread da requisição
+    "QUEUE_SIZE": 10000,  # Registros aguardando o listener; com a fila cheia são descartados
+    # Fração registrada de eventos de alto volume (WARNING ou acima nunca é amostrado)
+    "SAMPLE_RATES": {
+        "glpi_request": 0.1,  # log_glpi_request, uma vez por requisição ao GLPI
+        "ticket_count": 0.1,  # Parâmetros e resultado de cada contagem de tickets
+        "technician_batch": 0.1,  # Lotes e técnicos individuais das contagens do ranking
+    },
+}
+
+# Quantis de latência por endpoint e por família de consulta ao GLPI (utils/latency_sketch.py)
+LATENCY_CONFIG = {
+    "RELATIVE_ACCURACY": 0.01,  # Erro relativo máximo dos quantis (1%)
+    "SLOT_SECONDS": 10,  # Granularidade das janelas deslizantes
+    "WINDOWS": {"1m": 60, "5m": 300, "15m": 900},  # Janelas reportadas (segundos)
+    "DEFAULT_WINDOW": "5m",  # Janela do P95 do PerformanceMonitor
+    "MAX_SERIES": 100,  # Séries por grupo; nomes além disso são somados em "other"
+}
+
+# Atualizações do dashboard por Server-Sent Events (services/glpi_dashboard_stream.py)
+STREAM_CONFIG = {
+    "ENABLED": True,
+    # Intervalo de recálculo de cada seção por combinação de filtros (segundos)
+    "SECTION_INTERVALS": {"metrics": 30, "ranking": 300, "tickets": 60},
+    "KEEPALIVE_INTERVAL": 15,  # Comentário SSE enviado a conexões ociosas (proxies fecham conexões mudas)
+    "RETRY_MS": 5000,  # Espera sugerida ao EventSource antes de reconectar
+    "MAX_SUBSCRIBERS": 500,  # Conexões simultâneas por processo; além disso responde 503
+    "MAX_PENDING_EVENTS": 32,  # Eventos acumulados por cliente lento antes de encerrar a conexão
+    "TOPIC_IDLE_TTL": 120,  # Mantém o último estado de filtros sem assinantes (reconexões) por até (s)
+}
+
+# Respostas condicionais (ETag / If-None-Match) das rotas do dashboard (utils/conditional_response.py)
+ETAG_CONFIG = {
+    "ENABLED": True,  # Desligado, as rotas recalculam e respondem 200 sem ETag
+    # Tempo em que a representação é servida sem recalcular a rota (segundos); depois disso a rota
+    # recalcula e o ETag só muda se o conteúdo mudou
+    "TTLS": {
+        "metrics": 180,
+        "technician_ranking": 300,
+        "new_tickets": 60,
+        "ticket_details": 300,
+        "dashboard": 60,  # Acompanha a seção mais volátil (tickets recentes)
+    },
+    "DEFAULT_TTL": 120,
+    "MAX_ENTRIES": 500,  # Representações serializadas em memória (LRU)
 }
 
 # Configurações de Conexão Pool
@@ -43,6 +163,18 @@ CONNECTION_CONFIG = {
 # Configurações de Concorrência
 CONCURRENCY_CONFIG = {
     "MAX_WORKERS": 4,
-    "ENABLE_ASYNC": True,
+    "ENABLE_ASYNC": True,  # Fan-out via AsyncGLPIClient quando httpx estiver instalado
+    "ASYNC_MAX_CONNECTIONS": 32,  # Conexões HTTP do cliente assíncrono por event loop
+    "ASYNC_HTTP2": False,  # HTTP/2 multiplexado no cliente assíncrono (requer httpx[http2])
+    "ASYNC_HTTP2_PRIOR_KNOWLEDGE": False,  # HTTP/2 sem TLS (h2c) direto, sem negociação ALPN
+    "ASYNC_ROUTES": True,  # Métricas, ranking e tickets recentes em rotas ASGI nativas (asgi.py)
     "BATCH_PROCESSING": True,
+    # Limitador adaptativo (AIMD) de requisições simultâneas ao GLPI
+    "ADAPTIVE_INITIAL_LIMIT": 4,
+    "ADAPTIVE_MIN_LIMIT": 1,
+    "ADAPTIVE_MAX_LIMIT": 16,
+    "ADAPTIVE_LATENCY_THRESHOLD": 2.0,  # segundos
+    "ADAPTIVE_BACKOFF_RATIO": 0.5,
+    "ADAPTIVE_DECREASE_COOLDOWN": 1.0,  # segundos
+    "ADAPTIVE_ACQUIRE_TIMEOUT": 30,  # segundos
 }
@@ -1,8 +1,18 @@
-"""Configurações centralizadas do projeto com validações robustas"""
+"""Configurações centralizadas do projeto com validações robustas
+
+``active_config()`` devolve um snapshot imutável e memorizado da configuração:
+``config/system.yaml`` só é lido e validado de novo quando a data de
+modificação do arquivo muda (conferida no máximo a cada
+``CONFIG_CHECK_INTERVAL`` segundos).
+"""
 import logging
 import os
+import threading
+import time
 import warnings
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 
 from dotenv import load_dotenv
@@ -20,42 +30,63 @@ except ImportError:
     warnings.warn("PyYAML não está instalado. Usando apenas variáveis de ambiente.")
 
 
+# Arquivo de configuração do sistema
+CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "system.yaml"
+
+VALID_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+# Intervalo mínimo entre conferências da data de modificação do arquivo (segundos)
+CONFIG_CHECK_INTERVAL = 1.0
+
+
 class ConfigValidationError(Exception):
     """Exceção para erros de validação de configuração"""
 
     pass
 
 
+def _freeze(value: Any) -> Any:
+    """Cópia somente leitura do YAML (dicts viram mappingproxy e listas, tuplas)"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 class Config:
     """Configuração base com validações robustas"""
 
     def __init__(self):
-        """Inicializa e valida as configurações"""
+        """Inicializa e valida as configurações (a instância fica imutável)"""
         self._load_yaml_config()
         self._validate_required_configs()
         self._validate_config_values()
+        self._frozen = True
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"Configuração imutável: '{name}' não pode ser alterado")
+        super().__setattr__(name, value)
 
     def _load_yaml_config(self):
         """Carrega configurações do arquivo YAML"""
-        self.yaml_config = {}
+        self.yaml_config = MappingProxyType({})
 
         if not YAML_AVAILABLE:
             warnings.warn("PyYAML não disponível. Usando apenas variáveis de ambiente.")
             return
 
         try:
-            # Caminho para o arquivo de configuração
-            config_path = Path(__file__).parent.parent.parent / "config" / "system.yaml"
-
-            if config_path.exists():
-                with open(config_path, "r", encoding="utf-8") as file:
-                    self.yaml_config = yaml.safe_load(file)
+            if CONFIG_PATH.exists():
+                with open(CONFIG_PATH, "r", encoding="utf-8") as file:
+                    self.yaml_config = _freeze(yaml.safe_load(file) or {})
             else:
                 # Fallback para configurações padrão se arquivo não existir
-                warnings.warn(f"Arquivo de configuração não encontrado: {config_path}")
+                warnings.warn(f"Arquivo de configuração não encontrado: {CONFIG_PATH}")
         except Exception as e:
             warnings.warn(f"Erro ao carregar config/system.yaml: {e}")
-            self.yaml_config = {}
+            self.yaml_config = MappingProxyType({})
 
     def _get_config_value(self, path: str, default=None, env_var=None):
         """Obtém valor de configuração do YAML ou variável de ambiente"""
@@ -67,7 +98,7 @@ class Config:
         keys = path.split(".")
         value = self.yaml_config
         for key in keys:
-            if isinstance(value, dict) and key in value:
+            if isinstance(value, Mapping) and key in value:
                 value = value[key]
             else:
                 return default
@@ -201,7 +232,8 @@ class Config:
     # Logging
     @property
     def LOG_LEVEL(self) -> str:
-        return self._get_config_value("logging.level", "INFO", "LOG_LEVEL")
+        level = self._get_config_value("logging.level", "INFO", "LOG_LEVEL")
+        return level if str(level).upper() in VALID_LOG_LEVELS else "INFO"
 
     @property
     def LOG_FORMAT(self) -> str:
@@ -300,11 +332,10 @@ class Config:
                 f"GLPI_URL deve começar com http:// ou https://: {self.GLPI_URL}"
             )
 
-        # Validar nível de log
-        valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self.LOG_LEVEL.upper() not in valid_log_levels:
-            warnings.warn(f"LOG_LEVEL inválido '{self.LOG_LEVEL}', usando 'INFO'")
-            self.LOG_LEVEL = "INFO"
+        # Validar nível de log (LOG_LEVEL já devolve 'INFO' quando inválido)
+        log_level = self._get_config_value("logging.level", "INFO", "LOG_LEVEL")
+        if str(log_level).upper() not in VALID_LOG_LEVELS:
+            warnings.warn(f"LOG_LEVEL inválido '{log_level}', usando 'INFO'")
 
         # Validar chave secreta em produção
         if not self.DEBUG and self.SECRET_KEY == "dev-secret-key-change-in-production":
@@ -398,8 +429,88 @@ config_by_name = {
     "test": TestingConfig,
 }
 
-# Configuração ativa
-active_config = config_by_name[os.environ.get("FLASK_ENV", "dev")]
+# Classe da configuração ativa
+active_config_class = config_by_name[os.environ.get("FLASK_ENV", "dev")]
+
+
+def _config_mtime() -> Optional[int]:
+    try:
+        return CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+class SettingsSnapshot:
+    """Instância memorizada da configuração, recriada quando system.yaml muda"""
+
+    def __init__(self, config_class: type, check_interval: float = CONFIG_CHECK_INTERVAL):
+        self.config_class = config_class
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._config: Optional[Config] = None
+        self._mtime: Optional[int] = None
+        self._checked_at = 0.0
+        self.reloads = 0
+
+    def get(self) -> Config:
+        """Snapshot atual; no máximo um ``stat`` do arquivo por ``check_interval``"""
+        config = self._config
+        now = time.monotonic()
+        if config is not None and now - self._checked_at < self.check_interval:
+            return config
+
+        mtime = _config_mtime()
+        if config is not None and mtime == self._mtime:
+            self._checked_at = now
+            return config
+
+        with self._lock:
+            if self._config is None or self._mtime != mtime:
+                self._load(mtime)
+            self._checked_at = now
+            return self._config
+
+    def reload(self) -> Config:
+        """Recria o snapshot imediatamente"""
+        with self._lock:
+            self._load(_config_mtime())
+            self._checked_at = time.monotonic()
+            return self._config
+
+    def _load(self, mtime: Optional[int]) -> None:
+        try:
+            config = self.config_class()
+        except Exception as e:
+            if self._config is None:
+                raise
+            # Arquivo inválido no meio de uma edição: manter o snapshot anterior
+            logging.getLogger("config").warning(
+                f"Falha ao recarregar {CONFIG_PATH}, mantendo a configuração anterior: {e}"
+            )
+        else:
+            self._config = config
+            self.reloads += 1
+        self._mtime = mtime
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "config_class": self.config_class.__name__,
+            "reloads": self.reloads,
+            "check_interval": self.check_interval,
+        }
+
+
+_settings = SettingsSnapshot(active_config_class)
+
+
+def active_config() -> Config:
+    """Configuração ativa (snapshot imutável, recarregado quando system.yaml muda)"""
+    return _settings.get()
+
+
+def reload_config() -> Config:
+    """Força a releitura de system.yaml e das variáveis de ambiente"""
+    return _settings.reload()
 
 
 def get_config():
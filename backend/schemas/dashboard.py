@@ -1,6 +1,6 @@
 import re
 from datetime import datetime
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, validator
 
@@ -101,6 +101,10 @@ class DashboardMetrics(BaseModel):
     total: int = Field(ge=0, description="Total geral de tickets")
     niveis: NiveisMetrics
     tendencias: TendenciasMetrics
+    tendencias_janelas: Optional[Dict[str, TendenciasMetrics]] = Field(
+        None,
+        description="Tendências por janela (periodo_anterior, semana_anterior, mes_anterior, ano_anterior)",
+    )
     filters_applied: Optional[FiltersApplied] = None
     timestamp: datetime = Field(default_factory=datetime.now)
 
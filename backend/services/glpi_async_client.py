@@ -0,0 +1,733 @@
+# -*- coding: utf-8 -*-
+"""Cliente assíncrono do GLPI para consultas com grande fan-out.
+
+Contagens por status, contagens por técnico e páginas de ``search/Ticket`` são
+dezenas de requisições independentes. Com ``httpx.AsyncClient`` um único event
+loop mantém todas em andamento sem uma thread por requisição, ao contrário dos
+``ThreadPoolExecutor`` aninhados do ``GLPIService``.
+
+O cliente é um complemento do ``GLPIService``, não um substituto: usa a mesma
+autenticação (token principal ou pool de sessões), os mesmos builders de
+consulta (``glpi_queries``), os mesmos caches e as mesmas proteções do
+transporte síncrono (limitador adaptativo, circuit breaker, política de retry
+e deadline da requisição). Requer o pacote opcional ``httpx``.
+"""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from config.performance import API_CONFIG, CONCURRENCY_CONFIG
+from utils.deadline import deadline_expired, get_deadline
+from utils.latency_sketch import latency_recorder
+
+from .glpi_circuit_breaker import glpi_circuit_breakers
+from .glpi_concurrency import ConcurrencyLimitExceeded, glpi_concurrency_limiter
+from .glpi_queries import (
+    TechnicianTally,
+    build_group_status_count_params,
+    build_hierarchy_status_count_params,
+    build_hierarchy_status_scan_params,
+    build_status_count_params,
+    build_status_scan_params,
+    build_technician_scan_query,
+    hierarchy_level,
+    page_ranges,
+    parse_content_range_total,
+    parse_total_count,
+    parse_user_display_name,
+    query_family,
+    with_range,
+)
+from .glpi_query_planner import SCAN, glpi_query_planner
+from .glpi_retry import get_retry_budget, glpi_retry_policy, new_retry_budget
+from .glpi_session_pool import SessionLease, SessionPoolExhausted
+from .glpi_transfer_stats import accept_encoding, glpi_transfer_stats
+
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    httpx = None
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401  # HTTP/2 do httpx (extra "httpx[http2]")
+
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+logger = logging.getLogger("glpi_async_client")
+
+if TYPE_CHECKING:
+    from .glpi_service import GLPIService
+
+
+def create_async_http_client(
+    max_connections: int, http2: bool = False, http2_prior_knowledge: bool = False
+):
+    """``httpx.AsyncClient`` para o GLPI, em HTTP/1.1 (pool) ou HTTP/2 (multiplexado)
+
+    Com HTTP/2 as contagens e páginas simultâneas viram streams de uma mesma
+    conexão em vez de uma conexão TCP/TLS cada. Em HTTPS o protocolo é
+    negociado via ALPN (servidores só HTTP/1.1 continuam funcionando);
+    ``http2_prior_knowledge`` fala HTTP/2 direto (h2c) com proxies sem TLS.
+
+    Args:
+        max_connections: Limite de conexões do pool
+        http2: Habilita HTTP/2; ignorado (com aviso) sem o pacote ``h2``
+        http2_prior_knowledge: Usa apenas HTTP/2, sem negociação
+    """
+    if http2 and not H2_AVAILABLE:
+        logger.warning("HTTP/2 habilitado mas o pacote 'h2' não está instalado; usando HTTP/1.1")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=max_connections, max_keepalive_connections=max_connections
+    )
+    if http2:
+        return httpx.AsyncClient(limits=limits, http2=True, http1=not http2_prior_knowledge)
+    return httpx.AsyncClient(limits=limits)
+
+
+class AsyncGLPIClient:
+    """Contraparte assíncrona do ``GLPIService`` para os caminhos de fan-out
+
+    Args:
+        service: Serviço síncrono de onde vêm URL, tokens, field_ids e caches
+    """
+
+    def __init__(self, service: "GLPIService"):
+        if not HTTPX_AVAILABLE:
+            raise RuntimeError("AsyncGLPIClient requer o pacote 'httpx'")
+
+        self.service = service
+        self.glpi_url = service.glpi_url
+        self.max_connections = CONCURRENCY_CONFIG.get("ASYNC_MAX_CONNECTIONS", 32)
+        self.http2 = bool(CONCURRENCY_CONFIG.get("ASYNC_HTTP2", False)) and H2_AVAILABLE
+        self.http2_prior_knowledge = bool(CONCURRENCY_CONFIG.get("ASYNC_HTTP2_PRIOR_KNOWLEDGE", False))
+        self.logger = logger
+        if CONCURRENCY_CONFIG.get("ASYNC_HTTP2", False) and not H2_AVAILABLE:
+            self.logger.warning(
+                "ASYNC_HTTP2 habilitado mas o pacote 'h2' não está instalado; usando HTTP/1.1"
+            )
+
+        # Respostas por versão do protocolo efetivamente negociada
+        self._http_versions: Dict[str, int] = {}
+        self._stats_lock = threading.Lock()
+
+        # Um httpx.AsyncClient por event loop (o cliente não pode trocar de loop)
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._clients_lock = threading.Lock()
+
+        # Event loop de fundo das chamadas síncronas (``run``): as conexões (e o
+        # HTTP/2) continuam abertas de uma requisição Flask para a outra
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+
+    def _http_client(self):
+        loop = asyncio.get_running_loop()
+        with self._clients_lock:
+            client = self._clients.get(loop)
+            if client is None:
+                client = create_async_http_client(
+                    self.max_connections, self.http2, self.http2_prior_knowledge
+                )
+                self._clients[loop] = client
+            return client
+
+    def _record_http_version(self, response) -> None:
+        version = getattr(response, "http_version", None) or "unknown"
+        with self._stats_lock:
+            self._http_versions[version] = self._http_versions.get(version, 0) + 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Configuração do transporte e respostas por versão de HTTP"""
+        with self._stats_lock:
+            http_versions = dict(self._http_versions)
+        with self._clients_lock:
+            open_clients = len(self._clients)
+        return {
+            "http2": self.http2,
+            "http2_prior_knowledge": self.http2 and self.http2_prior_knowledge,
+            "max_connections": self.max_connections,
+            "open_clients": open_clients,
+            "background_loop": self._loop is not None,
+            "responses_by_http_version": http_versions,
+        }
+
+    async def aclose(self) -> None:
+        """Fecha o cliente HTTP do event loop atual"""
+        loop = asyncio.get_running_loop()
+        with self._clients_lock:
+            client = self._clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    @staticmethod
+    def can_run_sync() -> bool:
+        """Indica se ``run`` pode ser usado na thread atual (sem event loop ativo)"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+        return False
+
+    def _background_loop(self) -> asyncio.AbstractEventLoop:
+        """Event loop de fundo, iniciado na primeira chamada (ou de novo após ``close``)"""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="glpi-async-client", daemon=True)
+                thread.start()
+                self._loop, self._loop_thread = loop, thread
+            return self._loop
+
+    def run(self, coro: Awaitable[Any]) -> Any:
+        """Executa uma corrotina do cliente a partir de código síncrono
+
+        A corrotina roda no event loop de fundo do cliente, com o contexto do
+        chamador (deadline e orçamento de retry), e reaproveita as conexões das
+        chamadas anteriores. Não deve ser chamado de dentro de um event loop em
+        execução.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._background_loop()).result()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Fecha o cliente HTTP do event loop de fundo e encerra o loop (shutdown da aplicação)"""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is None:
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(self.aclose(), loop).result(timeout)
+        except Exception as e:
+            self.logger.warning(f"Erro ao fechar o cliente HTTP assíncrono: {e!r}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+
+    # ------------------------------------------------------------------
+    # Transporte
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _default_timeout(url: str) -> float:
+        endpoint_path = url.split("/")[-1].lower()
+        if any(op in endpoint_path for op in ["search", "report", "listsearchoptions"]):
+            return API_CONFIG.get("SLOW_TIMEOUT", 20)
+        return API_CONFIG.get("TIMEOUT", 12)
+
+    async def _auth_headers(
+        self, timeout: float
+    ) -> Tuple[Optional[Dict[str, str]], Optional[SessionLease]]:
+        # A obtenção do token pode chamar initSession (síncrono); roda fora do loop
+        pool = self.service.session_pool
+        if pool is not None:
+            lease = await asyncio.to_thread(pool.acquire, timeout)
+            if lease is None:
+                return None, None
+            return {"Session-Token": lease.token, "App-Token": self.service.app_token}, lease
+
+        headers = await asyncio.to_thread(self.service.get_api_headers)
+        return headers, None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Faz uma requisição autenticada com as mesmas proteções do cliente síncrono
+
+        Returns:
+            ``httpx.Response`` ou None se a requisição falhou/foi recusada
+        """
+        method = method.upper()
+        base_timeout = timeout or self._default_timeout(url)
+        breaker = glpi_circuit_breakers.for_url(url)
+        budget = get_retry_budget() or new_retry_budget()
+        acquire_timeout = CONCURRENCY_CONFIG.get("ADAPTIVE_ACQUIRE_TIMEOUT", 30)
+
+        for attempt in range(self.service.max_retries):
+            request_timeout = base_timeout
+            slot_timeout = acquire_timeout
+            deadline = get_deadline()
+            if deadline is not None:
+                if deadline_expired(f"{method} {breaker.name}"):
+                    return None
+                request_timeout = deadline.clamp(base_timeout)
+                slot_timeout = deadline.clamp(acquire_timeout)
+
+            if not breaker.allow_request():
+                self.logger.warning(
+                    f"Circuito GLPI '{breaker.name}' aberto, requisição {method} {url} "
+                    f"recusada (nova tentativa em {breaker.retry_after():.1f}s)"
+                )
+                return None
+
+            lease = None
+            try:
+                headers, lease = await self._auth_headers(request_timeout)
+                if not headers:
+                    self.logger.error(
+                        f"Falha ao obter headers de autenticação (tentativa {attempt + 1})"
+                    )
+                    return None
+                headers = {**headers, "Accept-Encoding": accept_encoding()}
+
+                async with glpi_concurrency_limiter.async_slot(slot_timeout):
+                    start_time = time.monotonic()
+                    try:
+                        response = await self._http_client().request(
+                            method, url, params=params, headers=headers, timeout=request_timeout
+                        )
+                    except httpx.TimeoutException:
+                        glpi_concurrency_limiter.on_overload("timeout")
+                        raise
+                response_time = time.monotonic() - start_time
+                self._record_http_version(response)
+                family = query_family(url, params)
+                glpi_transfer_stats.record_response(family, response)
+                latency_recorder.record("upstream", family, response_time)
+
+                if response.status_code >= 500:
+                    glpi_concurrency_limiter.on_overload(f"HTTP {response.status_code}")
+                    breaker.record_failure()
+                else:
+                    glpi_concurrency_limiter.on_success(response_time)
+                    breaker.record_success()
+
+                if response.status_code in (401, 403):
+                    self.logger.warning(
+                        f"Recebido status {response.status_code}, token pode estar expirado"
+                    )
+                    if lease is not None:
+                        lease.invalidate()
+                    else:
+                        await asyncio.to_thread(
+                            self.service._invalidate_session_token, headers.get("Session-Token")
+                        )
+                    if await glpi_retry_policy.wait_before_retry_async(
+                        attempt, budget, f"HTTP {response.status_code}"
+                    ):
+                        continue
+
+                if response.status_code in (502, 503, 504):
+                    if await glpi_retry_policy.wait_before_retry_async(
+                        attempt, budget, f"HTTP {response.status_code}"
+                    ):
+                        continue
+
+                if response.status_code >= 400:
+                    self.logger.warning(
+                        f"Erro na requisição: {response.status_code} - {response.text[:200]}"
+                    )
+                return response
+
+            except ConcurrencyLimitExceeded as e:
+                self.logger.error(f"Limite de concorrência GLPI saturado: {e}")
+                return None
+
+            except SessionPoolExhausted as e:
+                self.logger.error(f"Pool de sessões GLPI esgotado: {e}")
+                return None
+
+            except (httpx.TimeoutException, httpx.TransportError) as e:
+                self.logger.warning(f"Falha de transporte (tentativa {attempt + 1}): {e!r}")
+                breaker.record_failure()
+                if await glpi_retry_policy.wait_before_retry_async(attempt, budget, repr(e)):
+                    continue
+                break
+
+            except httpx.HTTPError as e:
+                self.logger.error(f"Erro na requisição (tentativa {attempt + 1}): {e!r}")
+                if await glpi_retry_policy.wait_before_retry_async(attempt, budget, repr(e)):
+                    continue
+                break
+
+            finally:
+                if lease is not None:
+                    self.service.session_pool.release(lease)
+
+        self.logger.error(f"Todas as tentativas falharam para {method} {url}")
+        return None
+
+    async def search_tickets(
+        self, params: Mapping[str, Any], timeout: Optional[float] = None
+    ):
+        """``GET search/Ticket`` com os parâmetros informados"""
+        return await self.request("GET", f"{self.glpi_url}/search/Ticket", params, timeout)
+
+    # ------------------------------------------------------------------
+    # Fan-out
+    # ------------------------------------------------------------------
+
+    async def _ensure_field_ids(self) -> bool:
+        if self.service.field_ids:
+            return True
+        return await asyncio.to_thread(self.service.discover_field_ids)
+
+    def _json_body(self, response, description: str) -> Any:
+        """Corpo JSON de uma resposta 200/206, ou None (status de erro ou corpo que não é JSON)
+
+        Uma página de erro de proxy (HTML) não deve virar ``ValueError`` na rota
+        nem ser tratada como dados.
+        """
+        if response is None or response.status_code not in (200, 206):
+            status = "sem resposta" if response is None else f"status {response.status_code}"
+            self.logger.warning(f"{description}: {status}")
+            return None
+        try:
+            return response.json()
+        except ValueError as e:
+            self.logger.warning(f"{description}: resposta não é JSON válido ({e})")
+            return None
+
+    async def count_tickets(self, params: Mapping[str, Any]) -> Optional[int]:
+        """Total de tickets de uma busca (idealmente com ``range=0-0``)"""
+        response = await self.search_tickets(params)
+        if response is None or response.status_code not in (200, 206):
+            return None
+
+        total = parse_content_range_total(response.headers.get("Content-Range"))
+        if total is not None:
+            return total
+        try:
+            return parse_total_count(response.headers, response.json())
+        except ValueError:
+            return None
+
+    async def _gather_counts(self, queries: Dict[Any, Dict[str, Any]]) -> Dict[Any, Optional[int]]:
+        keys = list(queries)
+        results = await asyncio.gather(
+            *(self.count_tickets(queries[key]) for key in keys), return_exceptions=True
+        )
+        counts = {}
+        for key, result in zip(keys, results):
+            if isinstance(result, BaseException):
+                self.logger.error(f"Erro na contagem {key}: {result!r}")
+                result = None
+            counts[key] = result
+        return counts
+
+    async def count_facets(
+        self,
+        label: str,
+        queries: Dict[Any, Dict[str, Any]],
+        scan_params: Dict[str, Any],
+        classify: Callable[[Dict[str, Any]], Any],
+    ) -> Dict[Any, int]:
+        """Contagem de cada faceta pelo plano mais barato (``glpi_query_planner``)
+
+        Args:
+            label: Nome da consulta no log do plano
+            queries: ``{faceta: parâmetros da contagem range=0-0}``
+            scan_params: Busca unificada das facetas (sem ``range``)
+            classify: Faceta de uma linha da varredura (ou ``None``)
+
+        Returns:
+            ``{faceta: total}``; contagens que falharam valem 0
+        """
+        parallelism = glpi_concurrency_limiter.limit
+        total = None
+        if glpi_query_planner.needs_probe(len(queries), parallelism, parallel_pages=True):
+            started = time.perf_counter()
+            total = await self.count_tickets(with_range(scan_params, 0, 1))
+            if total is not None:
+                glpi_query_planner.observe_requests(time.perf_counter() - started)
+
+        plan = glpi_query_planner.plan(
+            label, len(queries), parallelism, total, parallel_pages=True
+        )
+        if plan.strategy == SCAN:
+            started = time.perf_counter()
+            page_size = glpi_query_planner.page_size
+            rows = await self.fetch_all_pages(scan_params, page_size)
+            if rows is not None:
+                pages = max(1, math.ceil(len(rows) / page_size))
+                rounds = 1 + math.ceil((pages - 1) / parallelism)
+                glpi_query_planner.observe_scan(
+                    time.perf_counter() - started, rounds, min(len(rows), rounds * page_size)
+                )
+                counts = {key: 0 for key in queries}
+                for row in rows:
+                    key = classify(row)
+                    if key in counts:
+                        counts[key] += 1
+                return counts
+            self.logger.warning(f"Varredura de {label} incompleta; usando contagens")
+
+        started = time.perf_counter()
+        counts = await self._gather_counts(queries)
+        if any(total is not None for total in counts.values()):
+            glpi_query_planner.observe_requests(
+                time.perf_counter() - started, math.ceil(len(queries) / parallelism)
+            )
+        return {key: total or 0 for key, total in counts.items()}
+
+    async def count_by_status(
+        self,
+        statuses: Mapping[str, int],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Dict[str, int]:
+        """Total de tickets de cada status (todos os grupos) em paralelo
+
+        Returns:
+            ``{status: total}``; contagens que falharam valem 0
+        """
+        if not await self._ensure_field_ids():
+            return {}
+        status_field = self.service.field_ids.get("STATUS")
+        if not status_field:
+            return {}
+
+        queries = {
+            status_name: build_status_count_params(status_field, status_id, start_date, end_date)
+            for status_name, status_id in statuses.items()
+        }
+        status_by_id = {str(status_id): status_name for status_name, status_id in statuses.items()}
+        scan_params = build_status_scan_params(
+            status_field, list(statuses.values()), start_date, end_date
+        )
+        return await self.count_facets(
+            "totais por status",
+            queries,
+            scan_params,
+            lambda row: status_by_id.get(str(row.get(status_field))),
+        )
+
+    async def count_by_group_and_status(
+        self,
+        groups: Mapping[str, int],
+        statuses: Mapping[str, int],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        date_field: str = "15",
+    ) -> Dict[str, Dict[str, int]]:
+        """Matriz grupo x status (ex.: ``service_levels`` x ``status_map``) em paralelo
+
+        Returns:
+            ``{grupo: {status: total}}``; contagens que falharam valem 0
+        """
+        if not await self._ensure_field_ids():
+            return {}
+        group_field = self.service.field_ids.get("GROUP")
+        status_field = self.service.field_ids.get("STATUS")
+        if not group_field or not status_field:
+            return {}
+
+        queries = {
+            (group_name, status_name): build_group_status_count_params(
+                group_field, group_id, status_field, status_id, start_date, end_date, date_field
+            )
+            for group_name, group_id in groups.items()
+            for status_name, status_id in statuses.items()
+        }
+        counts = await self._gather_counts(queries)
+
+        result = {group_name: {} for group_name in groups}
+        for (group_name, status_name), total in counts.items():
+            result[group_name][status_name] = total or 0
+        return result
+
+    async def count_by_level_and_status(
+        self,
+        levels: Iterable[str],
+        statuses: Mapping[str, int],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Dict[str, Dict[str, int]]:
+        """Matriz nível (campo 8) x status em paralelo
+
+        Returns:
+            ``{nível: {status: total}}``; contagens que falharam valem 0
+        """
+        if not await self._ensure_field_ids():
+            return {}
+        status_field = self.service.field_ids.get("STATUS")
+        if not status_field:
+            return {}
+
+        levels = list(levels)
+        queries = {
+            (level, status_name): build_hierarchy_status_count_params(
+                level, status_field, status_id, start_date, end_date
+            )
+            for level in levels
+            for status_name, status_id in statuses.items()
+        }
+        status_by_id = {str(status_id): status_name for status_name, status_id in statuses.items()}
+        scan_params = build_hierarchy_status_scan_params(
+            levels, status_field, list(statuses.values()), start_date, end_date
+        )
+        counts = await self.count_facets(
+            "nível x status",
+            queries,
+            scan_params,
+            lambda row: (
+                hierarchy_level(row.get("8"), levels),
+                status_by_id.get(str(row.get(status_field))),
+            ),
+        )
+
+        result = {level: {} for level in levels}
+        for (level, status_name), total in counts.items():
+            result[level][status_name] = total or 0
+        return result
+
+    async def get_technician_metrics(
+        self,
+        tech_ids: Iterable[Any],
+        tech_field: str = "5",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Total, resolvidos e pendentes de cada técnico em uma única varredura
+
+        A lista de técnicos é dividida pelo limite de URL; as páginas de cada
+        parte são buscadas em paralelo (``fetch_all_pages``).
+        """
+        tech_ids = [str(tech_id) for tech_id in tech_ids]
+        if not tech_ids:
+            return {}
+        status_field = self.service.field_ids.get("STATUS") or "12"
+        tally = TechnicianTally(tech_field, status_field, tech_ids)
+        query = build_technician_scan_query(tech_field, tech_ids, status_field, start_date, end_date)
+
+        batches = query.split_any(self.glpi_url)
+        results = await asyncio.gather(
+            *(self.fetch_all_pages(batch.to_params()) for batch in batches),
+            return_exceptions=True,
+        )
+        for batch, rows in zip(batches, results):
+            if rows is None or isinstance(rows, BaseException):
+                self.logger.error(
+                    f"Erro na varredura de {len(batch.any_values)} técnicos: {rows!r}"
+                )
+                continue
+            tally.add(rows)
+
+        self.logger.info(
+            f"Varredura do ranking: {tally.rows} tickets, {len(tech_ids)} técnicos, "
+            f"{len(batches)} consulta(s)"
+        )
+        return tally.metrics()
+
+    async def _user_display_name(self, user_id: str) -> str:
+        # Mesmo cache (e chave) de GLPIService._get_user_name_by_id
+        cache_key = f"user_name_{user_id}"
+        cached_name = self.service._get_cache_data("user_names", cache_key)
+        if cached_name:
+            return cached_name
+
+        response = await self.request("GET", f"{self.glpi_url}/User/{user_id}")
+        body = self._json_body(response, f"Falha ao buscar usuário {user_id}")
+        if not isinstance(body, dict):
+            return f"Usuário {user_id}"
+
+        display_name = parse_user_display_name(body)
+        self.service._set_cache_data("user_names", display_name, 3600, cache_key)
+        return display_name
+
+    async def get_user_display_names(self, user_ids: Iterable[Any]) -> Dict[str, str]:
+        """Nome de exibição de cada usuário (``GET /User/{id}``) em paralelo"""
+        user_ids = list(dict.fromkeys(str(user_id) for user_id in user_ids))
+        results = await asyncio.gather(
+            *(self._user_display_name(user_id) for user_id in user_ids), return_exceptions=True
+        )
+        return {
+            user_id: f"Usuário {user_id}" if isinstance(result, BaseException) else result
+            for user_id, result in zip(user_ids, results)
+        }
+
+    async def _category_name(self, category_id: str) -> str:
+        # Mesmo cache (e chave) de GLPIService._get_category_name_by_id
+        cache_key = f"category_name_{category_id}"
+        cached_name = self.service._get_cache_data("category_names", cache_key)
+        if cached_name:
+            return cached_name
+
+        response = await self.request("GET", f"{self.glpi_url}/ITILCategory/{category_id}")
+        body = self._json_body(response, f"Falha ao buscar categoria {category_id}")
+        if not isinstance(body, dict):
+            return "Não categorizado"
+
+        category_name = body.get("name", "Não categorizado")
+        self.service._set_cache_data("category_names", category_name, 3600, cache_key)
+        return category_name
+
+    async def get_category_names(self, category_ids: Iterable[Any]) -> Dict[str, str]:
+        """Nome de cada categoria (``GET /ITILCategory/{id}``) em paralelo"""
+        category_ids = list(dict.fromkeys(str(category_id) for category_id in category_ids))
+        results = await asyncio.gather(
+            *(self._category_name(category_id) for category_id in category_ids),
+            return_exceptions=True,
+        )
+        return {
+            category_id: "Não categorizado" if isinstance(result, BaseException) else result
+            for category_id, result in zip(category_ids, results)
+        }
+
+    async def fetch_all_pages(
+        self,
+        search_params: Mapping[str, Any],
+        page_size: int = 1000,
+        max_items: int = 100000,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Todas as linhas de uma busca, com as páginas restantes buscadas em paralelo
+
+        A primeira página informa o total (``Content-Range``); as demais são
+        pedidas de uma vez.
+
+        Returns:
+            As linhas, ou None se alguma página falhar (como ``_scan_facet_counts``
+            do serviço): uma lista incompleta daria contagens baixas com cara de completas
+        """
+        first = await self.search_tickets(with_range(search_params, 0, page_size))
+        body = self._json_body(first, f"Página 0-{page_size - 1} não obtida")
+        if body is None:
+            return None
+
+        rows = list(body.get("data", []) if isinstance(body, dict) else [])
+        total = parse_total_count(first.headers, body) or len(rows)
+        if len(rows) < page_size or total <= page_size:
+            return rows
+
+        starts = page_ranges(min(total, max_items), page_size, start_index=page_size)
+        responses = await asyncio.gather(
+            *(self.search_tickets(with_range(search_params, start, page_size)) for start in starts),
+            return_exceptions=True,
+        )
+        for start, response in zip(starts, responses):
+            description = f"Página {start}-{start + page_size - 1} não obtida"
+            if isinstance(response, BaseException):
+                self.logger.warning(f"{description}: {response!r}")
+                continue
+            page = self._json_body(response, description)
+            rows.extend(page.get("data", []) if isinstance(page, dict) else [])
+
+        expected = min(total, max_items)
+        if len(rows) < expected:
+            if not deadline_expired("paginação assíncrona"):
+                self.logger.warning(f"Paginação incompleta: {len(rows)} de {expected} linhas")
+            return None
+        return rows
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""Circuit breaker por família de endpoint do GLPI.
+
+Quando o GLPI está lento ou fora do ar, cada chamada esgotaria todas as
+tentativas de ``_make_authenticated_request`` antes de desistir. O breaker
+abre após falhas consecutivas e passa a falhar imediatamente até o período de
+recuperação expirar, quando uma única chamada de teste (half-open) decide se
+o circuito fecha novamente.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+from config.performance import API_CONFIG
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker simples com estados closed / open / half_open"""
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """Inicializa o breaker
+
+        Args:
+            name: Nome da família de endpoint
+            failure_threshold: Falhas consecutivas necessárias para abrir
+            recovery_timeout: Segundos em aberto antes de permitir uma chamada de teste
+        """
+        self.name = name
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.recovery_timeout = recovery_timeout
+
+        self._state = STATE_CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+        self._stats = {"failures": 0, "successes": 0, "rejected": 0, "opened": 0}
+        self.logger = logging.getLogger("glpi_circuit_breaker")
+
+    @property
+    def state(self) -> str:
+        """Estado atual, considerando a expiração do período em aberto"""
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == STATE_OPEN and now - self._opened_at >= self.recovery_timeout:
+            return STATE_HALF_OPEN
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Indica se uma chamada pode prosseguir
+
+        Em half-open apenas uma chamada de teste é liberada por vez.
+        """
+        now = time.monotonic()
+        with self._lock:
+            state = self._current_state(now)
+            if state == STATE_CLOSED:
+                return True
+            # Uma chamada de teste abandonada (sem sucesso/falha registrada) expira
+            probe_expired = now - self._probe_started >= self.recovery_timeout
+            if state == STATE_HALF_OPEN and (not self._probe_in_flight or probe_expired):
+                self._state = STATE_HALF_OPEN
+                self._probe_in_flight = True
+                self._probe_started = now
+                return True
+            self._stats["rejected"] += 1
+            return False
+
+    def retry_after(self) -> float:
+        """Segundos restantes até a próxima chamada de teste"""
+        with self._lock:
+            if self._state != STATE_OPEN:
+                return 0.0
+            return max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+
+    def record_success(self) -> None:
+        """Registra uma chamada bem-sucedida e fecha o circuito"""
+        with self._lock:
+            self._stats["successes"] += 1
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+            if self._state != STATE_CLOSED:
+                self._state = STATE_CLOSED
+                self.logger.info(f"Circuito GLPI '{self.name}' fechado")
+
+    def record_failure(self) -> None:
+        """Registra uma falha (5xx, timeout, erro de conexão)"""
+        with self._lock:
+            self._stats["failures"] += 1
+            self._consecutive_failures += 1
+            self._probe_in_flight = False
+
+            should_open = self._state == STATE_HALF_OPEN or (
+                self._state == STATE_CLOSED
+                and self._consecutive_failures >= self.failure_threshold
+            )
+            if should_open:
+                self._state = STATE_OPEN
+                self._opened_at = time.monotonic()
+                self._stats["opened"] += 1
+                self.logger.warning(
+                    f"Circuito GLPI '{self.name}' aberto após "
+                    f"{self._consecutive_failures} falhas consecutivas"
+                )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna o estado e os contadores do breaker"""
+        with self._lock:
+            return {
+                "state": self._current_state(time.monotonic()),
+                "consecutive_failures": self._consecutive_failures,
+                **self._stats,
+            }
+
+
+def endpoint_family(url: str) -> str:
+    """Classifica uma URL do GLPI em uma família de endpoint
+
+    Args:
+        url: URL completa da requisição
+
+    Returns:
+        Nome da família (ex.: "search", "session", "item:User")
+    """
+    path = urlparse(url).path.rstrip("/")
+    # Caminho relativo à API REST (tudo após apirest.php, quando presente)
+    if "apirest.php" in path:
+        path = path.split("apirest.php", 1)[1]
+    parts = [part for part in path.split("/") if part]
+
+    if not parts:
+        return "root"
+    if parts[0] in ("initSession", "killSession"):
+        return "session"
+    if parts[0] == "search":
+        return "search"
+    if parts[0] == "listSearchOptions":
+        return "search_options"
+    return f"item:{parts[0]}"
+
+
+class CircuitBreakerRegistry:
+    """Mantém um breaker por família de endpoint"""
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, family: str) -> CircuitBreaker:
+        """Retorna (criando se necessário) o breaker da família"""
+        with self._lock:
+            breaker = self._breakers.get(family)
+            if breaker is None:
+                breaker = CircuitBreaker(family, self.failure_threshold, self.recovery_timeout)
+                self._breakers[family] = breaker
+            return breaker
+
+    def for_url(self, url: str) -> CircuitBreaker:
+        """Retorna o breaker responsável pela URL"""
+        return self.get(endpoint_family(url))
+
+    def is_open(self, family: Optional[str] = None) -> bool:
+        """Indica se a família (ou qualquer família, se None) está em aberto"""
+        with self._lock:
+            if family is None:
+                breakers = list(self._breakers.values())
+            else:
+                breakers = [self._breakers[family]] if family in self._breakers else []
+        return any(breaker.state == STATE_OPEN for breaker in breakers)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Retorna o estado de todos os breakers"""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {family: breaker.get_stats() for family, breaker in breakers.items()}
+
+
+# Registro global compartilhado por todas as chamadas ao GLPI
+glpi_circuit_breakers = CircuitBreakerRegistry(
+    failure_threshold=API_CONFIG.get("CIRCUIT_FAILURE_THRESHOLD", 5),
+    recovery_timeout=API_CONFIG.get("CIRCUIT_RECOVERY_TIMEOUT", 30),
+)
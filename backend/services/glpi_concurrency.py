@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""Limitador de concorrência adaptativo (AIMD) para chamadas ao GLPI.
+
+Todas as requisições ao GLPI passam por um único limitador global, independente
+de quantos ``ThreadPoolExecutor`` estejam ativos. O limite cresce de forma
+aditiva enquanto a latência está saudável e cai de forma multiplicativa em
+respostas 5xx e timeouts.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, Optional, Tuple
+
+from config.performance import CONCURRENCY_CONFIG
+
+
+class ConcurrencyLimitExceeded(Exception):
+    """Levantada quando não foi possível obter uma vaga no limitador a tempo"""
+
+
+def _wake_waiter(waiter: "asyncio.Future") -> None:
+    """Acorda uma corrotina à espera de vaga (executado no loop dela)"""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limitador AIMD (additive increase / multiplicative decrease).
+
+    O limite atual é um valor fracionário: cada resposta rápida soma
+    ``1 / limite`` (aproximadamente +1 por "janela" de requisições) e cada
+    sinal de sobrecarga multiplica o limite por ``backoff_ratio``. Reduções
+    consecutivas são espaçadas por ``decrease_cooldown`` para que uma rajada de
+    falhas simultâneas conte como um único evento de congestionamento.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        latency_threshold: float = 2.0,
+        backoff_ratio: float = 0.5,
+        decrease_cooldown: float = 1.0,
+    ):
+        """Inicializa o limitador
+
+        Args:
+            initial_limit: Limite inicial de requisições simultâneas
+            min_limit: Limite mínimo
+            max_limit: Limite máximo
+            latency_threshold: Latência (segundos) acima da qual o limite não cresce
+            backoff_ratio: Fator multiplicativo aplicado em sobrecarga
+            decrease_cooldown: Intervalo mínimo (segundos) entre reduções
+        """
+        self.min_limit = max(1, int(min_limit))
+        self.max_limit = max(self.min_limit, int(max_limit))
+        self.latency_threshold = latency_threshold
+        self.backoff_ratio = backoff_ratio
+        self.decrease_cooldown = decrease_cooldown
+
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self._in_flight = 0
+        self._waiting = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition(threading.Lock())
+        # Corrotinas à espera de vaga, acordadas junto com as threads
+        self._async_waiters: "Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]" = deque()
+        self.logger = logging.getLogger("glpi_concurrency")
+
+        self._stats = {
+            "acquired": 0,
+            "rejected": 0,
+            "increases": 0,
+            "decreases": 0,
+        }
+
+    @property
+    def limit(self) -> int:
+        """Limite atual (inteiro) de requisições simultâneas"""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Número de requisições em andamento"""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Número de chamadores aguardando uma vaga"""
+        return self._waiting
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Aguarda uma vaga no limitador
+
+        Args:
+            timeout: Tempo máximo de espera em segundos (None = sem limite)
+
+        Returns:
+            True se a vaga foi obtida, False se o tempo esgotou
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._condition:
+            self._waiting += 1
+            try:
+                while self._in_flight >= int(self._limit):
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        self._stats["rejected"] += 1
+                        return False
+                    self._condition.wait(remaining)
+
+                self._in_flight += 1
+                self._stats["acquired"] += 1
+                return True
+            finally:
+                self._waiting -= 1
+
+    def try_acquire(self) -> bool:
+        """Obtém uma vaga sem esperar
+
+        Returns:
+            True se havia vaga livre, False caso contrário
+        """
+        with self._condition:
+            if self._in_flight >= int(self._limit):
+                return False
+            self._in_flight += 1
+            self._stats["acquired"] += 1
+            return True
+
+    def _notify(self, count: int = 1) -> None:
+        """Acorda até ``count`` threads e ``count`` corrotinas em espera (com o lock obtido)"""
+        self._condition.notify(count)
+        woken = 0
+        while woken < count and self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(_wake_waiter, waiter)
+            except RuntimeError:
+                # Loop já fechado: a corrotina não vai mais usar a vaga
+                continue
+            woken += 1
+
+    def release(self) -> None:
+        """Libera uma vaga previamente obtida"""
+        with self._condition:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._notify()
+
+    def on_success(self, latency: float) -> None:
+        """Registra uma resposta saudável e, se rápida, aumenta o limite
+
+        Args:
+            latency: Duração da requisição em segundos
+        """
+        if latency > self.latency_threshold:
+            return
+
+        with self._condition:
+            if self._limit >= self.max_limit:
+                return
+
+            previous = int(self._limit)
+            self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+
+            if int(self._limit) > previous:
+                self._stats["increases"] += 1
+                # Novas vagas disponíveis: acordar chamadores em espera
+                self._notify(int(self._limit) - previous)
+
+    def on_overload(self, reason: str = "") -> None:
+        """Registra um sinal de sobrecarga (5xx ou timeout) e reduz o limite
+
+        Args:
+            reason: Descrição do sinal, usada apenas em log
+        """
+        now = time.monotonic()
+
+        with self._condition:
+            if now - self._last_decrease < self.decrease_cooldown:
+                return
+
+            previous = self._limit
+            self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+            self._last_decrease = now
+            self._stats["decreases"] += 1
+
+        self.logger.warning(
+            "Limite de concorrência GLPI reduzido de %d para %d (%s)",
+            int(previous),
+            int(self._limit),
+            reason or "sobrecarga",
+        )
+
+    @contextmanager
+    def slot(self, timeout: Optional[float] = None) -> Iterator[None]:
+        """Context manager que obtém e libera uma vaga
+
+        Raises:
+            ConcurrencyLimitExceeded: Se não houver vaga dentro do timeout
+        """
+        if not self.acquire(timeout):
+            raise ConcurrencyLimitExceeded(
+                f"Nenhuma vaga disponível em {timeout}s "
+                f"(limite={self.limit}, fila={self.queue_depth})"
+            )
+        try:
+            yield
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def async_slot(self, timeout: Optional[float] = None) -> AsyncIterator[None]:
+        """Equivalente de ``slot`` para corrotinas
+
+        A vaga vem do mesmo limite compartilhado com as threads. Sem vaga livre, a
+        corrotina espera num future do seu event loop, resolvido por ``release()``
+        (via ``call_soon_threadsafe``) sem bloquear o loop.
+
+        Raises:
+            ConcurrencyLimitExceeded: Se não houver vaga dentro do timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        woken = False
+        with self._condition:
+            self._waiting += 1
+        try:
+            while True:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                with self._condition:
+                    if self._in_flight < int(self._limit):
+                        self._in_flight += 1
+                        self._stats["acquired"] += 1
+                        break
+                    if remaining is not None and remaining <= 0:
+                        self._stats["rejected"] += 1
+                        if woken:
+                            # Repassa o aviso que não foi usado
+                            self._notify()
+                        raise ConcurrencyLimitExceeded(
+                            f"Nenhuma vaga disponível em {timeout}s "
+                            f"(limite={self.limit}, fila={self._waiting})"
+                        )
+                    waiter = loop.create_future()
+                    # Quem foi acordado e perdeu a vaga volta para o início da fila
+                    if woken:
+                        self._async_waiters.appendleft((loop, waiter))
+                    else:
+                        self._async_waiters.append((loop, waiter))
+
+                try:
+                    await asyncio.wait_for(waiter, remaining)
+                    woken = True
+                except asyncio.TimeoutError:
+                    woken = self._discard_waiter(loop, waiter)
+                except BaseException:
+                    if self._discard_waiter(loop, waiter):
+                        with self._condition:
+                            self._notify()
+                    raise
+        finally:
+            with self._condition:
+                self._waiting -= 1
+
+        try:
+            yield
+        finally:
+            self.release()
+
+    def _discard_waiter(self, loop: asyncio.AbstractEventLoop, waiter: "asyncio.Future") -> bool:
+        """Tira da fila uma espera abandonada
+
+        Returns:
+            True se ``release()`` já tinha acordado essa espera
+        """
+        with self._condition:
+            try:
+                self._async_waiters.remove((loop, waiter))
+            except ValueError:
+                return True
+            return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna o estado atual do limitador
+
+        Returns:
+            Dict com limite, requisições em andamento, fila e contadores
+        """
+        with self._condition:
+            return {
+                "limit": int(self._limit),
+                "min_limit": self.min_limit,
+                "max_limit": self.max_limit,
+                "in_flight": self._in_flight,
+                "queue_depth": self._waiting,
+                **self._stats,
+            }
+
+
+# Instância global compartilhada por todas as chamadas ao GLPI
+glpi_concurrency_limiter = AdaptiveConcurrencyLimiter(
+    initial_limit=CONCURRENCY_CONFIG.get("ADAPTIVE_INITIAL_LIMIT", 4),
+    min_limit=CONCURRENCY_CONFIG.get("ADAPTIVE_MIN_LIMIT", 1),
+    max_limit=CONCURRENCY_CONFIG.get("ADAPTIVE_MAX_LIMIT", 16),
+    latency_threshold=CONCURRENCY_CONFIG.get("ADAPTIVE_LATENCY_THRESHOLD", 2.0),
+    backoff_ratio=CONCURRENCY_CONFIG.get("ADAPTIVE_BACKOFF_RATIO", 0.5),
+    decrease_cooldown=CONCURRENCY_CONFIG.get("ADAPTIVE_DECREASE_COOLDOWN", 1.0),
+)
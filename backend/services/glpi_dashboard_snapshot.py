@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""Seções do dashboard calculadas juntas para ``/api/dashboard``.
+
+Uma requisição no lugar de ``/api/metrics``, ``/api/technicians/ranking`` e
+``/api/tickets/recent``:
+
+- os filtros são normalizados uma vez (``StreamTopic``, o mesmo tópico do
+  stream SSE);
+- seções que o ``DashboardStream`` já mantém atualizadas para wallboards com os
+  mesmos filtros saem dele, sem tocar no serviço;
+- as demais autenticam uma única vez e são calculadas em paralelo pelos mesmos
+  métodos (e caches de serviço) das rotas REST.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from utils.deadline import budget_for_endpoint, start_deadline
+from utils.executor_service import executor_service
+
+from .glpi_dashboard_stream import SECTION_ENDPOINTS, SECTIONS, DashboardStream, StreamTopic, metrics_section_data
+from .glpi_retry import start_retry_budget
+
+if TYPE_CHECKING:
+    from .glpi_service import GLPIService
+
+logger = logging.getLogger("glpi_dashboard_snapshot")
+
+
+def parse_sections(value: Optional[str]) -> Tuple[str, ...]:
+    """Seções pedidas em ``sections=metrics,ranking`` (todas se vazio), na ordem de ``SECTIONS``
+
+    Raises:
+        ValueError: Nome de seção desconhecido
+    """
+    if not value:
+        return SECTIONS
+    requested = {name.strip().lower() for name in value.split(",") if name.strip()}
+    unknown = requested.difference(SECTIONS)
+    if unknown:
+        raise ValueError(f"Seções inválidas: {', '.join(sorted(unknown))} (válidas: {', '.join(SECTIONS)})")
+    return tuple(section for section in SECTIONS if section in requested) or SECTIONS
+
+
+class DashboardSnapshot:
+    """Calcula as seções pedidas de uma vez, reaproveitando o estado do stream SSE"""
+
+    def __init__(self, service: "GLPIService", stream: DashboardStream):
+        self.service = service
+        self.stream = stream
+        self._lock = threading.Lock()
+        self._counters = {"requests": 0, "stream_hits": 0, "computed": 0, "failed": 0}
+
+    def _from_stream(self, topic: StreamTopic, sections: Iterable[str]) -> Tuple[Dict[str, Any], List[str]]:
+        results: Dict[str, Any] = {}
+        missing: List[str] = []
+        for section in sections:
+            data = self.stream.latest(topic, section)
+            if data is not None:
+                results[section] = data
+            else:
+                missing.append(section)
+        return results, missing
+
+    def _record(self, results: Dict[str, Any], computed: Iterable[str]) -> None:
+        computed = list(computed)
+        with self._lock:
+            self._counters["requests"] += 1
+            self._counters["stream_hits"] += len(results) - len(computed)
+            self._counters["computed"] += len(computed)
+            self._counters["failed"] += sum(1 for section in computed if results.get(section) is None)
+
+    def collect(self, topic: StreamTopic, sections: Iterable[str] = SECTIONS) -> Dict[str, Any]:
+        """Dados de cada seção pedida (``None`` nas que falharam)"""
+        sections = tuple(sections)
+        results, missing = self._from_stream(topic, sections)
+        if missing:
+            # Uma autenticação para todas as seções, antes do fan-out
+            if not self.service._ensure_authenticated():
+                logger.error("Falha na autenticação com o GLPI ao montar o dashboard")
+                results.update({section: None for section in missing})
+            else:
+                futures = {
+                    section: executor_service.submit("aggregations", self.stream.fetch_section, section, topic)
+                    for section in missing
+                }
+                for section, future in futures.items():
+                    try:
+                        results[section] = future.result()
+                    except Exception as e:
+                        logger.warning("Erro ao calcular a seção %s do dashboard: %s", section, e)
+                        results[section] = None
+        self._record(results, missing)
+        return {section: results[section] for section in sections}
+
+    async def _fetch_async(self, section: str, topic: StreamTopic) -> Any:
+        """Seção pelo ``AsyncGLPIClient`` quando há versão assíncrona (sem filtro de data)"""
+        if topic.start_date or topic.end_date or self.service.async_client is None:
+            return await asyncio.to_thread(self.stream.fetch_section, section, topic)
+
+        endpoint = SECTION_ENDPOINTS[section]
+        start_deadline(budget_for_endpoint(endpoint), f"dashboard.{endpoint}")
+        start_retry_budget()
+        if section == "metrics":
+            return metrics_section_data(await self.service.get_dashboard_metrics_async())
+        if section == "ranking":
+            return await self.service.get_technician_ranking_async(limit=topic.ranking_limit)
+        return await self.service.get_new_tickets_async(topic.tickets_limit)
+
+    async def collect_async(self, topic: StreamTopic, sections: Iterable[str] = SECTIONS) -> Dict[str, Any]:
+        """Versão assíncrona de ``collect`` (rotas ASGI)"""
+        sections = tuple(sections)
+        results, missing = self._from_stream(topic, sections)
+        if missing:
+            if not await asyncio.to_thread(self.service._ensure_authenticated):
+                logger.error("Falha na autenticação com o GLPI ao montar o dashboard")
+                results.update({section: None for section in missing})
+            else:
+                values = await asyncio.gather(
+                    *(self._fetch_async(section, topic) for section in missing), return_exceptions=True
+                )
+                for section, value in zip(missing, values):
+                    if isinstance(value, BaseException):
+                        logger.warning("Erro ao calcular a seção %s do dashboard: %s", section, value)
+                        value = None
+                    results[section] = value
+        self._record(results, missing)
+        return {section: results[section] for section in sections}
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._counters)
+
+
+def create_dashboard_snapshot(service: "GLPIService", stream: DashboardStream) -> DashboardSnapshot:
+    """Montagem do ``/api/dashboard`` sobre o serviço e o hub SSE do processo"""
+    return DashboardSnapshot(service, stream)
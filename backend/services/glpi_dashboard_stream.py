@@ -0,0 +1,489 @@
+# -*- coding: utf-8 -*-
+"""Atualizações do dashboard enviadas pelo servidor (Server-Sent Events).
+
+Em vez de cada aba aberta repetir ``/api/metrics``, ``/api/technicians/ranking``
+e ``/api/tickets/recent`` no próprio timer, os clientes assinam
+``/api/stream/dashboard`` e uma única thread de segundo plano por processo:
+
+- recalcula cada seção (``metrics``, ``ranking``, ``tickets``) uma vez por
+  combinação de filtros com assinantes, no intervalo de
+  ``STREAM_CONFIG["SECTION_INTERVALS"]``;
+- compara o conteúdo com o último enviado (sem campos voláteis como
+  ``timestamp``) e só difunde as seções que mudaram;
+- serializa cada evento uma vez e entrega os mesmos bytes a todos os
+  assinantes.
+
+Assim as chamadas ao GLPI acompanham a frequência de mudança dos dados, não o
+número de wallboards. Um assinante novo recebe de imediato o último estado
+conhecido das seções. Clientes lentos demais (``MAX_PENDING_EVENTS``) são
+desconectados e, ao reconectar, recebem o estado completo de novo.
+"""
+
+import asyncio
+import json
+import logging
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, List, Mapping, NamedTuple, Optional, Set
+
+from config.performance import STREAM_CONFIG
+from utils.conditional_response import fingerprint
+from utils.deadline import budget_for_endpoint, start_deadline
+
+from .glpi_retry import start_retry_budget
+
+if TYPE_CHECKING:
+    from .glpi_service import GLPIService
+
+logger = logging.getLogger("glpi_dashboard_stream")
+
+SECTIONS = ("metrics", "ranking", "tickets")
+
+# Endpoint REST equivalente de cada seção (prazo de ENDPOINT_DEADLINES)
+SECTION_ENDPOINTS = {
+    "metrics": "get_metrics",
+    "ranking": "get_technician_ranking",
+    "tickets": "get_new_tickets",
+}
+
+KEEPALIVE_CHUNK = b": keepalive\n\n"
+
+
+class StreamLimitExceeded(Exception):
+    """Limite de conexões simultâneas (``MAX_SUBSCRIBERS``) atingido"""
+
+
+class StreamTopic(NamedTuple):
+    """Combinação de filtros de uma assinatura"""
+
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    filter_type: str = "creation"
+    ranking_limit: int = 50
+    tickets_limit: int = 8
+
+
+def _bounded_int(value: Any, default: int, maximum: int) -> int:
+    try:
+        return max(1, min(int(value), maximum))
+    except (TypeError, ValueError):
+        return default
+
+
+def topic_from_args(args: Mapping[str, str]) -> StreamTopic:
+    """Tópico a partir da query string (``start_date``, ``end_date``, ``filter_type``,
+    ``ranking_limit``, ``tickets_limit``)"""
+    filter_type = args.get("filter_type") or "creation"
+    return StreamTopic(
+        start_date=args.get("start_date") or None,
+        end_date=args.get("end_date") or None,
+        filter_type=filter_type if filter_type in ("creation", "modification") else "creation",
+        ranking_limit=_bounded_int(args.get("ranking_limit"), 50, 200),
+        tickets_limit=_bounded_int(args.get("tickets_limit"), 8, 50),
+    )
+
+
+def metrics_section_data(result: Any) -> Optional[Dict[str, Any]]:
+    """``data`` da resposta de métricas do serviço, ou None se ela indica falha"""
+    if not isinstance(result, dict) or result.get("success") is False or "data" not in result:
+        return None
+    return result["data"]
+
+
+def format_event(event_id: int, section: str, data: Any) -> bytes:
+    """Evento SSE pronto para envio (serializado uma vez para todos os assinantes)"""
+    payload = json.dumps(
+        {"success": True, "data": data, "updated_at": datetime.now(tz=timezone.utc).isoformat()},
+        ensure_ascii=False,
+        default=str,
+        separators=(",", ":"),
+    )
+    return f"id: {event_id}\nevent: {section}\ndata: {payload}\n\n".encode("utf-8")
+
+
+class Subscription(ABC):
+    """Fila de eventos de um cliente conectado"""
+
+    def __init__(self, max_pending: int):
+        self.max_pending = max_pending
+        self.overflowed = False
+        self.topic: Optional[StreamTopic] = None
+
+    @abstractmethod
+    def push(self, chunk: Optional[bytes]) -> None:
+        """Enfileira um evento (``None`` encerra o stream); chamado pela thread do hub"""
+
+    def _overflow(self) -> None:
+        self.overflowed = True
+
+
+class ThreadSubscription(Subscription):
+    """Assinatura consumida por uma thread (rota Flask)"""
+
+    def __init__(self, max_pending: int):
+        super().__init__(max_pending)
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue()
+
+    def push(self, chunk: Optional[bytes]) -> None:
+        if self.overflowed:
+            return
+        if chunk is not None and self._queue.qsize() >= self.max_pending:
+            self._overflow()
+            chunk = None
+        self._queue.put(chunk)
+
+    def events(self, keepalive: float) -> Iterator[bytes]:
+        while True:
+            try:
+                chunk = self._queue.get(timeout=keepalive)
+            except queue.Empty:
+                yield KEEPALIVE_CHUNK
+                continue
+            if chunk is None:
+                return
+            yield chunk
+
+
+class AsyncSubscription(Subscription):
+    """Assinatura consumida no event loop (rota Starlette)"""
+
+    def __init__(self, max_pending: int, loop: asyncio.AbstractEventLoop):
+        super().__init__(max_pending)
+        self._loop = loop
+        self._queue: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue()
+
+    def push(self, chunk: Optional[bytes]) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._put, chunk)
+        except RuntimeError:
+            # Event loop já encerrado: o cliente foi embora
+            pass
+
+    def _put(self, chunk: Optional[bytes]) -> None:
+        if self.overflowed:
+            return
+        if chunk is not None and self._queue.qsize() >= self.max_pending:
+            self._overflow()
+            chunk = None
+        self._queue.put_nowait(chunk)
+
+    async def events(self, keepalive: float) -> AsyncIterator[bytes]:
+        while True:
+            try:
+                chunk = await asyncio.wait_for(self._queue.get(), keepalive)
+            except asyncio.TimeoutError:
+                yield KEEPALIVE_CHUNK
+                continue
+            if chunk is None:
+                return
+            yield chunk
+
+
+class _TopicState:
+    def __init__(self, topic: StreamTopic):
+        self.topic = topic
+        self.subscribers: Set[Subscription] = set()
+        # Seção -> (fingerprint, evento já serializado, dados) do último envio
+        self.sections: Dict[str, tuple] = {}
+        # Seção -> instante (monotonic) do último cálculo bem-sucedido, mesmo sem mudança
+        self.refreshed_at: Dict[str, float] = {}
+        self.next_due: Dict[str, float] = {section: 0.0 for section in SECTIONS}
+        self.idle_since: Optional[float] = None
+
+
+class DashboardStream:
+    """Hub das assinaturas SSE e thread única de recálculo das seções"""
+
+    def __init__(
+        self,
+        service: "GLPIService",
+        section_intervals: Optional[Mapping[str, float]] = None,
+        max_subscribers: int = 500,
+        max_pending: int = 32,
+        keepalive: float = 15,
+        retry_ms: int = 5000,
+        topic_idle_ttl: float = 120,
+    ):
+        """Inicializa o hub (a thread só sobe com o primeiro assinante)
+
+        Args:
+            service: Serviço usado nos cálculos (os mesmos métodos das rotas REST)
+            section_intervals: Intervalo de recálculo por seção (segundos)
+            max_subscribers: Conexões simultâneas aceitas
+            max_pending: Eventos acumulados por cliente antes de desconectá-lo
+            keepalive: Intervalo dos comentários enviados a conexões ociosas
+            retry_ms: ``retry:`` sugerido ao EventSource
+            topic_idle_ttl: Tempo que um tópico sem assinantes mantém o último estado
+        """
+        self.service = service
+        intervals = dict(STREAM_CONFIG.get("SECTION_INTERVALS", {}))
+        intervals.update(section_intervals or {})
+        self.section_intervals = {section: max(1.0, float(intervals.get(section, 60))) for section in SECTIONS}
+        self.max_subscribers = max_subscribers
+        self.max_pending = max_pending
+        self.keepalive = keepalive
+        self.retry_ms = retry_ms
+        self.topic_idle_ttl = topic_idle_ttl
+
+        self._lock = threading.Lock()
+        self._topics: Dict[StreamTopic, _TopicState] = {}
+        self._subscribers = 0
+        self._event_id = 0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._counters = {
+            "refreshes": 0,
+            "broadcasts": 0,
+            "unchanged": 0,
+            "failed": 0,
+            "events_delivered": 0,
+            "slow_clients_dropped": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Assinaturas
+    # ------------------------------------------------------------------
+
+    def subscribe(self, topic: StreamTopic, subscription: Subscription) -> Subscription:
+        """Registra o assinante e enfileira o último estado conhecido das seções
+
+        Raises:
+            StreamLimitExceeded: ``max_subscribers`` conexões já abertas
+        """
+        with self._lock:
+            if self._subscribers >= self.max_subscribers:
+                raise StreamLimitExceeded(f"{self._subscribers} conexões abertas")
+            state = self._topics.get(topic)
+            if state is None:
+                state = _TopicState(topic)
+                self._topics[topic] = state
+            state.subscribers.add(subscription)
+            state.idle_since = None
+            subscription.topic = topic
+            self._subscribers += 1
+            snapshot = [event for _, event, _ in state.sections.values()]
+
+        subscription.push(f"retry: {self.retry_ms}\n\n".encode("ascii"))
+        for event in snapshot:
+            subscription.push(event)
+        if len(snapshot) < len(SECTIONS):
+            # Tópico novo (ou ainda sem todas as seções): calcular já
+            self._wake.set()
+        self.start()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            state = self._topics.get(subscription.topic)
+            if state is None or subscription not in state.subscribers:
+                return
+            state.subscribers.discard(subscription)
+            self._subscribers -= 1
+            if subscription.overflowed:
+                self._counters["slow_clients_dropped"] += 1
+            if not state.subscribers:
+                state.idle_since = time.monotonic()
+
+    # ------------------------------------------------------------------
+    # Recálculo
+    # ------------------------------------------------------------------
+
+    def fetch_section(self, section: str, topic: StreamTopic) -> Any:
+        """Dados da seção (``None`` em caso de falha), pelos mesmos métodos das rotas REST
+
+        Usa o prazo e o orçamento de retry do endpoint REST da seção no contexto atual.
+        """
+        endpoint = SECTION_ENDPOINTS[section]
+        start_deadline(budget_for_endpoint(endpoint), f"stream.{endpoint}")
+        start_retry_budget()
+
+        if section == "metrics":
+            if topic.start_date or topic.end_date:
+                if topic.filter_type == "modification":
+                    method = self.service.get_dashboard_metrics_with_modification_date_filter
+                else:
+                    method = self.service.get_dashboard_metrics_with_date_filter
+                result = method(start_date=topic.start_date, end_date=topic.end_date)
+            else:
+                result = self.service.get_dashboard_metrics()
+            return metrics_section_data(result)
+
+        if section == "ranking":
+            if topic.start_date or topic.end_date:
+                return self.service.get_technician_ranking_with_filters(
+                    start_date=topic.start_date, end_date=topic.end_date, limit=topic.ranking_limit
+                )
+            return self.service.get_technician_ranking(limit=topic.ranking_limit)
+
+        return self.service.get_new_tickets(limit=topic.tickets_limit)
+
+    def refresh_topic(self, topic: StreamTopic, section: str) -> bool:
+        """Recalcula uma seção do tópico e difunde se mudou
+
+        Returns:
+            True se um evento foi enviado aos assinantes
+        """
+        try:
+            data = self.fetch_section(section, topic)
+        except Exception as e:
+            logger.warning("Erro ao atualizar a seção %s do stream %s: %s", section, topic, e)
+            data = None
+
+        with self._lock:
+            self._counters["refreshes"] += 1
+            state = self._topics.get(topic)
+            if state is None:
+                return False
+            if data is None:
+                # Mantém o último estado; nova tentativa no próximo intervalo
+                self._counters["failed"] += 1
+                return False
+
+            state.refreshed_at[section] = time.monotonic()
+            digest = fingerprint(data)
+            previous = state.sections.get(section)
+            if previous is not None and previous[0] == digest:
+                self._counters["unchanged"] += 1
+                return False
+
+            self._event_id += 1
+            event = format_event(self._event_id, section, data)
+            state.sections[section] = (digest, event, data)
+            subscribers = list(state.subscribers)
+            self._counters["broadcasts"] += 1
+            self._counters["events_delivered"] += len(subscribers)
+
+        for subscription in subscribers:
+            subscription.push(event)
+            if subscription.overflowed:
+                self.unsubscribe(subscription)
+        return True
+
+    def latest(self, topic: StreamTopic, section: str) -> Optional[Any]:
+        """Últimos dados da seção de um tópico com assinantes, se calculados dentro do intervalo
+
+        Permite que ``/api/dashboard`` reaproveite o que o hub já mantém atualizado
+        para os wallboards conectados com os mesmos filtros.
+        """
+        with self._lock:
+            state = self._topics.get(topic)
+            if state is None or not state.subscribers or section not in state.sections:
+                return None
+            refreshed_at = state.refreshed_at.get(section)
+            if refreshed_at is None or time.monotonic() - refreshed_at > self.section_intervals[section]:
+                return None
+            return state.sections[section][2]
+
+    def run_once(self, now: Optional[float] = None) -> float:
+        """Recalcula as seções vencidas de todos os tópicos com assinantes
+
+        Returns:
+            Segundos até a próxima seção vencer
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            for topic, state in list(self._topics.items()):
+                if state.idle_since is not None and now - state.idle_since >= self.topic_idle_ttl:
+                    del self._topics[topic]
+            due = [
+                (state.topic, section)
+                for state in self._topics.values()
+                if state.subscribers
+                for section, next_due in state.next_due.items()
+                if next_due <= now
+            ]
+
+        for topic, section in due:
+            if self._stop.is_set():
+                break
+            self.refresh_topic(topic, section)
+            with self._lock:
+                state = self._topics.get(topic)
+                if state is not None:
+                    state.next_due[section] = time.monotonic() + self.section_intervals[section]
+
+        with self._lock:
+            pending = [
+                next_due
+                for state in self._topics.values()
+                if state.subscribers
+                for next_due in state.next_due.values()
+            ]
+        if not pending:
+            return self.keepalive
+        return max(0.0, min(pending) - time.monotonic())
+
+    # ------------------------------------------------------------------
+    # Segundo plano
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Inicia a thread de recálculo (uma por processo; idempotente)"""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="glpi-dashboard-stream", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Interrompe a thread e encerra os streams abertos"""
+        self._stop.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        self._thread = None
+        with self._lock:
+            subscribers = [sub for state in self._topics.values() for sub in state.subscribers]
+        for subscription in subscribers:
+            subscription.push(None)
+            self.unsubscribe(subscription)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                wait = self.run_once()
+            except Exception as e:
+                logger.warning("Erro no laço de atualização do stream do dashboard: %s", e)
+                wait = self.keepalive
+            self._wake.wait(wait)
+            self._wake.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Tópicos, assinantes e contadores de recálculo/difusão"""
+        with self._lock:
+            topics: List[Dict[str, Any]] = [
+                {
+                    "filters": state.topic._asdict(),
+                    "subscribers": len(state.subscribers),
+                    "sections": sorted(state.sections),
+                }
+                for state in self._topics.values()
+            ]
+            return {
+                "background": self._thread is not None and self._thread.is_alive(),
+                "subscribers": self._subscribers,
+                "max_subscribers": self.max_subscribers,
+                "section_intervals": dict(self.section_intervals),
+                "topics": topics,
+                **self._counters,
+            }
+
+
+def create_dashboard_stream(service: "GLPIService") -> DashboardStream:
+    """Hub de streams configurado por ``STREAM_CONFIG``"""
+    return DashboardStream(
+        service,
+        max_subscribers=STREAM_CONFIG.get("MAX_SUBSCRIBERS", 500),
+        max_pending=STREAM_CONFIG.get("MAX_PENDING_EVENTS", 32),
+        keepalive=STREAM_CONFIG.get("KEEPALIVE_INTERVAL", 15),
+        retry_ms=STREAM_CONFIG.get("RETRY_MS", 5000),
+        topic_idle_ttl=STREAM_CONFIG.get("TOPIC_IDLE_TTL", 120),
+    )
@@ -5,7 +5,11 @@ to improve code maintainability and reduce cyclomatic complexity.
 """
 
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+from utils.deadline import deadline_exceeded, deadline_expired
+
+from .glpi_queries import with_range
 
 if TYPE_CHECKING:
     from .glpi_service import GLPIService
@@ -23,98 +27,6 @@ class GLPIServiceHelpers:
         self.glpi_service = glpi_service
         self.logger = glpi_service.logger
 
-    def get_technician_ids_from_tickets(
-        self, entity_id: Optional[int] = None, days_back: int = 90
-    ) -> Set[str]:
-        """Extract technician IDs from tickets assigned in recent days.
-
-        Args:
-            entity_id: Entity ID to filter tickets (optional)
-            days_back: Number of days to look back for tickets (default: 90)
-
-        Returns:
-            Set of technician IDs found in tickets
-        """
-        print(f"DEBUG: get_technician_ids_from_tickets CHAMADO com entity_id={entity_id}")
-        start_date = datetime.now() - timedelta(days=days_back)
-        ticket_params = self._build_ticket_search_params(start_date, entity_id)
-
-        print(
-            f"DEBUG: GLPIServiceHelpers fazendo requisição para: {self.glpi_service.glpi_url}/search/Ticket"
-        )
-        print(f"DEBUG: Parâmetros: {ticket_params}")
-        response = self.glpi_service._make_authenticated_request(
-            "GET",
-            f"{self.glpi_service.glpi_url}/search/Ticket",
-            params=ticket_params,
-        )
-        print(f"DEBUG: Resposta recebida: {response}")
-        print(f"DEBUG: Tipo da resposta: {type(response)}")
-
-        if not response or not response.ok:
-            self.logger.error(
-                f"Failed to fetch tickets - Status: {response.status_code if response else 'None'}"
-            )
-            return set()
-
-        ticket_result = response.json()
-        ticket_data = ticket_result.get("data", [])
-
-        return self._extract_technician_ids_from_response(ticket_data)
-
-    def _build_ticket_search_params(
-        self, start_date: datetime, entity_id: Optional[int]
-    ) -> Dict[str, str]:
-        """Build search parameters for ticket query.
-
-        Args:
-            start_date: Start date for ticket search
-            entity_id: Entity ID filter (optional)
-
-        Returns:
-            Dictionary of search parameters
-        """
-        params = {
-            "range": "0-5000",  # CORREÇÃO: Aumentado de 500 para 5000 para capturar mais tickets
-            "criteria[0][field]": "15",  # date
-            "criteria[0][searchtype]": "morethan",
-            "criteria[0][value]": start_date.strftime("%Y-%m-%d"),
-            "forcedisplay[0]": "2",  # id
-            "forcedisplay[1]": "5",  # users_id_tech
-            "forcedisplay[2]": "15",  # date
-        }
-
-        if entity_id is not None:
-            params.update(
-                {
-                    "criteria[1][field]": "80",  # entities_id
-                    "criteria[1][searchtype]": "equals",
-                    "criteria[1][value]": str(entity_id),
-                    "criteria[1][link]": "AND",
-                }
-            )
-
-        return params
-
-    def _extract_technician_ids_from_response(self, ticket_data: List[Dict]) -> Set[str]:
-        """Extract unique technician IDs from ticket response data.
-
-        Args:
-            ticket_data: List of ticket data from API response
-
-        Returns:
-            Set of unique technician IDs
-        """
-        tech_ids_set = set()
-
-        for ticket in ticket_data:
-            if isinstance(ticket, dict) and "5" in ticket:
-                tech_id = self.glpi_service._parse_technician_id(ticket["5"])
-                if tech_id and tech_id != "0":
-                    tech_ids_set.add(tech_id)
-
-        return tech_ids_set
-
     def parse_technician_id(self, tech_field) -> Optional[str]:
         """Parse technician ID from various field formats.
 
@@ -325,7 +237,6 @@ class GLPIServiceHelpers:
             ticket_counts = {tech_id: 0 for tech_id in tech_ids}
             page_size = 1000
             start_index = 0
-            max_retries = 3
             total_processed = 0
 
             self.glpi_service.logger.info(
@@ -333,10 +244,12 @@ class GLPIServiceHelpers:
             )
 
             while True:
+                # Prazo esgotado: devolver as contagens parciais já obtidas
+                if deadline_expired("paginação por técnico"):
+                    break
+
                 # Buscar página atual
-                page_data, page_items = self._fetch_page_with_retry(
-                    search_params, start_index, page_size, max_retries
-                )
+                page_data, page_items = self._fetch_page(search_params, start_index, page_size)
 
                 if not page_data:
                     break
@@ -382,67 +295,45 @@ class GLPIServiceHelpers:
             self.glpi_service.logger.error(f"Erro na paginação robusta: {e}")
             return {tech_id: 0 for tech_id in tech_ids}
 
-    def _fetch_page_with_retry(
+    def _fetch_page(
         self,
         search_params: Dict[str, str],
         start_index: int,
         page_size: int,
-        max_retries: int,
     ) -> Tuple[Optional[Dict], int]:
-        """Busca uma página com retry e backoff exponencial"""
-        import time
+        """Busca uma página de resultados.
 
+        As tentativas ficam a cargo de ``_make_authenticated_request``; uma falha
+        aqui já esgotou a política de retry e interrompe a paginação.
+        """
         end_index = start_index + page_size - 1
-        current_params = search_params.copy()
-        current_params["range"] = f"{start_index}-{end_index}"
+        current_params = with_range(search_params, start_index, page_size)
 
-        retry_count = 0
+        url = f"{self.glpi_service.glpi_url}/search/Ticket"
+        response = self.glpi_service._make_authenticated_request("GET", url, params=current_params)
 
-        while retry_count < max_retries:
-            try:
-                url = f"{self.glpi_service.glpi_url}/search/Ticket"
-                response = self.glpi_service._make_authenticated_request(
-                    "GET", url, params=current_params
-                )
+        if not response and deadline_exceeded():
+            return None, 0
 
-                if not response or not response.ok:
-                    raise Exception(
-                        f"Falha na requisição: "
-                        f"{response.status_code if response else 'No response'}"
-                    )
-
-                page_data = response.json()
-
-                # Log informações de paginação
-                self._log_pagination_info(response, start_index, end_index)
+        if not response or not response.ok:
+            raise Exception(
+                f"Falha na requisição da página {start_index}-{end_index}: "
+                f"{response.status_code if response else 'No response'}"
+            )
 
-                # Verificar se há dados
-                if not page_data or "data" not in page_data or not page_data["data"]:
-                    self.glpi_service.logger.info(
-                        f"Página {start_index}-{end_index} vazia ou sem dados. "
-                        "Finalizando paginação."
-                    )
-                    return None, 0
+        page_data = response.json()
 
-                return page_data, len(page_data["data"])
+        # Log informações de paginação
+        self._log_pagination_info(response, start_index, end_index)
 
-            except Exception as e:
-                retry_count += 1
-                if retry_count < max_retries:
-                    wait_time = 2**retry_count  # Backoff exponencial
-                    self.glpi_service.logger.warning(
-                        f"Erro na página {start_index}-{end_index}, tentativa "
-                        f"{retry_count}/{max_retries}: {e}. Aguardando {wait_time}s..."
-                    )
-                    time.sleep(wait_time)
-                else:
-                    self.glpi_service.logger.error(
-                        f"Falha após {max_retries} tentativas na página "
-                        f"{start_index}-{end_index}: {e}"
-                    )
-                    raise
+        # Verificar se há dados
+        if not page_data or "data" not in page_data or not page_data["data"]:
+            self.glpi_service.logger.info(
+                f"Página {start_index}-{end_index} vazia ou sem dados. Finalizando paginação."
+            )
+            return None, 0
 
-        return None, 0
+        return page_data, len(page_data["data"])
 
     def _log_pagination_info(self, response: Any, start_index: int, end_index: int) -> None:
         """Log informações de paginação do cabeçalho Content-Range"""
@@ -480,150 +371,3 @@ class GLPIServiceHelpers:
                 page_counts[tech_id] += 1
 
         return page_counts
-
-    def get_technician_details_in_batches(
-        self, tech_ids: Set[str], batch_size: int = 50
-    ) -> Tuple[List[str], Dict[str, str]]:
-        """Fetch technician details in batches to avoid API limits.
-
-        Args:
-            tech_ids: Set of technician IDs to fetch
-            batch_size: Number of IDs to process per batch
-
-        Returns:
-            Tuple of (list of valid IDs, dict of ID->name mappings)
-        """
-        tech_ids_list = list(tech_ids)
-        final_tech_ids = []
-        final_tech_names = {}
-
-        for i in range(0, len(tech_ids_list), batch_size):
-            batch = tech_ids_list[i : i + batch_size]
-            batch_ids, batch_names = self._process_technician_batch(batch)
-
-            final_tech_ids.extend(batch_ids)
-            final_tech_names.update(batch_names)
-
-        return final_tech_ids, final_tech_names
-
-    def _process_technician_batch(self, batch_ids: List[str]) -> Tuple[List[str], Dict[str, str]]:
-        """Process a single batch of technician IDs.
-
-        Args:
-            batch_ids: List of technician IDs in this batch
-
-        Returns:
-            Tuple of (valid IDs, ID->name mappings) for this batch
-        """
-        user_params = self._build_user_search_params(batch_ids)
-
-        response = self.glpi_service._make_authenticated_request(
-            "GET",
-            f"{self.glpi_service.glpi_url}/search/User",
-            params=user_params,
-        )
-
-        if not response or not response.ok:
-            self.logger.error(
-                f"Failed to fetch user batch - Status: {response.status_code if response else 'None'}"
-            )
-            return [], {}
-
-        user_result = response.json()
-        user_data = user_result.get("data", [])
-
-        return self._process_user_response(user_data)
-
-    def _build_user_search_params(self, batch_ids: List[str]) -> Dict[str, str]:
-        """Build search parameters for user batch query.
-
-        Args:
-            batch_ids: List of user IDs to search for
-
-        Returns:
-            Dictionary of search parameters
-        """
-        params = {
-            "range": "0-5000",  # CORREÇÃO: Aumentado de 500 para 5000 para capturar mais usuários
-            "forcedisplay[0]": "2",  # ID
-            "forcedisplay[1]": "1",  # Username
-            "forcedisplay[2]": "9",  # Firstname
-            "forcedisplay[3]": "34",  # Realname
-            "forcedisplay[4]": "8",  # is_active
-            "forcedisplay[5]": "23",  # is_deleted
-        }
-
-        # Add OR criteria for each user ID
-        for idx, user_id in enumerate(batch_ids):
-            params[f"criteria[{idx}][field]"] = "2"  # ID field
-            params[f"criteria[{idx}][searchtype]"] = "equals"
-            params[f"criteria[{idx}][value]"] = str(user_id)
-            if idx > 0:
-                params[f"criteria[{idx}][link]"] = "OR"
-
-        return params
-
-    def _process_user_response(
-        self, user_data: List[Dict[str, Any]]
-    ) -> Tuple[List[str], Dict[str, str]]:
-        """Process user response data to extract active technicians.
-
-        Args:
-            user_data: List of user data from API response
-
-        Returns:
-            Tuple of (valid IDs, ID->name mappings)
-        """
-        batch_ids = []
-        batch_names = {}
-
-        for user in user_data:
-            if not isinstance(user, dict):
-                continue
-
-            user_info = self._extract_user_info(user)
-            if not user_info:
-                continue
-
-            user_id, full_name, is_active = user_info
-
-            if self._is_active_user(is_active, user.get("23")):
-                batch_ids.append(user_id)
-                batch_names[user_id] = full_name
-
-        return batch_ids, batch_names
-
-    def _extract_user_info(self, user: Dict[str, Any]) -> Optional[Tuple[str, str, str]]:
-        """Extract user information from user data.
-
-        Args:
-            user: User data dictionary
-
-        Returns:
-            Tuple of (user_id, full_name, is_active) or None if invalid
-        """
-        user_id = user.get("2")
-        if not user_id:
-            return None
-
-        firstname = user.get("9", "").strip()
-        realname = user.get("34", "").strip()
-        is_active = user.get("8", "0")
-
-        # Build full name
-        name_parts = [part for part in [firstname, realname] if part]
-        full_name = " ".join(name_parts) if name_parts else f"User {user_id}"
-
-        return str(user_id), full_name, str(is_active)
-
-    def _is_active_user(self, is_active: str, is_deleted: Optional[str]) -> bool:
-        """Check if user is active and not deleted.
-
-        Args:
-            is_active: User active status
-            is_deleted: User deleted status
-
-        Returns:
-            True if user is active and not deleted
-        """
-        return is_active == "1" and (not is_deleted or is_deleted == "0")
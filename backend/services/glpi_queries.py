@@ -0,0 +1,595 @@
+# -*- coding: utf-8 -*-
+"""Construção de consultas ao GLPI e leitura das respostas.
+
+Funções puras compartilhadas pelo ``GLPIService`` (síncrono) e pelo
+``AsyncGLPIClient``: os dois clientes montam exatamente os mesmos parâmetros e
+interpretam as respostas da mesma forma, mudando apenas o transporte.
+
+``SearchQuery`` compila critérios, ``forcedisplay``, ordenação e ``range`` em
+parâmetros de ``search/<itemtype>``, conhece o tamanho da URL codificada e
+divide listas OR (técnicos, status, tickets) no menor número de requisições
+que cabem no limite de URL do servidor (evitando o 414 URI Too Long).
+"""
+
+import heapq
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+from urllib.parse import urlencode, urlparse
+
+from config.performance import API_CONFIG
+from utils.date_validator import DateValidator
+
+# Status considerados na contagem de tickets por técnico
+RESOLVED_STATUS_IDS = (5, 6)  # Solucionado, Fechado
+PENDING_STATUS_IDS = (2, 3, 4)  # Processando (atribuído/planejado), Pendente
+
+
+class Criterion(NamedTuple):
+    """Critério simples: ``criteria[i][field|searchtype|value]``"""
+
+    field: str
+    value: Any
+    searchtype: str = "equals"
+    link: str = "AND"
+
+
+class CriteriaGroup(NamedTuple):
+    """Critérios entre parênteses: ``criteria[i][criteria][j][...]``"""
+
+    criteria: Tuple[Criterion, ...]
+    link: str = "AND"
+
+
+def _criterion_params(prefix: str, criterion: Criterion, with_link: bool) -> Dict[str, Any]:
+    params = {}
+    if with_link:
+        params[f"{prefix}[link]"] = criterion.link
+    params[f"{prefix}[field]"] = criterion.field
+    params[f"{prefix}[searchtype]"] = criterion.searchtype
+    params[f"{prefix}[value]"] = criterion.value
+    return params
+
+
+class SearchQuery:
+    """Consulta ``search/<itemtype>`` compilada em parâmetros da API REST do GLPI
+
+    Os métodos retornam a própria consulta para encadeamento::
+
+        query = (
+            SearchQuery("Ticket")
+            .where_date_range("15", "2024-01-01", "2024-01-31")
+            .where_any(tech_field, tech_ids)
+            .display(tech_field, "2")
+        )
+        for part in query.split_any(glpi_url):
+            params = part.to_params()
+
+    Args:
+        itemtype: Tipo pesquisado (``Ticket``, ``User``...)
+        is_deleted: Valor de ``is_deleted`` (None omite o parâmetro)
+    """
+
+    def __init__(self, itemtype: str = "Ticket", is_deleted: Optional[int] = 0):
+        self.itemtype = itemtype
+        self.is_deleted = is_deleted
+        self.criteria: List[Union[Criterion, CriteriaGroup]] = []
+        self.forcedisplay: List[str] = []
+        self.sort_field: Optional[str] = None
+        self.sort_order = "ASC"
+        self.range: Optional[Tuple[int, int]] = None
+        self._any_index: Optional[int] = None
+
+    def copy(self) -> "SearchQuery":
+        """Cópia independente da consulta"""
+        query = SearchQuery(self.itemtype, self.is_deleted)
+        query.criteria = list(self.criteria)
+        query.forcedisplay = list(self.forcedisplay)
+        query.sort_field = self.sort_field
+        query.sort_order = self.sort_order
+        query.range = self.range
+        query._any_index = self._any_index
+        return query
+
+    def where(
+        self, field: Any, value: Any, searchtype: str = "equals", link: str = "AND"
+    ) -> "SearchQuery":
+        """Acrescenta um critério simples"""
+        self.criteria.append(Criterion(str(field), value, searchtype, link))
+        return self
+
+    def where_date_range(
+        self, field: Any, start_date: Optional[str], end_date: Optional[str]
+    ) -> "SearchQuery":
+        """Acrescenta o período (``DateValidator``); sem datas não altera a consulta"""
+        if not (start_date or end_date):
+            return self
+        flat = DateValidator.construir_criterios_filtro_data(
+            start_date=start_date, end_date=end_date, field_id=str(field), criteria_start_index=0
+        )
+        index = 0
+        while f"criteria[{index}][field]" in flat:
+            self.criteria.append(
+                Criterion(
+                    flat[f"criteria[{index}][field]"],
+                    flat[f"criteria[{index}][value]"],
+                    flat[f"criteria[{index}][searchtype]"],
+                    "AND",
+                )
+            )
+            index += 1
+        return self
+
+    def where_any(
+        self,
+        field: Any,
+        values: Iterable[Any],
+        searchtype: str = "equals",
+        link: str = "AND",
+        split: bool = True,
+    ) -> "SearchQuery":
+        """Acrescenta ``(field = v1 OR field = v2 ...)`` como um grupo
+
+        Com ``split=True`` esta é a lista que ``split_any`` divide entre
+        requisições; cada consulta aceita uma única lista divisível.
+        """
+        values = list(values)
+        if not values:
+            raise ValueError("where_any requer ao menos um valor")
+        if split:
+            if self._any_index is not None:
+                raise ValueError("SearchQuery aceita apenas uma lista OR divisível (where_any)")
+            self._any_index = len(self.criteria)
+        self.criteria.append(self._any_group(str(field), values, searchtype, link))
+        return self
+
+    @staticmethod
+    def _any_group(field: str, values: Sequence[Any], searchtype: str, link: str) -> CriteriaGroup:
+        return CriteriaGroup(
+            tuple(Criterion(field, value, searchtype, "OR") for value in values), link
+        )
+
+    def display(self, *fields: Any) -> "SearchQuery":
+        """Acrescenta campos a ``forcedisplay``"""
+        self.forcedisplay.extend(str(field) for field in fields)
+        return self
+
+    def sort(self, field: Any, order: str = "ASC") -> "SearchQuery":
+        """Ordenação do resultado"""
+        self.sort_field = str(field)
+        self.sort_order = order.upper()
+        return self
+
+    def rows(self, start_index: int, end_index: int) -> "SearchQuery":
+        """Faixa de linhas (``range=start-end``, inclusivo)"""
+        self.range = (start_index, end_index)
+        return self
+
+    def count(self) -> "SearchQuery":
+        """Apenas o total (``range=0-0``; o total vem em ``Content-Range``)"""
+        return self.rows(0, 0)
+
+    @property
+    def any_values(self) -> List[Any]:
+        """Valores da lista OR divisível (vazio se não houver)"""
+        if self._any_index is None:
+            return []
+        return [criterion.value for criterion in self.criteria[self._any_index].criteria]
+
+    def with_any_values(self, values: Sequence[Any]) -> "SearchQuery":
+        """Cópia com outros valores na lista OR divisível"""
+        if self._any_index is None:
+            raise ValueError("SearchQuery sem lista OR divisível (where_any)")
+        group = self.criteria[self._any_index]
+        first = group.criteria[0]
+        query = self.copy()
+        query.criteria[self._any_index] = self._any_group(
+            first.field, list(values), first.searchtype, group.link
+        )
+        return query
+
+    def to_params(self) -> Dict[str, Any]:
+        """Parâmetros de ``GET search/<itemtype>``"""
+        params: Dict[str, Any] = {}
+        if self.is_deleted is not None:
+            params["is_deleted"] = self.is_deleted
+
+        for index, item in enumerate(self.criteria):
+            prefix = f"criteria[{index}]"
+            if isinstance(item, CriteriaGroup) and len(item.criteria) == 1:
+                # Grupo de um valor só vira um critério simples (URL menor)
+                item = item.criteria[0]._replace(link=item.link)
+            if isinstance(item, CriteriaGroup):
+                if index > 0:
+                    params[f"{prefix}[link]"] = item.link
+                for position, criterion in enumerate(item.criteria):
+                    params.update(
+                        _criterion_params(
+                            f"{prefix}[criteria][{position}]", criterion, position > 0
+                        )
+                    )
+            else:
+                params.update(_criterion_params(prefix, item, index > 0))
+
+        for position, field in enumerate(self.forcedisplay):
+            params[f"forcedisplay[{position}]"] = field
+        if self.sort_field is not None:
+            params["sort"] = self.sort_field
+            params["order"] = self.sort_order
+        if self.range is not None:
+            params["range"] = f"{self.range[0]}-{self.range[1]}"
+        return params
+
+    def url(self, base_url: str) -> str:
+        """URL completa, codificada como o ``requests``/``httpx`` a enviam"""
+        return f"{base_url.rstrip('/')}/search/{self.itemtype}?{urlencode(self.to_params())}"
+
+    def url_length(self, base_url: str) -> int:
+        """Tamanho da URL codificada"""
+        return len(self.url(base_url))
+
+    def _any_entry_length(self, position: int, value: Any) -> int:
+        # Bytes que o valor ``position`` (>= 1) acrescenta à URL, incluindo o "&"
+        group = self.criteria[self._any_index]
+        criterion = group.criteria[0]._replace(value=value)
+        prefix = f"criteria[{self._any_index}][criteria][{position}]"
+        return len(urlencode(_criterion_params(prefix, criterion, True))) + 1
+
+    def split_any(
+        self, base_url: str, max_url_length: Optional[int] = None
+    ) -> List["SearchQuery"]:
+        """Divide a lista OR no menor número de consultas que cabem no limite de URL
+
+        Os valores são distribuídos em ordem, enchendo cada consulta até o
+        limite (``API_CONFIG["MAX_URL_LENGTH"]`` por padrão). Um valor que
+        sozinho não cabe ainda vai em uma consulta própria.
+        """
+        if self._any_index is None:
+            return [self]
+        if max_url_length is None:
+            max_url_length = API_CONFIG.get("MAX_URL_LENGTH", 8000)
+
+        chunks: List[List[Any]] = []
+        current: List[Any] = []
+        current_length = 0
+        for value in self.any_values:
+            if not current:
+                current = [value]
+                current_length = self.with_any_values(current).url_length(base_url)
+                continue
+
+            if len(current) == 1:
+                # O segundo valor transforma o critério simples em grupo: medir inteiro
+                candidate_length = self.with_any_values(current + [value]).url_length(base_url)
+            else:
+                candidate_length = current_length + self._any_entry_length(len(current), value)
+
+            if candidate_length <= max_url_length:
+                current.append(value)
+                current_length = candidate_length
+            else:
+                chunks.append(current)
+                current = [value]
+                current_length = self.with_any_values(current).url_length(base_url)
+
+        if current:
+            chunks.append(current)
+        return [self.with_any_values(chunk) for chunk in chunks]
+
+
+def build_status_count_params(
+    status_field: str,
+    status_id: int,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Contagem (range 0-0) de todos os tickets em um status, por data de criação"""
+    return (
+        SearchQuery("Ticket")
+        .where(status_field, status_id)
+        .where_date_range("15", start_date, end_date)
+        .count()
+        .to_params()
+    )
+
+
+def build_group_status_count_params(
+    group_field: str,
+    group_id: int,
+    status_field: str,
+    status_id: int,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    date_field: str = "15",
+) -> Dict[str, Any]:
+    """Contagem (range 0-0) de tickets de um grupo técnico em um status"""
+    return (
+        SearchQuery("Ticket")
+        .where(group_field, group_id)
+        .where(status_field, status_id)
+        .where_date_range(date_field, start_date, end_date)
+        .count()
+        .to_params()
+    )
+
+
+def build_hierarchy_status_count_params(
+    level: str,
+    status_field: str,
+    status_id: int,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Contagem (range 0-0) de tickets de um nível (campo 8, hierarquia) em um status
+
+    Métricas por nível filtram o período pela data de modificação (campo 19).
+    """
+    return (
+        SearchQuery("Ticket")
+        .where("8", level, "contains")  # Campo 8 contém a estrutura hierárquica (N1..N4)
+        .where(status_field, status_id)
+        .where_date_range("19", start_date, end_date)
+        .count()
+        .to_params()
+    )
+
+
+def build_status_scan_params(
+    status_field: str,
+    status_ids: Sequence[int],
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Varredura equivalente às contagens de ``build_status_count_params``
+
+    Uma única busca (status 1 OR 2 ...) no período, exibindo o status de cada
+    ticket. Sem ``range``: a paginação fica a cargo de quem varre.
+    """
+    return (
+        SearchQuery("Ticket")
+        .where_any(status_field, status_ids, split=False)
+        .where_date_range("15", start_date, end_date)
+        .display(status_field)
+        .to_params()
+    )
+
+
+def build_hierarchy_status_scan_params(
+    levels: Sequence[str],
+    status_field: str,
+    status_ids: Sequence[int],
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Varredura equivalente às contagens de ``build_hierarchy_status_count_params``
+
+    (nível N1 OR N2 ...) AND (status 1 OR 2 ...) no período de modificação,
+    exibindo hierarquia (campo 8) e status de cada ticket.
+    """
+    return (
+        SearchQuery("Ticket")
+        .where_any("8", [level.upper() for level in levels], "contains")
+        .where_any(status_field, status_ids, split=False)
+        .where_date_range("19", start_date, end_date)
+        .display("8", status_field)
+        .to_params()
+    )
+
+
+def hierarchy_level(value: Any, levels: Sequence[str]) -> Optional[str]:
+    """Nível contido na hierarquia textual (ex.: ``"CC-SE-SUBADM-DTIC > N2"`` -> ``"N2"``)"""
+    hierarchy = str(value or "").strip()
+    if not hierarchy or hierarchy == "None":
+        return None
+    for level in levels:
+        if level in hierarchy:
+            return level
+    return None
+
+
+def build_technician_scan_query(
+    tech_field: str,
+    technician_ids: Iterable[Any],
+    status_field: str = "12",
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> SearchQuery:
+    """Varredura do ranking: (técnico 1 OR técnico 2 ...) no período de abertura
+
+    Exibe o campo técnico e o status de cada ticket (``TechnicianTally``); a
+    lista de técnicos é a lista OR divisível (``split_any``).
+    """
+    return (
+        SearchQuery("Ticket")
+        .where_date_range("15", start_date, end_date)  # Data de criação
+        .where_any(tech_field, [str(tech_id) for tech_id in technician_ids])
+        .display(tech_field, status_field)
+    )
+
+
+def build_new_tickets_params(status_field: str, status_id: int, limit: int) -> Dict[str, Any]:
+    """Tickets mais recentes em um status, com os campos exibidos no dashboard"""
+    return (
+        SearchQuery("Ticket")
+        .where(status_field, status_id)
+        .sort("19", "DESC")  # Mais recentes primeiro
+        # ID, título, descrição, abertura, solicitante, prioridade, categoria, status
+        .display("2", "1", "21", "15", "4", "3", "5", "12")
+        .rows(0, limit - 1)
+        .to_params()
+    )
+
+
+def with_range(params: Mapping[str, Any], start_index: int, page_size: int) -> Dict[str, Any]:
+    """Cópia dos parâmetros com o ``range`` da página informada"""
+    page_params = dict(params)
+    page_params["range"] = f"{start_index}-{start_index + page_size - 1}"
+    return page_params
+
+
+def page_ranges(total: int, page_size: int, start_index: int = 0) -> List[int]:
+    """Índices iniciais das páginas necessárias para cobrir ``total`` itens"""
+    return list(range(start_index, max(total, start_index), page_size))
+
+
+def query_family(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """Família da consulta, para métricas por tipo de chamada
+
+    Buscas são separadas em contagens (``range=0-0``), buscas que exibem a
+    descrição (campo 21) e demais linhas: ``"search/Ticket:count"``,
+    ``"search/Ticket:descriptions"``, ``"search/Ticket:rows"``. Os demais
+    endpoints usam o itemtype (``"User"``, ``"ITILCategory"``...).
+    """
+    segments = [segment for segment in urlparse(url).path.split("/") if segment]
+    if "apirest.php" in segments:
+        segments = segments[segments.index("apirest.php") + 1 :]
+    if not segments:
+        return "other"
+
+    head = segments[0]
+    if head in ("initSession", "killSession"):
+        return "session"
+    if head != "search":
+        return head
+
+    itemtype = segments[1] if len(segments) > 1 else "unknown"
+    params = params or {}
+    if str(params.get("range", "")) == "0-0":
+        kind = "count"
+    elif any(
+        str(key).startswith("forcedisplay") and str(value) == "21" for key, value in params.items()
+    ):
+        kind = "descriptions"
+    else:
+        kind = "rows"
+    return f"search/{itemtype}:{kind}"
+
+
+def parse_content_range_total(content_range: Optional[str]) -> Optional[int]:
+    """Extrai o total de ``Content-Range`` (ex.: ``"0-0/42"`` ou ``"items */42"``)"""
+    if not content_range or not isinstance(content_range, str) or "/" not in content_range:
+        return None
+    total_str = content_range.split("/")[-1].strip()
+    return int(total_str) if total_str.isdigit() else None
+
+
+def parse_total_count(headers: Mapping[str, str], body: Any = None) -> Optional[int]:
+    """Total de tickets de uma resposta de busca
+
+    Ordem de preferência: cabeçalho ``Content-Range``, ``content-range`` no
+    JSON, ``totalcount`` e, por fim, o tamanho de ``data``.
+    """
+    total = parse_content_range_total(headers.get("Content-Range"))
+    if total is not None:
+        return total
+
+    if isinstance(body, dict):
+        total = parse_content_range_total(body.get("content-range"))
+        if total is not None:
+            return total
+        if isinstance(body.get("totalcount"), int):
+            return body["totalcount"]
+        if isinstance(body.get("data"), list):
+            return len(body["data"])
+    elif isinstance(body, list):
+        return len(body)
+
+    return None
+
+
+def assigned_technician_ids(value: Any) -> List[str]:
+    """IDs de técnicos de um valor do campo técnico (número, texto ou lista)
+
+    Tickets com mais de um técnico atribuído trazem uma lista; ``0`` e vazios
+    são ignorados.
+    """
+    values = value if isinstance(value, list) else [value]
+    tech_ids = []
+    for item in values:
+        if item is None or isinstance(item, bool):
+            continue
+        if isinstance(item, float) and item.is_integer():
+            item = int(item)
+        tech_id = str(item).strip()
+        if tech_id and tech_id not in ("0", "None") and tech_id not in tech_ids:
+            tech_ids.append(tech_id)
+    return tech_ids
+
+
+class TechnicianTally:
+    """Total, resolvidos e pendentes por técnico, acumulados página a página
+
+    Alimentado pelas linhas de uma varredura que exibe o campo técnico e o
+    status; com ``technician_ids`` só esses técnicos são contados (e todos
+    aparecem no resultado, mesmo sem tickets).
+    """
+
+    def __init__(
+        self,
+        tech_field: str = "5",
+        status_field: str = "12",
+        technician_ids: Optional[Iterable[Any]] = None,
+    ):
+        self.tech_field = str(tech_field)
+        self.status_field = str(status_field)
+        self.rows = 0
+        self._only = None
+        self._counts: Dict[str, List[int]] = {}  # [total, resolvidos, pendentes]
+        if technician_ids is not None:
+            self._counts = {str(tech_id): [0, 0, 0] for tech_id in technician_ids}
+            self._only = set(self._counts)
+
+    def add(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Conta as linhas de uma página"""
+        for row in rows:
+            self.rows += 1
+            try:
+                status_id = int(row.get(self.status_field, 0))
+            except (ValueError, TypeError):
+                status_id = None  # Status inválido conta apenas no total
+
+            for tech_id in assigned_technician_ids(row.get(self.tech_field)):
+                if self._only is not None and tech_id not in self._only:
+                    continue
+                counts = self._counts.setdefault(tech_id, [0, 0, 0])
+                counts[0] += 1
+                if status_id in RESOLVED_STATUS_IDS:
+                    counts[1] += 1
+                elif status_id in PENDING_STATUS_IDS:
+                    counts[2] += 1
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """``{tech_id: {"total_tickets", "resolved_tickets", "pending_tickets", ...}}``"""
+        return {
+            tech_id: {
+                "total_tickets": total,
+                "resolved_tickets": resolved,
+                "pending_tickets": pending,
+                "avg_resolution_time": 0.0,
+            }
+            for tech_id, (total, resolved, pending) in self._counts.items()
+        }
+
+
+def top_technicians(entries: Iterable[Dict[str, Any]], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Técnicos ordenados por total de tickets, com ``rank`` atribuído
+
+    Com ``limit`` seleciona os ``limit`` primeiros com um heap (``heapq.nlargest``,
+    O(n log k)) em vez de ordenar a lista inteira; empates mantêm a ordem de entrada.
+    """
+    if limit:
+        ranked = heapq.nlargest(limit, entries, key=lambda entry: entry["total_tickets"])
+    else:
+        ranked = sorted(entries, key=lambda entry: entry["total_tickets"], reverse=True)
+    for position, entry in enumerate(ranked, start=1):
+        entry["rank"] = position
+    return ranked
+
+
+def parse_user_display_name(user_data: Any) -> str:
+    """Nome de exibição de um usuário de ``GET /User/{id}`` (sem filtrar inativos)"""
+    if isinstance(user_data, dict):
+        if user_data.get("realname") and user_data.get("firstname"):
+            return f"{user_data['firstname']} {user_data['realname']}"
+        for key in ("realname", "name", "firstname"):
+            if user_data.get(key):
+                return user_data[key]
+    return "Usuário desconhecido"
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""Planejador de contagens por faceta: contagens paralelas x varredura única.
+
+Métricas do dashboard são contagens de várias facetas (status, nível x
+status...). Há duas formas de obtê-las do GLPI:
+
+- ``counts``: uma busca ``range=0-0`` por faceta, disparadas em paralelo; o
+  custo é o número de "rodadas" (facetas / requisições simultâneas) vezes a
+  latência de uma requisição;
+- ``scan``: uma única busca com a união das facetas, paginada, classificando
+  cada linha; o tamanho da varredura vem de uma sonda ``range=0-0`` na busca
+  unificada.
+
+O custo de uma requisição e o custo por linha começam com os valores de
+``PLANNER_CONFIG`` e são ajustados (média móvel exponencial) pelas execuções
+observadas. Quando as contagens são mais baratas que a menor varredura
+possível, o plano é decidido sem a sonda. O plano escolhido é registrado no log.
+"""
+
+import logging
+import math
+import threading
+from typing import Any, Dict, NamedTuple, Optional
+
+from config.performance import PLANNER_CONFIG
+
+COUNTS = "counts"
+SCAN = "scan"
+
+logger = logging.getLogger("glpi_query_planner")
+
+
+class FacetPlan(NamedTuple):
+    """Plano escolhido para contar um conjunto de facetas"""
+
+    strategy: str
+    facets: int
+    total: Optional[int]
+    parallelism: int
+    counts_cost: float
+    scan_cost: Optional[float]
+
+    @property
+    def estimated_cost(self) -> float:
+        return self.scan_cost if self.strategy == SCAN else self.counts_cost
+
+
+class FacetQueryPlanner:
+    """Escolhe, por custo estimado, entre contagens paralelas e varredura única"""
+
+    def __init__(
+        self,
+        request_cost: float = 0.25,
+        row_cost: float = 0.0005,
+        page_size: int = 1000,
+        smoothing: float = 0.2,
+        enabled: bool = True,
+        force_strategy: Optional[str] = None,
+    ):
+        """Inicializa o planejador
+
+        Args:
+            request_cost: Latência inicial estimada de uma requisição (segundos)
+            row_cost: Custo inicial estimado por linha devolvida (segundos)
+            page_size: Linhas por página da varredura
+            smoothing: Peso de cada observação na média móvel exponencial
+            enabled: Desligado, sempre usa contagens (sem sonda)
+            force_strategy: ``"counts"`` ou ``"scan"`` para fixar a estratégia
+        """
+        self.request_cost = float(request_cost)
+        self.row_cost = float(row_cost)
+        self.page_size = max(1, int(page_size))
+        self.smoothing = min(1.0, max(0.0, float(smoothing)))
+        self.enabled = enabled
+        self.force_strategy = force_strategy if force_strategy in (COUNTS, SCAN) else None
+
+        self._lock = threading.Lock()
+        self._plans = {COUNTS: 0, SCAN: 0}
+        self._probes = 0
+        self._last_plans: Dict[str, Dict[str, Any]] = {}
+
+    # ------------------------------------------------------------------
+    # Modelo de custo
+    # ------------------------------------------------------------------
+
+    def _page_cost(self, rows: int) -> float:
+        return self.request_cost + rows * self.row_cost
+
+    def counts_cost(self, facets: int, parallelism: int) -> float:
+        """Custo estimado de ``facets`` contagens ``range=0-0`` em paralelo"""
+        rounds = math.ceil(max(0, facets) / max(1, parallelism))
+        return rounds * self.request_cost
+
+    def scan_cost(self, total: int, parallelism: int, parallel_pages: bool = False) -> float:
+        """Custo estimado da sonda mais a varredura de ``total`` linhas
+
+        Com ``parallel_pages`` (cliente assíncrono) a primeira página informa o
+        total e as demais são buscadas em rodadas de ``parallelism`` páginas;
+        sem ele as páginas são sequenciais.
+        """
+        total = max(0, total)
+        probe = self.request_cost
+        pages = max(1, math.ceil(total / self.page_size))
+        if not parallel_pages:
+            return probe + pages * self.request_cost + total * self.row_cost
+
+        first = self._page_cost(min(total, self.page_size))
+        rounds = math.ceil((pages - 1) / max(1, parallelism))
+        return probe + first + rounds * self._page_cost(self.page_size)
+
+    def needs_probe(self, facets: int, parallelism: int, parallel_pages: bool = False) -> bool:
+        """Indica se vale a sonda ``range=0-0`` para dimensionar a varredura
+
+        Não vale quando a estratégia está fixa ou quando as contagens já custam
+        menos que a menor varredura possível (sonda e uma página vazia).
+        """
+        if not self.enabled or self.force_strategy == COUNTS:
+            return False
+        if self.force_strategy == SCAN:
+            return True
+        return self.counts_cost(facets, parallelism) > self.scan_cost(0, parallelism, parallel_pages)
+
+    # ------------------------------------------------------------------
+    # Escolha do plano
+    # ------------------------------------------------------------------
+
+    def plan(
+        self,
+        label: str,
+        facets: int,
+        parallelism: int,
+        total: Optional[int] = None,
+        parallel_pages: bool = False,
+    ) -> FacetPlan:
+        """Escolhe a estratégia para ``facets`` contagens e registra o plano no log
+
+        Args:
+            label: Nome da consulta nos logs (ex.: ``"totais por status"``)
+            facets: Número de contagens necessárias
+            parallelism: Requisições simultâneas permitidas
+            total: Linhas da busca unificada (sonda); ``None`` = sem sonda
+            parallel_pages: Páginas da varredura buscadas em paralelo
+        """
+        parallelism = max(1, int(parallelism))
+        counts_cost = self.counts_cost(facets, parallelism)
+        scan_cost = None
+        strategy = COUNTS
+
+        if total is not None:
+            scan_cost = self.scan_cost(total, parallelism, parallel_pages)
+            if self.force_strategy == SCAN or (
+                self.force_strategy is None and scan_cost < counts_cost
+            ):
+                strategy = SCAN
+
+        plan = FacetPlan(strategy, facets, total, parallelism, counts_cost, scan_cost)
+        with self._lock:
+            self._plans[strategy] += 1
+            if total is not None:
+                self._probes += 1
+            self._last_plans[label] = {
+                "strategy": strategy,
+                "facets": facets,
+                "total": total,
+                "parallelism": parallelism,
+                "counts_cost": round(counts_cost, 3),
+                "scan_cost": round(scan_cost, 3) if scan_cost is not None else None,
+            }
+
+        if scan_cost is None:
+            scan_text = "varredura não avaliada"
+        else:
+            pages = max(1, math.ceil(total / self.page_size))
+            scan_text = f"varredura de {total} tickets ({pages} páginas) ≈ {scan_cost:.2f}s"
+        forced = ", forçado por configuração" if self.force_strategy else ""
+        logger.info(
+            f"[PLANO] {label}: {strategy} — {facets} contagens ≈ {counts_cost:.2f}s x "
+            f"{scan_text} (paralelismo {parallelism}{forced})"
+        )
+        return plan
+
+    # ------------------------------------------------------------------
+    # Observações
+    # ------------------------------------------------------------------
+
+    def _blend(self, current: float, observed: float) -> float:
+        return (1 - self.smoothing) * current + self.smoothing * observed
+
+    def observe_requests(self, elapsed: float, rounds: int = 1) -> None:
+        """Ajusta o custo por requisição com ``rounds`` rodadas que levaram ``elapsed``"""
+        if rounds <= 0 or elapsed <= 0:
+            return
+        with self._lock:
+            self.request_cost = self._blend(self.request_cost, elapsed / rounds)
+
+    def observe_scan(self, elapsed: float, requests: int, rows: int) -> None:
+        """Ajusta o custo por linha com uma varredura de ``requests`` páginas sequenciais
+
+        ``rows`` são as linhas no caminho crítico (todas, em uma varredura
+        sequencial; uma página por rodada, em uma paralela).
+        """
+        if rows <= 0 or elapsed <= 0:
+            return
+        with self._lock:
+            per_row = max(0.0, elapsed - requests * self.request_cost) / rows
+            self.row_cost = self._blend(self.row_cost, per_row)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Custos estimados atuais e planos escolhidos"""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "force_strategy": self.force_strategy,
+                "request_cost": round(self.request_cost, 4),
+                "row_cost": round(self.row_cost, 6),
+                "page_size": self.page_size,
+                "plans": dict(self._plans),
+                "probes": self._probes,
+                "last_plans": {label: dict(plan) for label, plan in self._last_plans.items()},
+            }
+
+
+# Instância global, compartilhada pelos caminhos síncrono e assíncrono
+glpi_query_planner = FacetQueryPlanner(
+    request_cost=PLANNER_CONFIG.get("REQUEST_COST", 0.25),
+    row_cost=PLANNER_CONFIG.get("ROW_COST", 0.0005),
+    page_size=PLANNER_CONFIG.get("PAGE_SIZE", 1000),
+    smoothing=PLANNER_CONFIG.get("SMOOTHING", 0.2),
+    enabled=PLANNER_CONFIG.get("ENABLED", True),
+    force_strategy=PLANNER_CONFIG.get("FORCE_STRATEGY"),
+)
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""Política única de retry para chamadas ao GLPI.
+
+As tentativas ficam concentradas em ``_make_authenticated_request``; camadas
+superiores (paginação, contagens agregadas) não repetem chamadas por conta
+própria. O intervalo entre tentativas usa backoff exponencial com full jitter
+e todas as chamadas feitas durante uma mesma requisição da API consomem um
+único orçamento de tentativas, evitando que uma página instável prenda o
+worker por vários minutos.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from config.performance import API_CONFIG
+from utils.deadline import get_deadline
+
+
+class RetryBudget:
+    """Orçamento de tentativas extras compartilhado pelas chamadas de uma requisição"""
+
+    def __init__(self, max_retries: int = 6, max_sleep: float = 8.0):
+        """Inicializa o orçamento
+
+        Args:
+            max_retries: Número máximo de novas tentativas somando todas as chamadas
+            max_sleep: Tempo máximo total (segundos) de espera entre tentativas
+        """
+        self.max_retries = max_retries
+        self.max_sleep = max_sleep
+        self.retries = 0
+        self.slept = 0.0
+        self._lock = threading.Lock()
+
+    def try_spend(self, delay: float) -> bool:
+        """Reserva uma nova tentativa com a espera informada
+
+        Returns:
+            True se havia orçamento disponível, False caso contrário
+        """
+        with self._lock:
+            if self.retries >= self.max_retries or self.slept + delay > self.max_sleep:
+                return False
+            self.retries += 1
+            self.slept += delay
+            return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna o consumo atual do orçamento"""
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "max_retries": self.max_retries,
+                "slept": round(self.slept, 3),
+                "max_sleep": self.max_sleep,
+            }
+
+
+_retry_budget_var: ContextVar[Optional[RetryBudget]] = ContextVar("glpi_retry_budget", default=None)
+
+
+def new_retry_budget() -> RetryBudget:
+    """Cria um orçamento com os limites configurados em API_CONFIG"""
+    return RetryBudget(
+        max_retries=API_CONFIG.get("RETRY_BUDGET_RETRIES", 6),
+        max_sleep=API_CONFIG.get("RETRY_BUDGET_SLEEP", 8.0),
+    )
+
+
+def start_retry_budget() -> RetryBudget:
+    """Inicia um novo orçamento para o contexto atual (ex.: uma requisição da API)"""
+    budget = new_retry_budget()
+    _retry_budget_var.set(budget)
+    return budget
+
+
+def get_retry_budget() -> Optional[RetryBudget]:
+    """Orçamento ativo no contexto atual, ou None fora de uma requisição"""
+    return _retry_budget_var.get()
+
+
+class RetryPolicy:
+    """Backoff exponencial com full jitter limitado por um orçamento"""
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.5, max_delay: float = 4.0):
+        """Inicializa a política
+
+        Args:
+            max_attempts: Tentativas por chamada (incluindo a primeira)
+            base_delay: Base do backoff exponencial em segundos
+            max_delay: Teto de espera entre tentativas em segundos
+        """
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.logger = logging.getLogger("glpi_retry")
+
+    def backoff(self, attempt: int) -> float:
+        """Espera antes da próxima tentativa (full jitter: uniforme entre 0 e o teto)
+
+        Args:
+            attempt: Índice (0-based) da tentativa que acabou de falhar
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2**attempt))
+        return random.uniform(0, ceiling)
+
+    def next_delay(
+        self, attempt: int, budget: Optional[RetryBudget], reason: str = ""
+    ) -> Optional[float]:
+        """Decide se a chamada deve ser repetida e reserva a espera no orçamento
+
+        Args:
+            attempt: Índice (0-based) da tentativa que acabou de falhar
+            budget: Orçamento da requisição (None cria um orçamento só para a chamada)
+            reason: Motivo da falha, usado apenas em log
+
+        Returns:
+            Segundos a aguardar antes da nova tentativa, ou None para desistir
+        """
+        if attempt >= self.max_attempts - 1:
+            return None
+
+        delay = self._clamp_to_deadline(self.backoff(attempt))
+        if delay is None:
+            return None
+
+        if budget is not None and not budget.try_spend(delay):
+            self.logger.warning(
+                f"Orçamento de retry esgotado ({budget.retries} tentativas, "
+                f"{budget.slept:.1f}s de espera), desistindo: {reason}"
+            )
+            return None
+
+        self.logger.debug(f"Nova tentativa em {delay:.2f}s (tentativa {attempt + 1}): {reason}")
+        return delay
+
+    @staticmethod
+    def _clamp_to_deadline(delay: float) -> Optional[float]:
+        """Espera limitada ao prazo da requisição, ou None se o prazo não cobre a nova tentativa"""
+        deadline = get_deadline()
+        if deadline is None:
+            return delay
+        if delay >= deadline.remaining():
+            deadline.mark_exceeded("retry")
+            return None
+        return deadline.clamp(delay)
+
+    def wait_before_retry(
+        self, attempt: int, budget: Optional[RetryBudget], reason: str = ""
+    ) -> bool:
+        """Versão bloqueante: aguarda o backoff com ``time.sleep``
+
+        Returns:
+            True se uma nova tentativa deve ser feita, False para desistir
+        """
+        delay = self.next_delay(attempt, budget, reason)
+        # O prazo continua correndo desde a decisão (lock do orçamento, log)
+        delay = None if delay is None else self._clamp_to_deadline(delay)
+        if delay is None:
+            return False
+        time.sleep(delay)
+        return True
+
+    async def wait_before_retry_async(
+        self, attempt: int, budget: Optional[RetryBudget], reason: str = ""
+    ) -> bool:
+        """Versão assíncrona: aguarda o backoff sem bloquear o event loop
+
+        Returns:
+            True se uma nova tentativa deve ser feita, False para desistir
+        """
+        delay = self.next_delay(attempt, budget, reason)
+        # O prazo continua correndo desde a decisão (lock do orçamento, log)
+        delay = None if delay is None else self._clamp_to_deadline(delay)
+        if delay is None:
+            return False
+        await asyncio.sleep(delay)
+        return True
+
+
+# Política global usada pelo transporte GLPI
+glpi_retry_policy = RetryPolicy(
+    max_attempts=API_CONFIG.get("MAX_RETRIES", 3),
+    base_delay=API_CONFIG.get("RETRY_BASE_DELAY", 0.5),
+    max_delay=API_CONFIG.get("RETRY_MAX_DELAY", 4.0),
+)
@@ -0,0 +1,488 @@
+# -*- coding: utf-8 -*-
+"""Descoberta persistida dos IDs de campos de busca do GLPI (``listSearchOptions``).
+
+``listSearchOptions/<itemtype>`` é uma resposta grande e o mapeamento que se
+extrai dela (status, grupo, técnico...) só muda quando o GLPI é atualizado. O
+mapeamento de cada itemtype (``Ticket``, ``User``, ``Group_User``) é gravado
+em disco, em um arquivo por URL do GLPI que registra também a versão do GLPI:
+
+- na inicialização o arquivo é carregado e os campos ficam disponíveis sem
+  nenhuma requisição;
+- em segundo plano, a cada ``REVALIDATE_INTERVAL``, a versão é conferida em
+  ``getGlpiConfig`` (resposta pequena); só quando ela muda (ou, sem versão
+  conhecida, quando o mapeamento passa de ``MAX_AGE``) as opções de busca são
+  baixadas de novo.
+
+O arquivo é gravado de forma atômica e compartilhado pelos workers da máquina.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional, Tuple
+
+from config.performance import SEARCH_OPTIONS_CONFIG
+
+if TYPE_CHECKING:
+    from .glpi_service import GLPIService
+
+logger = logging.getLogger("glpi_search_options")
+
+# Campos do Ticket que precisam ser encontrados para o mapeamento ser aceito
+REQUIRED_TICKET_FIELDS = ("GROUP", "STATUS", "DATE_CREATION", "TECH")
+
+TECH_GROUP_FIELD_NAMES = (
+    "Grupo técnico",
+    "Technical group",
+    "Grupo tecnico",
+    "Assigned group",
+    "Group",
+    "Grupo",
+    "Grupo atribuído",
+    "Grupo responsável",
+    "Responsible group",
+)
+STATUS_FIELD_NAMES = ("Status", "Estado", "State", "Situação", "Condition")
+TECH_FIELD_NAMES = (
+    "Técnico",
+    "Technician",
+    "Tecnico",
+    "Assigned technician",
+    "Técnico encarregado",
+    "Assigned to",
+    "Atribuído para",
+    "Técnico responsável",
+    "Responsável",
+    "Assignee",
+    "Atribuído",
+    "Assigned user",
+    "Usuario atribuído",
+)
+
+# Técnico atribuído: IDs conhecidos com o nome exato, depois nomes alternativos
+ASSIGNED_TECH_KNOWN_FIELDS = {"5": "Técnico", "95": "Técnico encarregado"}
+ASSIGNED_TECH_FIELD_NAMES = (
+    "Técnico",
+    "Atribuído",
+    "Assigned to",
+    "Technician",
+    "Técnico encarregado",
+)
+
+# Campos identificados por tabela e coluna: nome -> (tabela, coluna, ID padrão)
+USER_FIELDS = {
+    "ID": ("glpi_users", "id", "2"),
+    "LOGIN": ("glpi_users", "name", "1"),
+    "FIRSTNAME": ("glpi_users", "firstname", "9"),
+    "REALNAME": ("glpi_users", "realname", "34"),
+    "ACTIVE": ("glpi_users", "is_active", "8"),
+    "DATE_MOD": ("glpi_users", "date_mod", "19"),
+    "GROUPS": ("glpi_groups", "completename", "13"),
+    "PROFILES": ("glpi_profiles", "name", "20"),
+    "ENTITIES": ("glpi_entities", "completename", "80"),
+}
+GROUP_USER_FIELDS = {
+    "ID": ("glpi_groups_users", "id", "2"),
+    "GROUP": ("glpi_groups", "completename", "3"),
+    "USER": ("glpi_users", "name", "4"),
+}
+
+
+def _option_name(option: Any) -> str:
+    if not isinstance(option, dict) or "name" not in option:
+        return ""
+    return str(option["name"]).strip()
+
+
+def resolve_ticket_fields(search_options: Mapping[str, Any]) -> Optional[Dict[str, str]]:
+    """GROUP, STATUS, TECH, DATE_CREATION e ASSIGNED_TECH das opções de busca do Ticket
+
+    Correspondência aproximada pelo nome (primeira opção que contém um dos
+    nomes conhecidos); None se faltar um campo obrigatório.
+    """
+    fields: Dict[str, str] = {}
+    for field_id, option in search_options.items():
+        name = _option_name(option).lower()
+        if not name:
+            continue
+        if "GROUP" not in fields and any(known.lower() in name for known in TECH_GROUP_FIELD_NAMES):
+            fields["GROUP"] = str(field_id)
+        elif "STATUS" not in fields and any(known.lower() in name for known in STATUS_FIELD_NAMES):
+            fields["STATUS"] = str(field_id)
+        elif "TECH" not in fields and any(known.lower() in name for known in TECH_FIELD_NAMES):
+            fields["TECH"] = str(field_id)
+        if len(fields) == 3:
+            break
+
+    # Data de abertura: ID 15 (padrão GLPI)
+    fields["DATE_CREATION"] = "15"
+
+    assigned = next(
+        (
+            field_id
+            for field_id, expected in ASSIGNED_TECH_KNOWN_FIELDS.items()
+            if _option_name(search_options.get(field_id)) == expected
+        ),
+        None,
+    )
+    if assigned is None:
+        assigned = next(
+            (
+                str(field_id)
+                for field_id, option in search_options.items()
+                if _option_name(option) in ASSIGNED_TECH_FIELD_NAMES
+            ),
+            "5",
+        )
+    fields["ASSIGNED_TECH"] = assigned
+
+    missing = [field for field in REQUIRED_TICKET_FIELDS if not fields.get(field)]
+    if missing:
+        logger.error(f"Campos do Ticket ausentes nas opções de busca: {missing}")
+        return None
+    return fields
+
+
+def resolve_table_fields(
+    search_options: Mapping[str, Any], specs: Mapping[str, Tuple[str, str, str]]
+) -> Dict[str, str]:
+    """IDs dos campos identificados por tabela e coluna
+
+    O ID padrão é mantido quando ainda aponta para a mesma tabela/coluna;
+    senão vale a primeira opção correspondente e, sem nenhuma, o padrão.
+    """
+
+    def matches(option: Any, table: str, column: str) -> bool:
+        return (
+            isinstance(option, dict)
+            and option.get("table") == table
+            and option.get("field") == column
+        )
+
+    fields = {}
+    for key, (table, column, default_id) in specs.items():
+        if matches(search_options.get(default_id), table, column):
+            fields[key] = default_id
+            continue
+        fields[key] = next(
+            (
+                str(field_id)
+                for field_id, option in search_options.items()
+                if matches(option, table, column)
+            ),
+            default_id,
+        )
+    return fields
+
+
+# Itemtype -> função que extrai o mapeamento das opções de busca
+RESOLVERS: Dict[str, Callable[[Mapping[str, Any]], Optional[Dict[str, str]]]] = {
+    "Ticket": resolve_ticket_fields,
+    "User": lambda options: resolve_table_fields(options, USER_FIELDS),
+    "Group_User": lambda options: resolve_table_fields(options, GROUP_USER_FIELDS),
+}
+
+# Mapeamento usado enquanto a descoberta não é possível (itemtypes com padrão seguro)
+DEFAULT_FIELDS = {
+    "User": {key: spec[2] for key, spec in USER_FIELDS.items()},
+    "Group_User": {key: spec[2] for key, spec in GROUP_USER_FIELDS.items()},
+}
+
+
+def _default_cache_path(glpi_url: str) -> str:
+    """Arquivo por instância GLPI (a versão fica registrada no conteúdo)"""
+    digest = hashlib.sha256(str(glpi_url).encode()).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), f"glpi_dashboard_search_options_{digest}.json")
+
+
+class SearchOptionsCache:
+    """Mapeamentos de campos por itemtype, persistidos por URL e versão do GLPI"""
+
+    def __init__(
+        self,
+        service: "GLPIService",
+        path: str,
+        revalidate_interval: float = 3600,
+        max_age: float = 7 * 86400,
+        background: bool = True,
+    ):
+        """Inicializa o cache e carrega o arquivo, se existir
+
+        Args:
+            service: Serviço usado nas requisições (autenticação, retry, limites)
+            path: Arquivo JSON do cache
+            revalidate_interval: Intervalo entre conferências da versão (segundos)
+            max_age: Idade máxima de um mapeamento quando a versão é desconhecida (segundos)
+            background: Revalidar em uma thread de segundo plano
+        """
+        self.service = service
+        self.path = path
+        self.revalidate_interval = max(1.0, float(revalidate_interval))
+        self.max_age = max(self.revalidate_interval, float(max_age))
+        self.background = background
+
+        self._lock = threading.Lock()
+        self._discover_lock = threading.Lock()
+        self._version: Optional[str] = None
+        self._checked_at = 0.0
+        self._entries: Dict[str, Dict[str, Any]] = {}  # itemtype -> {"fields", "discovered_at"}
+        self._stats = {"loaded_from_disk": False, "discoveries": 0, "revalidations": 0, "failures": 0}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Persistência
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Cache de opções de busca ilegível ({self.path}): {e}")
+            return
+
+        if not isinstance(data, dict) or data.get("glpi_url") != self.service.glpi_url:
+            return
+        entries = {
+            itemtype: entry
+            for itemtype, entry in (data.get("itemtypes") or {}).items()
+            if isinstance(entry, dict) and isinstance(entry.get("fields"), dict)
+        }
+        with self._lock:
+            self._version = data.get("version")
+            self._checked_at = float(data.get("checked_at") or 0)
+            self._entries = entries
+            self._stats["loaded_from_disk"] = bool(entries)
+        if entries:
+            logger.info(
+                f"Opções de busca carregadas do disco (GLPI {self._version or 'versão desconhecida'}): "
+                f"{sorted(entries)}"
+            )
+
+    def _save(self) -> None:
+        with self._lock:
+            data = {
+                "glpi_url": self.service.glpi_url,
+                "version": self._version,
+                "checked_at": self._checked_at,
+                "itemtypes": {itemtype: dict(entry) for itemtype, entry in self._entries.items()},
+            }
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(data, handle)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Falha ao gravar o cache de opções de busca ({self.path}): {e}")
+
+    # ------------------------------------------------------------------
+    # Consulta
+    # ------------------------------------------------------------------
+
+    def fields(self, itemtype: str) -> Optional[Dict[str, str]]:
+        """Mapeamento de campos do itemtype (descoberto na primeira vez, se não estiver em disco)
+
+        Returns:
+            Cópia do mapeamento; o padrão do itemtype (ou None) se a descoberta falhar
+        """
+        self.start()
+        with self._lock:
+            entry = self._entries.get(itemtype)
+        if entry is None:
+            with self._discover_lock:
+                # Chamadas simultâneas esperam a mesma descoberta
+                with self._lock:
+                    entry = self._entries.get(itemtype)
+                if entry is None:
+                    if self._version is None:
+                        version = self._fetch_version()
+                        with self._lock:
+                            self._version = version
+                    if self._discover(itemtype):
+                        self._save()
+                    with self._lock:
+                        entry = self._entries.get(itemtype)
+
+        if entry is None:
+            default = DEFAULT_FIELDS.get(itemtype)
+            return dict(default) if default else None
+        return dict(entry["fields"])
+
+    # ------------------------------------------------------------------
+    # Descoberta e revalidação
+    # ------------------------------------------------------------------
+
+    def _discover(self, itemtype: str) -> bool:
+        """Baixa ``listSearchOptions/<itemtype>`` e guarda o mapeamento extraído"""
+        resolver = RESOLVERS.get(itemtype)
+        if resolver is None:
+            raise ValueError(f"Itemtype sem mapeamento de opções de busca: {itemtype}")
+
+        try:
+            if not self.service._ensure_authenticated():
+                raise RuntimeError("falha na autenticação")
+            response = self.service._make_authenticated_request(
+                "GET", f"{self.service.glpi_url}/listSearchOptions/{itemtype}"
+            )
+            if response is None or not response.ok:
+                raise RuntimeError(f"HTTP {response.status_code if response is not None else 'sem resposta'}")
+            search_options = response.json()
+            if not isinstance(search_options, dict):
+                raise ValueError("formato de resposta inválido")
+            fields = resolver(search_options)
+        except Exception as e:
+            with self._lock:
+                self._stats["failures"] += 1
+            logger.error(f"Falha ao descobrir as opções de busca de {itemtype}: {e}")
+            return False
+
+        if not fields:
+            with self._lock:
+                self._stats["failures"] += 1
+            return False
+
+        with self._lock:
+            self._entries[itemtype] = {
+                "fields": fields,
+                "version": self._version,
+                "discovered_at": time.time(),
+            }
+            self._stats["discoveries"] += 1
+        logger.info(f"Opções de busca de {itemtype} descobertas: {fields}")
+        return True
+
+    def _fetch_version(self) -> Optional[str]:
+        """Versão do GLPI (``getGlpiConfig``); None se não for possível obtê-la"""
+        try:
+            if not self.service._ensure_authenticated():
+                return None
+            response = self.service._make_authenticated_request(
+                "GET", f"{self.service.glpi_url}/getGlpiConfig", timeout=10
+            )
+            if response is None or not response.ok:
+                return None
+            config = response.json().get("cfg_glpi") or {}
+            version = config.get("version")
+            return str(version) if version else None
+        except Exception as e:
+            logger.debug(f"Versão do GLPI indisponível: {e}")
+            return None
+
+    def revalidate(self) -> bool:
+        """Confere a versão do GLPI e redescobre os mapeamentos de outra versão
+
+        Sem versão conhecida, redescobre os mapeamentos mais velhos que ``max_age``.
+
+        Returns:
+            True se algum mapeamento foi redescoberto
+        """
+        version = self._fetch_version()
+        now = time.time()
+        with self._lock:
+            known_version = self._version
+            entries = dict(self._entries)
+
+        if version is None:
+            stale = [
+                itemtype
+                for itemtype, entry in entries.items()
+                if now - float(entry.get("discovered_at") or 0) >= self.max_age
+            ]
+        else:
+            stale = [itemtype for itemtype, entry in entries.items() if entry.get("version") != version]
+            if known_version and known_version != version:
+                logger.info(f"GLPI atualizado ({known_version} -> {version}): redescobrindo opções de busca")
+
+        with self._lock:
+            if version is not None:
+                self._version = version
+
+        changed = False
+        with self._discover_lock:
+            for itemtype in stale:
+                # Em caso de falha o mapeamento anterior continua valendo
+                changed = self._discover(itemtype) or changed
+
+        with self._lock:
+            self._checked_at = now
+            self._stats["revalidations"] += 1
+        self._save()
+        return changed
+
+    # ------------------------------------------------------------------
+    # Segundo plano
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Inicia a thread de revalidação (uma por processo; idempotente)"""
+        if not self.background or self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="glpi-search-options", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Interrompe a thread de revalidação"""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        self._thread = None
+
+    def _run(self) -> None:
+        # Cache carregado do disco e já vencido: revalidar logo após a inicialização
+        while True:
+            with self._lock:
+                delay = self._checked_at + self.revalidate_interval - time.time()
+            if self._stop.wait(max(1.0, delay)):
+                return
+            try:
+                self.revalidate()
+            except Exception as e:
+                logger.warning(f"Erro na revalidação das opções de busca: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Versão, idade da última conferência e mapeamentos em cache"""
+        now = time.time()
+        with self._lock:
+            return {
+                "path": self.path,
+                "glpi_version": self._version,
+                "last_check_age": round(now - self._checked_at, 1) if self._checked_at else None,
+                "revalidate_interval": self.revalidate_interval,
+                "background": self._thread is not None and self._thread.is_alive(),
+                "itemtypes": {
+                    itemtype: {
+                        "fields": dict(entry["fields"]),
+                        "version": entry.get("version"),
+                        "age": round(now - float(entry.get("discovered_at") or now), 1),
+                    }
+                    for itemtype, entry in self._entries.items()
+                },
+                **self._stats,
+            }
+
+
+def create_search_options_cache(service: "GLPIService") -> SearchOptionsCache:
+    """Cache de opções de busca configurado por ``SEARCH_OPTIONS_CONFIG``"""
+    return SearchOptionsCache(
+        service,
+        path=SEARCH_OPTIONS_CONFIG.get("CACHE_PATH") or _default_cache_path(service.glpi_url),
+        revalidate_interval=SEARCH_OPTIONS_CONFIG.get("REVALIDATE_INTERVAL", 3600),
+        max_age=SEARCH_OPTIONS_CONFIG.get("MAX_AGE", 7 * 86400),
+        background=SEARCH_OPTIONS_CONFIG.get("BACKGROUND", True),
+    )
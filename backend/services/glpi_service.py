@@ -1,28 +1,99 @@
 # -*- coding: utf-8 -*-
+import asyncio
+import atexit
+import concurrent.futures
 import logging
+import math
 import threading
 import time
 import traceback
+from collections.abc import Mapping
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 import requests
 
+from config.performance import API_CONFIG, CACHE_CONFIG, CONCURRENCY_CONFIG
 from config.settings import active_config
 
 # Removed unused import: alerting_system
-from utils.date_validator import DateValidator
+from utils.deadline import (
+    deadline_exceeded,
+    deadline_expired,
+    get_deadline,
+)
+from utils.executor_service import executor_service
 from utils.html_cleaner import clean_html_content
+from utils.latency_sketch import latency_recorder
+from utils.log_facade import get_logger
 
 # Removed unused import: prometheus_metrics
 from utils.response_formatter import ResponseFormatter
 from utils.structured_logging import glpi_logger, log_glpi_request
 
+from .glpi_async_client import HTTPX_AVAILABLE, AsyncGLPIClient
+from .glpi_circuit_breaker import glpi_circuit_breakers
+from .glpi_concurrency import ConcurrencyLimitExceeded, glpi_concurrency_limiter
 from .glpi_helpers import GLPIServiceHelpers
+from .glpi_queries import (
+    SearchQuery,
+    TechnicianTally,
+    build_group_status_count_params,
+    build_hierarchy_status_count_params,
+    build_hierarchy_status_scan_params,
+    build_new_tickets_params,
+    build_status_count_params,
+    build_status_scan_params,
+    build_technician_scan_query,
+    hierarchy_level,
+    parse_content_range_total,
+    parse_total_count,
+    parse_user_display_name,
+    query_family,
+    top_technicians,
+    with_range,
+)
+from .glpi_query_planner import SCAN, glpi_query_planner
+from .glpi_retry import get_retry_budget, glpi_retry_policy, new_retry_budget
+from .glpi_search_options import create_search_options_cache
+from .glpi_session_pool import GLPISessionPool, SessionPoolExhausted
+from .glpi_technician_roster import TechnicianRecord, create_technician_roster
+from .glpi_token_store import create_session_token_store, is_record_valid
+from .glpi_transfer_stats import accept_encoding, glpi_transfer_stats
+
+# Janelas de comparação das tendências: deslocamento (dias) do período atual;
+# None = período imediatamente anterior com a mesma duração
+TREND_WINDOWS = {
+    "periodo_anterior": None,
+    "semana_anterior": 7,
+    "mes_anterior": 30,
+    "ano_anterior": 365,
+}
+PREVIOUS_TREND_WINDOW = "periodo_anterior"
+
+# Eixo de data dos totais por status (campo 15 = data de abertura)
+TREND_DATE_AXIS = "15"
+
+NEUTRAL_TRENDS = {"novos": 0.0, "pendentes": 0.0, "progresso": 0.0, "resolvidos": 0.0}
+
+
+class SessionToken(NamedTuple):
+    """Sessão GLPI principal: trocada por inteiro, nunca alterada campo a campo"""
+
+    token: Optional[str] = None
+    created_at: Optional[float] = None
+    expires_at: Optional[float] = None
 
 
 class GLPIService:
-    """Serviço para integração com a API do GLPI com autenticação robusta"""
+    """Serviço para integração com a API do GLPI com autenticação robusta
+
+    Uma única instância atende todas as threads de requisição. O estado de
+    configuração (``field_ids``) é um snapshot imutável substituído por inteiro,
+    a sessão principal é um ``SessionToken`` trocado atomicamente sob
+    ``_token_lock`` e o cache interno só é acessado sob ``_cache_lock``.
+    """
 
     def __init__(self):
         try:
@@ -49,7 +120,7 @@ class GLPIService:
             # Usar logger consolidado
             self.structured_logger = glpi_logger
 
-            self.logger = logging.getLogger("glpi_service")
+            self.logger = get_logger("glpi_service")
             self.logger.info("GLPIService inicializado com sucesso")
         except Exception as e:
             error_msg = f"Erro na inicialização do GLPIService: {e}"
@@ -75,15 +146,52 @@ class GLPIService:
             "N4": 92,  # CC-SE-SUBADM-DTIC > N4
         }
 
-        self.field_ids = {}
+        # Snapshot imutável; discover_field_ids() troca o mapeamento inteiro
+        self.field_ids = MappingProxyType({})
         self.session = requests.Session()  # Sessão HTTP para reutilização de conexões
-        self.session_token = None
-        self.token_created_at = None
-        self.token_expires_at = None
+        # Sessão principal, lida sem lock e trocada sob _token_lock
+        self._token_lock = threading.Lock()
+        self._token = SessionToken()
         self.max_retries = 3
         self.retry_delay_base = 2  # Base para backoff exponencial
         self.session_timeout = 3600  # 1 hora em segundos
 
+        # Token compartilhado entre workers, renovado antes de expirar
+        self.token_store = create_session_token_store(self.glpi_url, self.user_token)
+        self.token_refresh_margin = API_CONFIG.get("TOKEN_REFRESH_MARGIN", 120)
+
+        # Pool de sessões (opcional): o GLPI serializa requisições simultâneas do mesmo
+        # token (lock da sessão PHP), então cada requisição em andamento usa um token
+        # próprio. Os tokens do pool são do processo, fora do token_store compartilhado
+        pool_size = API_CONFIG.get("SESSION_POOL_SIZE", 1)
+        if pool_size is None:
+            # Uma sessão por vaga do limitador adaptativo: o pool nunca limita abaixo dele
+            pool_size = CONCURRENCY_CONFIG.get("ADAPTIVE_MAX_LIMIT", 16)
+        self.session_pool = None
+        if pool_size and pool_size > 1:
+            self.session_pool = GLPISessionPool(
+                pool_size,
+                init_session=self._open_pooled_session,
+                kill_session=self._kill_session_token,
+                refresh_margin=self.token_refresh_margin,
+            )
+            atexit.register(self.session_pool.close)
+
+        # Cliente assíncrono para os caminhos de fan-out (contagens e páginas);
+        # sem httpx tudo continua pelo transporte síncrono
+        self.async_client = None
+        if HTTPX_AVAILABLE and CONCURRENCY_CONFIG.get("ENABLE_ASYNC", True):
+            self.async_client = AsyncGLPIClient(self)
+            atexit.register(self.async_client.close)
+
+        # IDs de campos de busca persistidos em disco (por URL e versão do GLPI)
+        self.search_options = create_search_options_cache(self)
+        atexit.register(self.search_options.stop)
+
+        # Índice dos técnicos ativos, compartilhado pelo ranking e por /api/technicians
+        self.technician_roster = create_technician_roster(self)
+        atexit.register(self.technician_roster.stop)
+
         # Lock para thread safety do cache
         self._cache_lock = threading.RLock()
 
@@ -99,17 +207,13 @@ class GLPIService:
                 "timestamp": None,
                 "ttl": 600,
             },  # 10 minutos
-            "field_ids": {
-                "data": None,
-                "timestamp": None,
-                "ttl": 1800,
-            },  # 30 minutos
             "dashboard_metrics": {
                 "data": None,
                 "timestamp": None,
                 "ttl": 180,
             },  # 3 minutos
             "dashboard_metrics_filtered": {},  # Cache dinâmico para filtros de data
+            "trend_windows": {},  # Totais por status de cada janela de tendência
             "priority_names": {},  # Cache para nomes de prioridade
         }
 
@@ -130,28 +234,29 @@ class GLPIService:
                 self.logger.warning("Cache não inicializado corretamente")
                 return False
 
-            if sub_key:
-                cache_data = self._cache.get(cache_key, {}).get(sub_key)
-            else:
-                cache_data = self._cache.get(cache_key)
+            with self._cache_lock:
+                if sub_key:
+                    cache_data = self._cache.get(cache_key, {}).get(sub_key)
+                else:
+                    cache_data = self._cache.get(cache_key)
 
-            if not cache_data or not isinstance(cache_data, dict):
-                return False
+                if not cache_data or not isinstance(cache_data, dict):
+                    return False
 
-            timestamp = cache_data.get("timestamp")
-            if timestamp is None or not isinstance(timestamp, (int, float)):
-                self.logger.warning(f"Timestamp inválido no cache para {cache_key}")
-                return False
+                timestamp = cache_data.get("timestamp")
+                if timestamp is None or not isinstance(timestamp, (int, float)):
+                    self.logger.warning(f"Timestamp inválido no cache para {cache_key}")
+                    return False
 
-            current_time = time.time()
-            ttl = cache_data.get("ttl", 300)  # Default 5 minutos
+                current_time = time.time()
+                ttl = cache_data.get("ttl", 300)  # Default 5 minutos
 
-            if not isinstance(ttl, (int, float)) or ttl <= 0:
-                self.logger.warning(f"TTL inválido no cache para {cache_key}: {ttl}")
-                return False
+                if not isinstance(ttl, (int, float)) or ttl <= 0:
+                    self.logger.warning(f"TTL inválido no cache para {cache_key}: {ttl}")
+                    return False
 
-            is_valid = (current_time - timestamp) < ttl
-            return is_valid
+                is_valid = (current_time - timestamp) < ttl
+                return is_valid
 
         except Exception as e:
             self.logger.error(f"Erro ao verificar cache para {cache_key}: {e}")
@@ -250,11 +355,47 @@ class GLPIService:
             except Exception as e:
                 self.logger.error(f"Erro ao definir dados do cache para {cache_key}: {e}")
 
-    def _is_token_expired(self) -> bool:
+    @property
+    def session_token(self) -> Optional[str]:
+        return self._token.token
+
+    @session_token.setter
+    def session_token(self, value: Optional[str]) -> None:
+        self._replace_token(token=value)
+
+    @property
+    def token_created_at(self) -> Optional[float]:
+        return self._token.created_at
+
+    @token_created_at.setter
+    def token_created_at(self, value: Optional[float]) -> None:
+        self._replace_token(created_at=value)
+
+    @property
+    def token_expires_at(self) -> Optional[float]:
+        return self._token.expires_at
+
+    @token_expires_at.setter
+    def token_expires_at(self, value: Optional[float]) -> None:
+        self._replace_token(expires_at=value)
+
+    def _replace_token(self, **fields) -> None:
+        """Altera campos da sessão principal trocando o snapshot inteiro"""
+        with self._token_lock:
+            self._token = self._token._replace(**fields)
+
+    def _set_token(self, token: SessionToken) -> None:
+        """Publica uma nova sessão principal"""
+        with self._token_lock:
+            self._token = token
+
+    def _is_token_expired(self, current: Optional[SessionToken] = None) -> bool:
         """Verifica se o token de sessão está expirado com validações robustas"""
         try:
+            created_at = (current or self._token).created_at
+
             # Verificar se o timestamp de criação existe e é válido
-            if not self.token_created_at or not isinstance(self.token_created_at, (int, float)):
+            if not created_at or not isinstance(created_at, (int, float)):
                 self.logger.debug("Timestamp de criação do token não existe ou é inválido")
                 return True
 
@@ -270,11 +411,11 @@ class GLPIService:
             current_time = time.time()
 
             # Verificar se o timestamp não é futuro (proteção contra clock skew)
-            if self.token_created_at > current_time:
+            if created_at > current_time:
                 self.logger.warning("Timestamp do token está no futuro, considerando expirado")
                 return True
 
-            token_age = current_time - self.token_created_at
+            token_age = current_time - created_at
             is_expired = token_age >= self.session_timeout
             return is_expired
 
@@ -282,31 +423,94 @@ class GLPIService:
             self.logger.error(f"Erro ao verificar expiração do token: {e}")
             return True  # Em caso de erro, considerar expirado por segurança
 
+    def _has_valid_local_token(self, margin: float = 0.0) -> bool:
+        """Indica se o token local existe e não expira nos próximos ``margin`` segundos"""
+        current = self._token
+        if not current.token or not isinstance(current.token, str) or not current.token.strip():
+            return False
+        if self._is_token_expired(current):
+            return False
+        if isinstance(current.expires_at, (int, float)):
+            return time.time() + margin < current.expires_at
+        return True
+
+    def _adopt_shared_token(self, margin: float = 0.0) -> bool:
+        """Adota o token gravado no store compartilhado, se ainda for válido"""
+        record = self.token_store.load()
+        if not is_record_valid(record, margin):
+            return False
+
+        if record["session_token"] != self.session_token:
+            self.logger.debug("Reutilizando Session-Token compartilhado entre workers")
+        self._set_token(
+            SessionToken(
+                record["session_token"], record.get("created_at") or time.time(), record["expires_at"]
+            )
+        )
+        return True
+
+    def _invalidate_session_token(self, expected_token: Optional[str] = None) -> None:
+        """Descarta o token atual localmente e no store compartilhado
+
+        Com ``expected_token`` (o token recusado pelo GLPI), nada é descartado
+        se outra thread já tiver trocado a sessão nesse meio tempo.
+        """
+        with self._token_lock:
+            current = self._token
+            if expected_token is not None and current.token != expected_token:
+                return
+            self._token = SessionToken()
+        if current.token:
+            self.token_store.clear(expected_token=current.token)
+
     def _ensure_authenticated(self) -> bool:
-        """Garante que temos um token válido, re-autenticando se necessário com validações robustas"""
+        """Garante que temos um token válido, re-autenticando se necessário com validações robustas
+
+        O token é compartilhado entre workers por ``self.token_store``. A renovação
+        é antecipada em ``token_refresh_margin`` segundos e apenas um chamador por
+        vez executa ``initSession`` (single-flight); os demais reutilizam o token
+        gravado por ele.
+        """
         try:
-            # Verificar se o token existe e é válido
-            if (
-                not self.session_token
-                or not isinstance(self.session_token, str)
-                or not self.session_token.strip()
-            ):
-                self.logger.info("Token de sessão não existe ou é inválido, autenticando...")
-                return self._authenticate_with_retry()
+            margin = self.token_refresh_margin
 
-            # Verificar se o token está expirado
-            if self._is_token_expired():
-                self.logger.info("Token expirado, re-autenticando...")
-                return self._authenticate_with_retry()
+            if self._has_valid_local_token(margin):
+                return True
 
-            return True
+            # Outro worker pode já ter renovado o token
+            if self._adopt_shared_token(margin):
+                return True
+
+            # Token ainda válido (apenas perto de expirar): renovar sem bloquear
+            still_valid = self._has_valid_local_token()
+
+            with self.token_store.refresh_lock(timeout=15, blocking=not still_valid) as acquired:
+                if not acquired:
+                    if still_valid:
+                        return True
+                    self.logger.warning("Timeout aguardando renovação do token por outro worker")
+                    return self._adopt_shared_token()
+
+                # Re-verificar: a renovação pode ter acontecido enquanto aguardávamos o lock
+                if self._adopt_shared_token(margin):
+                    return True
+
+                self.logger.info("Token de sessão inexistente ou perto de expirar, autenticando...")
+                if not self._authenticate_with_retry():
+                    return still_valid
+
+                current = self._token
+                self.token_store.save(
+                    {
+                        "session_token": current.token,
+                        "created_at": current.created_at,
+                        "expires_at": current.expires_at,
+                    }
+                )
+                return True
 
         except Exception as e:
             self.logger.error(f"Erro ao garantir autenticação: {e}")
-            # Limpar token inválido
-            self.session_token = None
-            self.token_created_at = None
-            self.token_expires_at = None
             return False
 
     def _authenticate_with_retry(self) -> bool:
@@ -329,40 +533,34 @@ class GLPIService:
                 self.logger.warning("retry_delay_base inválido, usando padrão de 2")
                 self.retry_delay_base = 2
 
+            budget = get_retry_budget() or new_retry_budget()
+
             for attempt in range(self.max_retries):
                 try:
-                    self.logger.info(f"Tentativa de autenticação {attempt + 1}/{self.max_retries}")
+                    self.logger.info("Tentativa de autenticação %s/%s", attempt + 1, self.max_retries)
 
                     if self._perform_authentication():
-                        self.logger.info(f"Autenticação bem-sucedida na tentativa {attempt + 1}")
+                        self.logger.info("Autenticação bem-sucedida na tentativa %s", attempt + 1)
                         return True
 
-                    if attempt < self.max_retries - 1:
-                        delay = min(self.retry_delay_base**attempt, 30)  # Máximo de 30 segundos
-                        self.logger.warning(
-                            f"Tentativa {attempt + 1} falhou, aguardando {delay}s antes da próxima tentativa..."
-                        )
-                        time.sleep(delay)
+                    reason = "autenticação recusada"
 
                 except requests.exceptions.Timeout as e:
                     self.logger.error(f"Timeout na tentativa {attempt + 1}: {e}")
-                    if attempt < self.max_retries - 1:
-                        delay = min(self.retry_delay_base**attempt, 30)
-                        time.sleep(delay)
+                    reason = str(e)
 
                 except requests.exceptions.ConnectionError as e:
                     self.logger.error(f"Erro de conexão na tentativa {attempt + 1}: {e}")
-                    if attempt < self.max_retries - 1:
-                        delay = min(self.retry_delay_base**attempt, 30)
-                        time.sleep(delay)
+                    reason = str(e)
 
                 except Exception as e:
                     self.logger.error(f"Erro na tentativa {attempt + 1} de autenticação: {e}")
-                    if attempt < self.max_retries - 1:
-                        delay = min(self.retry_delay_base**attempt, 30)
-                        time.sleep(delay)
+                    reason = str(e)
 
-            self.logger.error(f"Falha na autenticação após {self.max_retries} tentativas")
+                if not glpi_retry_policy.wait_before_retry(attempt, budget, reason):
+                    break
+
+            self.logger.error(f"Falha na autenticação após {attempt + 1} tentativas")
             return False
 
         except Exception as e:
@@ -403,51 +601,15 @@ class GLPIService:
                 self.logger.warning("session_timeout inválido, usando padrão de 3600s")
                 self.session_timeout = 3600
 
-            session_headers = {
-                "Content-Type": "application/json",
-                "App-Token": self.app_token,
-                "Authorization": f"user_token {self.user_token}",
-            }
-
-            auth_url = f"{self.glpi_url.rstrip('/')}/initSession"
-            self.logger.info(f"Autenticando na API do GLPI: {auth_url}")
-
-            response = requests.get(
-                auth_url,
-                headers=session_headers,
-                timeout=8,  # Timeout mais generoso para autenticação
-            )
-
-            # Verificar status code
-            if response.status_code != 200:
-                self.logger.error(
-                    f"Falha na autenticação - Status: {response.status_code}, Resposta: {response.text}"
-                )
-                return False
-
-            # Validar resposta JSON
-            try:
-                response_data = response.json()
-            except ValueError as e:
-                self.logger.error(f"Resposta de autenticação não é JSON válido: {e}")
+            session_token = self._request_session_token()
+            if not session_token:
                 return False
 
-            # Validar presença do session_token
-            if not response_data or "session_token" not in response_data:
-                self.logger.error(f"session_token não encontrado na resposta: {response_data}")
-                return False
-
-            session_token = response_data["session_token"]
-            if not session_token or not isinstance(session_token, str) or not session_token.strip():
-                self.logger.error(f"session_token inválido: {session_token}")
-                return False
+            # Publicar a sessão de uma vez (token e validade sempre consistentes)
+            created_at = time.time()
+            self._set_token(SessionToken(session_token, created_at, created_at + self.session_timeout))
 
-            # Definir dados da sessão
-            self.session_token = session_token
-            self.token_created_at = time.time()
-            self.token_expires_at = self.token_created_at + self.session_timeout
-
-            self.logger.info(f"Autenticação bem-sucedida! Token expira em {self.session_timeout}s")
+            self.logger.info("Autenticação bem-sucedida! Token expira em %ss", self.session_timeout)
             return True
 
         except requests.exceptions.Timeout as e:
@@ -466,6 +628,75 @@ class GLPIService:
             self.logger.error(f"Erro inesperado na autenticação: {e}")
             return False
 
+    def _request_session_token(self) -> Optional[str]:
+        """Abre uma nova sessão (initSession) e retorna o Session-Token, ou None
+
+        Exceções de rede (timeout, conexão) são propagadas ao chamador.
+        """
+        session_headers = {
+            "Content-Type": "application/json",
+            "App-Token": self.app_token,
+            "Authorization": f"user_token {self.user_token}",
+        }
+
+        auth_url = f"{self.glpi_url.rstrip('/')}/initSession"
+        self.logger.info("Autenticando na API do GLPI: %s", auth_url)
+
+        response = requests.get(
+            auth_url,
+            headers=session_headers,
+            timeout=8,  # Timeout mais generoso para autenticação
+        )
+
+        # Verificar status code
+        if response.status_code != 200:
+            self.logger.error(
+                f"Falha na autenticação - Status: {response.status_code}, Resposta: {response.text}"
+            )
+            return None
+
+        # Validar resposta JSON
+        try:
+            response_data = response.json()
+        except ValueError as e:
+            self.logger.error(f"Resposta de autenticação não é JSON válido: {e}")
+            return None
+
+        # Validar presença do session_token
+        if not response_data or "session_token" not in response_data:
+            self.logger.error(f"session_token não encontrado na resposta: {response_data}")
+            return None
+
+        session_token = response_data["session_token"]
+        if not session_token or not isinstance(session_token, str) or not session_token.strip():
+            self.logger.error(f"session_token inválido: {session_token}")
+            return None
+
+        return session_token
+
+    def _open_pooled_session(self) -> Optional[Tuple[str, float]]:
+        """Abre uma sessão para o pool, retornando ``(token, expires_at)`` ou None"""
+        try:
+            session_token = self._request_session_token()
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Erro ao abrir sessão do pool: {e}")
+            return None
+        if not session_token:
+            return None
+        return session_token, time.time() + self.session_timeout
+
+    def _kill_session_token(self, session_token: str) -> None:
+        """Encerra (killSession) a sessão de um token específico"""
+        requests.get(
+            f"{self.glpi_url}/killSession",
+            headers={"Session-Token": session_token, "App-Token": self.app_token},
+            timeout=API_CONFIG.get("FAST_TIMEOUT", 5),
+        )
+
+    def _use_async_client(self) -> bool:
+        """Indica se o fan-out pode usar o cliente assíncrono nesta thread"""
+        return self.async_client is not None and self.async_client.can_run_sync()
+
     def authenticate(self) -> bool:
         """Método público para autenticação (mantido para compatibilidade)"""
         return self._authenticate_with_retry()
@@ -487,16 +718,13 @@ class GLPIService:
                 self.logger.error("app_token não está disponível ou é inválido")
                 return None
 
-            if (
-                not self.session_token
-                or not isinstance(self.session_token, str)
-                or not self.session_token.strip()
-            ):
+            session_token = self.session_token
+            if not session_token or not isinstance(session_token, str) or not session_token.strip():
                 self.logger.error("session_token não está disponível ou é inválido")
                 return None
 
             headers = {
-                "Session-Token": self.session_token,
+                "Session-Token": session_token,
                 "App-Token": self.app_token,
             }
 
@@ -506,6 +734,19 @@ class GLPIService:
             self.logger.error(f"Erro ao obter headers da API: {e}")
             return None
 
+    @staticmethod
+    def _default_timeout(url: str) -> float:
+        """Timeout de ``API_CONFIG`` conforme o tipo de operação do endpoint"""
+        endpoint_path = (url.split("/")[-1] if "/" in url else url).lower()
+
+        # Operações rápidas (status, auth)
+        if any(fast_op in endpoint_path for fast_op in ("status", "initsession", "killsession")):
+            return API_CONFIG.get("FAST_TIMEOUT", 5)
+        # Operações pesadas (search, reports)
+        if any(heavy_op in endpoint_path for heavy_op in ("search", "report", "listsearchoptions")):
+            return API_CONFIG.get("SLOW_TIMEOUT", 20)
+        return API_CONFIG.get("TIMEOUT", 12)
+
     def _make_authenticated_request(
         self,
         method: str,
@@ -513,7 +754,12 @@ class GLPIService:
         correlation_id: Optional[str] = None,
         **kwargs,
     ) -> Optional[requests.Response]:
-        """Faz uma requisição autenticada com retry automático e validações robustas"""
+        """Faz uma requisição autenticada com retry automático e validações robustas
+
+        Esta é a única camada que repete chamadas ao GLPI: a espera entre tentativas
+        segue ``glpi_retry_policy`` (full jitter) e consome o orçamento de retry da
+        requisição da API em curso.
+        """
         start_time = None  # Initialize start_time to avoid UnboundLocalError
         try:
             # Validar parâmetros de entrada
@@ -551,64 +797,68 @@ class GLPIService:
 
             # Usar timeout configurado se não fornecido
             if "timeout" not in kwargs:
-                try:
-                    # Importar configurações de performance
-                    from backend.config.performance import API_CONFIG
-
-                    # Determinar timeout baseado no tipo de operação
-                    endpoint_path = url.split("/")[-1] if "/" in url else url
-
-                    # Operações rápidas (status, auth)
-                    if any(
-                        fast_op in endpoint_path.lower()
-                        for fast_op in ["status", "initSession", "killSession"]
-                    ):
-                        kwargs["timeout"] = API_CONFIG.get("FAST_TIMEOUT", 5)
-                    # Operações pesadas (search, reports)
-                    elif any(
-                        heavy_op in endpoint_path.lower()
-                        for heavy_op in ["search", "report", "listSearchOptions"]
-                    ):
-                        kwargs["timeout"] = API_CONFIG.get("SLOW_TIMEOUT", 20)
-                    else:
-                        # Timeout padrão
-                        kwargs["timeout"] = API_CONFIG.get("TIMEOUT", 12)
-
-                except (ImportError, AttributeError):
-                    # Fallback para configuração do objeto config
-                    try:
-                        config_obj = active_config()
-                        kwargs["timeout"] = config_obj.API_TIMEOUT
-                    except (AttributeError, NameError):
-                        kwargs["timeout"] = 30  # Fallback final
-                        self.logger.warning("API_TIMEOUT não configurado, usando 30s")
+                kwargs["timeout"] = self._default_timeout(url)
 
             # Validar timeout
             if not isinstance(kwargs["timeout"], (int, float)) or kwargs["timeout"] <= 0:
                 kwargs["timeout"] = 30
                 self.logger.warning("Timeout inválido, usando 30s")
 
+            base_timeout = kwargs["timeout"]
+            # Headers extras do chamador, separados dos de autenticação: cada tentativa
+            # monta os seus (uma repetição após 401 não pode reenviar o token recusado)
+            extra_headers = kwargs.pop("headers", None)
+            breaker = glpi_circuit_breakers.for_url(url)
+            # Orçamento da requisição da API em curso (ou um orçamento só para esta chamada)
+            budget = get_retry_budget() or new_retry_budget()
+
             for attempt in range(self.max_retries):
+                # Prazo da requisição da API esgotado: não iniciar novas chamadas
+                deadline = get_deadline()
+                if deadline is not None:
+                    if deadline_expired(f"{method} {breaker.name}"):
+                        return None
+                    kwargs["timeout"] = deadline.clamp(base_timeout)
+
+                # Circuito aberto: falhar imediatamente em vez de esgotar as tentativas
+                if not breaker.allow_request():
+                    self.logger.warning(
+                        f"Circuito GLPI '{breaker.name}' aberto, requisição {method} {url} "
+                        f"recusada (nova tentativa em {breaker.retry_after():.1f}s)"
+                    )
+                    return None
+
+                lease = None
                 try:
-                    headers = self.get_api_headers()
+                    # Cada requisição em andamento usa uma sessão própria do pool
+                    # (initSession/killSession continuam usando o token principal)
+                    if self.session_pool is not None and breaker.name != "session":
+                        lease = self.session_pool.acquire(
+                            deadline.clamp(base_timeout) if deadline else base_timeout
+                        )
+                        headers = (
+                            {"Session-Token": lease.token, "App-Token": self.app_token}
+                            if lease
+                            else None
+                        )
+                    else:
+                        headers = self.get_api_headers()
                     if not headers:
                         self.logger.error(
                             f"Falha ao obter headers de autenticação (tentativa {attempt + 1})"
                         )
-                        if attempt < self.max_retries - 1:
-                            delay = min(self.retry_delay_base**attempt, 30)
-                            time.sleep(delay)
-                            continue
+                        # A autenticação já aplicou a política de retry; não repetir por cima
                         return None
 
+                    # Respostas comprimidas (gzip/br), salvo se API_CONFIG["COMPRESSION"] desligar
+                    headers["Accept-Encoding"] = accept_encoding()
+
                     # Adicionar headers customizados se fornecidos
-                    if "headers" in kwargs and isinstance(kwargs["headers"], dict):
-                        headers.update(kwargs["headers"])
+                    if isinstance(extra_headers, dict):
+                        headers.update(extra_headers)
                     kwargs["headers"] = headers
 
-                    self.logger.debug(
-                        f"Fazendo requisição {method} para {url} (tentativa {attempt + 1})"
-                    )
+                    self.logger.debug("Fazendo requisição %s para %s (tentativa %s)", method, url, attempt + 1)
 
                     # Log estruturado da chamada de API com correlation_id
                     if self.structured_logger and correlation_id:
@@ -625,8 +875,28 @@ class GLPIService:
                     # Log detalhado antes da requisição
                     # Debug logs removidos para produção
 
-                    response = requests.request(method, url, **kwargs)
+                    # Limitador global: nenhuma chamada ultrapassa o limite adaptativo
+                    acquire_timeout = CONCURRENCY_CONFIG.get("ADAPTIVE_ACQUIRE_TIMEOUT", 30)
+                    with glpi_concurrency_limiter.slot(
+                        deadline.clamp(acquire_timeout) if deadline else acquire_timeout
+                    ):
+                        start_time = time.time()
+                        try:
+                            response = requests.request(method, url, **kwargs)
+                        except requests.exceptions.Timeout:
+                            glpi_concurrency_limiter.on_overload("timeout")
+                            raise
                     response_time = time.time() - start_time
+                    family = query_family(url, kwargs.get("params"))
+                    glpi_transfer_stats.record_response(family, response)
+                    latency_recorder.record("upstream", family, response_time)
+
+                    if response.status_code >= 500:
+                        glpi_concurrency_limiter.on_overload(f"HTTP {response.status_code}")
+                        breaker.record_failure()
+                    else:
+                        glpi_concurrency_limiter.on_success(response_time)
+                        breaker.record_success()
 
                     # Log detalhado da resposta
                     # Debug detalhado removido para produção
@@ -664,15 +934,24 @@ class GLPIService:
                         self.logger.warning(
                             f"Recebido status {response.status_code}, token pode estar expirado"
                         )
-                        # Limpar token para forçar re-autenticação
-                        self.session_token = None
-                        self.token_created_at = None
-                        self.token_expires_at = None
+                        # Limpar token (do pool, ou também do store compartilhado)
+                        # para forçar re-autenticação
+                        if lease is not None:
+                            lease.invalidate()
+                        else:
+                            self._invalidate_session_token(headers.get("Session-Token"))
 
-                        if attempt < self.max_retries - 1:
+                        if glpi_retry_policy.wait_before_retry(
+                            attempt, budget, f"HTTP {response.status_code}"
+                        ):
                             self.logger.info("Tentando re-autenticar...")
-                            delay = min(self.retry_delay_base**attempt, 10)
-                            time.sleep(delay)
+                            continue
+
+                    # Erros transitórios do proxy/servidor são repetidos pela mesma política
+                    if response.status_code in (502, 503, 504):
+                        if glpi_retry_policy.wait_before_retry(
+                            attempt, budget, f"HTTP {response.status_code}"
+                        ):
                             continue
 
                     # Log de status codes problemáticos
@@ -690,8 +969,17 @@ class GLPIService:
 
                     return response
 
+                except ConcurrencyLimitExceeded as e:
+                    self.logger.error(f"Limite de concorrência GLPI saturado: {e}")
+                    return None
+
+                except SessionPoolExhausted as e:
+                    self.logger.error(f"Pool de sessões GLPI esgotado: {e}")
+                    return None
+
                 except requests.exceptions.Timeout as e:
                     self.logger.warning(f"Timeout na requisição (tentativa {attempt + 1}): {e}")
+                    breaker.record_failure()
                     # Incrementar contador de erros Prometheus
                     # Métrica de timeout removida (prometheus_metrics não disponível)
 
@@ -706,13 +994,13 @@ class GLPIService:
                         correlation_id=correlation_id,
                     )
 
-                    if attempt < self.max_retries - 1:
-                        delay = min(self.retry_delay_base**attempt, 30)
-                        time.sleep(delay)
+                    if glpi_retry_policy.wait_before_retry(attempt, budget, str(e)):
                         continue
+                    break
 
                 except requests.exceptions.ConnectionError as e:
                     self.logger.error(f"Erro de conexão (tentativa {attempt + 1}): {e}")
+                    breaker.record_failure()
                     # Incrementar contador de erros Prometheus
                     # Métrica de erro de conexão removida (prometheus_metrics não disponível)
 
@@ -727,30 +1015,29 @@ class GLPIService:
                         correlation_id=correlation_id,
                     )
 
-                    if attempt < self.max_retries - 1:
-                        delay = min(self.retry_delay_base**attempt, 30)
-                        time.sleep(delay)
+                    if glpi_retry_policy.wait_before_retry(attempt, budget, str(e)):
                         continue
+                    break
 
                 except requests.exceptions.RequestException as e:
                     self.logger.error(f"Erro na requisição (tentativa {attempt + 1}): {e}")
-                    if attempt < self.max_retries - 1:
-                        delay = min(self.retry_delay_base**attempt, 30)
-                        time.sleep(delay)
+                    if glpi_retry_policy.wait_before_retry(attempt, budget, str(e)):
                         continue
+                    break
 
                 except Exception as e:
                     self.logger.error(
                         f"Erro inesperado na requisição (tentativa {attempt + 1}): {e}"
                     )
-                    if attempt < self.max_retries - 1:
-                        delay = min(self.retry_delay_base**attempt, 30)
-                        time.sleep(delay)
+                    if glpi_retry_policy.wait_before_retry(attempt, budget, str(e)):
                         continue
+                    break
 
-            self.logger.error(
-                f"Todas as {self.max_retries} tentativas falharam para {method} {url}"
-            )
+                finally:
+                    if lease is not None:
+                        self.session_pool.release(lease)
+
+            self.logger.error(f"Todas as tentativas falharam para {method} {url}")
             return None
 
         except Exception as e:
@@ -758,169 +1045,24 @@ class GLPIService:
             return None
 
     def discover_field_ids(self) -> bool:
-        """Descobre dinamicamente os IDs dos campos do GLPI com validações robustas e cache"""
-        try:
-            # Verificar cache primeiro
-            cached_field_ids = self._get_cache_data("field_ids")
-            if cached_field_ids and isinstance(cached_field_ids, dict):
-                self.field_ids = cached_field_ids.copy()
-                self.logger.debug("Field IDs carregados do cache")
-                return True
-
-            # Validar estado da instância
-            if not hasattr(self, "field_ids") or not isinstance(self.field_ids, dict):
-                self.field_ids = {}
-                self.logger.warning("field_ids não inicializado, criando novo dicionário")
+        """IDs dos campos de busca do Ticket (GROUP, STATUS, TECH, DATE_CREATION)
 
+        Vêm do cache persistido de ``search_options`` (carregado do disco e
+        revalidado pela versão do GLPI); ``listSearchOptions/Ticket`` só é
+        baixado quando o mapeamento ainda não existe.
+        """
+        try:
             if not hasattr(self, "glpi_url") or not self.glpi_url:
                 self.logger.error("glpi_url não configurado")
                 return False
 
-            # Verificar autenticação
-            if not self._ensure_authenticated():
-                self.logger.error("Falha na autenticação para descobrir field IDs")
-                return False
-
-            try:
-                self.logger.debug("Iniciando descoberta de IDs de campos")
-                response = self._make_authenticated_request(
-                    "GET", f"{self.glpi_url}/listSearchOptions/Ticket"
-                )
-
-                if not response:
-                    self.logger.error("Resposta nula ao descobrir field IDs")
-                    return False
-
-                if not response.ok:
-                    self.logger.error(f"Falha ao descobrir field IDs: HTTP {response.status_code}")
-                    return False
-
-                # Validar resposta JSON
-                try:
-                    search_options = response.json()
-                except ValueError as e:
-                    self.logger.error(f"Resposta JSON inválida ao descobrir field IDs: {e}")
-                    return False
-
-                if not isinstance(search_options, dict):
-                    self.logger.error("Formato de resposta inválido para search options")
-                    return False
-
-                # Mapear nomes de campos para IDs com maior precisão
-                tech_group_field_names = [
-                    "Grupo técnico",
-                    "Technical group",
-                    "Grupo tecnico",
-                    "Assigned group",
-                    "Group",
-                    "Grupo",
-                    "Grupo atribuído",
-                    "Grupo responsável",
-                    "Responsible group",
-                ]
-
-                status_field_names = [
-                    "Status",
-                    "Estado",
-                    "State",
-                    "Situação",
-                    "Condition",
-                ]
-
-                # Descobrir campo TECH com mais opções
-                tech_field_names = [
-                    "Técnico",
-                    "Technician",
-                    "Tecnico",
-                    "Assigned technician",
-                    "Técnico encarregado",
-                    "Assigned to",
-                    "Atribuído para",
-                    "Técnico responsável",
-                    "Responsável",
-                    "Assignee",
-                    "Atribuído",
-                    "Assigned user",
-                    "Usuario atribuído",
-                ]
-
-                fields_found = {"GROUP": False, "STATUS": False, "TECH": False}
-
-                for field_id, field_info in search_options.items():
-                    try:
-                        if not isinstance(field_info, dict) or "name" not in field_info:
-                            continue
-
-                        field_name = str(field_info["name"]).strip()
-                        if not field_name:
-                            continue
-
-                        # Buscar campo de grupo técnico
-                        if not fields_found["GROUP"] and any(
-                            name.lower() in field_name.lower() for name in tech_group_field_names
-                        ):
-                            self.field_ids["GROUP"] = str(field_id)
-                            fields_found["GROUP"] = True
-                            self.logger.info(
-                                f"Campo GROUP encontrado: ID {field_id} - {field_name}"
-                            )
-
-                        # Buscar campo de status
-                        elif not fields_found["STATUS"] and any(
-                            name.lower() in field_name.lower() for name in status_field_names
-                        ):
-                            self.field_ids["STATUS"] = str(field_id)
-                            fields_found["STATUS"] = True
-                            self.logger.info(
-                                f"Campo STATUS encontrado: ID {field_id} - {field_name}"
-                            )
-
-                        # Buscar campo de técnico
-                        elif not fields_found["TECH"] and any(
-                            name.lower() in field_name.lower() for name in tech_field_names
-                        ):
-                            self.field_ids["TECH"] = str(field_id)
-                            fields_found["TECH"] = True
-                            self.logger.info(f"Campo TECH encontrado: ID {field_id} - {field_name}")
-
-                        # Parar se todos os campos foram encontrados
-                        if all(fields_found.values()):
-                            break
-
-                    except Exception as e:
-                        self.logger.warning(f"Erro ao processar campo {field_id}: {e}")
-                        continue
-
-                # Forçar ID 15 para data de criação (padrão GLPI)
-                self.field_ids["DATE_CREATION"] = "15"
-                self.logger.info("Campo DATE_CREATION definido como ID 15 (padrão GLPI)")
-
-                # Verificar se todos os campos essenciais estão presentes
-                required_fields = ["GROUP", "STATUS", "DATE_CREATION", "TECH"]
-                missing_fields = [
-                    field
-                    for field in required_fields
-                    if field not in self.field_ids or not self.field_ids[field]
-                ]
-
-                if missing_fields:
-                    self.logger.error(f"Campos críticos ainda ausentes: {missing_fields}")
-                    return False
-
-                # Salvar no cache para evitar descobertas futuras
-                self._set_cache_data("field_ids", self.field_ids.copy(), ttl=1800)  # 30 minutos
-                self.logger.info(
-                    f"IDs de campos descobertos com sucesso e salvos no cache: {self.field_ids}"
-                )
-                return True
-
-            except requests.exceptions.RequestException as e:
-                self.logger.error(f"Erro de requisição ao descobrir IDs dos campos: {e}")
+            fields = self.search_options.fields("Ticket")
+            if not fields:
+                self.logger.error("Falha ao descobrir os IDs dos campos do Ticket")
                 return False
 
-            except Exception as e:
-                self.logger.error(f"Erro inesperado ao descobrir IDs dos campos: {e}")
-                return False
+            self.field_ids = MappingProxyType(dict(fields))
+            return True
 
         except Exception as e:
             self.logger.error(f"Erro crítico no método discover_field_ids: {e}")
@@ -942,7 +1084,7 @@ class GLPIService:
 
             # Se não for um ID numérico, retornar o nome baseado no ID
             if not tech_id.isdigit():
-                self.logger.debug(f"tech_id não numérico: {tech_id}, retornando nome baseado no ID")
+                self.logger.debug("tech_id não numérico: %s, retornando nome baseado no ID", tech_id)
                 return f"Técnico {tech_id}"
 
             # Verificar configurações necessárias
@@ -951,7 +1093,7 @@ class GLPIService:
                 return f"Técnico {tech_id}"
 
             try:
-                self.logger.debug(f"Buscando dados do técnico {tech_id}")
+                self.logger.debug("Buscando dados do técnico %s", tech_id)
                 user_response = self._make_authenticated_request(
                     "GET", f"{self.glpi_url}/User/{tech_id}"
                 )
@@ -1015,9 +1157,7 @@ class GLPIService:
                                 "none",
                                 "",
                             ]:
-                                self.logger.debug(
-                                    f"Nome encontrado para técnico {tech_id}: {name} (campo: {field})"
-                                )
+                                self.logger.debug("Nome encontrado para técnico %s: %s (campo: %s)", tech_id, name, field)
                                 return name
                     except Exception as e:
                         self.logger.warning(
@@ -1033,17 +1173,13 @@ class GLPIService:
                     if firstname and lastname:
                         combined_name = f"{firstname} {lastname}".strip()
                         if combined_name:
-                            self.logger.debug(
-                                f"Nome combinado para técnico {tech_id}: {combined_name}"
-                            )
+                            self.logger.debug("Nome combinado para técnico %s: %s", tech_id, combined_name)
                             return combined_name
                     elif firstname:
-                        self.logger.debug(
-                            f"Apenas primeiro nome para técnico {tech_id}: {firstname}"
-                        )
+                        self.logger.debug("Apenas primeiro nome para técnico %s: %s", tech_id, firstname)
                         return firstname
                     elif lastname:
-                        self.logger.debug(f"Apenas sobrenome para técnico {tech_id}: {lastname}")
+                        self.logger.debug("Apenas sobrenome para técnico %s: %s", tech_id, lastname)
                         return lastname
                 except Exception as e:
                     self.logger.warning(f"Erro ao combinar nomes para usuário {tech_id}: {e}")
@@ -1127,11 +1263,12 @@ class GLPIService:
 
             if not self.field_ids:
                 if not self.discover_field_ids():
-                    timestamp = datetime.now(tz=timezone.utc).isoformat()
                     self.logger.error(
-                        f"[{timestamp}] Falha ao descobrir field_ids - "
-                        f"level: {level}, status_id: {status_id}, "
-                        f"start_date: {start_date}, end_date: {end_date}"
+                        "Falha ao descobrir field_ids - level: %s, status_id: %s, start_date: %s, end_date: %s",
+                        level,
+                        status_id,
+                        start_date,
+                        end_date,
                     )
                     return 0
 
@@ -1142,32 +1279,17 @@ class GLPIService:
                 )
                 return 0
 
-            # Usar campo 8 para estrutura hierárquica em vez do campo GROUP (71)
-            search_params = {
-                "is_deleted": 0,
-                "range": "0-0",
-                "criteria[0][field]": "8",  # Campo 8 contém a estrutura hierárquica
-                "criteria[0][searchtype]": "contains",
-                "criteria[0][value]": level,  # Ex: "N1", "N2", "N3", "N4"
-                "criteria[1][link]": "AND",
-                "criteria[1][field]": self.field_ids["STATUS"],
-                "criteria[1][searchtype]": "equals",
-                "criteria[1][value]": status_id,
-            }
-
-            # Adicionar filtros de data se fornecidos usando função utilitária
-            # Para métricas por nível, usar data de modificação (campo 19) em vez de criação
-            if start_date or end_date:
-                date_criteria = DateValidator.construir_criterios_filtro_data(
-                    start_date=start_date,
-                    end_date=end_date,
-                    field_id="19",  # Campo de data de modificação para métricas por nível
-                    criteria_start_index=2,
-                )
-                search_params.update(date_criteria)
+            # Usar campo 8 para estrutura hierárquica em vez do campo GROUP (71);
+            # o período é filtrado pela data de modificação (campo 19)
+            search_params = build_hierarchy_status_count_params(
+                level, self.field_ids["STATUS"], status_id, start_date, end_date
+            )
 
             self.logger.info(
-                f"[{datetime.now(tz=timezone.utc).isoformat()}] Buscando tickets por hierarquia - level: {level}, status: {status_id}"
+                "Buscando tickets por hierarquia - level: %s, status: %s",
+                level,
+                status_id,
+                sample="ticket_count",
             )
 
             response = self._make_authenticated_request(
@@ -1183,9 +1305,7 @@ class GLPIService:
                 if content_range:
                     try:
                         total_count = int(content_range.split("/")[-1])
-                        self.logger.info(
-                            f"[{datetime.now(tz=timezone.utc).isoformat()}] Contagem extraída do Content-Range: {total_count}"
-                        )
+                        self.logger.info("Contagem extraída do Content-Range: %s", total_count, sample="ticket_count")
                         return total_count
                     except (ValueError, IndexError) as e:
                         self.logger.warning(
@@ -1201,7 +1321,9 @@ class GLPIService:
                             try:
                                 total_count = int(data["content-range"].split("/")[-1])
                                 self.logger.info(
-                                    f"[{datetime.now(tz=timezone.utc).isoformat()}] Contagem extraída do content-range no JSON: {total_count}"
+                                    "Contagem extraída do content-range no JSON: %s",
+                                    total_count,
+                                    sample="ticket_count",
                                 )
                                 return total_count
                             except (ValueError, IndexError) as e:
@@ -1212,25 +1334,19 @@ class GLPIService:
                         # Verificar campo 'totalcount'
                         if "totalcount" in data:
                             total_count = int(data["totalcount"])
-                            self.logger.info(
-                                f"[{datetime.now(tz=timezone.utc).isoformat()}] Contagem extraída do totalcount: {total_count}"
-                            )
+                            self.logger.info("Contagem extraída do totalcount: %s", total_count, sample="ticket_count")
                             return total_count
 
                         # Se data é uma lista, retornar o comprimento
                         if "data" in data and isinstance(data["data"], list):
                             count = len(data["data"])
-                            self.logger.info(
-                                f"[{datetime.now(tz=timezone.utc).isoformat()}] Contagem baseada no tamanho da lista de dados: {count}"
-                            )
+                            self.logger.info("Contagem baseada no tamanho da lista de dados: %s", count, sample="ticket_count")
                             return count
 
                     # Se a resposta é uma lista diretamente
                     elif isinstance(data, list):
                         count = len(data)
-                        self.logger.info(
-                            f"[{datetime.now(tz=timezone.utc).isoformat()}] Contagem baseada no tamanho da lista: {count}"
-                        )
+                        self.logger.info("Contagem baseada no tamanho da lista: %s", count, sample="ticket_count")
                         return count
 
                 except ValueError as e:
@@ -1324,11 +1440,12 @@ class GLPIService:
 
             if not self.field_ids:
                 if not self.discover_field_ids():
-                    timestamp = datetime.now(tz=timezone.utc).isoformat()
                     self.logger.error(
-                        f"[{timestamp}] Falha ao descobrir field_ids - "
-                        f"group_id: {group_id}, status_id: {status_id}, "
-                        f"start_date: {start_date}, end_date: {end_date}"
+                        "Falha ao descobrir field_ids - group_id: %s, status_id: %s, start_date: %s, end_date: %s",
+                        group_id,
+                        status_id,
+                        start_date,
+                        end_date,
                     )
                     return 0
 
@@ -1339,66 +1456,64 @@ class GLPIService:
                 )
                 return 0
 
-            search_params = {
-                "is_deleted": 0,
-                "range": "0-0",
-                "criteria[0][field]": self.field_ids["GROUP"],
-                "criteria[0][searchtype]": "equals",
-                "criteria[0][value]": group_id,
-                "criteria[1][link]": "AND",
-                "criteria[1][field]": self.field_ids["STATUS"],
-                "criteria[1][searchtype]": "equals",
-                "criteria[1][value]": status_id,
-            }
-
             # Log de observabilidade: parâmetros GLPI
-            timestamp = datetime.now(tz=timezone.utc).isoformat()
             self.logger.info(
-                f"[{timestamp}] GLPI Query Parameters - "
-                f"group_id: {group_id}, status_id: {status_id}, "
-                f"GROUP_field: {self.field_ids['GROUP']}, STATUS_field: {self.field_ids['STATUS']}, "
-                f"date_range: {start_date} to {end_date}"
+                "GLPI Query Parameters - group_id: %s, status_id: %s, GROUP_field: %s, STATUS_field: %s, date_range: %s to %s",
+                group_id,
+                status_id,
+                self.field_ids["GROUP"],
+                self.field_ids["STATUS"],
+                start_date,
+                end_date,
+                sample="ticket_count",
             )
 
-            # Adicionar filtros de data se fornecidos usando função utilitária
-            if (start_date and start_date.strip()) or (end_date and end_date.strip()):
-                try:
-                    date_criteria = DateValidator.construir_criterios_filtro_data(
-                        start_date=start_date.strip() if start_date else None,
-                        end_date=end_date.strip() if end_date else None,
-                        field_id=date_field,  # Usar campo de data configurável
-                        criteria_start_index=2,
-                    )
-                    search_params.update(date_criteria)
-                except ValueError as e:
-                    self.logger.warning(
-                        f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao processar filtros de data: {e}"
-                    )
-
+            # Filtros de data (campo configurável) aplicados pelo builder compartilhado
             try:
-                response = self._make_authenticated_request(
-                    "GET",
-                    f"{self.glpi_url}/search/Ticket",
+                search_params = build_group_status_count_params(
+                    self.field_ids["GROUP"],
+                    group_id,
+                    self.field_ids["STATUS"],
+                    status_id,
+                    start_date=start_date.strip() if start_date else None,
+                    end_date=end_date.strip() if end_date else None,
+                    date_field=date_field,
+                )
+            except ValueError as e:
+                self.logger.warning(
+                    f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao processar filtros de data: {e}"
+                )
+                search_params = build_group_status_count_params(
+                    self.field_ids["GROUP"], group_id, self.field_ids["STATUS"], status_id
+                )
+
+            try:
+                response = self._make_authenticated_request(
+                    "GET",
+                    f"{self.glpi_url}/search/Ticket",
                     correlation_id=correlation_id,
                     params=search_params,
                 )
 
                 if not response:
-                    timestamp = datetime.now(tz=timezone.utc).isoformat()
                     self.logger.error(
-                        f"[{timestamp}] Resposta vazia da API GLPI - "
-                        f"group_id: {group_id}, status_id: {status_id}, "
-                        f"start_date: {start_date}, end_date: {end_date}"
+                        "Resposta vazia da API GLPI - group_id: %s, status_id: %s, start_date: %s, end_date: %s",
+                        group_id,
+                        status_id,
+                        start_date,
+                        end_date,
                     )
                     return 0
 
                 # Verificar se o status code é válido (200 OK ou 206 Partial Content)
                 if response.status_code not in [200, 206]:
-                    timestamp = datetime.now(tz=timezone.utc).isoformat()
                     self.logger.error(
-                        f"[{timestamp}] API GLPI retornou status {response.status_code} - "
-                        f"group_id: {group_id}, status_id: {status_id}, "
-                        f"start_date: {start_date}, end_date: {end_date}"
+                        "API GLPI retornou status %s - group_id: %s, status_id: %s, start_date: %s, end_date: %s",
+                        response.status_code,
+                        group_id,
+                        status_id,
+                        start_date,
+                        end_date,
                     )
                     return 0
 
@@ -1420,11 +1535,12 @@ class GLPIService:
                             return 0
 
                         total = int(total_str)
-                        timestamp = datetime.now(tz=timezone.utc).isoformat()
                         self.logger.info(
-                            f"[{timestamp}] GLPI Query Result - "
-                            f"group_id: {group_id}, status_id: {status_id}, "
-                            f"ticket_count: {total}, source: content-range_header"
+                            "GLPI Query Result - group_id: %s, status_id: %s, ticket_count: %s, source: content-range_header",
+                            group_id,
+                            status_id,
+                            total,
+                            sample="ticket_count",
                         )
                         return total
                     except (ValueError, IndexError) as e:
@@ -1442,11 +1558,12 @@ class GLPIService:
                             total_str = content_range.split("/")[-1]
                             if total_str.isdigit():
                                 total = int(total_str)
-                                timestamp = datetime.now(tz=timezone.utc).isoformat()
                                 self.logger.info(
-                                    f"[{timestamp}] GLPI Query Result - "
-                                    f"group_id: {group_id}, status_id: {status_id}, "
-                                    f"ticket_count: {total}, source: content-range_json"
+                                    "GLPI Query Result - group_id: %s, status_id: %s, ticket_count: %s, source: content-range_json",
+                                    group_id,
+                                    status_id,
+                                    total,
+                                    sample="ticket_count",
                                 )
                                 return total
                             else:
@@ -1462,11 +1579,12 @@ class GLPIService:
                     if isinstance(response_data, dict) and "totalcount" in response_data:
                         total = response_data["totalcount"]
                         if isinstance(total, int):
-                            timestamp = datetime.now(tz=timezone.utc).isoformat()
                             self.logger.info(
-                                f"[{timestamp}] GLPI Query Result - "
-                                f"group_id: {group_id}, status_id: {status_id}, "
-                                f"ticket_count: {total}, source: totalcount"
+                                "GLPI Query Result - group_id: %s, status_id: %s, ticket_count: %s, source: totalcount",
+                                group_id,
+                                status_id,
+                                total,
+                                sample="ticket_count",
                             )
                             return total
 
@@ -1497,11 +1615,13 @@ class GLPIService:
                 )
                 return 0
             except Exception as e:
-                timestamp = datetime.now(tz=timezone.utc).isoformat()
                 self.logger.error(
-                    f"[{timestamp}] Exceção inesperada ao buscar contagem de tickets: {str(e)} - "
-                    f"group_id: {group_id}, status_id: {status_id}, "
-                    f"start_date: {start_date}, end_date: {end_date}"
+                    "Exceção inesperada ao buscar contagem de tickets: %s - group_id: %s, status_id: %s, start_date: %s, end_date: %s",
+                    str(e),
+                    group_id,
+                    status_id,
+                    start_date,
+                    end_date,
                 )
                 return 0
 
@@ -1627,6 +1747,19 @@ class GLPIService:
                 )
                 return {}
 
+            # Fan-out assíncrono: as 24 contagens (nível x status) ficam em andamento
+            # ao mesmo tempo em um único event loop
+            if self._use_async_client():
+                return self.async_client.run(
+                    self.async_client.count_by_group_and_status(
+                        self.service_levels,
+                        self.status_map,
+                        start_date.strip() if start_date else None,
+                        end_date.strip() if end_date else None,
+                        date_field="19",  # Usar data de modificação para métricas por nível
+                    )
+                )
+
             metrics = {}
 
             for level_name, group_id in self.service_levels.items():
@@ -1716,7 +1849,7 @@ class GLPIService:
             debug_data = {
                 "technician_id": technician_id,
                 "tech_field_id": tech_field_id,
-                "field_ids": self.field_ids,
+                "field_ids": dict(self.field_ids),
                 "status_map": self.status_map,
                 "tickets": [],
             }
@@ -1785,7 +1918,7 @@ class GLPIService:
             # Tentar descobrir IDs dos campos
             if self.discover_field_ids():
                 debug_data["field_discovery"] = True
-                debug_data["field_ids"] = self.field_ids
+                debug_data["field_ids"] = dict(self.field_ids)
 
                 # Descobrir ID do campo do técnico
                 tech_field_id = self._discover_tech_field_id()
@@ -1850,7 +1983,7 @@ class GLPIService:
             return None
 
         try:
-            self.logger.debug(f"Buscando detalhes do ticket ID: {ticket_id}")
+            self.logger.debug("Buscando detalhes do ticket ID: %s", ticket_id)
 
             # Buscar o ticket pelo ID
             url = f"{self.base_url}/Ticket/{ticket_id}"
@@ -1874,7 +2007,7 @@ class GLPIService:
 
             headers = {
                 "App-Token": self.app_token,
-                "Session-Token": self.session_token,
+                "Session-Token": self._token.token,
                 "Content-Type": "application/json",
             }
 
@@ -1886,7 +2019,7 @@ class GLPIService:
                 if ticket_data:
                     # Processar e enriquecer os dados do ticket
                     processed_ticket = self._process_ticket_details(ticket_data)
-                    self.logger.info(f"Detalhes do ticket {ticket_id} obtidos com sucesso")
+                    self.logger.info("Detalhes do ticket %s obtidos com sucesso", ticket_id)
                     return processed_ticket
                 else:
                     self.logger.warning(f"Ticket {ticket_id} não encontrado")
@@ -2037,221 +2170,195 @@ class GLPIService:
         }
         return status_map.get(status_id, "desconhecido")
 
-    def _get_aggregated_ticket_counts(
+    def _count_search(
+        self, search_params: Dict[str, Any], correlation_id: Optional[str] = None
+    ) -> Optional[int]:
+        """Total de tickets de uma busca ``range=0-0`` (``None`` se a contagem falhar)"""
+        response = self._make_authenticated_request(
+            "GET",
+            f"{self.glpi_url}/search/Ticket",
+            params=search_params,
+            correlation_id=correlation_id,
+        )
+        if not response or response.status_code not in (200, 206):
+            return None
+        try:
+            return parse_total_count(response.headers, response.json())
+        except ValueError:
+            return parse_content_range_total(response.headers.get("Content-Range"))
+
+    def _parallel_counts(
+        self, queries: Dict[Any, Dict[str, Any]], correlation_id: Optional[str] = None
+    ) -> Dict[Any, Optional[int]]:
+        """Contagens ``range=0-0`` em paralelo no pool compartilhado, limitadas pelo limitador adaptativo"""
+        if not queries:
+            return {}
+
+        counts = {}
+        pool = executor_service.pool("glpi_requests")
+        future_to_key = {
+            pool.submit(self._count_search, params, correlation_id): key
+            for key, params in queries.items()
+        }
+        for future in concurrent.futures.as_completed(future_to_key):
+            key = future_to_key[future]
+            try:
+                counts[key] = future.result()
+            except Exception as e:
+                self.logger.error(f"Erro na contagem {key}: {e}")
+                counts[key] = None
+        return {key: counts.get(key) for key in queries}
+
+    def _iter_search_pages(
         self,
-        levels: List[str],
-        status_ids: List[int],
-        start_date: Optional[str] = None,
-        end_date: Optional[str] = None,
+        label: str,
+        search_params: Dict[str, Any],
         correlation_id: Optional[str] = None,
-    ) -> Dict[str, Dict[str, int]]:
-        """Método otimizado para buscar contagens de tickets agregadas em uma única requisição
-
-        Args:
-            levels: Lista de níveis hierárquicos (ex: ["N1", "N2", "N3", "N4"])
-            status_ids: Lista de IDs de status
-            start_date: Data de início (formato YYYY-MM-DD)
-            end_date: Data de fim (formato YYYY-MM-DD)
-            correlation_id: ID de correlação para logs
+        page_size: int = 1000,
+        itemtype: str = "Ticket",
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Linhas de uma busca em ``search/<itemtype>``, página a página (paginação sequencial)
 
-        Returns:
-            Dict com estrutura: {"N1": {"status_name": count, ...}, ...}
+        Para no fim dos dados, no limite de segurança ou quando o prazo da
+        requisição acaba; levanta exceção se uma página falhar.
         """
-        try:
-            # Inicializar resultado
-            result = {level: {} for level in levels}
-
-            # Construir critérios de busca agregada
-            search_params = {
-                "is_deleted": 0,
-                "forcedisplay[0]": "8",  # Campo hierarquia
-                "forcedisplay[1]": "12",  # Campo status
-            }
+        correlation_log = f"[{correlation_id}] " if correlation_id else ""
+        start_index = 0
 
-            # Critério para hierarquia (campo 8) - usar OR para múltiplos níveis
-            criteria_index = 0
-            for i, level in enumerate(levels):
-                if i == 0:
-                    search_params[f"criteria[{criteria_index}][field]"] = "8"  # Campo hierarquia
-                    search_params[f"criteria[{criteria_index}][searchtype]"] = "contains"
-                    search_params[
-                        f"criteria[{criteria_index}][value]"
-                    ] = level.upper()  # N1, N2, N3, N4
-                else:
-                    criteria_index += 1
-                    search_params[f"criteria[{criteria_index}][link]"] = "OR"
-                    search_params[f"criteria[{criteria_index}][field]"] = "8"  # Campo hierarquia
-                    search_params[f"criteria[{criteria_index}][searchtype]"] = "contains"
-                    search_params[
-                        f"criteria[{criteria_index}][value]"
-                    ] = level.upper()  # N1, N2, N3, N4
-
-            # Critério para status - usar OR para múltiplos status
-            criteria_index += 1
-            search_params[f"criteria[{criteria_index}][link]"] = "AND"
-            search_params[f"criteria[{criteria_index}][field]"] = "12"
-            search_params[f"criteria[{criteria_index}][searchtype]"] = "equals"
-            search_params[f"criteria[{criteria_index}][value]"] = status_ids[0]
-
-            for status_id in status_ids[1:]:
-                criteria_index += 1
-                search_params[f"criteria[{criteria_index}][link]"] = "OR"
-                search_params[f"criteria[{criteria_index}][field]"] = "12"
-                search_params[f"criteria[{criteria_index}][searchtype]"] = "equals"
-                search_params[f"criteria[{criteria_index}][value]"] = status_id
-
-            # Adicionar filtros de data se fornecidos usando função utilitária
-            # Para métricas por nível, usar data de modificação (campo 19) em vez de criação (campo 15)
-            if start_date or end_date:
-                date_criteria = DateValidator.construir_criterios_filtro_data(
-                    start_date=start_date,
-                    end_date=end_date,
-                    field_id="19",  # Campo de data de modificação para métricas por nível
-                    criteria_start_index=criteria_index + 1,
-                )
-                search_params.update(date_criteria)
+        while True:
+            # Prazo esgotado: quem consome fica com as páginas já obtidas
+            if deadline_expired(f"varredura de {label}"):
+                return
 
-            correlation_log = f"[{correlation_id}] " if correlation_id else ""
-            self.logger.info(
-                f"{correlation_log}[OTIMIZAÇÃO] Buscando contagens agregadas para {len(levels)} níveis e {len(status_ids)} status"
+            response = self._make_authenticated_request(
+                "GET",
+                f"{self.glpi_url}/search/{itemtype}",
+                params=with_range(search_params, start_index, page_size),
+                timeout=60,
+                correlation_id=correlation_id,
             )
 
-            # Inicializar contadores
-            for level in levels:
-                for status_name, status_id in self.status_map.items():
-                    result[level][status_name] = 0
-
-            # Usar paginação robusta para buscar todos os dados
-            try:
-                import time
-
-                page_size = 1000
-                start_index = 0
-                max_retries = 3
-                total_processed = 0
-
-                while True:
-                    # Configurar range para esta página
-                    end_index = start_index + page_size - 1
-                    current_params = search_params.copy()
-                    current_params["range"] = f"{start_index}-{end_index}"
+            if not response and deadline_exceeded():
+                return
 
-                    retry_count = 0
-                    page_data = None
-
-                    # Tentar buscar esta página com retry
-                    while retry_count < max_retries:
-                        try:
-                            response = self._make_authenticated_request(
-                                "GET",
-                                f"{self.glpi_url}/search/Ticket",
-                                params=current_params,
-                                timeout=60,
-                            )
+            if not response or not response.ok:
+                raise Exception(
+                    f"Falha na requisição da página {start_index}-{start_index + page_size - 1}: "
+                    f"{response.status_code if response else 'No response'}"
+                )
 
-                            if not response or not response.ok:
-                                raise Exception(
-                                    f"Falha na requisição: {response.status_code if response else 'No response'}"
-                                )
+            page_data = response.json()
+            rows = page_data.get("data") if isinstance(page_data, dict) else None
+            if not rows:
+                return
 
-                            page_data = response.json()
-                            break  # Sucesso, sair do loop de retry
+            yield rows
 
-                        except Exception as e:
-                            retry_count += 1
-                            if retry_count < max_retries:
-                                wait_time = 2**retry_count
-                                self.logger.warning(
-                                    f"{correlation_log}Erro na página {start_index}-{end_index}, tentativa {retry_count}/{max_retries}: {e}. Aguardando {wait_time}s..."
-                                )
-                                time.sleep(wait_time)
-                            else:
-                                self.logger.error(
-                                    f"{correlation_log}Falha após {max_retries} tentativas na página {start_index}-{end_index}: {e}"
-                                )
-                                raise
-
-                    # Processar dados da página
-                    if (
-                        not page_data
-                        or not isinstance(page_data, dict)
-                        or "data" not in page_data
-                        or not page_data["data"]
-                    ):
-                        self.logger.info(
-                            f"{correlation_log}Página {start_index}-{end_index} vazia ou sem dados. Finalizando paginação."
-                        )
-                        break
+            if len(rows) < page_size:
+                return
 
-                    page_items = len(page_data["data"])
+            start_index += page_size
 
-                    # Contar tickets por nível e status nesta página
-                    for ticket in page_data["data"]:
-                        try:
-                            ticket_hierarchy = str(ticket.get("8", "")).strip()  # Campo hierarquia
-                            ticket_status_id = int(ticket.get("12", 0))  # Campo status
-
-                            # Extrair nível da hierarquia textual (ex: "CC-SE-SUBADM-DTIC > N2" -> "N2")
-                            ticket_level = None
-                            if ticket_hierarchy and ticket_hierarchy != "None":
-                                # Procurar por N1, N2, N3, N4 na string de hierarquia
-                                for level in ["N1", "N2", "N3", "N4"]:
-                                    if level in ticket_hierarchy:
-                                        ticket_level = level
-                                        break
-
-                            if ticket_level and ticket_level in result:
-                                # Encontrar nome do status
-                                for (
-                                    status_name,
-                                    status_id,
-                                ) in self.status_map.items():
-                                    if int(status_id) == ticket_status_id:
-                                        result[ticket_level][status_name] += 1
-                                        break
-                        except (ValueError, KeyError, TypeError) as e:
-                            self.logger.debug(f"{correlation_log}Erro ao processar ticket: {e}")
-                            continue
+            # Limite de segurança
+            if start_index > 100000:
+                self.logger.warning(
+                    f"{correlation_log}Limite de segurança atingido em {start_index} tickets. Finalizando paginação."
+                )
+                return
 
-                    total_processed += page_items
-                    self.logger.debug(
-                        f"{correlation_log}Processados {page_items} tickets na página {start_index}-{end_index}. Total: {total_processed}"
-                    )
+    def _scan_facet_counts(
+        self,
+        label: str,
+        scan_params: Dict[str, Any],
+        classify: Callable[[Dict[str, Any]], Any],
+        keys: Iterable[Any],
+        correlation_id: Optional[str] = None,
+    ) -> Optional[Dict[Any, int]]:
+        """Conta as facetas varrendo a busca unificada página a página
 
-                    # Verificar se chegamos ao fim
-                    if page_items < page_size:
-                        self.logger.info(
-                            f"{correlation_log}Última página processada. Total de tickets: {total_processed}"
-                        )
-                        break
+        Returns:
+            ``{faceta: total}`` ou ``None`` se uma página falhar
+        """
+        correlation_log = f"[{correlation_id}] " if correlation_id else ""
+        counts = {key: 0 for key in keys}
+        total_processed = 0
+        pages = 0
+        started = time.perf_counter()
 
-                    # Avançar para próxima página
-                    start_index += page_size
+        try:
+            for rows in self._iter_search_pages(
+                label, scan_params, correlation_id, glpi_query_planner.page_size
+            ):
+                pages += 1
+                for row in rows:
+                    try:
+                        key = classify(row)
+                    except (ValueError, KeyError, TypeError) as e:
+                        self.logger.debug("%sErro ao processar ticket: %s", correlation_log, e)
+                        continue
+                    if key in counts:
+                        counts[key] += 1
+                total_processed += len(rows)
 
-                    # Limite de segurança
-                    if start_index > 100000:
-                        self.logger.warning(
-                            f"{correlation_log}Limite de segurança atingido em {start_index} tickets. Finalizando paginação."
-                        )
-                        break
+        except Exception as e:
+            self.logger.error(f"{correlation_log}Erro na varredura de {label}: {e}")
+            return None
 
-                total_tickets = sum(sum(level_data.values()) for level_data in result.values())
-                self.logger.info(
-                    f"{correlation_log}[OTIMIZAÇÃO] Contagens agregadas obtidas: {total_tickets} tickets total"
-                )
+        glpi_query_planner.observe_scan(time.perf_counter() - started, pages, total_processed)
+        self.logger.info("%sVarredura de %s: %s tickets em %s páginas", correlation_log, label, total_processed, pages)
+        return counts
 
-                return result
+    def _count_facets(
+        self,
+        label: str,
+        queries: Dict[Any, Dict[str, Any]],
+        scan_params: Dict[str, Any],
+        classify: Callable[[Dict[str, Any]], Any],
+        correlation_id: Optional[str] = None,
+    ) -> Dict[Any, int]:
+        """Contagem de cada faceta pelo plano mais barato (``glpi_query_planner``)
 
-            except Exception as e:
-                self.logger.error(f"{correlation_log}Erro na paginação robusta: {e}")
-                return {}
+        Escolhe entre contagens ``range=0-0`` em paralelo e uma varredura única
+        da busca unificada, dimensionada por uma sonda ``range=0-0``. Com o
+        cliente assíncrono disponível o plano é executado por ele.
 
-        except Exception as e:
-            correlation_log = f"[{correlation_id}] " if correlation_id else ""
-            self.logger.error(f"{correlation_log}Erro na busca agregada: {e}")
-            return {}
+        Args:
+            label: Nome da consulta no log do plano
+            queries: ``{faceta: parâmetros da contagem range=0-0}``
+            scan_params: Busca unificada das facetas (sem ``range``)
+            classify: Faceta de uma linha da varredura (ou ``None``)
+            correlation_id: ID de correlação para logs
 
+        Returns:
+            ``{faceta: total}``; contagens que falharam valem 0
+        """
+        if self._use_async_client():
+            return self.async_client.run(
+                self.async_client.count_facets(label, queries, scan_params, classify)
+            )
 
+        parallelism = glpi_concurrency_limiter.limit
+        total = None
+        if glpi_query_planner.needs_probe(len(queries), parallelism):
+            started = time.perf_counter()
+            total = self._count_search(with_range(scan_params, 0, 1), correlation_id)
+            if total is not None:
+                glpi_query_planner.observe_requests(time.perf_counter() - started)
+
+        plan = glpi_query_planner.plan(label, len(queries), parallelism, total)
+        if plan.strategy == SCAN:
+            counts = self._scan_facet_counts(label, scan_params, classify, queries, correlation_id)
+            if counts is not None:
+                return counts
+            self.logger.warning(f"Varredura de {label} falhou; usando contagens")
+
+        started = time.perf_counter()
+        counts = self._parallel_counts(queries, correlation_id)
+        if any(total is not None for total in counts.values()):
+            glpi_query_planner.observe_requests(
+                time.perf_counter() - started, math.ceil(len(queries) / parallelism)
+            )
+        return {key: total or 0 for key, total in counts.items()}
 
     def _get_metrics_by_level_internal_hierarchy(
         self,
@@ -2306,30 +2413,46 @@ class GLPIService:
                 )
                 return {}
 
-            # OTIMIZAÇÃO: Usar busca agregada em vez de requisições individuais
+            # Matriz nível x status: 24 contagens em paralelo ou uma varredura
+            # única, conforme o plano mais barato para o período
             hierarchy_levels = ["N1", "N2", "N3", "N4"]
-            status_ids = [int(status_id) for status_id in self.status_map.values()]
+            status_field = self.field_ids.get("STATUS", "12")
+            statuses = {
+                status_name: int(status_id) for status_name, status_id in self.status_map.items()
+            }
+            status_by_id = {str(status_id): status_name for status_name, status_id in statuses.items()}
+            start = start_date.strip() if start_date else None
+            end = end_date.strip() if end_date else None
 
-            correlation_log = f"[{correlation_id}] " if correlation_id else ""
-            self.logger.info(
-                f"{correlation_log}[OTIMIZAÇÃO] Usando busca agregada para {len(hierarchy_levels)} níveis e {len(status_ids)} status"
+            queries = {
+                (level, status_name): build_hierarchy_status_count_params(
+                    level, status_field, status_id, start, end
+                )
+                for level in hierarchy_levels
+                for status_name, status_id in statuses.items()
+            }
+            scan_params = build_hierarchy_status_scan_params(
+                hierarchy_levels, status_field, list(statuses.values()), start, end
             )
-
-            # Tentar busca agregada primeiro
-            metrics = self._get_aggregated_ticket_counts(
-                hierarchy_levels,
-                status_ids,
-                start_date,
-                end_date,
+            counts = self._count_facets(
+                "nível x status",
+                queries,
+                scan_params,
+                lambda row: (
+                    hierarchy_level(row.get("8"), hierarchy_levels),
+                    status_by_id.get(str(row.get(status_field))),
+                ),
                 correlation_id,
             )
 
-            if not metrics or all(not level_data for level_data in metrics.values()):
-                self.logger.warning(
-                    f"{correlation_log}Busca agregada retornou dados vazios"
-                )
+            if not counts:
+                correlation_log = f"[{correlation_id}] " if correlation_id else ""
+                self.logger.warning(f"{correlation_log}Contagens por nível retornaram dados vazios")
                 return {}
 
+            metrics = {level: {} for level in hierarchy_levels}
+            for (level, status_name), total in counts.items():
+                metrics[level][status_name] = total
             return metrics
 
         except Exception as e:
@@ -2430,7 +2553,7 @@ class GLPIService:
                 )
                 return {}
 
-            if not hasattr(self, "field_ids") or not isinstance(self.field_ids, dict):
+            if not hasattr(self, "field_ids") or not isinstance(self.field_ids, Mapping):
                 self.logger.error(
                     f"[{datetime.now(tz=timezone.utc).isoformat()}] field_ids inválido: {getattr(self, 'field_ids', None)}"
                 )
@@ -2455,136 +2578,55 @@ class GLPIService:
                 return {}
 
             status_totals = {}
+            statuses = {}
 
-            # Buscar totais por status sem filtro de grupo
+            # Validar os status antes de montar as contagens
             for status_name, status_id in self.status_map.items():
-                try:
-                    # Validar status_name e status_id
-                    if not status_name or not isinstance(status_name, str):
-                        self.logger.warning(
-                            f"[{datetime.now(tz=timezone.utc).isoformat()}] status_name inválido: {status_name}"
-                        )
-                        continue
-
-                    if not isinstance(status_id, (int, str)) or (
-                        isinstance(status_id, str) and not status_id.strip()
-                    ):
-                        self.logger.warning(
-                            f"[{datetime.now(tz=timezone.utc).isoformat()}] status_id inválido para {status_name}: {status_id}"
-                        )
-                        continue
-
-                    # Converter status_id para int se necessário
-                    try:
-                        status_id_int = int(status_id)
-                    except (ValueError, TypeError) as e:
-                        self.logger.error(
-                            f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao converter status_id para int '{status_id}': {e}"
-                        )
-                        status_totals[status_name] = 0
-                        continue
-
-                    search_params = {
-                        "is_deleted": 0,
-                        "range": "0-0",
-                        "criteria[0][field]": self.field_ids["STATUS"],
-                        "criteria[0][searchtype]": "equals",
-                        "criteria[0][value]": status_id_int,
-                    }
-
-                    # Adicionar filtros de data se fornecidos usando função utilitária
-                    if start_date or end_date:
-                        date_criteria = DateValidator.construir_criterios_filtro_data(
-                            start_date=start_date,
-                            end_date=end_date,
-                            field_id="15",
-                            criteria_start_index=1,
-                        )
-                        search_params.update(date_criteria)
-
-                    try:
-                        response = self._make_authenticated_request(
-                            "GET",
-                            f"{self.glpi_url}/search/Ticket",
-                            params=search_params,
-                            correlation_id=correlation_id,
-                        )
-
-                        if not response:
-                            self.logger.warning(
-                                f"[{datetime.now(tz=timezone.utc).isoformat()}] Resposta vazia para status {status_name}"
-                            )
-                            status_totals[status_name] = 0
-                            continue
-
-                        if response.status_code not in [200, 206]:
-                            self.logger.warning(
-                                f"[{datetime.now(tz=timezone.utc).isoformat()}] Status code inválido {response.status_code} para status {status_name}"
-                            )
-                            status_totals[status_name] = 0
-                            continue
-
-                        if "Content-Range" in response.headers:
-                            try:
-                                content_range = response.headers["Content-Range"]
-                                if not content_range or "/" not in content_range:
-                                    self.logger.warning(
-                                        f"[{datetime.now(tz=timezone.utc).isoformat()}] Content-Range inválido para {status_name}: {content_range}"
-                                    )
-                                    status_totals[status_name] = 0
-                                    continue
-
-                                total_str = content_range.split("/")[-1]
-                                if not total_str.isdigit():
-                                    self.logger.warning(
-                                        f"[{datetime.now(tz=timezone.utc).isoformat()}] Total não numérico para {status_name}: {total_str}"
-                                    )
-                                    status_totals[status_name] = 0
-                                    continue
-
-                                count = int(total_str)
-                                status_totals[status_name] = count
-                                self.logger.debug(
-                                    f"[{datetime.now(tz=timezone.utc).isoformat()}] Contagem para {status_name}: {count}"
-                                )
-                            except (ValueError, IndexError) as e:
-                                self.logger.error(
-                                    f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao processar Content-Range para {status_name}: {e}"
-                                )
-                                status_totals[status_name] = 0
-                        else:
-                            self.logger.warning(
-                                f"[{datetime.now(tz=timezone.utc).isoformat()}] Sem Content-Range para {status_name}"
-                            )
-                            status_totals[status_name] = 0
+                if not status_name or not isinstance(status_name, str):
+                    self.logger.warning(
+                        f"[{datetime.now(tz=timezone.utc).isoformat()}] status_name inválido: {status_name}"
+                    )
+                    continue
 
-                    except requests.exceptions.Timeout as e:
-                        self.logger.error(
-                            f"[{datetime.now(tz=timezone.utc).isoformat()}] Timeout ao buscar {status_name}: {e}"
-                        )
-                        status_totals[status_name] = 0
-                    except requests.exceptions.ConnectionError as e:
-                        self.logger.error(
-                            f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro de conexão ao buscar {status_name}: {e}"
-                        )
-                        status_totals[status_name] = 0
-                    except requests.exceptions.RequestException as e:
-                        self.logger.error(
-                            f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro de requisição ao buscar {status_name}: {e}"
-                        )
-                        status_totals[status_name] = 0
-                    except Exception as e:
-                        self.logger.error(
-                            f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro inesperado ao buscar contagem geral para {status_name}: {e}"
-                        )
-                        status_totals[status_name] = 0
+                if not isinstance(status_id, (int, str)) or (
+                    isinstance(status_id, str) and not status_id.strip()
+                ):
+                    self.logger.warning(
+                        f"[{datetime.now(tz=timezone.utc).isoformat()}] status_id inválido para {status_name}: {status_id}"
+                    )
+                    continue
 
-                except Exception as e:
+                try:
+                    statuses[status_name] = int(status_id)
+                except (ValueError, TypeError) as e:
                     self.logger.error(
-                        f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao processar status {status_name}: {e}"
+                        f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao converter status_id para int '{status_id}': {e}"
                     )
-                    status_totals[status_name] = 0
+                status_totals[status_name] = 0
+
+            if not statuses:
+                return status_totals
 
+            # Totais por status sem filtro de grupo: contagens em paralelo ou uma
+            # varredura única, conforme o plano mais barato para o período
+            status_field = self.field_ids["STATUS"]
+            status_by_id = {str(status_id): status_name for status_name, status_id in statuses.items()}
+            queries = {
+                status_name: build_status_count_params(status_field, status_id, start_date, end_date)
+                for status_name, status_id in statuses.items()
+            }
+            scan_params = build_status_scan_params(
+                status_field, list(statuses.values()), start_date, end_date
+            )
+            status_totals.update(
+                self._count_facets(
+                    "totais por status",
+                    queries,
+                    scan_params,
+                    lambda row: status_by_id.get(str(row.get(status_field))),
+                    correlation_id,
+                )
+            )
             return status_totals
 
         except Exception as e:
@@ -2709,9 +2751,7 @@ class GLPIService:
                 if self._is_cache_valid("dashboard_metrics"):
                     cached_data = self._get_cache_data("dashboard_metrics")
                     if cached_data:
-                        self.logger.info(
-                            f"[{datetime.now(tz=timezone.utc).isoformat()}] Retornando métricas do cache"
-                        )
+                        self.logger.info("Retornando métricas do cache")
                         return cached_data
             except Exception as e:
                 self.logger.warning(
@@ -2752,9 +2792,7 @@ class GLPIService:
                         correlation_id=correlation_id,
                     )
 
-                self.logger.info(
-                    f"[{datetime.now(tz=timezone.utc).isoformat()}] Totais gerais obtidos: {general_totals}"
-                )
+                self.logger.info("Totais gerais obtidos: %s", general_totals)
             except Exception as e:
                 self.logger.error(
                     f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao obter totais gerais: {e}"
@@ -2778,9 +2816,7 @@ class GLPIService:
                         correlation_id=correlation_id,
                     )
 
-                self.logger.debug(
-                    f"[{datetime.now(tz=timezone.utc).isoformat()}] Métricas por nível obtidas: {raw_metrics}"
-                )
+                self.logger.debug("Métricas por nível obtidas: %s", raw_metrics)
             except Exception as e:
                 self.logger.error(
                     f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao obter métricas por nível: {e}"
@@ -2791,253 +2827,335 @@ class GLPIService:
                     correlation_id=correlation_id,
                 )
 
-            # Usar o mesmo formato da função com filtros para consistência
-            # Calcular totais gerais com validação
-            try:
-                general_novos = general_totals.get("Novo", 0) if general_totals else 0
-                general_pendentes = general_totals.get("Pendente", 0) if general_totals else 0
-                general_progresso = (
-                    (
-                        general_totals.get("Processando (atribuído)", 0)
-                        + general_totals.get("Processando (planejado)", 0)
-                    )
-                    if general_totals
-                    else 0
-                )
-                general_resolvidos = (
-                    (general_totals.get("Solucionado", 0) + general_totals.get("Fechado", 0))
-                    if general_totals
-                    else 0
-                )
-                general_total = (
-                    general_novos + general_pendentes + general_progresso + general_resolvidos
-                )
+            return self._build_dashboard_metrics_result(
+                general_totals, raw_metrics, start_time, correlation_id
+            )
 
-                # Validar se os valores são numéricos
-                for name, value in [
-                    ("novos", general_novos),
-                    ("pendentes", general_pendentes),
-                    ("progresso", general_progresso),
-                    ("resolvidos", general_resolvidos),
-                ]:
-                    if not isinstance(value, (int, float)) or value < 0:
-                        self.logger.warning(
-                            f"[{datetime.now(tz=timezone.utc).isoformat()}] Valor inválido para {name}: {value}"
-                        )
+        except Exception as e:
+            self.logger.error(
+                f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro geral ao obter métricas do dashboard: {e}"
+            )
+            return ResponseFormatter.format_error_response(
+                f"Erro interno: {str(e)}",
+                [str(e)],
+                correlation_id=correlation_id,
+            )
 
-            except Exception as e:
-                self.logger.error(
-                    f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao calcular totais gerais: {e}"
+    async def get_dashboard_metrics_async(
+        self, correlation_id: Optional[str] = None
+    ) -> Dict[str, any]:
+        """Versão assíncrona de ``get_dashboard_metrics`` (sem filtro de data)
+
+        Totais gerais, matriz nível x status e totais das janelas de comparação
+        (tendências) são buscados de uma vez pelo ``AsyncGLPIClient``, no event
+        loop do chamador. Cache e formato da resposta são os mesmos da versão
+        síncrona; sem o cliente assíncrono delega para ela em uma thread.
+        """
+        if self.async_client is None:
+            return await asyncio.to_thread(
+                self.get_dashboard_metrics, correlation_id=correlation_id
+            )
+
+        start_time = time.time()
+        try:
+            if self._is_cache_valid("dashboard_metrics"):
+                cached_data = self._get_cache_data("dashboard_metrics")
+                if cached_data:
+                    self.logger.info("Retornando métricas do cache")
+                    return cached_data
+
+            # Autenticação e descoberta de campos podem bloquear; rodam fora do loop
+            if not await asyncio.to_thread(self._ensure_authenticated):
+                return ResponseFormatter.format_error_response(
+                    "Falha na autenticação com GLPI",
+                    ["Erro de autenticação"],
+                    correlation_id=correlation_id,
                 )
+
+            if not await asyncio.to_thread(self.discover_field_ids):
                 return ResponseFormatter.format_error_response(
-                    "Erro ao calcular totais",
-                    [str(e)],
+                    "Falha ao descobrir IDs dos campos",
+                    ["Erro ao obter configuração"],
                     correlation_id=correlation_id,
                 )
 
-            # Métricas por nível com validação
-            try:
-                level_metrics = {
-                    "n1": {
-                        "novos": 0,
-                        "progresso": 0,
-                        "pendentes": 0,
-                        "resolvidos": 0,
-                    },
-                    "n2": {
-                        "novos": 0,
-                        "progresso": 0,
-                        "pendentes": 0,
-                        "resolvidos": 0,
-                    },
-                    "n3": {
-                        "novos": 0,
-                        "progresso": 0,
-                        "pendentes": 0,
-                        "resolvidos": 0,
-                    },
-                    "n4": {
-                        "novos": 0,
-                        "progresso": 0,
-                        "pendentes": 0,
-                        "resolvidos": 0,
-                    },
-                }
+            general_totals, raw_metrics, window_totals = await asyncio.gather(
+                self.async_client.count_by_status(self.status_map),
+                self.async_client.count_by_level_and_status(
+                    ["N1", "N2", "N3", "N4"], self.status_map
+                ),
+                self._get_trend_window_totals_async(self._trend_windows()),
+            )
 
-                if raw_metrics and isinstance(raw_metrics, dict):
-                    for level_name, level_data in raw_metrics.items():
-                        try:
-                            if not level_name or not isinstance(level_name, str):
-                                self.logger.warning(
-                                    f"[{datetime.now(tz=timezone.utc).isoformat()}] level_name inválido: {level_name}"
-                                )
-                                continue
+            current = self._group_status_totals(general_totals)
+            trend_windows = {
+                name: self._trends_from_totals(*current, totals)
+                for name, totals in window_totals.items()
+            }
+            return self._build_dashboard_metrics_result(
+                general_totals, raw_metrics, start_time, correlation_id, trend_windows=trend_windows
+            )
 
-                            if not isinstance(level_data, dict):
-                                self.logger.warning(
-                                    f"[{datetime.now(tz=timezone.utc).isoformat()}] level_data inválido para {level_name}: {type(level_data)}"
-                                )
-                                continue
+        except Exception as e:
+            self.logger.error(
+                f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro geral ao obter métricas do dashboard (async): {e}"
+            )
+            return ResponseFormatter.format_error_response(
+                f"Erro interno: {str(e)}",
+                [str(e)],
+                correlation_id=correlation_id,
+            )
 
-                            level_key = level_name.lower()
-                            if level_key in level_metrics:
-                                # Validar e extrair valores com fallback para 0
-                                novos = level_data.get("Novo", 0)
-                                progresso_atribuido = level_data.get("Processando (atribuído)", 0)
-                                progresso_planejado = level_data.get("Processando (planejado)", 0)
-                                pendentes = level_data.get("Pendente", 0)
-                                solucionado = level_data.get("Solucionado", 0)
-                                fechado = level_data.get("Fechado", 0)
-
-                                # Validar tipos numéricos
-                                for name, value in [
-                                    ("novos", novos),
-                                    (
-                                        "progresso_atribuido",
-                                        progresso_atribuido,
-                                    ),
-                                    (
-                                        "progresso_planejado",
-                                        progresso_planejado,
-                                    ),
-                                    ("pendentes", pendentes),
-                                    ("solucionado", solucionado),
-                                    ("fechado", fechado),
-                                ]:
-                                    if not isinstance(value, (int, float)):
-                                        self.logger.warning(
-                                            f"[{datetime.now(tz=timezone.utc).isoformat()}] Valor não numérico para {level_key}.{name}: {value}"
-                                        )
-
-                                level_metrics[level_key]["novos"] = max(
-                                    0,
-                                    int(novos) if isinstance(novos, (int, float)) else 0,
-                                )
-                                level_metrics[level_key]["progresso"] = max(
-                                    0,
-                                    (
-                                        int(progresso_atribuido)
-                                        if isinstance(progresso_atribuido, (int, float))
-                                        else 0
-                                    )
-                                    + (
-                                        int(progresso_planejado)
-                                        if isinstance(progresso_planejado, (int, float))
-                                        else 0
-                                    ),
-                                )
-                                level_metrics[level_key]["pendentes"] = max(
-                                    0,
-                                    int(pendentes) if isinstance(pendentes, (int, float)) else 0,
-                                )
-                                level_metrics[level_key]["resolvidos"] = max(
-                                    0,
-                                    (
-                                        int(solucionado)
-                                        if isinstance(solucionado, (int, float))
-                                        else 0
+    def _build_dashboard_metrics_result(
+        self,
+        general_totals: Dict[str, int],
+        raw_metrics: Dict[str, Dict[str, int]],
+        start_time: float,
+        correlation_id: Optional[str] = None,
+        trend_windows: Optional[Dict[str, dict]] = None,
+    ) -> Dict[str, any]:
+        """Formata totais gerais e métricas por nível no schema DashboardMetrics
+
+        Compartilhado por ``get_dashboard_metrics`` e ``get_dashboard_metrics_async``;
+        o resultado completo é gravado no cache ``dashboard_metrics``. Sem
+        ``trend_windows`` as tendências são calculadas aqui (chamadas síncronas
+        ao GLPI).
+        """
+        # Usar o mesmo formato da função com filtros para consistência
+        # Calcular totais gerais com validação
+        try:
+            general_novos = general_totals.get("Novo", 0) if general_totals else 0
+            general_pendentes = general_totals.get("Pendente", 0) if general_totals else 0
+            general_progresso = (
+                (
+                    general_totals.get("Processando (atribuído)", 0)
+                    + general_totals.get("Processando (planejado)", 0)
+                )
+                if general_totals
+                else 0
+            )
+            general_resolvidos = (
+                (general_totals.get("Solucionado", 0) + general_totals.get("Fechado", 0))
+                if general_totals
+                else 0
+            )
+            general_total = (
+                general_novos + general_pendentes + general_progresso + general_resolvidos
+            )
+
+            # Validar se os valores são numéricos
+            for name, value in [
+                ("novos", general_novos),
+                ("pendentes", general_pendentes),
+                ("progresso", general_progresso),
+                ("resolvidos", general_resolvidos),
+            ]:
+                if not isinstance(value, (int, float)) or value < 0:
+                    self.logger.warning(
+                        f"[{datetime.now(tz=timezone.utc).isoformat()}] Valor inválido para {name}: {value}"
+                    )
+
+        except Exception as e:
+            self.logger.error(
+                f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao calcular totais gerais: {e}"
+            )
+            return ResponseFormatter.format_error_response(
+                "Erro ao calcular totais",
+                [str(e)],
+                correlation_id=correlation_id,
+            )
+
+        # Métricas por nível com validação
+        try:
+            level_metrics = {
+                "n1": {
+                    "novos": 0,
+                    "progresso": 0,
+                    "pendentes": 0,
+                    "resolvidos": 0,
+                },
+                "n2": {
+                    "novos": 0,
+                    "progresso": 0,
+                    "pendentes": 0,
+                    "resolvidos": 0,
+                },
+                "n3": {
+                    "novos": 0,
+                    "progresso": 0,
+                    "pendentes": 0,
+                    "resolvidos": 0,
+                },
+                "n4": {
+                    "novos": 0,
+                    "progresso": 0,
+                    "pendentes": 0,
+                    "resolvidos": 0,
+                },
+            }
+
+            if raw_metrics and isinstance(raw_metrics, dict):
+                for level_name, level_data in raw_metrics.items():
+                    try:
+                        if not level_name or not isinstance(level_name, str):
+                            self.logger.warning(
+                                f"[{datetime.now(tz=timezone.utc).isoformat()}] level_name inválido: {level_name}"
+                            )
+                            continue
+
+                        if not isinstance(level_data, dict):
+                            self.logger.warning(
+                                f"[{datetime.now(tz=timezone.utc).isoformat()}] level_data inválido para {level_name}: {type(level_data)}"
+                            )
+                            continue
+
+                        level_key = level_name.lower()
+                        if level_key in level_metrics:
+                            # Validar e extrair valores com fallback para 0
+                            novos = level_data.get("Novo", 0)
+                            progresso_atribuido = level_data.get("Processando (atribuído)", 0)
+                            progresso_planejado = level_data.get("Processando (planejado)", 0)
+                            pendentes = level_data.get("Pendente", 0)
+                            solucionado = level_data.get("Solucionado", 0)
+                            fechado = level_data.get("Fechado", 0)
+
+                            # Validar tipos numéricos
+                            for name, value in [
+                                ("novos", novos),
+                                (
+                                    "progresso_atribuido",
+                                    progresso_atribuido,
+                                ),
+                                (
+                                    "progresso_planejado",
+                                    progresso_planejado,
+                                ),
+                                ("pendentes", pendentes),
+                                ("solucionado", solucionado),
+                                ("fechado", fechado),
+                            ]:
+                                if not isinstance(value, (int, float)):
+                                    self.logger.warning(
+                                        f"[{datetime.now(tz=timezone.utc).isoformat()}] Valor não numérico para {level_key}.{name}: {value}"
                                     )
-                                    + (int(fechado) if isinstance(fechado, (int, float)) else 0),
+
+                            level_metrics[level_key]["novos"] = max(
+                                0,
+                                int(novos) if isinstance(novos, (int, float)) else 0,
+                            )
+                            level_metrics[level_key]["progresso"] = max(
+                                0,
+                                (
+                                    int(progresso_atribuido)
+                                    if isinstance(progresso_atribuido, (int, float))
+                                    else 0
                                 )
-                            else:
-                                self.logger.warning(
-                                    f"[{datetime.now(tz=timezone.utc).isoformat()}] Nível desconhecido: {level_key}"
+                                + (
+                                    int(progresso_planejado)
+                                    if isinstance(progresso_planejado, (int, float))
+                                    else 0
+                                ),
+                            )
+                            level_metrics[level_key]["pendentes"] = max(
+                                0,
+                                int(pendentes) if isinstance(pendentes, (int, float)) else 0,
+                            )
+                            level_metrics[level_key]["resolvidos"] = max(
+                                0,
+                                (
+                                    int(solucionado)
+                                    if isinstance(solucionado, (int, float))
+                                    else 0
                                 )
-                        except Exception as e:
-                            self.logger.error(
-                                f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao processar nível {level_name}: {e}"
+                                + (int(fechado) if isinstance(fechado, (int, float)) else 0),
                             )
-                            continue
+                        else:
+                            self.logger.warning(
+                                f"[{datetime.now(tz=timezone.utc).isoformat()}] Nível desconhecido: {level_key}"
+                            )
+                    except Exception as e:
+                        self.logger.error(
+                            f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao processar nível {level_name}: {e}"
+                        )
+                        continue
 
-            except Exception as e:
-                self.logger.error(
-                    f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao processar métricas por nível: {e}"
-                )
-                return ResponseFormatter.format_error_response(
-                    "Erro ao processar métricas por nível",
-                    [str(e)],
-                    correlation_id=correlation_id,
+        except Exception as e:
+            self.logger.error(
+                f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao processar métricas por nível: {e}"
+            )
+            return ResponseFormatter.format_error_response(
+                "Erro ao processar métricas por nível",
+                [str(e)],
+                correlation_id=correlation_id,
+            )
+
+        # Construir resultado final no formato do schema DashboardMetrics
+        try:
+            if trend_windows is None:
+                trend_windows = self._calculate_trend_windows(
+                    general_novos, general_pendentes, general_progresso, general_resolvidos
                 )
 
-            # Construir resultado final no formato do schema DashboardMetrics
-            try:
-                result = {
-                    "success": True,
-                    "data": {
-                        # Campos principais do DashboardMetrics
-                        "novos": general_novos,
-                        "pendentes": general_pendentes,
-                        "progresso": general_progresso,
-                        "resolvidos": general_resolvidos,
-                        "total": general_total,
-                        # Estrutura de níveis
-                        "niveis": {
-                            "n1": level_metrics["n1"],
-                            "n2": level_metrics["n2"],
-                            "n3": level_metrics["n3"],
-                            "n4": level_metrics["n4"],
-                        },
-                        "tendencias": self._calculate_trends(
-                            general_novos,
-                            general_pendentes,
-                            general_progresso,
-                            general_resolvidos,
-                        ),
-                        "filters_applied": None,
-                        "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+            result = {
+                "success": True,
+                "data": {
+                    # Campos principais do DashboardMetrics
+                    "novos": general_novos,
+                    "pendentes": general_pendentes,
+                    "progresso": general_progresso,
+                    "resolvidos": general_resolvidos,
+                    "total": general_total,
+                    # Estrutura de níveis
+                    "niveis": {
+                        "n1": level_metrics["n1"],
+                        "n2": level_metrics["n2"],
+                        "n3": level_metrics["n3"],
+                        "n4": level_metrics["n4"],
                     },
-                    "timestamp": datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
-                    "tempo_execucao": (time.time() - start_time) * 1000,
-                }
-
-                # Validar resultado final
-                if not isinstance(result, dict) or "success" not in result or "data" not in result:
-                    self.logger.error(
-                        f"[{datetime.now(tz=timezone.utc).isoformat()}] Resultado final inválido: {type(result)}"
-                    )
-                    return ResponseFormatter.format_error_response(
-                        "Erro na construção do resultado",
-                        ["Estrutura de dados inválida"],
-                        correlation_id=correlation_id,
-                    )
-
-                self.logger.info(
-                    f"[{datetime.now(tz=timezone.utc).isoformat()}] Métricas do dashboard construídas com sucesso"
-                )
+                    "tendencias": trend_windows[PREVIOUS_TREND_WINDOW],
+                    "tendencias_janelas": trend_windows,
+                    "filters_applied": None,
+                    "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+                },
+                "timestamp": datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "tempo_execucao": (time.time() - start_time) * 1000,
+            }
 
-            except Exception as e:
+            # Validar resultado final
+            if not isinstance(result, dict) or "success" not in result or "data" not in result:
                 self.logger.error(
-                    f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao construir resultado final: {e}"
+                    f"[{datetime.now(tz=timezone.utc).isoformat()}] Resultado final inválido: {type(result)}"
                 )
                 return ResponseFormatter.format_error_response(
-                    "Erro ao construir resultado",
-                    [str(e)],
+                    "Erro na construção do resultado",
+                    ["Estrutura de dados inválida"],
                     correlation_id=correlation_id,
                 )
 
-            # Salvar no cache
-            try:
-                self._set_cache_data("dashboard_metrics", result, ttl=180)
-                self.logger.debug(
-                    f"[{datetime.now(tz=timezone.utc).isoformat()}] Resultado salvo no cache"
-                )
-            except Exception as e:
-                self.logger.warning(
-                    f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao salvar no cache: {e}"
-                )
-
-            return result
+            self.logger.info("Métricas do dashboard construídas com sucesso")
 
         except Exception as e:
             self.logger.error(
-                f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro geral ao obter métricas do dashboard: {e}"
+                f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao construir resultado final: {e}"
             )
             return ResponseFormatter.format_error_response(
-                f"Erro interno: {str(e)}",
+                "Erro ao construir resultado",
                 [str(e)],
                 correlation_id=correlation_id,
             )
 
+        # Salvar no cache
+        try:
+            if not deadline_exceeded():  # Resultado parcial não vai para o cache
+                self._set_cache_data("dashboard_metrics", result, ttl=180)
+            self.logger.debug("Resultado salvo no cache")
+        except Exception as e:
+            self.logger.warning(
+                f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao salvar no cache: {e}"
+            )
+
+        return result
+
     def _get_general_totals_internal(self, start_date: str = None, end_date: str = None) -> dict:
         """Método interno para obter totais gerais com filtro de data"""
         # Validações de entrada
@@ -3092,15 +3210,13 @@ class GLPIService:
                 )
                 return {}
 
-            if not isinstance(self.field_ids, dict) or "STATUS" not in self.field_ids:
+            if not isinstance(self.field_ids, Mapping) or "STATUS" not in self.field_ids:
                 self.logger.error(
                     f"[{datetime.now(tz=timezone.utc).isoformat()}] field_ids inválido ou STATUS ausente"
                 )
                 return {}
 
-            self.logger.debug(
-                f"[{datetime.now(tz=timezone.utc).isoformat()}] Iniciando busca de totais gerais com filtro de data"
-            )
+            self.logger.debug("Iniciando busca de totais gerais com filtro de data")
 
         except Exception as e:
             self.logger.error(
@@ -3108,115 +3224,10 @@ class GLPIService:
             )
             return {}
 
-        status_totals = {}
-
-        # Buscar totais por status sem filtro de grupo (mesma lógica do _get_general_metrics_internal)
-        for status_name, status_id in self.status_map.items():
-            try:
-                # Validar status_name e status_id
-                if not status_name or not isinstance(status_name, str):
-                    self.logger.warning(
-                        f"[{datetime.now(tz=timezone.utc).isoformat()}] status_name inválido: {status_name}"
-                    )
-                    continue
-
-                if not isinstance(status_id, (int, str)) or (
-                    isinstance(status_id, str) and not status_id.strip()
-                ):
-                    self.logger.warning(
-                        f"[{datetime.now(tz=timezone.utc).isoformat()}] status_id inválido para {status_name}: {status_id}"
-                    )
-                    continue
-
-                search_params = {
-                    "is_deleted": 0,
-                    "range": "0-0",
-                    "criteria[0][field]": self.field_ids["STATUS"],
-                    "criteria[0][searchtype]": "equals",
-                    "criteria[0][value]": status_id,
-                }
-
-                # Adicionar filtros de data usando a função utilitária
-                criterios_data = DateValidator.construir_criterios_filtro_data(start_date, end_date)
-                search_params.update(criterios_data)
-
-                try:
-                    response = self._make_authenticated_request(
-                        "GET",
-                        f"{self.glpi_url}/search/Ticket",
-                        params=search_params,
-                    )
-
-                    if not response:
-                        self.logger.warning(
-                            f"[{datetime.now(tz=timezone.utc).isoformat()}] Resposta vazia para {status_name}"
-                        )
-                        status_totals[status_name] = 0
-                        continue
-
-                    if response.status_code not in [200, 206]:
-                        self.logger.warning(
-                            f"[{datetime.now(tz=timezone.utc).isoformat()}] Status HTTP inválido para {status_name}: {response.status_code}"
-                        )
-                        status_totals[status_name] = 0
-                        continue
-
-                    if "Content-Range" in response.headers:
-                        try:
-                            content_range = response.headers["Content-Range"]
-                            if not content_range or "/" not in content_range:
-                                self.logger.warning(
-                                    f"[{datetime.now(tz=timezone.utc).isoformat()}] Content-Range mal formatado para {status_name}: {content_range}"
-                                )
-                                status_totals[status_name] = 0
-                                continue
-
-                            count = int(content_range.split("/")[-1])
-                            status_totals[status_name] = max(0, count)
-                            self.logger.debug(
-                                f"[{datetime.now(tz=timezone.utc).isoformat()}] Contagem para {status_name}: {count}"
-                            )
-                        except (ValueError, IndexError) as e:
-                            self.logger.error(
-                                f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao parsear Content-Range para {status_name}: {e}"
-                            )
-                            status_totals[status_name] = 0
-                    else:
-                        self.logger.warning(
-                            f"[{datetime.now(tz=timezone.utc).isoformat()}] Content-Range ausente para {status_name}"
-                        )
-                        status_totals[status_name] = 0
-
-                except requests.exceptions.Timeout as e:
-                    self.logger.error(
-                        f"[{datetime.now(tz=timezone.utc).isoformat()}] Timeout ao buscar {status_name}: {e}"
-                    )
-                    status_totals[status_name] = 0
-                except requests.exceptions.ConnectionError as e:
-                    self.logger.error(
-                        f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro de conexão ao buscar {status_name}: {e}"
-                    )
-                    status_totals[status_name] = 0
-                except requests.exceptions.RequestException as e:
-                    self.logger.error(
-                        f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro de requisição ao buscar {status_name}: {e}"
-                    )
-                    status_totals[status_name] = 0
-                except Exception as e:
-                    self.logger.error(
-                        f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro inesperado ao buscar {status_name}: {e}"
-                    )
-                    status_totals[status_name] = 0
-
-            except Exception as e:
-                self.logger.error(
-                    f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao processar status {status_name}: {e}"
-                )
-                status_totals[status_name] = 0
+        # Mesmas contagens (planejadas) do _get_general_metrics_internal
+        status_totals = self._get_general_metrics_internal(start_date, end_date)
 
-        self.logger.info(
-            f"[{datetime.now(tz=timezone.utc).isoformat()}] Totais gerais obtidos: {status_totals}"
-        )
+        self.logger.info("Totais gerais obtidos: %s", status_totals)
         return status_totals
 
     def get_dashboard_metrics_with_date_filter(
@@ -3235,7 +3246,7 @@ class GLPIService:
         """
         start_time = time.time()
         self.logger.info(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Iniciando get_dashboard_metrics_with_date_filter com start_date={start_date}, end_date={end_date}"
+            "Iniciando get_dashboard_metrics_with_date_filter com start_date=%s, end_date=%s", start_date, end_date
         )
 
         try:
@@ -3281,7 +3292,7 @@ class GLPIService:
                 if self._is_cache_valid("dashboard_metrics_filtered", cache_key):
                     cached_data = self._get_cache_data("dashboard_metrics_filtered", cache_key)
                     if cached_data:
-                        self.logger.info(f"Retornando métricas do cache para filtro: {cache_key}")
+                        self.logger.info("Retornando métricas do cache para filtro: %s", cache_key)
                         return cached_data
             except Exception as e:
                 self.logger.warning(f"Erro ao verificar cache: {e}")
@@ -3311,7 +3322,7 @@ class GLPIService:
                         f"general_totals deve ser dict, recebido: {type(general_totals)}"
                     )
                     return None
-                self.logger.info(f"Totais gerais obtidos com filtro de data: {general_totals}")
+                self.logger.info("Totais gerais obtidos com filtro de data: %s", general_totals)
             except Exception as e:
                 self.logger.error(f"Erro ao obter totais gerais: {e}")
                 return None
@@ -3322,7 +3333,7 @@ class GLPIService:
                 if not isinstance(raw_metrics, dict):
                     self.logger.error(f"raw_metrics deve ser dict, recebido: {type(raw_metrics)}")
                     return None
-                self.logger.info(f"Métricas por nível obtidas: {len(raw_metrics)} níveis")
+                self.logger.info("Métricas por nível obtidas: %s níveis", len(raw_metrics))
             except Exception as e:
                 self.logger.error(f"Erro ao obter métricas por nível: {e}")
                 return None
@@ -3437,7 +3448,7 @@ class GLPIService:
                         )
                         continue
 
-                self.logger.info(f"Agregação concluída - totais: {totals}")
+                self.logger.info("Agregação concluída - totais: %s", totals)
 
             except Exception as e:
                 self.logger.error(f"Erro durante agregação de métricas: {e}")
@@ -3488,7 +3499,12 @@ class GLPIService:
                 )
 
                 self.logger.info(
-                    f"Métricas gerais calculadas com filtro: novos={general_novos}, pendentes={general_pendentes}, progresso={general_progresso}, resolvidos={general_resolvidos}, total={general_total}"
+                    "Métricas gerais calculadas com filtro: novos=%s, pendentes=%s, progresso=%s, resolvidos=%s, total=%s",
+                    general_novos,
+                    general_pendentes,
+                    general_progresso,
+                    general_resolvidos,
+                    general_total,
                 )
 
             except Exception as e:
@@ -3499,7 +3515,7 @@ class GLPIService:
             try:
                 # Calcular tendências
                 try:
-                    tendencias = self._get_trends_with_logging(
+                    tendencias_janelas = self._calculate_trend_windows(
                         general_novos,
                         general_pendentes,
                         general_progresso,
@@ -3507,24 +3523,16 @@ class GLPIService:
                         start_date,
                         end_date,
                     )
+                    tendencias = tendencias_janelas.get(PREVIOUS_TREND_WINDOW)
                     if not isinstance(tendencias, dict):
                         self.logger.warning(
                             f"Tendências inválidas: {type(tendencias)}, usando valores padrão"
                         )
-                        tendencias = {
-                            "novos": 0.0,
-                            "pendentes": 0.0,
-                            "progresso": 0.0,
-                            "resolvidos": 0.0,
-                        }
+                        tendencias = dict(NEUTRAL_TRENDS)
                 except Exception as e:
                     self.logger.error(f"Erro ao calcular tendências: {e}")
-                    tendencias = {
-                        "novos": 0.0,
-                        "pendentes": 0.0,
-                        "progresso": 0.0,
-                        "resolvidos": 0.0,
-                    }
+                    tendencias = dict(NEUTRAL_TRENDS)
+                    tendencias_janelas = {PREVIOUS_TREND_WINDOW: tendencias}
 
                 result = {
                     "success": True,
@@ -3549,6 +3557,7 @@ class GLPIService:
                             "n4": level_metrics["n4"],
                         },
                         "tendencias": tendencias,
+                        "tendencias_janelas": tendencias_janelas,
                         "filters_applied": {
                             "data_inicio": start_date,
                             "data_fim": end_date,
@@ -3563,9 +3572,7 @@ class GLPIService:
                     self.logger.error("Resultado final inválido: data não é dict")
                     return None
 
-                self.logger.info(
-                    f"Métricas formatadas com filtro de data: sucesso=True, tempo={result['tempo_execucao']}s"
-                )
+                self.logger.info("Métricas formatadas com filtro de data: sucesso=True, tempo=%ss", result["tempo_execucao"])
 
             except Exception as e:
                 self.logger.error(f"Erro ao construir resultado final: {e}")
@@ -3573,13 +3580,14 @@ class GLPIService:
 
             # Salvar no cache com TTL de 3 minutos
             try:
-                self._set_cache_data(
-                    "dashboard_metrics_filtered",
-                    result,
-                    ttl=180,
-                    sub_key=cache_key,
-                )
-                self.logger.info(f"Resultado salvo no cache com chave: {cache_key}")
+                if not deadline_exceeded():  # Resultado parcial não vai para o cache
+                    self._set_cache_data(
+                        "dashboard_metrics_filtered",
+                        result,
+                        ttl=180,
+                        sub_key=cache_key,
+                    )
+                    self.logger.info("Resultado salvo no cache com chave: %s", cache_key)
             except Exception as e:
                 self.logger.warning(f"Erro ao salvar no cache: {e}")
 
@@ -3593,36 +3601,230 @@ class GLPIService:
             self.logger.error(f"Stack trace: {traceback.format_exc()}")
             return None
 
-    def _get_trends_with_logging(
-        self,
-        general_novos: int,
-        general_pendentes: int,
-        general_progresso: int,
-        general_resolvidos: int,
-        start_date: str,
-        end_date: str,
-    ) -> dict:
-        """Função auxiliar para fazer log e chamar _calculate_trends"""
-        self.logger.info(
-            f"Chamando _calculate_trends com start_date={start_date}, end_date={end_date}"
-        )
-        return self._calculate_trends(
-            general_novos,
-            general_pendentes,
-            general_progresso,
-            general_resolvidos,
-            start_date,
-            end_date,
-        )
+    def _previous_trend_window(
+        self, current_start_date: Optional[str] = None, current_end_date: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """Período anterior usado nas tendências: mesma duração do filtro ou 7 dias"""
+        # Se há filtros de data aplicados, calcular período anterior baseado neles
+        if current_start_date and current_end_date:
+            # Calcular a duração do período atual
+            current_start = datetime.strptime(current_start_date, "%Y-%m-%d")
+            current_end = datetime.strptime(current_end_date, "%Y-%m-%d")
+            period_duration = (current_end - current_start).days
+
+            # Calcular período anterior com a mesma duração
+            end_date_previous = (current_start - timedelta(days=1)).strftime("%Y-%m-%d")
+            start_date_previous = (
+                current_start - timedelta(days=period_duration + 1)
+            ).strftime("%Y-%m-%d")
 
-    def _calculate_trends(
-        self,
-        current_novos: int,
-        current_pendentes: int,
-        current_progresso: int,
-        current_resolvidos: int,
-        current_start_date: Optional[str] = None,
-        current_end_date: Optional[str] = None,
+            self.logger.info(
+                "Calculando tendências com filtro: período atual %s a %s, período anterior %s a %s",
+                current_start_date,
+                current_end_date,
+                start_date_previous,
+                end_date_previous,
+            )
+        else:
+            # Usar período padrão de 7 dias
+            end_date_previous = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+            start_date_previous = (datetime.now() - timedelta(days=14)).strftime("%Y-%m-%d")
+
+            self.logger.info(
+                "Calculando tendências sem filtro: período anterior %s a %s",
+                start_date_previous,
+                end_date_previous,
+            )
+
+        return start_date_previous, end_date_previous
+
+    def _trend_windows(
+        self,
+        current_start_date: Optional[str] = None,
+        current_end_date: Optional[str] = None,
+        names: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Tuple[str, str]]:
+        """Datas (início, fim) de cada janela de comparação das tendências
+
+        Janelas deslocadas (semana, mês, ano) movem o período atual para trás;
+        sem filtro de data a referência é a última semana.
+        """
+        if current_start_date and current_end_date:
+            current_start = datetime.strptime(current_start_date.strip(), "%Y-%m-%d")
+            current_end = datetime.strptime(current_end_date.strip(), "%Y-%m-%d")
+        else:
+            current_end = datetime.now()
+            current_start = current_end - timedelta(days=7)
+
+        windows = {}
+        for name in names if names is not None else TREND_WINDOWS:
+            if name not in TREND_WINDOWS:
+                self.logger.warning(f"Janela de tendência desconhecida: {name}")
+                continue
+            offset = TREND_WINDOWS[name]
+            if offset is None:
+                windows[name] = self._previous_trend_window(current_start_date, current_end_date)
+            else:
+                windows[name] = (
+                    (current_start - timedelta(days=offset)).strftime("%Y-%m-%d"),
+                    (current_end - timedelta(days=offset)).strftime("%Y-%m-%d"),
+                )
+        return windows
+
+    @staticmethod
+    def _trend_window_ttl(end_date: str) -> int:
+        """Janelas encerradas mudam pouco; a que inclui hoje expira junto com as métricas"""
+        if end_date < datetime.now().strftime("%Y-%m-%d"):
+            return CACHE_CONFIG.get("TREND_WINDOW_TTL", 3600)
+        return CACHE_CONFIG.get("METRICS_TTL", 180)
+
+    def _split_trend_windows(
+        self, windows: Dict[str, Tuple[str, str]]
+    ) -> Tuple[Dict[str, str], Dict[str, Dict[str, int]], Dict[str, Tuple[str, str]]]:
+        """Separa as janelas já em cache das que precisam ser consultadas
+
+        Returns:
+            ``({janela: chave}, {chave: totais em cache}, {chave: (início, fim) faltantes})``;
+            a chave combina eixo de data e período, então janelas iguais são
+            consultadas uma única vez
+        """
+        keys = {
+            name: f"{TREND_DATE_AXIS}:{start}:{end}" for name, (start, end) in windows.items()
+        }
+        totals = {}
+        missing = {}
+        for name, key in keys.items():
+            if key in totals or key in missing:
+                continue
+            cached = self._get_cache_data("trend_windows", key)
+            if cached is not None:
+                totals[key] = cached
+            else:
+                missing[key] = windows[name]
+        return keys, totals, missing
+
+    def _store_trend_window_totals(self, key: str, end_date: str, totals: Dict[str, int]) -> None:
+        """Grava no cache os totais de uma janela completa"""
+        if totals and not deadline_exceeded():  # Totais parciais não vão para o cache
+            self._set_cache_data(
+                "trend_windows", totals, ttl=self._trend_window_ttl(end_date), sub_key=key
+            )
+
+    def _get_trend_window_totals(
+        self, windows: Dict[str, Tuple[str, str]]
+    ) -> Dict[str, Dict[str, int]]:
+        """Totais por status de cada janela, do cache ou do GLPI (faltantes em paralelo)"""
+        keys, totals, missing = self._split_trend_windows(windows)
+        if missing:
+            self.logger.info("Consultando janelas de tendência: %s", ", ".join(missing))
+            # Cada janela faz as próprias contagens no pool de requisições
+            pool = executor_service.pool("aggregations")
+            future_to_key = {
+                pool.submit(self._get_general_totals_internal, start, end): key
+                for key, (start, end) in missing.items()
+            }
+            for future in concurrent.futures.as_completed(future_to_key):
+                key = future_to_key[future]
+                try:
+                    totals[key] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Erro ao obter totais da janela {key}: {e}")
+                    totals[key] = {}
+                self._store_trend_window_totals(key, missing[key][1], totals[key])
+
+        return {name: totals.get(key) or {} for name, key in keys.items()}
+
+    async def _get_trend_window_totals_async(
+        self, windows: Dict[str, Tuple[str, str]]
+    ) -> Dict[str, Dict[str, int]]:
+        """Versão assíncrona de ``_get_trend_window_totals`` (mesmo cache por janela)"""
+        keys, totals, missing = self._split_trend_windows(windows)
+        if missing:
+            results = await asyncio.gather(
+                *(
+                    self.async_client.count_by_status(self.status_map, start, end)
+                    for start, end in missing.values()
+                ),
+                return_exceptions=True,
+            )
+            for (key, (_, end)), result in zip(missing.items(), results):
+                if isinstance(result, BaseException):
+                    self.logger.error(f"Erro ao obter totais da janela {key}: {result!r}")
+                    result = {}
+                totals[key] = result
+                self._store_trend_window_totals(key, end, result)
+
+        return {name: totals.get(key) or {} for name, key in keys.items()}
+
+    @staticmethod
+    def _group_status_totals(totals: Dict[str, int]) -> Tuple[int, int, int, int]:
+        """Agrupa totais por status em (novos, pendentes, progresso, resolvidos)"""
+        totals = totals or {}
+        return (
+            totals.get("Novo", 0),
+            totals.get("Pendente", 0),
+            totals.get("Processando (atribuído)", 0) + totals.get("Processando (planejado)", 0),
+            totals.get("Solucionado", 0) + totals.get("Fechado", 0),
+        )
+
+    def _trends_from_totals(
+        self,
+        current_novos: int,
+        current_pendentes: int,
+        current_progresso: int,
+        current_resolvidos: int,
+        previous_general: Dict[str, int],
+    ) -> dict:
+        """Variação percentual de cada grupo de status em relação ao período anterior"""
+        # Calcular totais do período anterior
+        (
+            previous_novos,
+            previous_pendentes,
+            previous_progresso,
+            previous_resolvidos,
+        ) = self._group_status_totals(previous_general)
+
+        self.logger.info(
+            "Dados período anterior: novos=%s, pendentes=%s, progresso=%s, resolvidos=%s",
+            previous_novos,
+            previous_pendentes,
+            previous_progresso,
+            previous_resolvidos,
+        )
+        self.logger.info(
+            "Dados período atual: novos=%s, pendentes=%s, progresso=%s, resolvidos=%s",
+            current_novos,
+            current_pendentes,
+            current_progresso,
+            current_resolvidos,
+        )
+
+        # Calcular percentuais de variação
+        def calculate_percentage_change(current: int, previous: int) -> float:
+            if previous == 0:
+                return 100.0 if current > 0 else 0.0
+
+            change = ((current - previous) / previous) * 100
+            return round(change, 1)
+
+        trends = {
+            "novos": calculate_percentage_change(current_novos, previous_novos),
+            "pendentes": calculate_percentage_change(current_pendentes, previous_pendentes),
+            "progresso": calculate_percentage_change(current_progresso, previous_progresso),
+            "resolvidos": calculate_percentage_change(current_resolvidos, previous_resolvidos),
+        }
+
+        self.logger.info("Tendências calculadas: %s", trends)
+        return trends
+
+    def _calculate_trends(
+        self,
+        current_novos: int,
+        current_pendentes: int,
+        current_progresso: int,
+        current_resolvidos: int,
+        current_start_date: Optional[str] = None,
+        current_end_date: Optional[str] = None,
     ) -> dict:
         """Calcula as tendências comparando dados atuais com período anterior
 
@@ -3634,85 +3836,66 @@ class GLPIService:
             current_start_date: Data inicial do período atual (opcional)
             current_end_date: Data final do período atual (opcional)
         """
-        self.logger.info(
-            f"_calculate_trends chamada com: novos={current_novos}, pendentes={current_pendentes}, progresso={current_progresso}, resolvidos={current_resolvidos}, start_date={current_start_date}, end_date={current_end_date}"
-        )
-        try:
-            # Se há filtros de data aplicados, calcular período anterior baseado neles
-            if current_start_date and current_end_date:
-                # Calcular a duração do período atual
-                current_start = datetime.strptime(current_start_date, "%Y-%m-%d")
-                current_end = datetime.strptime(current_end_date, "%Y-%m-%d")
-                period_duration = (current_end - current_start).days
-
-                # Calcular período anterior com a mesma duração
-                end_date_previous = (current_start - timedelta(days=1)).strftime("%Y-%m-%d")
-                start_date_previous = (
-                    current_start - timedelta(days=period_duration + 1)
-                ).strftime("%Y-%m-%d")
-
-                self.logger.info(
-                    f"Calculando tendências com filtro: período atual {current_start_date} a {current_end_date}, período anterior {start_date_previous} a {end_date_previous}"
-                )
-            else:
-                # Usar período padrão de 7 dias
-                end_date_previous = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-                start_date_previous = (datetime.now() - timedelta(days=14)).strftime("%Y-%m-%d")
-
-                self.logger.info(
-                    f"Calculando tendências sem filtro: período anterior {start_date_previous} a {end_date_previous}"
-                )
+        return self._calculate_trend_windows(
+            current_novos,
+            current_pendentes,
+            current_progresso,
+            current_resolvidos,
+            current_start_date,
+            current_end_date,
+            windows=(PREVIOUS_TREND_WINDOW,),
+        )[PREVIOUS_TREND_WINDOW]
+
+    def _calculate_trend_windows(
+        self,
+        current_novos: int,
+        current_pendentes: int,
+        current_progresso: int,
+        current_resolvidos: int,
+        current_start_date: Optional[str] = None,
+        current_end_date: Optional[str] = None,
+        windows: Optional[Iterable[str]] = None,
+    ) -> Dict[str, dict]:
+        """Tendências em relação a várias janelas de comparação de uma vez
 
-            # Obter métricas do período anterior
-            previous_general = self._get_general_totals_internal(
-                start_date_previous, end_date_previous
-            )
+        Os totais de cada janela vêm do cache por janela (``_get_trend_window_totals``):
+        filtros que levam à mesma janela anterior compartilham a consulta.
 
-            # Calcular totais do período anterior
-            previous_novos = previous_general.get("Novo", 0)
-            previous_pendentes = previous_general.get("Pendente", 0)
-            previous_progresso = previous_general.get(
-                "Processando (atribuído)", 0
-            ) + previous_general.get("Processando (planejado)", 0)
-            previous_resolvidos = previous_general.get("Solucionado", 0) + previous_general.get(
-                "Fechado", 0
-            )
+        Args:
+            current_*: Totais atuais por grupo de status
+            current_start_date: Data inicial do período atual (opcional)
+            current_end_date: Data final do período atual (opcional)
+            windows: Nomes de ``TREND_WINDOWS`` (padrão: todas)
 
-            self.logger.info(
-                f"Dados período anterior: novos={previous_novos}, pendentes={previous_pendentes}, progresso={previous_progresso}, resolvidos={previous_resolvidos}"
-            )
-            self.logger.info(
-                f"Dados período atual: novos={current_novos}, pendentes={current_pendentes}, progresso={current_progresso}, resolvidos={current_resolvidos}"
+        Returns:
+            ``{janela: {"novos": %, "pendentes": %, "progresso": %, "resolvidos": %}}``
+        """
+        names = list(windows) if windows is not None else list(TREND_WINDOWS)
+        current = (current_novos, current_pendentes, current_progresso, current_resolvidos)
+        self.logger.info(
+            "Calculando tendências (%s): novos=%s, pendentes=%s, progresso=%s, resolvidos=%s, start_date=%s, end_date=%s",
+            ", ".join(names),
+            current_novos,
+            current_pendentes,
+            current_progresso,
+            current_resolvidos,
+            current_start_date,
+            current_end_date,
+        )
+        try:
+            window_totals = self._get_trend_window_totals(
+                self._trend_windows(current_start_date, current_end_date, names)
             )
-
-            # Calcular percentuais de variação
-            def calculate_percentage_change(current: int, previous: int) -> float:
-                if previous == 0:
-                    return 100.0 if current > 0 else 0.0
-
-                change = ((current - previous) / previous) * 100
-                return round(change, 1)
-
-            trends = {
-                "novos": calculate_percentage_change(current_novos, previous_novos),
-                "pendentes": calculate_percentage_change(current_pendentes, previous_pendentes),
-                "progresso": calculate_percentage_change(current_progresso, previous_progresso),
-                "resolvidos": calculate_percentage_change(current_resolvidos, previous_resolvidos),
+            return {
+                name: self._trends_from_totals(*current, window_totals.get(name))
+                for name in names
             }
 
-            self.logger.info(f"Tendências calculadas: {trends}")
-            return trends
-
         except Exception as e:
             self.logger.error(f"Erro ao calcular tendências: {e}")
             self.logger.error(f"Stack trace: {traceback.format_exc()}")
             # Retornar valores padrão em caso de erro
-            return {
-                "novos": 0.0,
-                "pendentes": 0.0,
-                "progresso": 0.0,
-                "resolvidos": 0.0,
-            }
+            return {name: dict(NEUTRAL_TRENDS) for name in names}
 
     def get_technician_ranking(self, limit: int = None) -> list:
         """Retorna ranking de técnicos por total de chamados seguindo a base de conhecimento
@@ -3728,9 +3911,7 @@ class GLPIService:
             # LIMPAR CACHE INTERNO FORÇADAMENTE - CORREÇÃO CRÍTICA
             # PROBLEMA IDENTIFICADO: Esta linha estava causando métricas zeradas
             # self._cache.clear()  # COMENTADO - Esta linha estava limpando o cache antes de usar
-            self.logger.info(
-                f"[{datetime.now(tz=timezone.utc).isoformat()}] Cache interno preservado para melhor performance"
-            )
+            self.logger.info("Cache interno preservado para melhor performance")
 
             # Validações de entrada
             if limit is not None:
@@ -3752,9 +3933,7 @@ class GLPIService:
                 )
                 return []
 
-            self.logger.info(
-                f"[{datetime.now(tz=timezone.utc).isoformat()}] Iniciando get_technician_ranking com limit={limit}"
-            )
+            self.logger.info("Iniciando get_technician_ranking com limit=%s", limit)
 
             # Verificar cache com lógica inteligente
             cache_key = f"technician_ranking_{limit or 'all'}"
@@ -3762,14 +3941,10 @@ class GLPIService:
                 cached_data = self._get_cache_data(cache_key)
                 # Verificar se cache existe E não está vazio
                 if cached_data and isinstance(cached_data, list) and len(cached_data) > 0:
-                    self.logger.info(
-                        f"[{datetime.now(tz=timezone.utc).isoformat()}] Retornando ranking do cache: {len(cached_data)} técnicos"
-                    )
+                    self.logger.info("Retornando ranking do cache: %s técnicos", len(cached_data))
                     return cached_data[:limit] if limit else cached_data
                 else:
-                    self.logger.info(
-                        f"[{datetime.now(tz=timezone.utc).isoformat()}] Cache vazio ou inválido, processando dados reais"
-                    )
+                    self.logger.info("Cache vazio ou inválido, processando dados reais")
             except Exception as e:
                 self.logger.warning(
                     f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao verificar cache interno: {e}"
@@ -3790,10 +3965,8 @@ class GLPIService:
 
             # Implementação seguindo a base de conhecimento
             try:
-                self.logger.info(
-                    f"[{datetime.now(tz=timezone.utc).isoformat()}] Chamando _get_technician_ranking_knowledge_base"
-                )
-                ranking = self._get_technician_ranking_knowledge_base()
+                self.logger.info("Chamando _get_technician_ranking_knowledge_base")
+                ranking = self._get_technician_ranking_knowledge_base(limit)
 
                 if not isinstance(ranking, list):
                     self.logger.error(
@@ -3801,9 +3974,7 @@ class GLPIService:
                     )
                     return []
 
-                self.logger.info(
-                    f"[{datetime.now(tz=timezone.utc).isoformat()}] Resultado da busca: {len(ranking)} técnicos"
-                )
+                self.logger.info("Resultado da busca: %s técnicos", len(ranking))
             except Exception as e:
                 self.logger.error(
                     f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao obter ranking: {e}"
@@ -3812,11 +3983,9 @@ class GLPIService:
 
             # Armazenar no cache com TTL otimizado para 5 minutos
             try:
-                if ranking:
+                if ranking and not deadline_exceeded():
                     self._set_cache_data(cache_key, ranking, ttl=300)
-                    self.logger.info(
-                        f"[{datetime.now(tz=timezone.utc).isoformat()}] Dados armazenados no cache por 5 minutos"
-                    )
+                    self.logger.info("Dados armazenados no cache por 5 minutos")
             except Exception as e:
                 self.logger.warning(
                     f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao salvar no cache: {e}"
@@ -3826,9 +3995,7 @@ class GLPIService:
             try:
                 if limit and len(ranking) > limit:
                     ranking = ranking[:limit]
-                    self.logger.info(
-                        f"[{datetime.now(tz=timezone.utc).isoformat()}] Ranking limitado a {limit} técnicos"
-                    )
+                    self.logger.info("Ranking limitado a %s técnicos", limit)
             except Exception as e:
                 self.logger.error(
                     f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao aplicar limite: {e}"
@@ -3836,9 +4003,7 @@ class GLPIService:
                 return []
 
             execution_time = time.time() - start_time
-            self.logger.info(
-                f"[{datetime.now(tz=timezone.utc).isoformat()}] Ranking obtido com sucesso em {execution_time:.2f}s: {len(ranking)} técnicos"
-            )
+            self.logger.info("Ranking obtido com sucesso em %.2fs: %s técnicos", execution_time, len(ranking))
             return ranking
 
         except Exception as e:
@@ -3855,947 +4020,210 @@ class GLPIService:
             self.logger.error(f"Stack trace: {traceback.format_exc()}")
             return []
 
-    def _discover_tech_field_id(self) -> Optional[str]:
-        """Descobre dinamicamente o field ID do técnico atribuído (com cache)"""
-        # Verificar cache primeiro
-        if hasattr(self, "_cached_tech_field_id") and self._cached_tech_field_id:
-            return self._cached_tech_field_id
-
-        try:
-            self.logger.debug("Descobrindo field ID do técnico...")
-
-            # Timeout reduzido para 10 segundos
-            response = self._make_authenticated_request(
-                "GET", f"{self.glpi_url}/listSearchOptions/Ticket", timeout=10
-            )
-            if not response:
-                self.logger.debug("Falha ao buscar search options do Ticket")
-                # Cache fallback
-                self._cached_tech_field_id = "5"
-                return "5"
-
-            search_options = response.json()
-
-            # Procurar por campos conhecidos primeiro
-            tech_field_mapping = {"5": "Técnico", "95": "Técnico encarregado"}
-
-            for field_id, expected_name in tech_field_mapping.items():
-                if field_id in search_options:
-                    field_data = search_options[field_id]
-                    if isinstance(field_data, dict) and "name" in field_data:
-                        field_name = field_data["name"]
-                        if field_name == expected_name:
-                            self.logger.debug(
-                                f"Campo técnico encontrado: {field_name} (ID: {field_id})"
-                            )
-                            # Cache o resultado
-                            self._cached_tech_field_id = field_id
-                            return field_id
-
-            # Fallback: procurar por nomes alternativos
-            tech_field_names = [
-                "Técnico",
-                "Atribuído",
-                "Assigned to",
-                "Technician",
-                "Técnico encarregado",
-            ]
-
-            for field_id, field_data in search_options.items():
-                if isinstance(field_data, dict) and "name" in field_data:
-                    field_name = field_data["name"]
-                    if field_name in tech_field_names:
-                        self.logger.debug(
-                            f"Campo técnico encontrado (fallback): {field_name} (ID: {field_id})"
-                        )
-                        # Cache o resultado
-                        self._cached_tech_field_id = field_id
-                        return field_id
-
-            # Fallback final
-            self.logger.debug("Campo de técnico não encontrado, usando ID padrão = 5")
-            self._cached_tech_field_id = "5"
-            return "5"
-
-        except Exception as e:
-            self.logger.debug(f"Erro ao descobrir field ID do técnico: {str(e)[:100]}")
-            # Cache fallback em caso de erro
-            self._cached_tech_field_id = "5"
-            return "5"
-
-    def _get_user_details_direct(self, user_id: str) -> Optional[Dict[str, Any]]:
-        """Busca direta de usuário por ID (otimizado)"""
-        url = f"{self.glpi_url}/User/{user_id}"
-
-        try:
-            # Timeout reduzido para 10 segundos
-            response = self._make_authenticated_request("GET", url, timeout=10)
-            if not response or not response.ok:
-                self.logger.debug(f"Usuário {user_id} não encontrado ou inacessível")
-                return None
-
-            user_data = response.json()
-
-            # Verificação rápida de status
-            is_active = str(user_data.get("is_active", "0")).strip()
-            is_deleted = str(user_data.get("is_deleted", "0")).strip()
-
-            if str(is_active) != "1" or str(is_deleted) == "1":
-                return None
+    async def get_technician_ranking_async(self, limit: int = None) -> list:
+        """Versão assíncrona de ``get_technician_ranking``
 
-            # Construção otimizada do nome
-            firstname = str(user_data.get("firstname", "")).strip()
-            realname = str(user_data.get("realname", "")).strip()
-            username = str(user_data.get("name", "")).strip()
-
-            full_name = f"{firstname} {realname}".strip()
-            if not full_name:
-                full_name = username or f"Usuário {user_id}"
-
-            return {
-                "id": user_id,
-                "name": full_name,
-                "realname": realname,
-                "firstname": firstname,
-                "username": username,
-            }
-
-        except Exception as e:
-            self.logger.debug(f"Erro ao buscar usuário {user_id}: {str(e)[:100]}")
-            return None
-
-
-
-    def _get_technician_metrics_corrected(self, tecnico_id: str) -> Dict[str, Any]:
-        """Coleta métricas de performance de um técnico específico (otimizado)"""
-        self.logger.debug(f"Coletando métricas do técnico {tecnico_id}")
-
-        url = f"{self.glpi_url}/search/Ticket"
-
-        # CORREÇÃO: Usar range maior para capturar todos os tickets dos técnicos
-        # Range aumentado para evitar que técnicos com muitos tickets sejam zerados
-        adaptive_range = "0-5000"  # Range aumentado para capturar mais tickets
-        self.logger.debug(f"Usando range expandido para técnico {tecnico_id}: {adaptive_range}")
-
-        # CACHE AGRESSIVO: Verificar se já temos dados em cache
-        cache_key = f"technician_metrics_{tecnico_id}"
-        cached_metrics = self._get_cache_data(cache_key)
-        if cached_metrics:
-            self.logger.debug(f"Cache hit para técnico {tecnico_id}")
-            return cached_metrics
-
-        # Buscar todos os tickets atribuídos ao técnico com timeout reduzido
-        params = {
-            "criteria[0][field]": 5,  # Campo técnico atribuído (FIXO)
-            "criteria[0][searchtype]": "equals",
-            "criteria[0][value]": tecnico_id,
-            "forcedisplay[0]": 2,  # ID
-            "forcedisplay[1]": 12,  # Status
-            "range": adaptive_range,  # Range híbrido adaptativo
-        }
+        Usa o mesmo cache (``technician_ranking_{limit}``) e o mesmo fan-out de
+        ``_collect_technician_ranking_async``, aguardado no event loop do
+        chamador em vez de ``AsyncGLPIClient.run``.
+        """
+        if self.async_client is None:
+            return await asyncio.to_thread(self.get_technician_ranking, limit)
 
-        # Debug específico removido para produção
-        # Debug removido para performance
+        if limit is not None and (not isinstance(limit, int) or limit <= 0):
+            self.logger.error(f"limit inválido: {limit}")
+            return []
 
+        start_time = time.time()
+        cache_key = f"technician_ranking_{limit or 'all'}"
         try:
-            # Timeout reduzido para 15 segundos
-            response = self._make_authenticated_request("GET", url, params=params, timeout=8)
-
-            if not response or response.status_code != 200:
-                self.logger.warning(
-                    f"Falha na requisição para técnico {tecnico_id}: {response.status_code if response else 'None'}"
-                )
-                # Debug específico removido para produção
-                # Debug removido para performance
-                return {
-                    "total_tickets": 0,
-                    "resolved_tickets": 0,
-                    "pending_tickets": 0,
-                    "avg_resolution_time": 0.0,
-                }
-
-            data = response.json()
-            tickets = data.get("data", [])
-            # initial_count = len(tickets)  # Commented out unused variable
-
-            # FASE 2: Verificação de completude e fallback automático
-            # TEMPORARIAMENTE DESABILITADO PARA MELHORAR PERFORMANCE
-            # fallback_triggered = False  # Commented out unused variable
-            # try:
-            #     if hybrid_pagination.is_range_potentially_insufficient(tickets, adaptive_range):
-            #         self.logger.warning(f"Range insuficiente detectado para {tech_name}: {initial_count} tickets")
-            #
-            #         # Calcular range estendido
-            #         extended_range = hybrid_pagination.calculate_extended_range(adaptive_range)
-            #         self.logger.info(f"Tentando fallback com range estendido: {extended_range}")
-            #
-            #         # Nova consulta com range estendido
-            #         params["range"] = extended_range
-            #         extended_response = self._make_authenticated_request("GET", url, params=params, timeout=8)
-            #
-            #         if extended_response and extended_response.status_code == 200:
-            #             extended_data = extended_response.json()
-            #             extended_tickets = extended_data.get("data", [])
-            #
-            #             if len(extended_tickets) > initial_count:
-            #                 self.logger.info(f"Fallback bem-sucedido: {initial_count} → {len(extended_tickets)} tickets")
-            #                 tickets = extended_tickets
-            #                 adaptive_range = extended_range  # Atualizar range usado
-            #                 fallback_triggered = True
-            #             else:
-            #                 self.logger.debug("Fallback não trouxe tickets adicionais")
-            #         else:
-            #             self.logger.warning("Falha na consulta de fallback")
-            # except Exception as e:
-            #     self.logger.error(f"Erro no fallback híbrido: {e}")
-
-            total = len(tickets)
-            resolvidos = 0
-            pendentes = 0
-
-            # Processamento otimizado sem logs excessivos
-            for ticket in tickets:
-                try:
-                    status_id = int(ticket.get("12", 0))
-                    if status_id in [5, 6]:  # Solucionado ou Fechado
-                        resolvidos += 1
-                    elif status_id in [2, 3, 4]:  # Em progresso, Planejado, Pendente
-                        pendentes += 1
-                except (ValueError, TypeError):
-                    continue  # Ignorar tickets com status inválido
-
-            self.logger.debug(
-                f"Técnico {tecnico_id}: {total} tickets ({resolvidos} resolvidos, {pendentes} pendentes)"
-            )
-
-            # Atualizar cache do sistema híbrido
-            # try:
-            #     hybrid_pagination.update_technician_cache(
-            #         tecnico_id,
-            #         tech_name or f"Técnico {tecnico_id}",
-            #         adaptive_range,
-            #         total,
-            #         fallback_triggered
-            #     )
-            # except Exception as e:
-            #     self.logger.debug(f"Erro ao atualizar stats de paginação: {e}")
-
-            result = {
-                "total_tickets": total,
-                "resolved_tickets": resolvidos,
-                "pending_tickets": pendentes,
-                "avg_resolution_time": 0.0,
-            }
-
-            # CACHE AGRESSIVO: Salvar resultado em cache por 1 hora
-            self._set_cache_data(cache_key, result, ttl=3600)
-            self.logger.debug(f"Cache salvo para técnico {tecnico_id}")
-
-            return result
-
-        except Exception as e:
-            self.logger.error(f"Erro ao buscar métricas do técnico {tecnico_id}: {e}")
-            return {
-                "total_tickets": 0,
-                "resolved_tickets": 0,
-                "pending_tickets": 0,
-                "avg_resolution_time": 0.0,
-            }
-
-    def _get_technician_ranking_knowledge_base(self) -> list:
-        """Implementação otimizada baseada nos scripts que funcionam - busca direta por ID
+            cached_data = self._get_cache_data(cache_key)
+            if cached_data and isinstance(cached_data, list):
+                return cached_data[:limit] if limit else cached_data
 
-        Esta implementação usa a mesma abordagem dos scripts com otimizações:
-        1. Lista hardcoded de IDs de técnicos conhecidos
-        2. Cache do field ID para evitar descoberta repetida
-        3. Processamento paralelo das métricas
-        4. Validação direta de ativo/não deletado
-        """
-        try:
-            # Validar configurações essenciais
-            if not hasattr(self, "glpi_url") or not self.glpi_url:
-                self.logger.error("glpi_url não configurado")
+            if not await asyncio.to_thread(self._ensure_authenticated):
+                self.logger.error("Falha na autenticação")
                 return []
 
-            # IDs dos técnicos válidos da entidade CAU (mesmo dos scripts)
-            technician_ids = [
-                "696",
-                "32",
-                "141",
-                "60",
-                "69",
-                "1032",
-                "252",
-                "721",
-                "926",
-                "1291",
-                "185",
-                "1331",
-                "1404",
-                "1088",
-                "1263",
-                "10",
-                "53",
-                "250",
-                "1471",
-            ]
-
-            self.logger.info(f"Lista de técnicos para verificar: {len(technician_ids)} IDs")
-
-            # Cache do field ID para evitar descoberta repetida
-            if not hasattr(self, "_cached_tech_field_id"):
-                self._cached_tech_field_id = self._discover_tech_field_id()
-                if not self._cached_tech_field_id:
-                    self.logger.error("Não foi possível descobrir o field ID do técnico")
-                    return []
-
-            # Buscar detalhes de todos os técnicos em paralelo
-            technician_candidates = []
-            import concurrent.futures
-
-            def get_technician_data(tech_id):
-                try:
-                    user_details = self._get_user_details_direct(tech_id)
-                    if user_details:
-                        return {
-                            "id": tech_id,
-                            "name": user_details["name"],
-                            "realname": user_details["realname"],
-                            "firstname": user_details["firstname"],
-                        }
-                except Exception as e:
-                    self.logger.error(f"Erro ao processar técnico {tech_id}: {e}")
-                return None
-
-            # Processar técnicos em paralelo (otimizado para 5 threads para melhor estabilidade)
-            with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-                future_to_tech = {
-                    executor.submit(get_technician_data, tech_id): tech_id
-                    for tech_id in technician_ids
-                }
-
-                for future in concurrent.futures.as_completed(future_to_tech):
-                    tech_id = future_to_tech[future]
-                    try:
-                        result = future.result(timeout=15)  # Timeout otimizado para 15s por técnico
-                        if result:
-                            technician_candidates.append(result)
-                        else:
-                            self.logger.warning(f"Técnico não encontrado ou inativo: {tech_id}")
-                    except concurrent.futures.TimeoutError:
-                        self.logger.error(f"Timeout ao processar técnico {tech_id}")
-                    except Exception as e:
-                        self.logger.error(f"Erro ao processar técnico {tech_id}: {e}")
-
-            self.logger.info(
-                f"Total de técnicos candidatos encontrados: {len(technician_candidates)}"
-            )
-
-            if not technician_candidates:
-                self.logger.warning("Nenhum técnico candidato encontrado")
+            # Field ID do técnico do cache persistido (acompanha a revalidação)
+            tech_field_id = await asyncio.to_thread(self._discover_tech_field_id)
+            if not tech_field_id:
+                self.logger.error("Não foi possível descobrir o field ID do técnico")
                 return []
 
-            # Construir ranking com processamento otimizado
-            def get_technician_metrics_and_level(tech):
-                try:
-                    tech_id = tech["id"]
-                    # Buscar métricas e nível em paralelo
-                    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                        # Submeter tarefas em paralelo
-                        metrics_future = executor.submit(
-                            self._get_technician_metrics_corrected, tech_id
-                        )
-                        # Removed fallback method - using real GLPI data only
-                        tech_level = "N1"  # Default level when no real data available
-
-                        # Aguardar resultados
-                        metricas = metrics_future.result(timeout=15)
-
-                    return {
-                        "id": tech_id,
-                        "name": tech["name"],
-                        "nome": tech["name"],
-                        "total_tickets": metricas["total_tickets"],
-                        "resolved_tickets": metricas["resolved_tickets"],
-                        "pending_tickets": metricas["pending_tickets"],
-                        "avg_resolution_time": metricas["avg_resolution_time"],
-                        "level": tech_level,
-                        "rank": 0,
-                    }
-                except Exception as e:
-                    self.logger.error(f"Erro ao processar métricas do técnico {tech['id']}: {e}")
-                    return None
-
-            ranking = []
-            # Processar métricas em paralelo (máximo 3 threads para não sobrecarregar)
-            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                future_to_tech = {
-                    executor.submit(get_technician_metrics_and_level, tech): tech
-                    for tech in technician_candidates
-                }
-
-                for future in concurrent.futures.as_completed(future_to_tech):
-                    tech = future_to_tech[future]
-                    try:
-                        result = future.result(timeout=30)  # Timeout otimizado para 30s por técnico
-                        if result:
-                            ranking.append(result)
-                    except concurrent.futures.TimeoutError:
-                        self.logger.error(
-                            f"Timeout ao processar métricas do técnico {tech['id']}"
-                        )
-                    except Exception as e:
-                        self.logger.error(
-                            f"Erro ao processar métricas do técnico {tech['id']}: {e}"
-                        )
-
-            # Ordenar por total de tickets
-            ranking.sort(key=lambda x: x["total_tickets"], reverse=True)
+            technicians = await asyncio.to_thread(self.technician_roster.technicians)
+            ranking = self._rank_technicians(
+                await self._collect_technician_ranking_async(technicians, tech_field_id), limit
+            )
 
-            # Atribuir ranks
-            for i, tech in enumerate(ranking):
-                tech["rank"] = i + 1
+            if ranking and not deadline_exceeded():
+                self._set_cache_data(cache_key, ranking, ttl=300)
 
-            self.logger.info(f"Ranking final construído com {len(ranking)} técnicos")
+            if limit:
+                ranking = ranking[:limit]
 
+            self.logger.info("Ranking (async) obtido em %.2fs: %s técnicos", time.time() - start_time, len(ranking))
             return ranking
 
         except Exception as e:
-            self.logger.error(f"Erro geral na busca de técnicos: {e}")
+            self.logger.error(f"Erro geral em get_technician_ranking_async: {e}")
+            self.logger.error(f"Stack trace: {traceback.format_exc()}")
             return []
 
-    def _get_technician_level(
-        self,
-        user_id: int,
-        total_tickets: int = 0,
-        all_technicians_data: list = None,
-    ) -> str:
-        """Atribui nível do técnico baseado nos grupos do GLPI
-
-        Mapeamento correto dos técnicos por grupos:
-        - N1 (ID 89): Gabriel Andrade da Conceicao, Nicolas Fernando Muniz Nunez
-        - N2 (ID 90): Alessandro Carbonera Vieira, Edson Joel dos Santos Silva, Luciano Marcelino da Silva,
-            Jonathan Nascimento Moletta, Leonardo Trojan Repiso Riela, Thales Vinicius Paz Leite, Joao Pedro Wilson Dias
-        - N3 (ID 91): Jorge Antonio Vicente Júnior, Anderson da Silva Morim de Oliveira, Miguelangelo Ferreira,
-            Silvio Godinho Valim, Pablo Hebling Guimaraes
-        - N4 (ID 92): Paulo César Pedó Nunes, Luciano de Araujo Silva, Wagner Mengue,
-            Alexandre Rovinski Almoarqueg, Gabriel Silva Machado
-        """
+    def _discover_tech_field_id(self) -> Optional[str]:
+        """Field ID do técnico atribuído (cache persistido de ``search_options``; padrão 5)"""
         try:
-            # Validar configuração
-            if not self.glpi_url:
-                self.logger.error("URL do GLPI não configurada")
-                return "N1"
-
-            # Buscar grupos do usuário com tratamento de erros
-            try:
-                response = self._make_authenticated_request(
-                    "GET",
-                    f"{self.glpi_url}/search/Group_User",
-                    params={
-                        "range": "0-99",
-                        "criteria[0][field]": "4",  # Campo users_id
-                        "criteria[0][searchtype]": "equals",
-                        "criteria[0][value]": str(user_id),
-                        "forcedisplay[0]": "3",  # groups_id
-                        "forcedisplay[1]": "4",  # users_id
-                    },
-                    timeout=10,
-                )
-
-                if response and response.ok:
-                    try:
-                        group_data = response.json()
-
-                        if group_data and isinstance(group_data, dict) and group_data.get("data"):
-                            for group_entry in group_data["data"]:
-                                if isinstance(group_entry, dict) and "3" in group_entry:
-                                    try:
-                                        group_id = int(group_entry["3"])
-
-                                        # Verificar se o grupo corresponde aos service_levels
-                                        for (
-                                            level,
-                                            level_group_id,
-                                        ) in self.service_levels.items():
-                                            if group_id == level_group_id:
-                                                self.logger.info(
-                                                    f"Técnico {user_id} encontrado no grupo {group_id} -> {level}"
-                                                )
-                                                return level
-                                    except (
-                                        ValueError,
-                                        TypeError,
-                                    ) as parse_error:
-                                        self.logger.warning(
-                                            f"Erro ao processar group_id para usuário {user_id}: {parse_error}"
-                                        )
-                                        continue
-                    except ValueError as json_error:
-                        self.logger.error(
-                            f"Erro ao decodificar JSON da resposta de grupos para usuário {user_id}: {json_error}"
-                        )
-                else:
-                    self.logger.warning(
-                        f"Falha na busca de grupos para usuário {user_id}: {response.status_code if response else 'Sem resposta'}"
-                    )
-            except requests.exceptions.Timeout:
-                self.logger.error(f"Timeout na busca de grupos para usuário {user_id}")
-            except requests.exceptions.ConnectionError:
-                self.logger.error(f"Erro de conexão na busca de grupos para usuário {user_id}")
-            except requests.exceptions.RequestException as req_error:
-                self.logger.error(
-                    f"Erro na requisição de grupos para usuário {user_id}: {req_error}"
-                )
-            except Exception as groups_error:
-                self.logger.error(
-                    f"Erro inesperado na busca de grupos para usuário {user_id}: {groups_error}"
-                )
-
-            # Se não encontrou nos grupos configurados, usar fallback baseado no nome do usuário
-            # (para casos onde o técnico não está nos grupos mas está na lista fornecida)
-            try:
-                user_response = self._make_authenticated_request(
-                    "GET", f"{self.glpi_url}/User/{user_id}", timeout=10
-                )
-
-                if user_response and user_response.ok:
-                    try:
-                        user_data = user_response.json()
-
-                        if user_data and isinstance(user_data, dict):
-                            # Construir nome completo como no método get_technician_ranking
-                            display_name = ""
-                            if "realname" in user_data and "firstname" in user_data:
-                                display_name = f"{user_data['firstname']} {user_data['realname']}"
-                            elif "realname" in user_data:
-                                display_name = user_data["realname"]
-                            elif "name" in user_data:
-                                display_name = user_data["name"]
-                            elif "1" in user_data:
-                                display_name = user_data["1"]
-
-                            if display_name and display_name.strip():
-                                user_name = display_name.lower().strip()
-
-                                # Mapeamento manual baseado nos nomes exatos do GLPI
-                                n1_names = [
-                                    "gabriel andrade da conceicao",
-                                    "nicolas fernando muniz nunez",
-                                ]
-                                n2_names = [
-                                    "alessandro carbonera vieira",
-                                    "jonathan nascimento moletta",
-                                    "thales vinicius paz leite",
-                                    "leonardo trojan repiso riela",
-                                    "edson joel dos santos silva",
-                                    "luciano marcelino da silva",
-                                    "joao pedro wilson dias",
-                                ]
-                                n3_names = [
-                                    "anderson da silva morim de oliveira",
-                                    "silvio godinho valim",
-                                    "jorge antonio vicente júnior",
-                                    "pablo hebling guimaraes",
-                                    "miguelangelo ferreira",
-                                ]
-                                n4_names = [
-                                    "gabriel silva machado",
-                                    "luciano de araujo silva",
-                                    "wagner mengue",
-                                    "paulo césar pedó nunes",
-                                    "alexandre rovinski almoarqueg",
-                                ]
-
-                                if user_name in n4_names:
-                                    self.logger.info(
-                                        f"Técnico {user_id} ({user_name}) mapeado para N4 por nome"
-                                    )
-                                    return "N4"
-                                elif user_name in n3_names:
-                                    self.logger.info(
-                                        f"Técnico {user_id} ({user_name}) mapeado para N3 por nome"
-                                    )
-                                    return "N3"
-                                elif user_name in n2_names:
-                                    self.logger.info(
-                                        f"Técnico {user_id} ({user_name}) mapeado para N2 por nome"
-                                    )
-                                    return "N2"
-                                elif user_name in n1_names:
-                                    self.logger.info(
-                                        f"Técnico {user_id} ({user_name}) mapeado para N1 por nome"
-                                    )
-                                    return "N1"
-                            else:
-                                self.logger.warning(
-                                    f"Nome de usuário vazio ou inválido para usuário {user_id}"
-                                )
-                        else:
-                            self.logger.warning(
-                                f"Dados de usuário inválidos para usuário {user_id}"
-                            )
-                    except ValueError as json_error:
-                        self.logger.error(
-                            f"Erro ao decodificar JSON dos dados do usuário {user_id}: {json_error}"
-                        )
-                else:
-                    self.logger.warning(
-                        f"Falha na busca de dados do usuário {user_id}: {user_response.status_code if user_response else 'Sem resposta'}"
-                    )
-            except requests.exceptions.Timeout:
-                self.logger.error(f"Timeout na busca de dados do usuário {user_id}")
-            except requests.exceptions.ConnectionError:
-                self.logger.error(f"Erro de conexão na busca de dados do usuário {user_id}")
-            except requests.exceptions.RequestException as req_error:
-                self.logger.error(f"Erro na requisição de dados do usuário {user_id}: {req_error}")
-            except Exception as user_error:
-                self.logger.error(
-                    f"Erro inesperado na busca de dados do usuário {user_id}: {user_error}"
-                )
-
-            # Fallback final
-            self.logger.warning(
-                f"Técnico {user_id} não encontrado nos grupos ou mapeamento - usando N1 como padrão"
-            )
-            return "N1"
-
+            fields = self.search_options.fields("Ticket") or {}
         except Exception as e:
-            self.logger.error(f"Erro ao determinar nível do técnico {user_id}: {e}")
-            return "N1"  # Nível padrão em caso de erro
-
-    def _count_tickets_by_technician_optimized(
-        self, tech_id: int, tech_field_id: str
-    ) -> Optional[int]:
-        """Conta tickets por técnico seguindo a base de conhecimento
-
-        Usa range 0-0 para retornar apenas contagem (otimizado)
-        Corrigido para usar campo 4 (users_id_tech) como o método que funciona
-        """
-        try:
-            # Validar parâmetros de entrada
-            if not tech_id or not isinstance(tech_id, int) or tech_id <= 0:
-                self.logger.error(f"ID de técnico inválido: {tech_id}")
-                return None
-
-            if not self.glpi_url:
-                self.logger.error("URL do GLPI não configurada para contagem de tickets")
-                return None
+            self.logger.debug("Erro ao descobrir field ID do técnico: %s", str(e)[:100])
+            fields = {}
+        return fields.get("ASSIGNED_TECH") or "5"
 
-            # Usar o tech_field_id descoberto dinamicamente
-            tech_field = tech_field_id
+    def _scan_technician_metrics(
+        self,
+        technician_ids: List[str],
+        tech_field_id: str = "5",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Total, resolvidos e pendentes de cada técnico em uma única varredura paginada
 
-            # Parâmetros seguindo a base de conhecimento
-            params = {
-                "is_deleted": 0,
-                "criteria[0][field]": tech_field,  # Campo users_id_tech (field 4)
-                "criteria[0][searchtype]": "equals",
-                "criteria[0][value]": str(tech_id),  # Garantir que seja string
-                "range": "0-0",  # Retorna apenas contagem
-            }
+        Uma busca (técnico 1 OR técnico 2 ...) no período, exibindo técnico e
+        status, substitui uma consulta por técnico. A lista é dividida pelo
+        limite de URL; com o cliente assíncrono as páginas vêm em paralelo.
 
-            self.logger.info(f"Contando tickets para técnico {tech_id} com field {tech_field}")
+        Returns:
+            ``{tech_id: {"total_tickets", "resolved_tickets", "pending_tickets", ...}}``
+        """
+        technician_ids = [str(tech_id) for tech_id in technician_ids]
+        if not technician_ids:
+            return {}
 
-            try:
-                response = self._make_authenticated_request(
-                    "GET",
-                    f"{self.glpi_url}/search/Ticket",
-                    params=params,
-                    timeout=30,
+        if self._use_async_client():
+            return self.async_client.run(
+                self.async_client.get_technician_metrics(
+                    technician_ids, tech_field_id, start_date, end_date
                 )
+            )
 
-                if not response:
-                    self.logger.error(
-                        f"Falha na requisição para contar tickets do técnico {tech_id}"
-                    )
-                    return None
-
-                if not response.ok:
-                    self.logger.error(
-                        f"Erro HTTP na contagem de tickets do técnico {tech_id}: {response.status_code}"
-                    )
-                    return None
-
-            except requests.exceptions.Timeout:
-                self.logger.error(f"Timeout na contagem de tickets do técnico {tech_id}")
-                return None
-            except requests.exceptions.ConnectionError:
-                self.logger.error(f"Erro de conexão na contagem de tickets do técnico {tech_id}")
-                return None
-            except requests.exceptions.RequestException as req_error:
-                self.logger.error(
-                    f"Erro na requisição de contagem de tickets do técnico {tech_id}: {req_error}"
-                )
-                return None
+        correlation_log = f"[{correlation_id}] " if correlation_id else ""
+        status_field = self.field_ids.get("STATUS") or "12"
+        tally = TechnicianTally(tech_field_id, status_field, technician_ids)
+        query = build_technician_scan_query(
+            tech_field_id, technician_ids, status_field, start_date, end_date
+        )
+        batches = query.split_any(self.glpi_url)
 
-            # Extrair total do cabeçalho Content-Range com validação
+        for batch in batches:
             try:
-                if "Content-Range" in response.headers:
-                    content_range = response.headers["Content-Range"]
-
-                    if not content_range or not isinstance(content_range, str):
-                        self.logger.warning(
-                            f"Content-Range inválido para técnico {tech_id}: {content_range}"
-                        )
-                        return 0
-
-                    # Formato esperado: "items 0-0/total" ou "items */total"
-                    if "/" in content_range:
-                        total_str = content_range.split("/")[-1].strip()
-                        if total_str.isdigit():
-                            total = int(total_str)
-                            if total >= 0:
-                                self.logger.info(f"Técnico {tech_id}: {total} tickets encontrados")
-                                return total
-                            else:
-                                self.logger.warning(
-                                    f"Total de tickets negativo para técnico {tech_id}: {total}"
-                                )
-                                return 0
-                        else:
-                            self.logger.warning(
-                                f"Total de tickets não numérico para técnico {tech_id}: {total_str}"
-                            )
-                            return 0
-                    else:
-                        self.logger.warning(
-                            f"Formato de Content-Range inválido para técnico {tech_id}: {content_range}"
-                        )
-                        return 0
-                else:
-                    self.logger.warning(f"Content-Range não encontrado para técnico {tech_id}")
-                    # Fallback: tentar extrair do JSON
-                    try:
-                        result = response.json()
-                        if isinstance(result, dict) and "totalcount" in result:
-                            total = result["totalcount"]
-                            self.logger.info(
-                                f"Técnico {tech_id}: {total} tickets encontrados (JSON fallback)"
-                            )
-                            return total
-                        elif isinstance(result, dict) and "data" in result:
-                            total = len(result["data"])
-                            self.logger.info(
-                                f"Técnico {tech_id}: {total} tickets encontrados (data length)"
-                            )
-                            return total
-                    except Exception as json_error:
-                        self.logger.warning(f"Erro ao processar resposta JSON: {json_error}")
-                    return 0
-
-            except (ValueError, IndexError, AttributeError) as parse_error:
-                self.logger.error(
-                    f"Erro ao processar Content-Range para técnico {tech_id}: {parse_error}"
-                )
-                return 0
-
-        except Exception as e:
-            self.logger.error(f"Erro geral ao contar tickets do técnico {tech_id}: {e}")
-            return None
-
-    def _count_tickets_by_technician(self, tech_id: int, tech_field_id: str) -> Optional[int]:
-        """Método mantido para compatibilidade - redireciona para versão otimizada"""
-        return self._count_tickets_by_technician_optimized(tech_id, tech_field_id)
-
-    def _get_technician_ticket_details(self, tech_id: int, tech_field_id: str) -> Optional[dict]:
-        """Obtém dados detalhados dos tickets de um técnico (versão legacy - usa função otimizada)
+                for rows in self._iter_search_pages(
+                    f"ranking ({len(batch.any_values)} técnicos)", batch.to_params(), correlation_id
+                ):
+                    tally.add(rows)
+            except Exception as e:
+                self.logger.error(f"{correlation_log}Erro na varredura do ranking: {e}")
 
-        Retorna:
-        {
-            "total_tickets": int,
-            "resolved_tickets": int,
-            "pending_tickets": int,
-            "avg_resolution_time": float
+        self.logger.info(
+            "%sVarredura do ranking: %s tickets, %s técnicos, %s consulta(s)",
+            correlation_log,
+            tally.rows,
+            len(technician_ids),
+            len(batches),
+        )
+        return tally.metrics()
+
+    @staticmethod
+    def _technician_entry(
+        tech_id: str, name: str, metrics: Optional[Dict[str, Any]], level: str = "N1"
+    ) -> Dict[str, Any]:
+        """Linha do ranking de um técnico (``rank`` é atribuído por ``_rank_technicians``)"""
+        metrics = metrics or {}
+        return {
+            "id": tech_id,
+            "name": name,
+            "nome": name,
+            "total_tickets": metrics.get("total_tickets", 0),
+            "resolved_tickets": metrics.get("resolved_tickets", 0),
+            "pending_tickets": metrics.get("pending_tickets", 0),
+            "avg_resolution_time": metrics.get("avg_resolution_time", 0.0),
+            "level": level,
+            "rank": 0,
         }
-        """
-        try:
-            # Usar a versão otimizada para um único técnico
-            result = self._get_technician_ticket_details_optimized([tech_id], tech_field_id)
-            return result.get(
-                str(tech_id),
-                {
-                    "total_tickets": 0,
-                    "resolved_tickets": 0,
-                    "pending_tickets": 0,
-                    "avg_resolution_time": 0.0,
-                },
-            )
-        except Exception as e:
-            self.logger.error(
-                f"Erro ao obter dados detalhados dos tickets do técnico {tech_id}: {e}"
-            )
-            return None
 
-    def _get_technician_ticket_details_optimized(
-        self, technician_ids: list, tech_field_id: str
-    ) -> dict:
-        """Obtém dados detalhados dos tickets de múltiplos técnicos com cache otimizado
+    def _get_technician_ranking_knowledge_base(self, limit: Optional[int] = None) -> list:
+        """Ranking dos técnicos do índice (``technician_roster``)
 
-        Args:
-            technician_ids: Lista de IDs dos técnicos
-            tech_field_id: ID do campo técnico no GLPI
-
-        Retorna:
-            Dict com dados de cada técnico: {
-                "tech_id": {
-                    "total_tickets": int,
-                    "resolved_tickets": int,
-                    "pending_tickets": int,
-                    "avg_resolution_time": float
-                }
-            }
+        1. Técnicos ativos, nomes e níveis vêm do índice (sem ``/User/{id}`` por técnico)
+        2. Field ID do técnico do cache persistido de opções de busca
+        3. Métricas de todos os técnicos em uma única varredura
+        4. Top ``limit`` selecionado com heap
         """
         try:
-            self.logger.info("=== DEBUG RANKING TÉCNICOS ===")
-            self.logger.info(f"Técnicos para processar: {technician_ids}")
-            self.logger.info(f"Field ID do técnico: {tech_field_id}")
-            self.logger.info(f"Tipo do field ID: {type(tech_field_id)}")
-
-            # Inicializar resultado para todos os técnicos
-            result = {}
-            for tech_id in technician_ids:
-                result[str(tech_id)] = {
-                    "total_tickets": 0,
-                    "resolved_tickets": 0,
-                    "pending_tickets": 0,
-                    "avg_resolution_time": 0.0,
-                }
-
-            if not technician_ids:
-                self.logger.warning("Lista de técnicos vazia")
-                return result
-
-            # Verificar se o field ID é válido
-            if not tech_field_id or tech_field_id == "None":
-                self.logger.error(f"Field ID do técnico é inválido: '{tech_field_id}'")
-                return result
-
-            # Testar consulta simples primeiro
-            test_params = {
-                "is_deleted": 0,
-                "range": "0-10",
-                "forcedisplay[0]": tech_field_id,
-                "forcedisplay[1]": "12",  # Status
-            }
+            # Validar configurações essenciais
+            if not hasattr(self, "glpi_url") or not self.glpi_url:
+                self.logger.error("glpi_url não configurado")
+                return []
 
-            test_response = self._make_authenticated_request(
-                "GET",
-                f"{self.glpi_url}/search/Ticket",
-                params=test_params,
-                timeout=30,
-            )
+            technicians = self.technician_roster.technicians()
+            self.logger.info("Técnicos no índice: %s", len(technicians))
+            if not technicians:
+                self.logger.warning("Nenhum técnico ativo no índice")
+                return []
 
-            if test_response and test_response.status_code == 200:
-                test_data = test_response.json()
-                if not test_data.get("data"):
-                    self.logger.warning("Nenhum ticket encontrado na consulta de teste")
-            else:
-                self.logger.error(
-                    f"Consulta de teste falhou: {test_response.status_code if test_response else 'None'}"
-                )
-                if test_response:
-                    self.logger.error(f"Resposta: {test_response.text[:500]}")
+            # Field ID do técnico do cache persistido (acompanha a revalidação)
+            tech_field_id = self._discover_tech_field_id()
+            if not tech_field_id:
+                self.logger.error("Não foi possível descobrir o field ID do técnico")
+                return []
 
-            # Verificar cache primeiro
-            cache_key = f"ticket_details_{hash(tuple(sorted(technician_ids)))}"
-            try:
-                cached_data = self._get_cache_data(cache_key)
-                if cached_data is not None:
-                    self.logger.info(
-                        f"[{datetime.now(tz=timezone.utc).isoformat()}] Retornando dados de tickets do cache para {len(technician_ids)} técnicos"
-                    )
-                    return cached_data
-            except Exception as e:
-                self.logger.warning(
-                    f"[{datetime.now(tz=timezone.utc).isoformat()}] Erro ao verificar cache de tickets: {e}"
+            # Varredura paginada em paralelo no cliente assíncrono
+            if self._use_async_client():
+                ranking = self.async_client.run(
+                    self._collect_technician_ranking_async(technicians, tech_field_id)
                 )
+                return self._rank_technicians(ranking, limit)
 
-            # Processar técnicos em lotes menores
-            batch_size = 10
-            batches = [
-                technician_ids[i : i + batch_size]
-                for i in range(0, len(technician_ids), batch_size)
+            # Total, resolvidos e pendentes de todos os técnicos em uma única varredura
+            metrics = self._scan_technician_metrics([tech.id for tech in technicians], tech_field_id)
+            ranking = [
+                self._technician_entry(tech.id, tech.name, metrics.get(tech.id), tech.level or "N1")
+                for tech in technicians
             ]
 
-            self.logger.info(
-                f"Processando {len(technician_ids)} técnicos em {len(batches)} lotes de até {batch_size}"
-            )
-
-            for batch_idx, batch in enumerate(batches):
-                try:
-                    # Buscar tickets para este lote (otimizado com range menor)
-                    params = {
-                        "is_deleted": 0,
-                        "forcedisplay[0]": tech_field_id,
-                        "forcedisplay[1]": "12",
-                        "range": "0-5000",  # CORREÇÃO: Aumentado de 500 para 5000 para capturar mais tickets
-                    }
-
-                    # Adicionar critérios OR para técnicos do lote
-                    for i, tech_id in enumerate(batch):
-                        params[f"criteria[{i}][field]"] = tech_field_id
-                        params[f"criteria[{i}][searchtype]"] = "equals"
-                        params[f"criteria[{i}][value]"] = str(tech_id)
-                        if i < len(batch) - 1:
-                            params[f"criteria[{i}][link]"] = "OR"
-
-                    # Fazer a requisição
-                    response = self._make_authenticated_request(
-                        "GET",
-                        f"{self.glpi_url}/search/Ticket",
-                        params=params,
-                        timeout=30,
-                    )
+            return self._rank_technicians(ranking, limit)
 
-                    if response and response.status_code == 200:
-                        tickets_json = response.json()
-
-                        if "data" in tickets_json:
-                            # Processar os tickets e agrupar por técnico
-                            for ticket in tickets_json["data"]:
-                                tech_id_str = str(ticket.get(str(tech_field_id), ""))
-
-                                if tech_id_str in result:
-                                    status = int(ticket.get("12", 0))
-                                    result[tech_id_str]["total_tickets"] += 1
-
-                                    # Contar tickets resolvidos (status 5 e 6)
-                                    if status in [5, 6]:
-                                        result[tech_id_str]["resolved_tickets"] += 1
-                                    # Contar tickets pendentes (status 1, 2, 3, 4)
-                                    elif status in [1, 2, 3, 4]:
-                                        result[tech_id_str]["pending_tickets"] += 1
-                                else:
-                                    self.logger.warning(
-                                        f"Técnico {tech_id_str} não encontrado na lista de resultados"
-                                    )
-                        else:
-                            self.logger.warning("Nenhum dado encontrado na resposta")
-                    else:
-                        self.logger.error(
-                            f"Falha na requisição do lote {batch_idx + 1}: {response.status_code if response else 'None'}"
-                        )
-                        if response:
-                            self.logger.error(f"Resposta: {response.text[:500]}")
-
-                except Exception as batch_error:
-                    self.logger.error(f"Erro no lote {batch_idx + 1}: {batch_error}")
-                    continue
+        except Exception as e:
+            self.logger.error(f"Erro geral na busca de técnicos: {e}")
+            return []
 
-            # Salvar no cache
-            try:
-                self._set_cache_data(cache_key, result, ttl=180)  # Cache por 3 minutos
-            except Exception as cache_error:
-                self.logger.warning(f"Erro ao salvar no cache: {cache_error}")
+    def _rank_technicians(self, ranking: list, limit: Optional[int] = None) -> list:
+        """Ordena os técnicos por total de tickets e atribui as posições
 
-            return result
+        Com ``limit`` só os ``limit`` primeiros são selecionados (heap).
+        """
+        ranking = top_technicians(ranking, limit)
+        self.logger.info("Ranking final construído com %s técnicos", len(ranking))
+        return ranking
+
+    async def _collect_technician_ranking_async(
+        self, technicians: List[TechnicianRecord], tech_field_id: str = "5"
+    ) -> list:
+        """Métricas dos técnicos do índice via ``AsyncGLPIClient`` (ranking sem ordenação)"""
+        metrics = await self.async_client.get_technician_metrics(
+            [tech.id for tech in technicians], tech_field_id
+        )
 
-        except Exception as e:
-            self.logger.error(f"Erro geral no processamento de tickets: {e}")
-            return result
+        # Nível N1 quando o técnico não está em um grupo de nível
+        return [
+            self._technician_entry(tech.id, tech.name, metrics.get(tech.id), tech.level or "N1")
+            for tech in technicians
+        ]
 
     def close_session(self):
-        """Encerra a sessão com a API do GLPI"""
+        """Encerra a sessão com a API do GLPI (e as sessões do pool, se houver)"""
+        if self.session_pool is not None:
+            self.session_pool.close()
         if self.session_token:
             try:
                 response = self._make_authenticated_request("GET", f"{self.glpi_url}/killSession")
@@ -4806,29 +4234,28 @@ class GLPIService:
             except Exception as e:
                 self.logger.error(f"Erro ao encerrar sessão: {e}")
             finally:
-                self.session_token = None
-                self.token_created_at = None
-                self.token_expires_at = None
+                self._invalidate_session_token()
 
     def _get_cached_data(self, cache_key: str):
         """Recupera dados do cache se ainda válidos (TTL customizável)"""
-        if cache_key not in self._cache:
-            return None
+        with self._cache_lock:
+            if cache_key not in self._cache:
+                return None
 
-        cache_entry = self._cache[cache_key]
-        if cache_entry["data"] is None or cache_entry["timestamp"] is None:
-            return None
+            cache_entry = self._cache[cache_key]
+            if cache_entry["data"] is None or cache_entry["timestamp"] is None:
+                return None
 
-        # Verificar se o cache ainda é válido
-        current_time = time.time()
-        ttl = cache_entry.get("ttl", 300)  # TTL padrão de 5 minutos
-        if current_time - cache_entry["timestamp"] > ttl:
-            # Cache expirado
-            cache_entry["data"] = None
-            cache_entry["timestamp"] = None
-            return None
+            # Verificar se o cache ainda é válido
+            current_time = time.time()
+            ttl = cache_entry.get("ttl", 300)  # TTL padrão de 5 minutos
+            if current_time - cache_entry["timestamp"] > ttl:
+                # Cache expirado
+                cache_entry["data"] = None
+                cache_entry["timestamp"] = None
+                return None
 
-        return cache_entry["data"]
+            return cache_entry["data"]
 
     def _set_cached_data(self, cache_key: str, data, ttl: int = None):
         """Armazena dados no cache com TTL customizável
@@ -4838,11 +4265,12 @@ class GLPIService:
             data: Dados a serem armazenados
             ttl: Time to live em segundos (usa TTL padrão do cache se None)
         """
-        if cache_key in self._cache:
-            self._cache[cache_key]["data"] = data
-            self._cache[cache_key]["timestamp"] = time.time()
-            if ttl is not None:
-                self._cache[cache_key]["ttl"] = ttl
+        with self._cache_lock:
+            if cache_key in self._cache:
+                self._cache[cache_key]["data"] = data
+                self._cache[cache_key]["timestamp"] = time.time()
+                if ttl is not None:
+                    self._cache[cache_key]["ttl"] = ttl
 
     def _get_user_name_by_id(self, user_id: str) -> str:
         """Busca o nome do usuário pelo ID"""
@@ -4863,19 +4291,8 @@ class GLPIService:
                 self.logger.warning(f"Falha ao buscar usuário {user_id}")
                 return f"Usuário {user_id}"
 
-            user_data = response.json()
-
             # Construir nome de exibição
-            display_name = "Usuário desconhecido"
-            if isinstance(user_data, dict):
-                if user_data.get("realname") and user_data.get("firstname"):
-                    display_name = f"{user_data['firstname']} {user_data['realname']}"
-                elif user_data.get("realname"):
-                    display_name = user_data["realname"]
-                elif user_data.get("name"):
-                    display_name = user_data["name"]
-                elif user_data.get("firstname"):
-                    display_name = user_data["firstname"]
+            display_name = parse_user_display_name(response.json())
 
             # Armazenar no cache por 1 hora
             self._set_cache_data("user_names", display_name, 3600, cache_key)
@@ -5088,81 +4505,131 @@ class GLPIService:
             status_id = self.status_map.get("novos", 1)
 
             # Parâmetros para buscar tickets com status novo
-            search_params = {
-                "is_deleted": 0,
-                "range": f"0-{limit - 1}",  # Limitar resultados
-                "criteria[0][field]": self.field_ids["STATUS"],
-                "criteria[0][searchtype]": "equals",
-                "criteria[0][value]": status_id,
-                "sort": "19",  # Ordenar por data de criação (campo 19)
-                "order": "DESC",  # Mais recentes primeiro
-                "forcedisplay[0]": "2",  # ID do ticket
-                "forcedisplay[1]": "1",  # Título
-                "forcedisplay[2]": "21",  # Descrição
-                "forcedisplay[3]": "15",  # Data de abertura
-                "forcedisplay[4]": "4",  # Solicitante (users_id_recipient)
-                "forcedisplay[5]": "3",  # Prioridade
-                "forcedisplay[6]": "5",  # Categoria
-                "forcedisplay[7]": "12",  # Status
-            }
+            search_params = build_new_tickets_params(self.field_ids["STATUS"], status_id, limit)
 
             response = self._make_authenticated_request(
                 "GET", f"{self.glpi_url}/search/Ticket", params=search_params
             )
 
-            if not response or not response.ok:
+            if not response or not response.ok:
+                self.logger.error("Falha ao buscar tickets novos")
+                return []
+
+            data = response.json()
+            tickets = []
+
+            if "data" in data and data["data"]:
+                for ticket_data in data["data"]:
+                    # Extrair ID do requerente e buscar o nome
+                    requester_id = ticket_data.get("4", "")
+                    requester_name = (
+                        self._get_user_name_by_id(str(requester_id))
+                        if requester_id
+                        else "Não informado"
+                    )
+
+                    # Extrair ID da categoria e converter para nome
+                    category_id = ticket_data.get("5", "")  # Campo 5 = categoria
+                    category_name = (
+                        self._get_category_name_by_id(str(category_id))
+                        if category_id
+                        else "Não categorizado"
+                    )
+
+                    tickets.append(
+                        self._format_new_ticket(ticket_data, requester_name, category_name)
+                    )
+
+            self.logger.info("Encontrados %s tickets novos", len(tickets))
+            return tickets
+
+        except Exception as e:
+            self.logger.error(f"Erro ao buscar tickets novos: {e}")
+            return []
+
+    async def get_new_tickets_async(self, limit: int = 10) -> List[Dict[str, any]]:
+        """Versão assíncrona de ``get_new_tickets``
+
+        Uma busca pelos tickets e, em seguida, nomes de solicitantes e
+        categorias buscados em paralelo (com os mesmos caches), em vez de duas
+        requisições sequenciais por ticket.
+        """
+        if self.async_client is None:
+            return await asyncio.to_thread(self.get_new_tickets, limit)
+
+        try:
+            if not await asyncio.to_thread(self._ensure_authenticated):
+                return []
+            if not await asyncio.to_thread(self.discover_field_ids):
+                return []
+
+            status_id = self.status_map.get("novos", 1)
+            search_params = build_new_tickets_params(self.field_ids["STATUS"], status_id, limit)
+            response = await self.async_client.search_tickets(search_params)
+            if response is None or response.status_code >= 400:
                 self.logger.error("Falha ao buscar tickets novos")
                 return []
 
-            data = response.json()
-            tickets = []
+            rows = response.json().get("data") or []
+            requester_ids = [str(row["4"]) for row in rows if row.get("4")]
+            category_ids = [
+                str(row["5"][0] if isinstance(row["5"], list) else row["5"])
+                for row in rows
+                if row.get("5")
+            ]
+            requester_names, category_names = await asyncio.gather(
+                self.async_client.get_user_display_names(requester_ids),
+                self.async_client.get_category_names(category_ids),
+            )
 
-            if "data" in data and data["data"]:
-                for ticket_data in data["data"]:
-                    # Extrair ID do requerente e buscar o nome
-                    requester_id = ticket_data.get("4", "")
-                    requester_name = (
-                        self._get_user_name_by_id(str(requester_id))
+            tickets = []
+            for row in rows:
+                requester_id = row.get("4")
+                category_id = row.get("5")
+                if isinstance(category_id, list):
+                    category_id = category_id[0] if category_id else None
+                tickets.append(
+                    self._format_new_ticket(
+                        row,
+                        requester_names.get(str(requester_id), "Não informado")
                         if requester_id
-                        else "Não informado"
-                    )
-
-                    # Extrair ID da prioridade e converter para nome
-                    priority_id = ticket_data.get("3", "3")  # Default para prioridade média (ID 3)
-                    priority_name = self._get_priority_name_by_id(str(priority_id))
-
-                    # Extrair ID da categoria e converter para nome
-                    category_id = ticket_data.get("5", "")  # Campo 5 = categoria
-                    category_name = (
-                        self._get_category_name_by_id(str(category_id))
+                        else "Não informado",
+                        category_names.get(str(category_id), "Não categorizado")
                         if category_id
-                        else "Não categorizado"
+                        else "Não categorizado",
                     )
+                )
 
-                    # Extrair e formatar descrição usando nova função inteligente
-                    raw_description = ticket_data.get("21", "")
-                    formatted_description = self.format_ticket_description(raw_description)
-
-                    # Extrair informações do ticket
-                    ticket_info = {
-                        "id": str(ticket_data.get("2", "")),  # ID do ticket
-                        "title": ticket_data.get("1", "Sem título"),  # Título
-                        "description": formatted_description,  # Descrição formatada inteligentemente
-                        "date": ticket_data.get("15", ""),  # Data de abertura
-                        "requester": requester_name,  # Nome do solicitante
-                        "priority": priority_name,  # Nome da prioridade convertido
-                        "category": category_name,  # Nome da categoria convertido
-                        "status": "Novo",
-                    }
-                    tickets.append(ticket_info)
-
-            self.logger.info(f"Encontrados {len(tickets)} tickets novos")
+            self.logger.info("Encontrados %s tickets novos", len(tickets))
             return tickets
 
         except Exception as e:
             self.logger.error(f"Erro ao buscar tickets novos: {e}")
             return []
 
+    def _format_new_ticket(
+        self, ticket_data: Dict[str, Any], requester_name: str, category_name: str
+    ) -> Dict[str, Any]:
+        """Monta o item de ``get_new_tickets`` a partir de uma linha da busca"""
+        # Extrair ID da prioridade e converter para nome
+        priority_id = ticket_data.get("3", "3")  # Default para prioridade média (ID 3)
+        priority_name = self._get_priority_name_by_id(str(priority_id))
+
+        # Extrair e formatar descrição usando nova função inteligente
+        raw_description = ticket_data.get("21", "")
+        formatted_description = self.format_ticket_description(raw_description)
+
+        return {
+            "id": str(ticket_data.get("2", "")),  # ID do ticket
+            "title": ticket_data.get("1", "Sem título"),  # Título
+            "description": formatted_description,  # Descrição formatada inteligentemente
+            "date": ticket_data.get("15", ""),  # Data de abertura
+            "requester": requester_name,  # Nome do solicitante
+            "priority": priority_name,  # Nome da prioridade convertido
+            "category": category_name,  # Nome da categoria convertido
+            "status": "Novo",
+        }
+
     def get_system_status(self) -> Dict[str, any]:
         """Retorna status do sistema GLPI com verificação rápida"""
         try:
@@ -5170,11 +4637,12 @@ class GLPIService:
 
             # Verificação rápida de conectividade sem autenticação completa
             # Se já temos um token válido, usar ele; caso contrário, fazer ping básico
-            if self.session_token and not self._is_token_expired():
+            current = self._token
+            if current.token and not self._is_token_expired(current):
                 # Token válido - verificação rápida
                 try:
                     headers = {
-                        "Session-Token": self.session_token,
+                        "Session-Token": current.token,
                         "App-Token": self.app_token,
                     }
                     response = requests.get(
@@ -5330,10 +4798,7 @@ class GLPIService:
             )
 
     def _get_all_technician_ids_and_names(self, entity_id: int = None) -> tuple[list, dict]:
-        """Obtém todos os IDs de técnicos ativos do GLPI e seus nomes
-
-        IMPLEMENTAÇÃO CORRIGIDA: Busca direta de usuários ativos com perfil de técnico
-        usando busca por atribuições de tickets recentes como fallback para Profile_User vazio
+        """IDs e nomes dos técnicos ativos do índice (``technician_roster``)
 
         Args:
             entity_id: ID da entidade para filtrar técnicos (opcional)
@@ -5341,43 +4806,14 @@ class GLPIService:
         Returns:
             tuple: (lista de IDs, dicionário ID->nome)
         """
-        print(f"DEBUG: INÍCIO _get_all_technician_ids_and_names com entity_id={entity_id}")
         try:
-            print(f"DEBUG: _get_all_technician_ids_and_names chamado com entity_id={entity_id}")
-            timestamp = datetime.now(tz=timezone.utc).isoformat()
-            self.logger.info(f"[{timestamp}] Iniciando busca de técnicos com método alternativo")
-
-            # Criar instância dos helpers
-            helpers = GLPIServiceHelpers(self)
-            print(f"DEBUG: GLPIServiceHelpers criado: {helpers}")
-
-            # Buscar IDs de técnicos através de tickets atribuídos
-            print(f"DEBUG: Chamando get_technician_ids_from_tickets com entity_id={entity_id}")
-            tech_ids_set = helpers.get_technician_ids_from_tickets(entity_id)
-            print(f"DEBUG: get_technician_ids_from_tickets retornou: {tech_ids_set}")
-
-            if not tech_ids_set:
-                self.logger.warning(f"[{timestamp}] Nenhum técnico encontrado nos tickets")
+            technicians = self.technician_roster.technicians(entity_id)
+            if not technicians:
+                self.logger.warning(f"Nenhum técnico ativo no índice (entidade {entity_id})")
                 return [], {}
-
-            # Buscar detalhes dos técnicos em lotes
-            tech_ids, tech_names = helpers.get_technician_details_in_batches(tech_ids_set)
-            if len(tech_ids) == 0:
-                self.logger.warning(f"[{timestamp}] Nenhum técnico ativo encontrado")
-                return [], {}
-
-            self.logger.info(
-                f"[{timestamp}] Busca concluída: {len(tech_ids)} técnicos ativos "
-                f"identificados via atribuições de tickets"
-            )
-            return tech_ids, tech_names
+            return [tech.id for tech in technicians], {tech.id: tech.name for tech in technicians}
 
         except Exception as e:
-            print(f"DEBUG: EXCEÇÃO CAPTURADA em _get_all_technician_ids_and_names: {e}")
-            print(f"DEBUG: Tipo da exceção: {type(e)}")
-            import traceback
-
-            print(f"DEBUG: Traceback: {traceback.format_exc()}")
             self.logger.error(f"Erro ao obter técnicos: {e}")
             return [], {}
 
@@ -5426,34 +4862,19 @@ class GLPIService:
                 self.logger.error("Não foi possível descobrir o campo do técnico")
                 return {}
 
-            # Inicializar contadores para todos os técnicos
-            ticket_counts = {tech_id: 0 for tech_id in technician_ids}
-
-            # OTIMIZAÇÃO: Buscar todos os tickets de uma vez usando uma única query
-            self.logger.info(
-                f"[OTIMIZAÇÃO] Iniciando busca otimizada em lote para "
-                f"{len(technician_ids)} técnicos"
+            # OTIMIZAÇÃO: Buscar todos os tickets de uma vez usando uma única varredura
+            self.logger.info("[OTIMIZAÇÃO] Iniciando busca otimizada em lote para %s técnicos", len(technician_ids))
+            if not (start_date and end_date):
+                start_date = end_date = None
+            metrics = self._scan_technician_metrics(
+                technician_ids, tech_field_id, start_date, end_date
             )
-            if start_date and end_date:
-                # Com filtros de data - usar query otimizada em lote
-                self.logger.info(
-                    f"[OTIMIZAÇÃO] Usando busca em lote COM filtro de data: "
-                    f"{start_date} a {end_date}"
-                )
-                ticket_counts = self._get_tickets_batch_with_date_filter(
-                    technician_ids, start_date, end_date, tech_field_id
-                )
-            else:
-                # Sem filtros de data - usar query otimizada em lote
-                self.logger.info("[OTIMIZAÇÃO] Usando busca em lote SEM filtro de data")
-                ticket_counts = self._get_tickets_batch_without_date_filter(
-                    technician_ids, tech_field_id
-                )
+            ticket_counts = {
+                tech_id: metrics.get(str(tech_id), {}).get("total_tickets", 0)
+                for tech_id in technician_ids
+            }
 
-            self.logger.info(
-                f"[OTIMIZAÇÃO] Busca otimizada concluída: "
-                f"{sum(ticket_counts.values())} tickets total"
-            )
+            self.logger.info("[OTIMIZAÇÃO] Busca otimizada concluída: %s tickets total", sum(ticket_counts.values()))
             return ticket_counts
 
         except Exception as e:
@@ -5462,320 +4883,6 @@ class GLPIService:
             # Return empty dictionary instead of using fallback
             return {}
 
-    def _get_tickets_batch_with_date_filter(
-        self,
-        technician_ids: List[str],
-        start_date: str,
-        end_date: str,
-        tech_field_id: str,
-    ) -> Dict[str, int]:
-        """Busca todos os tickets com filtros de data usando paginação robusta
-
-        Args:
-            technician_ids: Lista de IDs dos técnicos
-            start_date: Data de início no formato YYYY-MM-DD
-            end_date: Data de fim no formato YYYY-MM-DD
-
-        Returns:
-            Dict com contagem de tickets por técnico
-        """
-        try:
-            # Debug: Método _get_tickets_batch_with_date_filter iniciado
-
-            if not technician_ids:
-                print("[DEBUG] _get_tickets_batch_with_date_filter: technician_ids vazio")
-                # Debug: Problema de technician_ids vazio registrado
-                return {}
-
-            self.logger.info(
-                f"_get_tickets_batch_with_date_filter: processando {len(technician_ids)} técnicos"
-            )
-            self.logger.info(f"Período: {start_date} a {end_date}")
-            self.logger.info(f"tech_field_id: {tech_field_id}")
-
-            # Construir parâmetros de busca usando função utilitária centralizada
-
-            search_params = {
-                "is_deleted": 0,
-                # Campo do técnico descoberto dinamicamente
-                "forcedisplay[0]": tech_field_id,
-                "forcedisplay[1]": "2",  # id
-            }
-
-            # Usar função utilitária para construir critérios de data
-            date_criteria = DateValidator.construir_criterios_filtro_data(
-                start_date=start_date,
-                end_date=end_date,
-                field_id="15",  # Campo de data de criação
-                criteria_start_index=0,
-            )
-            search_params.update(date_criteria)
-
-            # Usar lotes otimizados (reduzido para evitar erro 414 - URI Too Long)
-            batch_size = 25  # Reduzido para evitar erro 414
-            all_ticket_counts = {tech_id: 0 for tech_id in technician_ids}
-
-            # print(f"[DEBUG] Processando {len(technician_ids)} técnicos em lotes " f"otimizados de {batch_size}")
-
-            for i in range(0, len(technician_ids), batch_size):
-                batch_tech_ids = technician_ids[i : i + batch_size]
-                batch_params = search_params.copy()
-
-                # Adicionar critérios para cada técnico no batch
-                # Calcular próximo índice disponível após critérios de data
-                date_criteria_count = len(date_criteria) // 3 if date_criteria else 0
-                criteria_index = date_criteria_count
-
-                for j, tech_id in enumerate(batch_tech_ids):
-                    link_type = "OR" if j > 0 else "AND"
-                    batch_params.update(
-                        {
-                            f"criteria[{criteria_index}][link]": link_type,
-                            # Campo do técnico
-                            f"criteria[{criteria_index}][field]": tech_field_id,
-                            # descoberto dinamicamente
-                            f"criteria[{criteria_index}][searchtype]": "equals",
-                            f"criteria[{criteria_index}][value]": str(tech_id),
-                        }
-                    )
-                    criteria_index += 1
-
-                # Usar paginação robusta para este batch
-                batch_counts = self._fetch_all_pages_robust(
-                    batch_params, batch_tech_ids, tech_field_id
-                )
-
-                # Combinar resultados
-                for tech_id, count in batch_counts.items():
-                    all_ticket_counts[tech_id] += count
-
-            return all_ticket_counts
-
-        except Exception as e:
-            self.logger.error(f"Erro na busca em lote com filtro de data: {e}")
-            # Retornar contadores zerados em caso de erro
-            return {tech_id: 0 for tech_id in technician_ids}
-
-    def _fetch_all_pages_robust(
-        self, search_params: dict, tech_ids: List[str], tech_field_id: str
-    ) -> Dict[str, int]:
-        """Implementa paginação robusta para buscar todos os dados incrementalmente
-
-        Args:
-            search_params: Parâmetros de busca base
-            tech_ids: Lista de IDs dos técnicos
-            tech_field_id: ID do campo de técnico
-
-        Returns:
-            Dict com contagem de tickets por técnico
-        """
-        helpers = GLPIServiceHelpers(self)
-        return helpers.fetch_all_pages_robust(search_params, tech_ids, tech_field_id)
-
-    def _process_ticket_batch(
-        self, search_params: dict, tech_ids: List[str], tech_field_id: str
-    ) -> Dict[str, int]:
-        """Processa um batch de técnicos e retorna contagem de tickets"""
-        import time
-
-        start_time = time.time()
-        try:
-            ticket_counts = {tech_id: 0 for tech_id in tech_ids}
-
-            url = f"{self.glpi_url}/search/Ticket"
-
-            # print(f"[DEBUG] Processando batch de {len(tech_ids)} técnicos - URL: {url}")
-            self.logger.info(f"Processando batch de {len(tech_ids)} técnicos")
-
-            response = self._make_authenticated_request("GET", url, params=search_params)
-            if not response or not response.ok:
-                self.logger.error(
-                    f"Falha na requisição do batch: "
-                    f"{response.status_code if response else 'No response'}"
-                )
-                return ticket_counts
-
-            data = response.json()
-
-            if "data" in data and data["data"]:
-                # Contar tickets por técnico
-                for ticket in data["data"]:
-                    tech_id = str(
-                        ticket.get(tech_field_id, "")
-                    )  # Campo do técnico descoberto dinamicamente
-                    if tech_id in ticket_counts:
-                        ticket_counts[tech_id] += 1
-
-            # elapsed_time = time.time() - start_time  # Commented out unused variable
-            # print(f"[DEBUG] Batch processado em {elapsed_time:.2f}s: " f"{sum(ticket_counts.values())} tickets encontrados")
-            self.logger.info(f"Batch processado: {sum(ticket_counts.values())} tickets encontrados")
-            return ticket_counts
-
-        except Exception as e:
-            # elapsed_time = time.time() - start_time  # Commented out unused variable
-            # print(f"[DEBUG] Erro no batch após {elapsed_time:.2f}s: {e}")
-            self.logger.error(f"Erro no processamento do batch: {e}")
-            return {tech_id: 0 for tech_id in tech_ids}
-
-    def _get_tickets_batch_without_date_filter(
-        self, technician_ids: List[str], tech_field_id: str
-    ) -> Dict[str, int]:
-        """Busca todos os tickets sem filtros de data em uma única query otimizada
-
-        Args:
-            technician_ids: Lista de IDs dos técnicos
-
-        Returns:
-            Dict com contagem de tickets por técnico
-        """
-        try:
-            if not technician_ids:
-                return {}
-
-            # Inicializar contadores
-            ticket_counts = {tech_id: 0 for tech_id in technician_ids}
-
-            # Construir parâmetros de busca usando a mesma estrutura que funciona
-            search_params = {
-                "is_deleted": 0,
-                # Campo do técnico descoberto dinamicamente
-                "forcedisplay[0]": tech_field_id,
-                "forcedisplay[1]": "2",  # id
-            }
-
-            # Adicionar critérios para cada técnico com OR
-            criteria_index = 0
-            for i, tech_id in enumerate(technician_ids):
-                if i == 0:
-                    # Primeiro critério não precisa de link
-                    search_params.update(
-                        {
-                            # Campo do técnico descoberto dinamicamente
-                            f"criteria[{criteria_index}][field]": tech_field_id,
-                            f"criteria[{criteria_index}][searchtype]": "equals",
-                            f"criteria[{criteria_index}][value]": str(tech_id),
-                        }
-                    )
-                else:
-                    # Demais critérios usam OR
-                    search_params.update(
-                        {
-                            f"criteria[{criteria_index}][link]": "OR",
-                            # Campo do técnico descoberto dinamicamente
-                            f"criteria[{criteria_index}][field]": tech_field_id,
-                            f"criteria[{criteria_index}][searchtype]": "equals",
-                            f"criteria[{criteria_index}][value]": str(tech_id),
-                        }
-                    )
-                criteria_index += 1
-
-            # Usar paginação robusta para buscar todos os dados
-            self.logger.info(
-                f"Buscando tickets em lote para {len(technician_ids)} técnicos sem filtro de data"
-            )
-
-            ticket_counts = self._fetch_all_pages_robust(
-                search_params, technician_ids, tech_field_id
-            )
-
-            self.logger.info(
-                f"Busca em lote concluída: {sum(ticket_counts.values())} tickets encontrados"
-            )
-            return ticket_counts
-
-        except Exception as e:
-            self.logger.error(f"Erro na busca em lote sem filtro de data: {e}")
-            # Retornar contadores zerados em caso de erro
-            return {tech_id: 0 for tech_id in technician_ids}
-
-    def _get_technician_batch_optimized(
-        self, technician_ids: List[str], start_date: str = None, end_date: str = None
-    ) -> Dict[str, int]:
-        """
-        Busca dados de múltiplos técnicos em uma única requisição
-        Reduz de N requisições para 1 requisição
-
-        Args:
-            technician_ids: Lista de IDs dos técnicos
-            start_date: Data de início no formato YYYY-MM-DD (opcional)
-            end_date: Data de fim no formato YYYY-MM-DD (opcional)
-
-        Returns:
-            Dict com contagem de tickets por técnico
-        """
-        import time
-
-        start_time = time.time()
-
-        try:
-            # Log detalhado de início
-            self.logger.info(
-                f"[BATCH_OPTIMIZED] Iniciando processamento em lote para {len(technician_ids)} técnicos"
-            )
-            self.logger.info(
-                f"[BATCH_OPTIMIZED] Período: {start_date or 'sem filtro'} a {end_date or 'sem filtro'}"
-            )
-
-            # Validação de entrada
-            if not technician_ids:
-                self.logger.warning("[BATCH_OPTIMIZED] Lista de técnicos vazia")
-                return {}
-
-            # Descobrir o campo correto para técnico responsável dinamicamente
-            tech_field_id = self._discover_tech_field_id()
-            if not tech_field_id:
-                self.logger.error("[BATCH_OPTIMIZED] Não foi possível descobrir o campo do técnico")
-                raise Exception("Campo do técnico não encontrado")
-
-            self.logger.info(f"[BATCH_OPTIMIZED] Campo do técnico descoberto: {tech_field_id}")
-
-            # Usar método otimizado com requisições individuais range 0-0
-            ticket_counts = {tech_id: 0 for tech_id in technician_ids}
-
-            # Para cada técnico, usar método otimizado que retorna apenas contagem
-            for tech_id in technician_ids:
-                try:
-                    if start_date and end_date:
-                        # Usar método com filtro de data
-                        count = self._count_tickets_with_date_filter(tech_id, start_date, end_date)
-                    else:
-                        # Usar método otimizado sem filtro de data (range 0-0)
-                        count = self._count_tickets_by_technician_optimized(
-                            int(tech_id), tech_field_id
-                        )
-
-                    ticket_counts[tech_id] = count if count is not None else 0
-                    self.logger.info(
-                        f"[BATCH_OPTIMIZED] Técnico {tech_id}: {ticket_counts[tech_id]} tickets"
-                    )
-
-                except Exception as e:
-                    self.logger.error(f"[BATCH_OPTIMIZED] Erro ao processar técnico {tech_id}: {e}")
-                    ticket_counts[tech_id] = 0
-
-            elapsed_time = time.time() - start_time
-            total_tickets = sum(ticket_counts.values())
-            self.logger.info(f"[BATCH_OPTIMIZED] Processamento concluído em {elapsed_time:.2f}s")
-            self.logger.info(f"[BATCH_OPTIMIZED] Total de tickets encontrados: {total_tickets}")
-            self.logger.info(f"[BATCH_OPTIMIZED] Distribuição por técnico: {dict(ticket_counts)}")
-
-            return ticket_counts
-
-        except Exception as e:
-            elapsed_time = time.time() - start_time
-            self.logger.error(
-                f"[BATCH_OPTIMIZED] Erro no batch processing após {elapsed_time:.2f}s: {e}"
-            )
-
-            # Return empty dictionary instead of using fallback
-            try:
-                # Retornar contadores zerados como último recurso
-                return {tech_id: 0 for tech_id in technician_ids}
-            except Exception as fallback_error:
-                self.logger.error(f"Erro no processamento em lote: {fallback_error}")
-                # Retornar contadores zerados como último recurso
-                return {tech_id: 0 for tech_id in technician_ids}
-
     def get_technician_ranking_with_filters(
         self,
         start_date: str = None,
@@ -5795,18 +4902,13 @@ class GLPIService:
             correlation_id: ID de correlação para logs
             entity_id: ID da entidade para filtrar técnicos
         """
-        # Log simples para confirmar que o método está sendo chamado
-        # print(f"[DEBUG] get_technician_ranking_with_filters CHAMADO - start_date: {start_date}, end_date: {end_date}")
-
         if not correlation_id:
             obs_logger = glpi_logger
             correlation_id = obs_logger.generate_correlation_id()
         else:
             obs_logger = glpi_logger
 
-        auth_result = self._ensure_authenticated()
-        print(f"DEBUG: _ensure_authenticated() retornou: {auth_result}")
-        if not auth_result:
+        if not self._ensure_authenticated():
             obs_logger.emit_warning(
                 correlation_id,
                 "AUTHENTICATION_FAILURE",
@@ -5814,8 +4916,6 @@ class GLPIService:
             )
             return []
 
-        print(f"DEBUG: Autenticação OK, continuando com o ranking")
-
         try:
             obs_logger.log_pipeline_step(
                 correlation_id,
@@ -5828,15 +4928,16 @@ class GLPIService:
                 },
             )
             self.logger.info(
-                f"[{correlation_id}] Iniciando ranking com filtros - start_date: {start_date}, end_date: {end_date}, level: {level}, limit: {limit}"
+                "[%s] Iniciando ranking com filtros - start_date: %s, end_date: %s, level: %s, limit: %s",
+                correlation_id,
+                start_date,
+                end_date,
+                level,
+                limit,
             )
 
             # Descobrir o field ID do técnico dinamicamente
             tech_field_id = self._discover_tech_field_id()
-            print(f"DEBUG: tech_field_id descoberto: {tech_field_id}")
-            print(f"DEBUG: tech_field_id type: {type(tech_field_id)}")
-            print(f"DEBUG: tech_field_id bool: {bool(tech_field_id)}")
-            print(f"DEBUG: not tech_field_id: {not tech_field_id}")
             if not tech_field_id:
                 obs_logger.emit_warning(
                     correlation_id,
@@ -5844,18 +4945,14 @@ class GLPIService:
                     "Não foi possível descobrir o field ID do técnico",
                 )
                 return []
-            print(f"DEBUG: Continuando com tech_field_id: {tech_field_id}")
-
-            # print(f"[DEBUG] tech_field_id descoberto: {tech_field_id}")
+            self.logger.debug("[%s] tech_field_id descoberto: %s", correlation_id, tech_field_id)
 
-            # Obter todos os técnicos ativos dinamicamente com nomes otimizados
-            # print(f"[DEBUG] [{correlation_id}] Buscando técnicos ativos com entity_id: {entity_id}")
-            (
-                technician_ids,
-                technician_names,
-            ) = self._get_all_technician_ids_and_names(entity_id=entity_id)
-            # print(f"[DEBUG] [{correlation_id}] Encontrados {len(technician_ids) if technician_ids else 0} técnicos")
-            # print(f"[DEBUG] [{correlation_id}] Técnicos encontrados: {technician_ids[:5] if technician_ids else 'Nenhum'}")
+            # Técnicos ativos do índice, com nome e nível (grupo N1-N4)
+            technicians = self.technician_roster.technicians(entity_id)
+            if level:
+                # Filtro de nível antes da varredura: só os técnicos do nível são buscados
+                technicians = [tech for tech in technicians if (tech.level or "N1") == level]
+            technician_ids = [tech.id for tech in technicians]
 
             if not technician_ids:
                 obs_logger.log_pipeline_step(
@@ -5875,80 +4972,35 @@ class GLPIService:
                 },
             )
             self.logger.info(
-                f"[{correlation_id}] Encontrados {len(technician_ids)} técnicos: {technician_ids[:10]}..."
+                "[%s] Encontrados %s técnicos: %s...",
+                correlation_id,
+                len(technician_ids),
+                technician_ids[:10],
             )  # Limitar log
 
-            ranking = []
-
-            # Buscar todos os tickets de uma vez e agrupar por técnico (otimizado)
+            # Total, resolvidos e pendentes de todos os técnicos em uma única varredura
             if start_date and end_date:
                 self.logger.info(
-                    f"[{correlation_id}] Usando método otimizado com filtros de data: {start_date} a {end_date}"
-                )
-                self.logger.info(
-                    f"Chamando _get_tickets_batch_with_date_filter para {len(technician_ids)} técnicos"
-                )
-                ticket_counts = self._get_tickets_batch_with_date_filter(
-                    technician_ids, start_date, end_date, tech_field_id
+                    "[%s] Varredura do ranking com filtros de data: %s a %s",
+                    correlation_id,
+                    start_date,
+                    end_date,
                 )
-                self.logger.info(
-                    f"_get_tickets_batch_with_date_filter retornou {len(ticket_counts)} resultados"
+                technician_metrics = self._scan_technician_metrics(
+                    technician_ids, tech_field_id, start_date, end_date, correlation_id
                 )
-                self.logger.info(f"Conteúdo de ticket_counts: {ticket_counts}")
             else:
-                self.logger.info(f"[{correlation_id}] Usando método sem filtros de data")
-                ticket_counts = self._get_tickets_batch_without_date_filter(
-                    technician_ids, tech_field_id
+                self.logger.info("[%s] Varredura do ranking sem filtros de data", correlation_id)
+                technician_metrics = self._scan_technician_metrics(
+                    technician_ids, tech_field_id, correlation_id=correlation_id
                 )
 
-            # Para cada técnico, usar os dados já obtidos
-            for tech_id in technician_ids:
-                try:
-                    # Obter nome do técnico do cache otimizado
-                    tech_name = technician_names.get(tech_id, f"Técnico {tech_id}")
-
-                    # Obter contagem de tickets do cache otimizado
-                    ticket_count = ticket_counts.get(tech_id, 0)
-
-                    # Determinar o nível real do técnico
-                    # Tentar converter tech_id para int, se falhar usar o método alternativo
-                    try:
-                        tech_id_int = int(tech_id)
-                        tech_level = self._get_technician_level(tech_id_int, ticket_count)
-                    except (ValueError, TypeError):
-                        # Se tech_id não for numérico, usar nome para determinar nível
-                        self.logger.debug(
-                            f"tech_id não numérico: {tech_id}, usando nome para determinar nível"
-                        )
-                        self.logger.debug(f"Nome do técnico obtido: {tech_name}")
-                        # Use default level N1 instead of fallback method
-                        tech_level = "N1"
-                        self.logger.debug(f"Nível determinado para {tech_name}: {tech_level}")
-
-                    # Se um filtro de nível foi especificado, verificar se o técnico corresponde
-                    if level and tech_level != level:
-                        self.logger.debug(
-                            f"Técnico {tech_name} (nível {tech_level}) filtrado - não corresponde ao filtro {level}"
-                        )
-                        continue  # Pular este técnico se não corresponder ao filtro de nível
-
-                    ranking.append(
-                        {
-                            "id": tech_id,
-                            "name": tech_name,
-                            "total_tickets": ticket_count,
-                            "resolved_tickets": 0,
-                            "pending_tickets": 0,
-                            "avg_resolution_time": 0.0,
-                            "level": tech_level,  # Usar o nível real do técnico
-                            "rank": 0,  # Será definido após ordenação
-                        }
-                    )
-
-                except Exception as e:
-                    self.logger.error(f"Erro ao processar técnico {tech_id}: {e}")
-                    self.logger.error(f"Traceback completo: {traceback.format_exc()}")
-                    continue
+            ranking = [
+                self._technician_entry(
+                    tech.id, tech.name, technician_metrics.get(tech.id), tech.level or "N1"
+                )
+                for tech in technicians
+            ]
 
             # Log antes da ordenação
             obs_logger.log_pipeline_step(
@@ -5963,14 +5015,8 @@ class GLPIService:
                 },
             )
 
-            # Ordenar por contagem de tickets (decrescente)
-            ranking.sort(key=lambda x: x["total_tickets"], reverse=True)
-
-            # Definir ranks
-            for i, tech in enumerate(ranking):
-                tech["rank"] = i + 1
-
-            result = ranking[:limit]
+            # Top ``limit`` por contagem de tickets (heap), com ranks definidos
+            result = self._rank_technicians(ranking, limit)
 
             # Log final com estatísticas
             obs_logger.log_pipeline_step(
@@ -5983,9 +5029,7 @@ class GLPIService:
                 },
             )
 
-            self.logger.info(
-                f"[{correlation_id}] Ranking com filtros concluído: {len(result)} técnicos"
-            )
+            self.logger.info("[%s] Ranking com filtros concluído: %s técnicos", correlation_id, len(result))
 
             return result
 
@@ -6047,64 +5091,32 @@ class GLPIService:
 
         try:
             # Construir parâmetros de busca de forma mais eficiente
-            search_params = {
-                "is_deleted": 0,
-                "range": f"0-{limit - 1}",
-                "sort": "15",  # Ordenar por data de criação
-                "order": "DESC",
-                "criteria[0][field]": self.field_ids.get("STATUS", "12"),
-                "criteria[0][searchtype]": "equals",
-                "criteria[0][value]": self.status_map.get("Novo", 1),
-            }
-
-            criteria_index = 1
+            query = (
+                SearchQuery("Ticket")
+                .where(self.field_ids.get("STATUS", "12"), self.status_map.get("Novo", 1))
+                .sort("15", "DESC")  # Ordenar por data de criação
+                .rows(0, limit - 1)
+            )
 
             # Adicionar filtros opcionais
             if priority:
                 priority_id = self._get_priority_id_by_name(priority)
                 if priority_id:
-                    search_params.update(
-                        {
-                            f"criteria[{criteria_index}][link]": "AND",
-                            # Campo prioridade
-                            f"criteria[{criteria_index}][field]": "3",
-                            f"criteria[{criteria_index}][searchtype]": "equals",
-                            f"criteria[{criteria_index}][value]": priority_id,
-                        }
-                    )
-                    criteria_index += 1
+                    query.where("3", priority_id)  # Campo prioridade
 
             if technician:
-                tech_field = self.field_ids.get("TECH", "5")
-                search_params.update(
-                    {
-                        f"criteria[{criteria_index}][link]": "AND",
-                        f"criteria[{criteria_index}][field]": tech_field,
-                        f"criteria[{criteria_index}][searchtype]": "equals",
-                        f"criteria[{criteria_index}][value]": technician,
-                    }
-                )
-                criteria_index += 1
-
-            # Usar função utilitária para filtros de data
-            date_criteria_dict = DateValidator.construir_criterios_filtro_data(
-                start_date, end_date, criteria_index
-            )
-
-            # Atualizar o índice de critérios com base nos critérios de data adicionados
-            if date_criteria_dict:
-                # Contar quantos critérios de data foram adicionados
-                date_criteria_count = len(
-                    [k for k in date_criteria_dict.keys() if "criteria[" in k and "][field]" in k]
-                )
-                criteria_index += date_criteria_count
+                query.where(self.field_ids.get("TECH", "5"), technician)
 
-            # Adicionar critérios de data se existirem
-            if date_criteria_dict:
-                search_params.update(date_criteria_dict)
+            # Período pela data de criação (campo 15)
+            query.where_date_range("15", start_date, end_date)
+            search_params = query.to_params()
 
             self.logger.debug(
-                f"Buscando tickets novos com filtros: priority={priority}, technician={technician}, dates={start_date}-{end_date}"
+                "Buscando tickets novos com filtros: priority=%s, technician=%s, dates=%s-%s",
+                priority,
+                technician,
+                start_date,
+                end_date,
             )
 
             response = self._make_authenticated_request(
@@ -6181,7 +5193,7 @@ class GLPIService:
                         self.logger.warning(f"Erro ao processar ticket individual: {e}")
                         continue
 
-            self.logger.info(f"Encontrados {len(tickets)} tickets novos com filtros aplicados")
+            self.logger.info("Encontrados %s tickets novos com filtros aplicados", len(tickets))
             return tickets  # Manter compatibilidade retornando apenas os tickets
 
         except requests.exceptions.Timeout:
@@ -6236,47 +5248,31 @@ class GLPIService:
                 self.logger.error("Não foi possível descobrir o campo do técnico")
                 return 0
 
-            self.logger.debug(
-                f"Usando campo {tech_field} para buscar tickets do técnico {tech_id_str}"
-            )
+            self.logger.debug("Usando campo %s para buscar tickets do técnico %s", tech_field, tech_id_str)
 
             # Verificar configuração da URL do GLPI
             if not self.glpi_url:
                 self.logger.error("URL do GLPI não configurada")
                 return 0
 
-            # Construir parâmetros de busca
-            search_params = {
-                "is_deleted": 0,
-                "range": "0-0",  # Apenas contagem
-                "criteria[0][field]": tech_field,
-                "criteria[0][searchtype]": "equals",
-                "criteria[0][value]": tech_id_str,
-            }
-
-            criteria_index = 1
-
-            # Preparar datas com formato completo de data e hora
-            start_date_full = None
-            end_date_full = None
-
-            if start_date:
-                start_date_full = f"{start_date} 00:00:00" if len(start_date) == 10 else start_date
-
-            if end_date:
-                end_date_full = f"{end_date} 23:59:59" if len(end_date) == 10 else end_date
-
-            # Usar função utilitária para filtros de data
-            date_criteria_dict = DateValidator.construir_criterios_filtro_data(
-                start_date_full, end_date_full, criteria_index
+            # Apenas contagem (range 0-0) no período, pela data de criação (campo 15)
+            search_params = (
+                SearchQuery("Ticket")
+                .where(tech_field, tech_id_str)
+                .where_date_range(
+                    "15",
+                    start_date[:10] if start_date else None,
+                    end_date[:10] if end_date else None,
+                )
+                .count()
+                .to_params()
             )
 
-            # Adicionar critérios de data se existirem
-            if date_criteria_dict:
-                search_params.update(date_criteria_dict)
-
             self.logger.debug(
-                f"Contando tickets para técnico {tech_id_str} com filtros: start={start_date}, end={end_date}"
+                "Contando tickets para técnico %s com filtros: start=%s, end=%s",
+                tech_id_str,
+                start_date,
+                end_date,
             )
 
             response = self._make_authenticated_request(
@@ -6293,12 +5289,10 @@ class GLPIService:
             if "Content-Range" in response.headers:
                 try:
                     content_range = response.headers["Content-Range"]
-                    self.logger.debug(f"Content-Range recebido: {content_range}")
+                    self.logger.debug("Content-Range recebido: %s", content_range)
                     # Formato esperado: "0-0/total" ou "0-N/total"
                     total = int(content_range.split("/")[-1])
-                    self.logger.debug(
-                        f"Técnico {tech_id_str}: {total} tickets encontrados (Content-Range)"
-                    )
+                    self.logger.debug("Técnico %s: %s tickets encontrados (Content-Range)", tech_id_str, total)
                     return total
                 except (ValueError, IndexError) as e:
                     self.logger.error(f"Erro ao parsear Content-Range '{content_range}': {e}")
@@ -6365,9 +5359,10 @@ class GLPIService:
         if self._is_cache_valid(cache_key):
             cached_data = self._get_cache_data(cache_key)
             if cached_data:
-                timestamp = datetime.now(tz=timezone.utc).isoformat()
                 self.logger.info(
-                    f"[{timestamp}] Cache hit para métricas com filtro de modificação: {start_date} a {end_date}"
+                    "Cache hit para métricas com filtro de modificação: %s a %s",
+                    start_date,
+                    end_date,
                 )
                 return cached_data
 
@@ -6380,11 +5375,7 @@ class GLPIService:
             if not self.discover_field_ids():
                 raise Exception("Falha ao descobrir field_ids")
 
-            timestamp = datetime.now(tz=timezone.utc).isoformat()
-            self.logger.info(
-                f"[{timestamp}] Obtendo métricas com filtro de modificação: "
-                f"{start_date} a {end_date}"
-            )
+            self.logger.info("Obtendo métricas com filtro de modificação: %s a %s", start_date, end_date)
 
             # Obter métricas por data de modificação
             metrics_by_level = self._get_metrics_by_level_by_modification_date(start_date, end_date)
@@ -6482,10 +5473,9 @@ class GLPIService:
             # Salvar no cache
             self._set_cache_data(cache_key, result, ttl_minutes=3)
 
-            timestamp = datetime.now(tz=timezone.utc).isoformat()
             self.logger.info(
-                f"[{timestamp}] Métricas obtidas com sucesso - Filtro modificação, "
-                f"Total: {sum(result['totals'].values())}"
+                "Métricas obtidas com sucesso - Filtro modificação, Total: %s",
+                sum(result["totals"].values()),
             )
 
             return result
@@ -6538,7 +5528,7 @@ class GLPIService:
         """Debug para verificar valores únicos nos campos do GLPI"""
         try:
             correlation_log = f"[{correlation_id}] " if correlation_id else ""
-            self.logger.info(f"{correlation_log}Iniciando debug de valores dos campos")
+            self.logger.info("%sIniciando debug de valores dos campos", correlation_log)
 
             if not self._ensure_authenticated():
                 raise Exception("Falha na autenticação")
@@ -6631,7 +5621,7 @@ class GLPIService:
                     "ticket_count": group_id_analysis.get(group_id_str, 0),
                 }
 
-            self.logger.info(f"{correlation_log}Debug concluído: {result}")
+            self.logger.info("%sDebug concluído: %s", correlation_log, result)
             return result
 
         except Exception as e:
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""Pool de sessões (Session-Tokens) do GLPI.
+
+O GLPI guarda a sessão da API em uma sessão PHP, e o PHP trava o arquivo de
+sessão durante cada requisição: chamadas simultâneas com o mesmo
+Session-Token são executadas uma de cada vez no servidor. O pool mantém N
+tokens independentes e entrega um token diferente a cada requisição em
+andamento, para que os fan-outs paralelos sejam de fato paralelos.
+"""
+
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+
+class SessionPoolExhausted(Exception):
+    """Levantada quando nenhuma sessão foi liberada dentro do timeout"""
+
+
+class SessionLease:
+    """Sessão emprestada do pool durante uma requisição"""
+
+    def __init__(self, slot: "_SessionSlot"):
+        self._slot = slot
+        self.invalidated = False
+
+    @property
+    def token(self) -> str:
+        """Session-Token da sessão emprestada"""
+        return self._slot.token
+
+    @property
+    def slot_id(self) -> int:
+        """Índice da sessão no pool"""
+        return self._slot.slot_id
+
+    def invalidate(self) -> None:
+        """Marca o token como inválido (ex.: 401); será recriado no próximo uso"""
+        self.invalidated = True
+
+
+class _SessionSlot:
+    def __init__(self, slot_id: int):
+        self.slot_id = slot_id
+        self.token: Optional[str] = None
+        self.expires_at = 0.0
+        self.uses = 0
+        # Geração do pool em que o token foi aberto (ver ``close``)
+        self.generation = 0
+
+
+class GLPISessionPool:
+    """Pool de N Session-Tokens com ciclo de vida gerenciado
+
+    Args:
+        size: Número máximo de sessões simultâneas
+        init_session: Função que abre uma sessão e retorna ``(token, expires_at)``
+            ou None em caso de falha
+        kill_session: Função que encerra a sessão do token informado
+        refresh_margin: Renovar o token quando faltar menos que isso (segundos)
+    """
+
+    def __init__(
+        self,
+        size: int,
+        init_session: Callable[[], Optional[Tuple[str, float]]],
+        kill_session: Callable[[str], None],
+        refresh_margin: float = 120.0,
+    ):
+        self.size = max(1, int(size))
+        self._init_session = init_session
+        self._kill_session = kill_session
+        self.refresh_margin = refresh_margin
+
+        # LIFO: reaproveita primeiro as sessões usadas mais recentemente
+        self._idle: "queue.LifoQueue[_SessionSlot]" = queue.LifoQueue()
+        self._slots = []
+        self._lock = threading.Lock()
+        # Incrementada a cada ``close``: tokens de gerações anteriores são encerrados na devolução
+        self._generation = 0
+        self._stats = {"leases": 0, "sessions_opened": 0, "sessions_killed": 0, "waits": 0, "closes": 0}
+        self.logger = logging.getLogger("glpi_session_pool")
+
+    def _take_slot(self, timeout: Optional[float]) -> _SessionSlot:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._slots) < self.size:
+                slot = _SessionSlot(len(self._slots))
+                self._slots.append(slot)
+                return slot
+            self._stats["waits"] += 1
+
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise SessionPoolExhausted(
+                f"Nenhuma sessão GLPI livre em {timeout}s (pool com {self.size} sessões)"
+            )
+
+    def _ensure_token(self, slot: _SessionSlot) -> bool:
+        if slot.token and time.time() + self.refresh_margin < slot.expires_at:
+            return True
+
+        old_token = slot.token
+        opened = self._init_session()
+        if not opened:
+            return False
+
+        slot.token, slot.expires_at = opened
+        slot.uses = 0
+        slot.generation = self._generation
+        with self._lock:
+            self._stats["sessions_opened"] += 1
+        self.logger.debug(f"Sessão GLPI #{slot.slot_id} aberta")
+
+        if old_token:
+            self._kill(old_token)
+        return True
+
+    def _kill(self, token: str) -> None:
+        try:
+            self._kill_session(token)
+            with self._lock:
+                self._stats["sessions_killed"] += 1
+        except Exception as e:
+            self.logger.debug(f"Falha ao encerrar sessão GLPI: {e}")
+
+    def acquire(self, timeout: Optional[float] = None) -> Optional[SessionLease]:
+        """Empresta uma sessão exclusiva; devolver com ``release``
+
+        Returns:
+            SessionLease, ou None se não foi possível abrir a sessão
+
+        Raises:
+            SessionPoolExhausted: Se nenhuma sessão foi liberada dentro do timeout
+        """
+        slot = self._take_slot(timeout)
+        try:
+            if not self._ensure_token(slot):
+                self._idle.put(slot)
+                return None
+        except Exception:
+            self._idle.put(slot)
+            raise
+
+        slot.uses += 1
+        with self._lock:
+            self._stats["leases"] += 1
+        return SessionLease(slot)
+
+    def release(self, lease: SessionLease) -> None:
+        """Devolve a sessão ao pool"""
+        slot = lease._slot
+        if lease.invalidated:
+            # Token rejeitado pelo GLPI: descartar sem killSession
+            self._reset(slot)
+        elif slot.token and slot.generation != self._generation:
+            # Emprestado durante um ``close``: encerrar agora que a requisição terminou
+            self._kill(slot.token)
+            self._reset(slot)
+        self._idle.put(slot)
+
+    @staticmethod
+    def _reset(slot: _SessionSlot) -> None:
+        slot.token = None
+        slot.expires_at = 0.0
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[Optional[SessionLease]]:
+        """Context manager sobre ``acquire``/``release``"""
+        lease = self.acquire(timeout)
+        try:
+            yield lease
+        finally:
+            if lease is not None:
+                self.release(lease)
+
+    def close(self) -> None:
+        """Encerra (killSession) todas as sessões abertas pelo pool
+
+        O pool continua utilizável: o próximo ``acquire`` abre sessões novas.
+        Sessões emprestadas no momento são encerradas quando forem devolvidas.
+        """
+        with self._lock:
+            self._generation += 1
+            self._stats["closes"] += 1
+            total = len(self._slots)
+
+        idle = []
+        while True:
+            try:
+                idle.append(self._idle.get_nowait())
+            except queue.Empty:
+                break
+        for slot in idle:
+            if slot.token:
+                self._kill(slot.token)
+                self._reset(slot)
+            self._idle.put(slot)
+        self.logger.info(f"Pool de sessões GLPI encerrado ({len(idle)} de {total} sessões livres)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna o estado do pool"""
+        with self._lock:
+            open_sessions = sum(1 for slot in self._slots if slot.token)
+            return {
+                "size": self.size,
+                "created_slots": len(self._slots),
+                "open_sessions": open_sessions,
+                "idle": self._idle.qsize(),
+                **self._stats,
+            }
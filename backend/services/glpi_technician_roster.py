@@ -0,0 +1,389 @@
+# -*- coding: utf-8 -*-
+"""Índice (roster) dos técnicos ativos: nomes, grupos, nível e entidades.
+
+Técnico é o usuário ativo e não excluído que pertence a um dos grupos de
+atendimento (``service_levels`` ou ``ROSTER_CONFIG["GROUP_IDS"]``) ou tem um
+dos perfis de ``ROSTER_CONFIG["PROFILE_IDS"]``. O índice é carregado com uma
+busca paginada em ``search/User`` (em vez de baixar tickets para descobrir
+quem está atribuído e depois consultar ``/User/{id}`` técnico a técnico) e é
+compartilhado pelos dois caminhos do ranking e por ``/api/technicians``.
+
+Manutenção incremental, em uma thread de segundo plano:
+
+- a cada ``REFRESH_INTERVAL`` só os usuários modificados desde a última
+  sincronização (campo 19, ``date_mod``) são buscados e mesclados; os que
+  ficaram inativos saem do índice;
+- a cada ``FULL_REFRESH_INTERVAL`` o índice é recarregado por inteiro, o que
+  também capta entradas e saídas de grupos e exclusões (que não alteram
+  ``date_mod``).
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple
+
+from config.performance import ROSTER_CONFIG
+from utils.deadline import deadline_exceeded
+
+from .glpi_queries import SearchQuery, hierarchy_level
+from .glpi_search_options import DEFAULT_FIELDS
+
+if TYPE_CHECKING:
+    from .glpi_service import GLPIService
+
+logger = logging.getLogger("glpi_technician_roster")
+
+# Sobreposição da busca incremental, para não perder alterações na virada da sincronização
+INCREMENTAL_OVERLAP = timedelta(minutes=1)
+
+
+class TechnicianRecord(NamedTuple):
+    """Técnico ativo no índice"""
+
+    id: str
+    name: str
+    username: str
+    groups: Tuple[str, ...]
+    entities: Tuple[str, ...]
+    level: Optional[str]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "username": self.username,
+            "groups": list(self.groups),
+            "entities": list(self.entities),
+            "level": self.level,
+        }
+
+
+def _field_values(value: Any) -> Tuple[str, ...]:
+    """Valores de um campo multivalorado da busca (lista ou valor único)"""
+    values = value if isinstance(value, list) else [value]
+    result = []
+    for item in values:
+        text = str(item).strip() if item is not None else ""
+        if text and text != "None" and text not in result:
+            result.append(text)
+    return tuple(result)
+
+
+def parse_roster_row(
+    row: Any, levels: Sequence[str], fields: Optional[Mapping[str, str]] = None
+) -> Tuple[Optional[str], Optional[TechnicianRecord]]:
+    """``(id, registro)`` de uma linha de ``search/User``; registro None se o usuário está inativo
+
+    ``fields`` é o mapeamento de campos do User (``SearchOptionsCache.fields("User")``).
+    """
+    fields = fields or DEFAULT_FIELDS["User"]
+    if not isinstance(row, dict):
+        return None, None
+
+    user_id = str(row.get(fields["ID"]) or "").strip()
+    if not user_id or user_id == "None":
+        return None, None
+    if str(row.get(fields["ACTIVE"], "1")).strip() != "1":
+        return user_id, None
+
+    firstname = str(row.get(fields["FIRSTNAME"]) or "").strip()
+    realname = str(row.get(fields["REALNAME"]) or "").strip()
+    username = str(row.get(fields["LOGIN"]) or "").strip()
+    name = f"{firstname} {realname}".strip() or username or f"Usuário {user_id}"
+
+    groups = _field_values(row.get(fields["GROUPS"]))
+    level = next(
+        (found for found in (hierarchy_level(group, levels) for group in groups) if found), None
+    )
+    return user_id, TechnicianRecord(
+        user_id, name, username, groups, _field_values(row.get(fields["ENTITIES"])), level
+    )
+
+
+class TechnicianRoster:
+    """Índice dos técnicos ativos de uma instância do ``GLPIService``"""
+
+    def __init__(
+        self,
+        service: "GLPIService",
+        refresh_interval: float = 300,
+        full_refresh_interval: float = 3600,
+        group_ids: Optional[Iterable[Any]] = None,
+        profile_ids: Optional[Iterable[Any]] = None,
+        background: bool = True,
+    ):
+        """Inicializa o índice (vazio; carregado no primeiro uso)
+
+        Args:
+            service: Serviço usado nas buscas (autenticação, retry, limites)
+            refresh_interval: Intervalo da atualização incremental (segundos)
+            full_refresh_interval: Intervalo da recarga completa (segundos)
+            group_ids: Grupos de técnicos; None = grupos de ``service.service_levels``
+            profile_ids: Perfis que também definem técnicos
+            background: Atualizar em uma thread de segundo plano
+        """
+        self.service = service
+        self.refresh_interval = max(1.0, float(refresh_interval))
+        self.full_refresh_interval = max(self.refresh_interval, float(full_refresh_interval))
+        self.group_ids = [str(group_id) for group_id in group_ids] if group_ids else None
+        self.profile_ids = [str(profile_id) for profile_id in profile_ids or ()]
+        self.background = background
+
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._records: Dict[str, TechnicianRecord] = {}
+        self._entity_members: Dict[str, Set[str]] = {}
+        self._loaded = False
+        self._synced_at: Optional[datetime] = None
+        self._last_full_refresh = 0.0
+        self._last_refresh = 0.0
+        self._refreshes = {"full": 0, "incremental": 0, "failed": 0}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Consulta
+    # ------------------------------------------------------------------
+
+    def technicians(self, entity_id: Optional[Any] = None) -> List[TechnicianRecord]:
+        """Técnicos ativos ordenados por nome; com ``entity_id``, só os da entidade
+
+        O primeiro uso carrega o índice (bloqueante) e inicia a atualização em
+        segundo plano.
+        """
+        self._ensure_loaded()
+        with self._lock:
+            records = list(self._records.values())
+        if entity_id is not None and str(entity_id).strip():
+            members = self._members_of_entity(str(entity_id).strip())
+            records = [record for record in records if record.id in members]
+        return sorted(records, key=lambda record: (record.name.lower(), record.id))
+
+    def get(self, tech_id: Any) -> Optional[TechnicianRecord]:
+        """Registro de um técnico (None se não está no índice)"""
+        self._ensure_loaded()
+        with self._lock:
+            return self._records.get(str(tech_id))
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            with self._refresh_lock:
+                # Chamadas simultâneas esperam a mesma carga
+                if not self._loaded:
+                    self._refresh(full=True)
+        self.start()
+
+    # ------------------------------------------------------------------
+    # Buscas no GLPI
+    # ------------------------------------------------------------------
+
+    def _queries(
+        self,
+        only_active: bool = True,
+        modified_since: Optional[datetime] = None,
+        entity_id: Optional[str] = None,
+    ) -> List[SearchQuery]:
+        """Uma busca por critério de técnico (grupos, perfis), já dividida pelo limite de URL"""
+        fields = self._fields()
+        group_ids = self.group_ids
+        if group_ids is None:
+            group_ids = [str(group_id) for group_id in (self.service.service_levels or {}).values()]
+
+        queries = []
+        for field, values in ((fields["GROUPS"], group_ids), (fields["PROFILES"], self.profile_ids)):
+            if not values:
+                continue
+            query = SearchQuery("User").where_any(field, values)
+            if only_active:
+                query.where(fields["ACTIVE"], 1)
+            if modified_since is not None:
+                query.where(
+                    fields["DATE_MOD"], modified_since.strftime("%Y-%m-%d %H:%M:%S"), "morethan"
+                )
+            if entity_id is not None:
+                query.where(fields["ENTITIES"], entity_id)
+                query.display(fields["ID"])
+            else:
+                query.display(
+                    fields["ID"],
+                    fields["LOGIN"],
+                    fields["FIRSTNAME"],
+                    fields["REALNAME"],
+                    fields["ACTIVE"],
+                    fields["GROUPS"],
+                    fields["ENTITIES"],
+                )
+            queries.extend(query.split_any(self.service.glpi_url))
+        return queries
+
+    def _fields(self) -> Dict[str, str]:
+        """Campos de busca do User (cache persistido de opções de busca do serviço)"""
+        return self.service.search_options.fields("User") or dict(DEFAULT_FIELDS["User"])
+
+    def _search_rows(self, label: str, queries: List[SearchQuery]) -> List[Dict[str, Any]]:
+        """Linhas de todas as buscas (levanta exceção se uma página falhar)"""
+        rows: List[Dict[str, Any]] = []
+        for query in queries:
+            for page in self.service._iter_search_pages(label, query.to_params(), itemtype="User"):
+                rows.extend(page)
+        return rows
+
+    def _members_of_entity(self, entity_id: str) -> Set[str]:
+        """Técnicos com autorização na entidade (busca única, guardada até a próxima recarga)"""
+        with self._lock:
+            members = self._entity_members.get(entity_id)
+        if members is not None:
+            return members
+
+        try:
+            rows = self._search_rows(
+                f"técnicos da entidade {entity_id}", self._queries(entity_id=entity_id)
+            )
+        except Exception as e:
+            logger.warning(f"Falha ao buscar técnicos da entidade {entity_id}: {e}")
+            return set()
+
+        id_field = self._fields()["ID"]
+        members = {str(row.get(id_field)) for row in rows if isinstance(row, dict)}
+        if not deadline_exceeded():  # Lista parcial não é guardada
+            with self._lock:
+                self._entity_members[entity_id] = members
+        return members
+
+    # ------------------------------------------------------------------
+    # Atualização
+    # ------------------------------------------------------------------
+
+    def refresh(self, full: bool = False) -> bool:
+        """Atualiza o índice; incremental, exceto com ``full`` ou antes da primeira carga
+
+        Returns:
+            True se a atualização foi concluída (o índice anterior é mantido em caso de falha)
+        """
+        with self._refresh_lock:
+            return self._refresh(full)
+
+    def _refresh(self, full: bool) -> bool:
+        full = full or not self._loaded
+        started_at = datetime.now()
+        since = None if full else self._synced_at - INCREMENTAL_OVERLAP
+        kind = "full" if full else "incremental"
+        start = time.time()
+        try:
+            rows = self._search_rows("técnicos", self._queries(only_active=full, modified_since=since))
+            if deadline_exceeded():
+                # Carga dentro de uma requisição cujo prazo acabou: resultado parcial
+                raise TimeoutError("prazo da requisição esgotado durante a busca")
+        except Exception as e:
+            with self._lock:
+                self._refreshes["failed"] += 1
+            logger.warning(f"Falha na atualização ({kind}) do índice de técnicos: {e}")
+            return False
+
+        updated, removed = self._merge(rows, list(self.service.service_levels or {}), full)
+        now = time.time()
+        self._synced_at = started_at
+        self._last_refresh = now
+        if full:
+            self._last_full_refresh = now
+        self._loaded = True
+        with self._lock:
+            self._refreshes[kind] += 1
+            total = len(self._records)
+
+        logger.info(
+            f"Índice de técnicos ({kind}) em {now - start:.2f}s: {total} técnicos, "
+            f"{updated} atualizados, {removed} removidos"
+        )
+        return True
+
+    def _merge(self, rows: List[Dict[str, Any]], levels: Sequence[str], full: bool) -> Tuple[int, int]:
+        """Mescla as linhas no índice; a recarga completa substitui o conteúdo"""
+        parsed: Dict[str, Optional[TechnicianRecord]] = {}
+        fields = self._fields()
+        for row in rows:
+            user_id, record = parse_roster_row(row, levels, fields)
+            if user_id is not None:
+                parsed[user_id] = record
+
+        with self._lock:
+            if full:
+                records = {user_id: record for user_id, record in parsed.items() if record}
+                removed = len(set(self._records) - set(records))
+                self._records = records
+                self._entity_members.clear()
+                return len(records), removed
+
+            updated = removed = 0
+            for user_id, record in parsed.items():
+                if record is not None:
+                    self._records[user_id] = record
+                    updated += 1
+                elif self._records.pop(user_id, None) is not None:
+                    removed += 1
+            return updated, removed
+
+    # ------------------------------------------------------------------
+    # Segundo plano
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Inicia a thread de atualização (uma por processo; idempotente)"""
+        if not self.background or self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="glpi-technician-roster", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Interrompe a thread de atualização"""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.refresh_interval):
+            full = time.time() - self._last_full_refresh >= self.full_refresh_interval
+            try:
+                self.refresh(full=full)
+            except Exception as e:
+                logger.warning(f"Erro na atualização em segundo plano do índice de técnicos: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Tamanho do índice, idade das atualizações e contadores"""
+        now = time.time()
+        with self._lock:
+            return {
+                "loaded": self._loaded,
+                "technicians": len(self._records),
+                "entities_cached": len(self._entity_members),
+                "background": self._thread is not None and self._thread.is_alive(),
+                "refresh_interval": self.refresh_interval,
+                "full_refresh_interval": self.full_refresh_interval,
+                "last_refresh_age": round(now - self._last_refresh, 1) if self._last_refresh else None,
+                "last_full_refresh_age": (
+                    round(now - self._last_full_refresh, 1) if self._last_full_refresh else None
+                ),
+                "refreshes": dict(self._refreshes),
+            }
+
+
+def create_technician_roster(service: "GLPIService") -> TechnicianRoster:
+    """Índice de técnicos configurado por ``ROSTER_CONFIG``"""
+    return TechnicianRoster(
+        service,
+        refresh_interval=ROSTER_CONFIG.get("REFRESH_INTERVAL", 300),
+        full_refresh_interval=ROSTER_CONFIG.get("FULL_REFRESH_INTERVAL", 3600),
+        group_ids=ROSTER_CONFIG.get("GROUP_IDS"),
+        profile_ids=ROSTER_CONFIG.get("PROFILE_IDS"),
+        background=ROSTER_CONFIG.get("BACKGROUND", True),
+    )
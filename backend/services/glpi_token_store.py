@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+"""Armazenamento compartilhado do Session-Token do GLPI entre workers.
+
+Cada processo (worker do gunicorn/uvicorn) chamava ``initSession`` por conta
+própria. Com um store compartilhado todos os workers reutilizam o mesmo token
+válido e apenas um chamador por vez executa a renovação (single-flight): os
+demais aguardam o lock e então leem o token recém-gravado.
+
+Implementações:
+- ``InMemorySessionTokenStore``: um único processo (padrão em testes)
+- ``FileSessionTokenStore``: arquivo JSON + lock de arquivo (mesma máquina)
+- ``RedisSessionTokenStore``: Redis (vários hosts), requer o pacote ``redis``
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from config.performance import API_CONFIG
+
+try:
+    import fcntl
+
+    FCNTL_AVAILABLE = True
+except ImportError:  # Windows
+    FCNTL_AVAILABLE = False
+
+logger = logging.getLogger("glpi_token_store")
+
+# Espera máxima pelo lock de renovação ao descartar um token recusado (segundos)
+CLEAR_LOCK_TIMEOUT = 5.0
+
+
+class SessionTokenStore(ABC):
+    """Interface do store de tokens de sessão
+
+    Os registros são dicts com ``session_token``, ``created_at`` e
+    ``expires_at`` (timestamps em segundos).
+    """
+
+    @abstractmethod
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Retorna o registro atual ou None"""
+
+    @abstractmethod
+    def save(self, record: Dict[str, Any]) -> None:
+        """Grava um novo registro"""
+
+    @abstractmethod
+    def clear(self, expected_token: Optional[str] = None) -> None:
+        """Remove o registro (apenas se o token for ``expected_token``, quando informado)"""
+
+    @abstractmethod
+    def refresh_lock(self, timeout: float = 10.0, blocking: bool = True):
+        """Lock de renovação compartilhado entre workers
+
+        Returns:
+            Context manager que produz True se o lock foi obtido, False caso contrário
+        """
+
+
+def is_record_valid(record: Optional[Dict[str, Any]], margin: float = 0.0) -> bool:
+    """Indica se o registro tem um token que não expira nos próximos ``margin`` segundos"""
+    if not record or not isinstance(record, dict):
+        return False
+    token = record.get("session_token")
+    expires_at = record.get("expires_at")
+    if not token or not isinstance(expires_at, (int, float)):
+        return False
+    return time.time() + margin < expires_at
+
+
+class InMemorySessionTokenStore(SessionTokenStore):
+    """Store em memória, compartilhado apenas entre threads do mesmo processo"""
+
+    def __init__(self):
+        self._record: Optional[Dict[str, Any]] = None
+        self._data_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        with self._data_lock:
+            return dict(self._record) if self._record else None
+
+    def save(self, record: Dict[str, Any]) -> None:
+        with self._data_lock:
+            self._record = dict(record)
+
+    def clear(self, expected_token: Optional[str] = None) -> None:
+        with self._data_lock:
+            if self._record and (
+                expected_token is None or self._record.get("session_token") == expected_token
+            ):
+                self._record = None
+
+    @contextmanager
+    def refresh_lock(self, timeout: float = 10.0, blocking: bool = True) -> Iterator[bool]:
+        acquired = self._refresh_lock.acquire(blocking, timeout if blocking else -1)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                self._refresh_lock.release()
+
+
+class FileSessionTokenStore(SessionTokenStore):
+    """Store em arquivo JSON protegido por lock de arquivo (workers na mesma máquina)"""
+
+    def __init__(self, path: str):
+        """Inicializa o store
+
+        Args:
+            path: Caminho do arquivo JSON; o lock usa ``path + ".lock"``
+        """
+        self.path = path
+        self.lock_path = f"{path}.lock"
+        self._thread_lock = threading.Lock()
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+            return record if isinstance(record, dict) else None
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Falha ao ler token compartilhado em {self.path}: {e}")
+            return None
+
+    def save(self, record: Dict[str, Any]) -> None:
+        # Escrita atômica: arquivo temporário no mesmo diretório + rename
+        directory = os.path.dirname(self.path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".glpi_session_")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(record, f)
+            os.chmod(tmp_path, 0o600)  # O token é uma credencial
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Falha ao gravar token compartilhado em {self.path}: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def clear(self, expected_token: Optional[str] = None) -> None:
+        # Comparação e remoção sob o lock de renovação: sem ele, o token que outro
+        # worker acabou de gravar poderia ser apagado no lugar do token recusado
+        with self.refresh_lock(timeout=CLEAR_LOCK_TIMEOUT) as acquired:
+            if not acquired:
+                logger.warning(f"Timeout aguardando o lock para remover o token compartilhado em {self.path}")
+                return
+            record = self.load()
+            if not record:
+                return
+            if expected_token is not None and record.get("session_token") != expected_token:
+                return
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+    @contextmanager
+    def refresh_lock(self, timeout: float = 10.0, blocking: bool = True) -> Iterator[bool]:
+        # Lock entre threads do processo + lock de arquivo entre processos
+        if not self._thread_lock.acquire(blocking, timeout if blocking else -1):
+            yield False
+            return
+
+        lock_file = None
+        acquired = False
+        try:
+            lock_file = open(self.lock_path, "a+")
+            deadline = time.monotonic() + timeout
+            while True:
+                if self._try_lock_file(lock_file):
+                    acquired = True
+                    break
+                if not blocking or time.monotonic() >= deadline:
+                    break
+                time.sleep(0.05)
+            yield acquired
+        finally:
+            if lock_file is not None:
+                if acquired:
+                    self._unlock_file(lock_file)
+                lock_file.close()
+            self._thread_lock.release()
+
+    @staticmethod
+    def _try_lock_file(lock_file) -> bool:
+        if not FCNTL_AVAILABLE:
+            # Sem fcntl o lock entre threads do processo é o melhor disponível
+            return True
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    @staticmethod
+    def _unlock_file(lock_file) -> None:
+        if FCNTL_AVAILABLE:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+class RedisSessionTokenStore(SessionTokenStore):
+    """Store em Redis, compartilhado entre hosts
+
+    Args:
+        client: Cliente Redis (``redis.Redis``) ou um fake compatível com
+            ``get``/``set``/``delete``
+        key: Chave base do registro
+    """
+
+    def __init__(self, client, key: str = "glpi_dashboard:session_token"):
+        self.client = client
+        self.key = key
+        self.lock_key = f"{key}:lock"
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        try:
+            raw = self.client.get(self.key)
+            if not raw:
+                return None
+            if isinstance(raw, bytes):
+                raw = raw.decode("utf-8")
+            record = json.loads(raw)
+            return record if isinstance(record, dict) else None
+        except Exception as e:
+            logger.warning(f"Falha ao ler token compartilhado no Redis: {e}")
+            return None
+
+    def save(self, record: Dict[str, Any]) -> None:
+        try:
+            ttl = max(1, int(record.get("expires_at", 0) - time.time()))
+            self.client.set(self.key, json.dumps(record), ex=ttl)
+        except Exception as e:
+            logger.warning(f"Falha ao gravar token compartilhado no Redis: {e}")
+
+    def clear(self, expected_token: Optional[str] = None) -> None:
+        # Mesmo motivo do store em arquivo: comparar e remover sob o lock de renovação
+        with self.refresh_lock(timeout=CLEAR_LOCK_TIMEOUT) as acquired:
+            if not acquired:
+                logger.warning("Timeout aguardando o lock para remover o token compartilhado no Redis")
+                return
+            record = self.load()
+            if not record:
+                return
+            if expected_token is not None and record.get("session_token") != expected_token:
+                return
+            try:
+                self.client.delete(self.key)
+            except Exception as e:
+                logger.warning(f"Falha ao remover token compartilhado no Redis: {e}")
+
+    @contextmanager
+    def refresh_lock(self, timeout: float = 10.0, blocking: bool = True) -> Iterator[bool]:
+        owner = uuid.uuid4().hex
+        # O lock expira sozinho caso o dono morra no meio da renovação
+        lock_ttl = max(1, int(timeout) + 5)
+        deadline = time.monotonic() + timeout
+        acquired = False
+        try:
+            while True:
+                if self.client.set(self.lock_key, owner, nx=True, ex=lock_ttl):
+                    acquired = True
+                    break
+                if not blocking or time.monotonic() >= deadline:
+                    break
+                time.sleep(0.05)
+        except Exception as e:
+            logger.warning(f"Falha ao obter lock de renovação no Redis: {e}")
+
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                try:
+                    current = self.client.get(self.lock_key)
+                    if isinstance(current, bytes):
+                        current = current.decode("utf-8")
+                    if current == owner:
+                        self.client.delete(self.lock_key)
+                except Exception as e:
+                    logger.warning(f"Falha ao liberar lock de renovação no Redis: {e}")
+
+
+def _default_token_path(glpi_url: str, user_token: str) -> str:
+    """Arquivo por instância GLPI + usuário, sem expor o user_token no nome"""
+    digest = hashlib.sha256(f"{glpi_url}|{user_token}".encode()).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), f"glpi_dashboard_session_{digest}.json")
+
+
+def create_session_token_store(glpi_url: str, user_token: str) -> SessionTokenStore:
+    """Cria o store configurado em ``API_CONFIG["TOKEN_STORE"]``
+
+    Valores aceitos: "file" (padrão), "redis" e "memory". Se o backend
+    escolhido não estiver disponível cai para o store em memória.
+    """
+    backend = str(API_CONFIG.get("TOKEN_STORE", "file")).lower()
+
+    if backend == "redis":
+        try:
+            import redis
+
+            from config.settings import active_config
+
+            client = redis.from_url(active_config().REDIS_URL, socket_timeout=2)
+            client.ping()
+            digest = hashlib.sha256(f"{glpi_url}|{user_token}".encode()).hexdigest()[:16]
+            return RedisSessionTokenStore(client, key=f"glpi_dashboard:session_token:{digest}")
+        except Exception as e:
+            logger.warning(f"Redis indisponível para o token compartilhado, usando memória: {e}")
+            return InMemorySessionTokenStore()
+
+    if backend == "file":
+        path = API_CONFIG.get("TOKEN_STORE_PATH") or _default_token_path(glpi_url, user_token)
+        return FileSessionTokenStore(path)
+
+    return InMemorySessionTokenStore()
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""Compressão das respostas do GLPI e contabilidade de bytes transferidos.
+
+As buscas que exibem descrições (campo 21) devolvem JSON grande e muito
+compressível. Os clientes pedem ``gzip``/``br`` (``Accept-Encoding``) e, a cada
+chamada, registram os bytes recebidos na rede (comprimidos) e os bytes
+decodificados, agrupados por família de consulta (``query_family``), para
+medir a economia de transferência de cada tipo de busca.
+"""
+
+import logging
+import threading
+from typing import Any, Dict
+
+from config.performance import API_CONFIG
+
+try:
+    import brotli  # noqa: F401  # Decodificação de "br" no requests/urllib3 e no httpx
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+logger = logging.getLogger("glpi_transfer_stats")
+
+
+def compression_enabled() -> bool:
+    """Indica se as respostas do GLPI devem ser pedidas comprimidas"""
+    return bool(API_CONFIG.get("COMPRESSION", True))
+
+
+def accept_encoding() -> str:
+    """Valor de ``Accept-Encoding`` das requisições ao GLPI
+
+    ``br`` só é anunciado quando há decodificador instalado; com a compressão
+    desligada pede ``identity`` (proxies que não comprimem).
+    """
+    if not compression_enabled():
+        return "identity"
+    return "br, gzip" if BROTLI_AVAILABLE else "gzip"
+
+
+def response_sizes(response) -> Dict[str, Any]:
+    """Bytes na rede, bytes decodificados e ``Content-Encoding`` de uma resposta
+
+    Aceita ``requests.Response`` (bytes lidos do socket em ``raw.tell()``) e
+    ``httpx.Response`` (``num_bytes_downloaded``); o corpo já deve ter sido lido.
+    """
+    decoded_bytes = len(response.content or b"")
+    wire_bytes = getattr(response, "num_bytes_downloaded", None)
+    if wire_bytes is None:
+        raw = getattr(response, "raw", None)
+        try:
+            wire_bytes = raw.tell() if raw is not None else None
+        except Exception:
+            wire_bytes = None
+    if not wire_bytes:
+        wire_bytes = decoded_bytes
+    return {
+        "wire_bytes": int(wire_bytes),
+        "decoded_bytes": decoded_bytes,
+        "encoding": (response.headers.get("Content-Encoding") or "identity").lower(),
+    }
+
+
+class TransferStats:
+    """Bytes comprimidos x decodificados por família de consulta"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._families: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, family: str, wire_bytes: int, decoded_bytes: int, encoding: str) -> None:
+        """Registra uma resposta da família informada"""
+        with self._lock:
+            stats = self._families.get(family)
+            if stats is None:
+                stats = {"calls": 0, "wire_bytes": 0, "decoded_bytes": 0, "encodings": {}}
+                self._families[family] = stats
+            stats["calls"] += 1
+            stats["wire_bytes"] += wire_bytes
+            stats["decoded_bytes"] += decoded_bytes
+            stats["encodings"][encoding] = stats["encodings"].get(encoding, 0) + 1
+
+    def record_response(self, family: str, response) -> None:
+        """Registra uma resposta ``requests``/``httpx`` sem interromper a chamada em caso de erro"""
+        try:
+            sizes = response_sizes(response)
+            self.record(family, sizes["wire_bytes"], sizes["decoded_bytes"], sizes["encoding"])
+        except Exception as e:
+            logger.debug(f"Falha ao contabilizar bytes de {family}: {e}")
+
+    @staticmethod
+    def _summary(stats: Dict[str, Any]) -> Dict[str, Any]:
+        wire = stats["wire_bytes"]
+        decoded = stats["decoded_bytes"]
+        saved = max(0, decoded - wire)
+        return {
+            "calls": stats["calls"],
+            "wire_bytes": wire,
+            "decoded_bytes": decoded,
+            "saved_bytes": saved,
+            "savings_pct": round(saved / decoded * 100, 1) if decoded else 0.0,
+            "avg_wire_bytes": round(wire / stats["calls"]) if stats["calls"] else 0,
+            "encodings": dict(stats["encodings"]),
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Economia de transferência total e por família de consulta"""
+        with self._lock:
+            families = {
+                family: self._summary(stats) for family, stats in sorted(self._families.items())
+            }
+            totals = {"calls": 0, "wire_bytes": 0, "decoded_bytes": 0, "encodings": {}}
+            for stats in self._families.values():
+                totals["calls"] += stats["calls"]
+                totals["wire_bytes"] += stats["wire_bytes"]
+                totals["decoded_bytes"] += stats["decoded_bytes"]
+                for encoding, count in stats["encodings"].items():
+                    totals["encodings"][encoding] = totals["encodings"].get(encoding, 0) + count
+
+        return {
+            "compression_enabled": compression_enabled(),
+            "accept_encoding": accept_encoding(),
+            "totals": self._summary(totals),
+            "families": families,
+        }
+
+    def reset(self) -> None:
+        """Zera os contadores"""
+        with self._lock:
+            self._families.clear()
+
+
+# Contadores globais, compartilhados pelos clientes síncrono e assíncrono
+glpi_transfer_stats = TransferStats()
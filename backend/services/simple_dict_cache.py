@@ -16,6 +16,8 @@ from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from config.performance import API_CONFIG
+
 logger = logging.getLogger(__name__)
 
 
@@ -238,6 +240,9 @@ class SimpleDictCache:
 # Instância global do cache
 simple_cache = SimpleDictCache(default_ttl=300)  # 5 minutos
 
+# Último payload válido de cada rota, servido em modo degradado quando o GLPI falha
+last_known_good_cache = SimpleDictCache(default_ttl=API_CONFIG.get("LAST_KNOWN_GOOD_TTL", 3600), max_size=200)
+
 
 def cache_key(*args, **kwargs) -> str:
     """Gera uma chave de cache a partir de argumentos
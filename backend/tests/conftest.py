@@ -3,6 +3,8 @@
 import logging
 import os
 import sys
+import threading
+import time
 
 import pytest
 from unittest.mock import Mock, patch
@@ -11,6 +13,49 @@ from unittest.mock import Mock, patch
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from services.glpi_service import GLPIService
+from services.glpi_token_store import FileSessionTokenStore, InMemorySessionTokenStore, RedisSessionTokenStore
+
+
+class FakeRedis:
+    """Fake mínimo do cliente Redis usado pelo store de tokens (get/set/delete)
+
+    Cada comando é atômico, como no Redis: ``set(nx=True)`` serve de lock entre threads.
+    """
+
+    def __init__(self):
+        self._data = {}
+        self._expiry = {}
+        self._lock = threading.Lock()
+
+    def _purge(self, key):
+        expires_at = self._expiry.get(key)
+        if expires_at is not None and time.time() >= expires_at:
+            self._data.pop(key, None)
+            self._expiry.pop(key, None)
+
+    def get(self, key):
+        with self._lock:
+            self._purge(key)
+            return self._data.get(key)
+
+    def set(self, key, value, ex=None, nx=False):
+        with self._lock:
+            self._purge(key)
+            if nx and key in self._data:
+                return None
+            self._data[key] = value
+            if ex is not None:
+                self._expiry[key] = time.time() + ex
+            else:
+                self._expiry.pop(key, None)
+            return True
+
+    def delete(self, key):
+        with self._lock:
+            existed = key in self._data
+            self._data.pop(key, None)
+            self._expiry.pop(key, None)
+            return int(existed)
 
 
 @pytest.fixture(autouse=True)
@@ -174,11 +219,31 @@ def sample_metrics_data():
     }
 
 
+@pytest.fixture
+def fake_redis():
+    """Cliente Redis falso em memória"""
+    return FakeRedis()
+
+
+@pytest.fixture
+def redis_token_store(fake_redis):
+    """Store de Session-Token compartilhado sobre o Redis falso"""
+    return RedisSessionTokenStore(fake_redis, key="test:session_token")
+
+
+@pytest.fixture
+def file_token_store(tmp_path):
+    """Store de Session-Token compartilhado em arquivo temporário"""
+    return FileSessionTokenStore(str(tmp_path / "session_token.json"))
+
+
 @pytest.fixture
 def glpi_service(mock_glpi_config):
     """Fixture para instanciar GLPIService com configuração mockada"""
-    with patch("services.glpi_service.active_config", mock_glpi_config):
+    with patch("services.glpi_service.active_config", return_value=mock_glpi_config):
         service = GLPIService()
+        # Não compartilhar tokens com outros processos durante os testes
+        service.token_store = InMemorySessionTokenStore()
         return service
 
 
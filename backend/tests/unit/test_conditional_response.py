@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Testes das representações com ETag guardadas pelas rotas do dashboard"""
+import json
+
+import pytest
+
+from utils.conditional_response import RepresentationCache, etag_matches
+
+
+@pytest.fixture
+def cache():
+    return RepresentationCache(ttls={"metrics": 60}, max_entries=10, enabled=True)
+
+
+def _payload(correlation_id, novos=12):
+    return {
+        "success": True,
+        "data": {"novos": novos},
+        "response_time_ms": 12.5,
+        "correlation_id": correlation_id,
+        "cached": False,
+    }
+
+
+def test_corpo_guardado_sem_campos_da_resposta(cache):
+    representation = cache.store("metrics", {}, _payload("cid-original"))
+
+    stored = json.loads(representation.body)
+    assert "correlation_id" not in stored
+    assert "cached" not in stored
+    assert stored["data"] == {"novos": 12}
+
+
+def test_corpo_identico_para_o_mesmo_etag(cache):
+    other = RepresentationCache(ttls={"metrics": 60}, max_entries=10, enabled=True)
+    first = cache.store("metrics", {}, _payload("cid-1"))
+    second = other.store("metrics", {}, {**_payload("cid-2"), "cached": True})
+
+    assert second.etag == first.etag
+    assert second.body == first.body
+
+
+def test_mesmo_conteudo_reaproveita_bytes_e_etag(cache):
+    first = cache.store("metrics", {}, _payload("cid-1"))
+    second = cache.store("metrics", {}, _payload("cid-2"))
+
+    assert second.body is first.body
+    assert second.etag == first.etag
+    assert cache.get_stats()["reused"] == 1
+
+
+def test_conteudo_diferente_troca_o_etag(cache):
+    first = cache.store("metrics", {}, _payload("cid-1"))
+    second = cache.store("metrics", {}, _payload("cid-2", novos=13))
+
+    assert second.etag != first.etag
+
+
+def test_etag_forte_revalida(cache):
+    representation = cache.store("metrics", {}, _payload("cid"))
+
+    assert representation.etag.startswith('"')
+    assert etag_matches(representation.etag, representation.etag)
+    assert etag_matches(f'"outro", {representation.etag}', representation.etag)
+    assert etag_matches("*", representation.etag)
+    assert not etag_matches(f"W/{representation.etag}", representation.etag)
+    assert not etag_matches('"outro"', representation.etag)
+
+
+def test_payload_parcial_ou_degradado_nao_e_guardado(cache):
+    assert cache.store("metrics", {}, {**_payload("cid"), "partial": True}) is None
+    assert cache.store("metrics", {}, {**_payload("cid"), "degraded": True}) is None
+    assert cache.lookup("metrics", {}) is None
+
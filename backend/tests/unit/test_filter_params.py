@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""Testes da leitura dos filtros da query string, comum às rotas Flask e assíncronas"""
+import pytest
+from flask import Flask
+from werkzeug.datastructures import MultiDict
+
+from utils.performance import extract_filter_params, parse_filter_params
+
+QUERY = "start_date=2024-01-01&end_date=2024-01-31&status=novo&level=n2&limit=10&entity_id=abc"
+
+
+def test_parse_filter_params():
+    filters = parse_filter_params(
+        MultiDict(
+            {
+                "start_date": "2024-01-01",
+                "end_date": "2024-01-31",
+                "status": "novo",
+                "level": "n2",
+                "limit": "10",
+                "entity_id": "abc",
+            }
+        )
+    )
+
+    assert filters == {
+        "start_date": "2024-01-01",
+        "end_date": "2024-01-31",
+        "filter_type": "creation",
+        "status": "novo",
+        "priority": None,
+        "level": "n2",
+        "technician": None,
+        "category": None,
+        "limit": 10,
+        "entity_id": None,
+    }
+
+
+def test_flask_e_starlette_leem_os_mesmos_filtros():
+    QueryParams = pytest.importorskip("starlette.datastructures").QueryParams
+
+    with Flask(__name__).test_request_context(f"/api/metrics?{QUERY}"):
+        flask_filters = extract_filter_params()
+
+    assert flask_filters == parse_filter_params(QueryParams(QUERY))
+    assert flask_filters["status"] == "novo"
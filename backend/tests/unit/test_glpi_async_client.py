@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""Testes do cliente assíncrono do GLPI diante de respostas de erro"""
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from services.glpi_async_client import AsyncGLPIClient
+from services.glpi_query_planner import SCAN, glpi_query_planner
+from utils.deadline import clear_deadline, get_deadline, start_deadline
+
+PAGE_SIZE = 2
+
+
+def _page(start, total, status_code=200):
+    rows = [{"2": str(index)} for index in range(start, min(start + PAGE_SIZE, total))]
+    return httpx.Response(
+        status_code,
+        json={"totalcount": total, "data": rows},
+        headers={"Content-Range": f"{start}-{start + len(rows) - 1}/{total}"},
+    )
+
+
+def _proxy_error(status_code=502):
+    return httpx.Response(status_code, text="<html><body>Bad Gateway</body></html>")
+
+
+@pytest.fixture
+def async_client(glpi_service):
+    return AsyncGLPIClient(glpi_service)
+
+
+def _fetch_all_pages(client, responses):
+    """``fetch_all_pages`` com a página de cada ``range`` vinda de ``responses``"""
+
+    async def search_tickets(params, timeout=None):
+        start = int(params["range"].split("-")[0])
+        return responses[start]
+
+    with patch.object(client, "search_tickets", side_effect=search_tickets):
+        return asyncio.run(client.fetch_all_pages({"is_deleted": 0}, page_size=PAGE_SIZE))
+
+
+def test_fetch_all_pages_junta_todas_as_paginas(async_client):
+    responses = {start: _page(start, 5) for start in (0, 2, 4)}
+
+    rows = _fetch_all_pages(async_client, responses)
+
+    assert [row["2"] for row in rows] == ["0", "1", "2", "3", "4"]
+
+
+def test_fetch_all_pages_primeira_pagina_nao_json(async_client):
+    rows = _fetch_all_pages(async_client, {0: httpx.Response(200, text="<html>proxy</html>")})
+    assert rows is None
+
+
+def test_fetch_all_pages_sem_tickets(async_client):
+    rows = _fetch_all_pages(async_client, {0: httpx.Response(200, json={"totalcount": 0, "data": []})})
+    assert rows == []
+
+
+@pytest.mark.parametrize(
+    "error_page",
+    # 4xx com corpo JSON também não pode ser tratado como dados
+    [_proxy_error(502), httpx.Response(400, json={"data": [{"2": "erro"}]})],
+)
+def test_fetch_all_pages_falha_com_pagina_de_erro(async_client, error_page):
+    responses = {0: _page(0, 6), 2: error_page, 4: _page(4, 6)}
+
+    assert _fetch_all_pages(async_client, responses) is None
+
+
+def test_fetch_all_pages_falha_com_pagina_html(async_client):
+    responses = {0: _page(0, 4), 2: httpx.Response(200, text="<html>proxy</html>")}
+
+    assert _fetch_all_pages(async_client, responses) is None
+
+
+def test_fetch_all_pages_falha_com_excecao(async_client):
+    async def search_tickets(params, timeout=None):
+        if params["range"].startswith("0-"):
+            return _page(0, 4)
+        raise httpx.ReadTimeout("timeout")
+
+    with patch.object(async_client, "search_tickets", side_effect=search_tickets):
+        rows = asyncio.run(async_client.fetch_all_pages({"is_deleted": 0}, page_size=PAGE_SIZE))
+
+    assert rows is None
+
+
+def test_count_facets_com_varredura_incompleta_usa_contagens(async_client):
+    queries = {"novo": {"status": 1}, "fechado": {"status": 6}}
+    plan = Mock(strategy=SCAN)
+
+    fetch_all_pages = AsyncMock(return_value=None)
+    gather_counts = AsyncMock(return_value={"novo": 10, "fechado": 7})
+
+    with patch.object(glpi_query_planner, "needs_probe", return_value=False), patch.object(
+        glpi_query_planner, "plan", return_value=plan
+    ), patch.object(async_client, "fetch_all_pages", new=fetch_all_pages), patch.object(
+        async_client, "_gather_counts", new=gather_counts
+    ):
+        counts = asyncio.run(
+            async_client.count_facets("status", queries, {"is_deleted": 0}, lambda row: row.get("12"))
+        )
+
+    assert counts == {"novo": 10, "fechado": 7}
+    fetch_all_pages.assert_awaited_once()
+    gather_counts.assert_awaited_once_with(queries)
+
+
+@pytest.mark.parametrize("response", [_proxy_error(502), httpx.Response(200, text="<html>proxy</html>")])
+def test_nomes_de_usuario_e_categoria_com_resposta_invalida(async_client, response):
+    async def request(method, url, params=None, timeout=None):
+        return response
+
+    with patch.object(async_client, "request", side_effect=request):
+        users = asyncio.run(async_client.get_user_display_names(["7"]))
+        categories = asyncio.run(async_client.get_category_names(["3"]))
+
+    assert users == {"7": "Usuário 7"}
+    assert categories == {"3": "Não categorizado"}
+
+
+def test_run_reaproveita_loop_e_cliente_http(async_client):
+    async def current():
+        return asyncio.get_running_loop(), async_client._http_client(), get_deadline()
+
+    deadline = start_deadline(30, "teste")
+    try:
+        first_loop, first_client, seen_deadline = async_client.run(current())
+        second_loop, second_client, _ = async_client.run(current())
+    finally:
+        clear_deadline()
+
+    try:
+        # O deadline do chamador vale dentro do loop de fundo
+        assert seen_deadline is deadline
+        assert second_loop is first_loop
+        assert second_client is first_client
+        assert not first_client.is_closed
+    finally:
+        async_client.close()
+
+    assert first_client.is_closed
+    assert first_loop.is_closed()
+    assert async_client.get_stats()["background_loop"] is False
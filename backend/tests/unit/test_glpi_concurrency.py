@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Testes da espera de corrotinas por vagas do limitador adaptativo"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from services.glpi_concurrency import AdaptiveConcurrencyLimiter, ConcurrencyLimitExceeded
+
+
+@pytest.fixture
+def limiter():
+    return AdaptiveConcurrencyLimiter(initial_limit=1, min_limit=1, max_limit=4)
+
+
+def test_corrotina_acordada_pelo_release_de_outra_thread(limiter):
+    assert limiter.acquire()
+    release_at = {}
+
+    def release_later():
+        time.sleep(0.1)
+        release_at["time"] = time.monotonic()
+        limiter.release()
+
+    async def wait_for_slot():
+        async with limiter.async_slot(timeout=5):
+            return time.monotonic()
+
+    thread = threading.Thread(target=release_later)
+    thread.start()
+    acquired_at = asyncio.run(wait_for_slot())
+    thread.join()
+
+    assert acquired_at >= release_at["time"]
+    assert acquired_at - release_at["time"] < 0.05
+    assert limiter.in_flight == 0
+    assert not limiter._async_waiters
+
+
+def test_corrotinas_em_fila_recebem_a_vaga_em_ordem(limiter):
+    order = []
+
+    async def worker(name):
+        async with limiter.async_slot(timeout=5):
+            order.append(name)
+            await asyncio.sleep(0.01)
+
+    async def run():
+        async with limiter.async_slot():
+            tasks = [asyncio.ensure_future(worker(name)) for name in ("a", "b", "c")]
+            await asyncio.sleep(0.01)
+            assert limiter.queue_depth == 3
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+
+    assert order == ["a", "b", "c"]
+    assert limiter.in_flight == 0
+
+
+def test_corrotina_sem_vaga_no_prazo(limiter):
+    assert limiter.acquire()
+
+    async def wait_for_slot():
+        async with limiter.async_slot(timeout=0.05):
+            pass
+
+    with pytest.raises(ConcurrencyLimitExceeded):
+        asyncio.run(wait_for_slot())
+
+    assert not limiter._async_waiters
+    assert limiter.queue_depth == 0
+    assert limiter.get_stats()["rejected"] == 1
+    limiter.release()
+    assert limiter.in_flight == 0
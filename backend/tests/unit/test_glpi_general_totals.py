@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Testes dos totais gerais por status com filtro de data"""
+from types import MappingProxyType
+from unittest.mock import patch
+
+from services.glpi_queries import build_status_count_params
+
+
+def _criteria(params):
+    """Critérios ``criteria[i][campo]`` agrupados por índice"""
+    criteria = {}
+    for key, value in params.items():
+        if key.startswith("criteria["):
+            index, name = key[len("criteria[") : -1].split("][")
+            criteria.setdefault(int(index), {})[name] = value
+    return criteria
+
+
+def test_filtro_de_data_nao_sobrescreve_o_criterio_de_status():
+    criteria = _criteria(build_status_count_params("12", 4, "2024-01-01", "2024-01-31"))
+
+    assert criteria[0]["field"] == "12"
+    assert str(criteria[0]["value"]) == "4"
+    date_criteria = [criteria[index] for index in sorted(criteria) if index > 0]
+    assert len(date_criteria) == 2
+    assert all(criterion["field"] == "15" for criterion in date_criteria)
+    assert {criterion["value"] for criterion in date_criteria} == {"2024-01-01 00:00:00", "2024-01-31 23:59:59"}
+
+
+def test_totais_gerais_com_data_contam_cada_status(glpi_service):
+    glpi_service.field_ids = MappingProxyType({"STATUS": "12", "GROUP": "8"})
+    captured = {}
+
+    def count_facets(description, queries, scan_params, facet, correlation_id=None):
+        captured.update(queries)
+        return {status_name: 0 for status_name in queries}
+
+    with patch.object(glpi_service, "_count_facets", side_effect=count_facets):
+        totals = glpi_service._get_general_totals_internal("2024-01-01", "2024-01-31")
+
+    assert set(totals) == set(glpi_service.status_map)
+    for status_name, status_id in glpi_service.status_map.items():
+        criteria = _criteria(captured[status_name])
+        assert criteria[0]["field"] == "12"
+        assert str(criteria[0]["value"]) == str(status_id)
+        assert len(criteria) == 3
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Testes da espera entre tentativas limitada ao prazo da requisição"""
+from unittest.mock import patch
+
+import pytest
+
+from services.glpi_retry import RetryBudget, RetryPolicy
+from utils.deadline import clear_deadline, start_deadline
+
+
+@pytest.fixture
+def policy():
+    return RetryPolicy(max_attempts=3, base_delay=1.0, max_delay=4.0)
+
+
+@pytest.fixture
+def deadline():
+    deadline = start_deadline(1.0, "teste")
+    yield deadline
+    clear_deadline()
+
+
+def test_espera_sem_prazo(policy):
+    with patch.object(policy, "backoff", return_value=0.5), patch("services.glpi_retry.time.sleep") as sleep:
+        assert policy.wait_before_retry(0, RetryBudget()) is True
+
+    sleep.assert_called_once_with(0.5)
+
+
+def test_prazo_curto_pula_a_nova_tentativa(policy, deadline):
+    budget = RetryBudget()
+
+    with patch.object(policy, "backoff", return_value=2.0), patch("services.glpi_retry.time.sleep") as sleep:
+        assert policy.wait_before_retry(0, budget) is False
+
+    sleep.assert_not_called()
+    assert budget.retries == 0
+    assert deadline.exceeded
+    assert "retry" in deadline.cut_points
+
+
+def test_espera_limitada_ao_prazo_restante(policy, deadline):
+    # O prazo encolhe entre a decisão e a espera
+    with patch.object(policy, "next_delay", return_value=0.9), patch.object(
+        deadline, "remaining", return_value=0.95
+    ), patch("services.glpi_retry.time.sleep") as sleep:
+        assert policy.wait_before_retry(0, RetryBudget()) is True
+        sleep.assert_called_once_with(0.9)
+
+    with patch.object(policy, "next_delay", return_value=0.9), patch.object(
+        deadline, "remaining", return_value=0.5
+    ), patch("services.glpi_retry.time.sleep") as sleep:
+        assert policy.wait_before_retry(0, RetryBudget()) is False
+        sleep.assert_not_called()
+
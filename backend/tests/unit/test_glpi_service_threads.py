@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""Estresse curto do GLPIService compartilhado por várias threads
+
+Um GLPI falso local (``ThreadingHTTPServer``) emite Session-Tokens em
+``initSession``, tem o token corrente revogado algumas vezes durante a rodada
+(forçando renovações concorrentes) e responde ``search/Ticket`` com um total
+determinístico por status. Uma única instância do ``GLPIService`` é usada por
+várias threads que misturam contagens, headers, redescoberta dos campos e
+leituras/escritas no cache interno.
+"""
+import json
+import random
+import threading
+import time
+import uuid
+from collections.abc import Mapping
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from config.performance import API_CONFIG, CONCURRENCY_CONFIG, ROSTER_CONFIG, SEARCH_OPTIONS_CONFIG
+from services.glpi_queries import build_status_count_params
+from services.glpi_service import GLPIService
+
+THREADS = 16
+REVOCATIONS = 5
+# Tempo entre o fim de uma renovação e a próxima revogação
+REVOKE_INTERVAL = 0.15
+# Limite para cada renovação aparecer no GLPI falso
+SWAP_TIMEOUT = 10.0
+
+STATUS_FIELD = "12"
+TICKET_SEARCH_OPTIONS = {
+    "8": {"name": "Grupo técnico"},
+    "12": {"name": "Status"},
+    "5": {"name": "Técnico"},
+    "15": {"name": "Data de abertura"},
+}
+
+
+def expected_total(status_id):
+    return 100 + status_id
+
+
+class FakeGLPI:
+    """Estado do GLPI falso: tokens emitidos, revogados e contadores"""
+
+    def __init__(self, latency=0.002):
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.issued = []
+        self.revoked = set()
+        self.counters = {"initSession": 0, "killSession": 0, "search": 0, "401": 0}
+
+    def issue(self):
+        token = uuid.uuid4().hex
+        with self.lock:
+            self.issued.append(token)
+            self.counters["initSession"] += 1
+        return token
+
+    def is_valid(self, token):
+        with self.lock:
+            return bool(token) and token in self.issued and token not in self.revoked
+
+    def was_issued(self, token):
+        with self.lock:
+            return token in self.issued
+
+    def revoke_current(self):
+        """Revoga o token corrente e devolve quantos tokens já foram emitidos"""
+        with self.lock:
+            self.revoked.add(self.issued[-1])
+            return len(self.issued)
+
+    def issued_count(self):
+        with self.lock:
+            return len(self.issued)
+
+    def count(self, key):
+        with self.lock:
+            self.counters[key] += 1
+
+
+def make_handler(glpi):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _json(self, status, payload, headers=None):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            endpoint = parts.path.split("/apirest.php/", 1)[-1]
+
+            if endpoint == "initSession":
+                self._json(200, {"session_token": glpi.issue()})
+                return
+
+            if not glpi.is_valid(self.headers.get("Session-Token")):
+                glpi.count("401")
+                self._json(401, ["ERROR_SESSION_TOKEN_INVALID", "session_token inválido"])
+                return
+
+            if endpoint == "killSession":
+                glpi.count("killSession")
+                self._json(200, {})
+            elif endpoint == "getGlpiConfig":
+                self._json(200, {"cfg_glpi": {"version": "10.0.10"}})
+            elif endpoint == "listSearchOptions/Ticket":
+                self._json(200, TICKET_SEARCH_OPTIONS)
+            elif endpoint == "search/Ticket":
+                glpi.count("search")
+                time.sleep(glpi.latency)
+                query = parse_qs(parts.query)
+                status_id = int(query.get("criteria[0][value]", ["0"])[0])
+                total = expected_total(status_id)
+                self._json(200, {"totalcount": total, "count": 0, "data": []}, {"Content-Range": f"0-0/{total}"})
+            else:
+                self._json(404, ["ERROR_ITEM_NOT_FOUND", endpoint])
+
+    return Handler
+
+
+class StressResult:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.operations = {}
+        self.violations = []
+        self.errors = []
+
+    def ok(self, operation):
+        with self.lock:
+            self.operations[operation] = self.operations.get(operation, 0) + 1
+
+    def violation(self, message):
+        with self.lock:
+            self.violations.append(message)
+
+    def error(self, message):
+        with self.lock:
+            self.errors.append(message)
+
+
+def worker(index, service, glpi, result, stop):
+    rng = random.Random(index)
+    while not stop.is_set():
+        operation = rng.choice(("count", "headers", "fields", "cache", "snapshot"))
+        try:
+            if operation == "count":
+                status_id = rng.randint(1, 6)
+                total = service._count_search(build_status_count_params(STATUS_FIELD, status_id))
+                if total != expected_total(status_id):
+                    result.violation(f"contagem do status {status_id}: {total}")
+
+            elif operation == "headers":
+                headers = service.get_api_headers()
+                token = headers.get("Session-Token") if headers else None
+                if not glpi.was_issued(token):
+                    result.violation(f"Session-Token não emitido pelo GLPI: {token!r}")
+
+            elif operation == "fields":
+                service.discover_field_ids()
+                fields = service.field_ids
+                if not isinstance(fields, Mapping) or isinstance(fields, dict):
+                    result.violation(f"field_ids mutável: {type(fields).__name__}")
+                elif fields and fields.get("STATUS") != STATUS_FIELD:
+                    result.violation(f"field_ids incompleto: {dict(fields)}")
+
+            elif operation == "cache":
+                key = f"stress_{index}"
+                value = rng.random()
+                service._set_cache_data("dashboard_metrics_filtered", value, ttl=60, sub_key=key)
+                cached = service._get_cache_data("dashboard_metrics_filtered", key)
+                if cached != value:
+                    result.violation(f"cache da thread {index}: {cached!r} != {value!r}")
+
+            else:
+                current = service._token
+                if current.token is not None and (
+                    current.created_at is None
+                    or abs(current.expires_at - current.created_at - service.session_timeout) > 1e-6
+                ):
+                    result.violation(f"sessão inconsistente: {current}")
+
+            result.ok(operation)
+        except Exception as e:
+            result.error(f"{operation}: {type(e).__name__}: {e}")
+
+
+@pytest.fixture
+def fake_glpi():
+    glpi = FakeGLPI()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(glpi))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    glpi.url = f"http://127.0.0.1:{server.server_port}/apirest.php"
+    yield glpi
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def shared_service(fake_glpi, tmp_path):
+    """GLPIService ligado ao GLPI falso, com token único e nada em segundo plano"""
+    config = Mock()
+    config.GLPI_URL = fake_glpi.url
+    config.GLPI_APP_TOKEN = "stress-app-token"
+    config.GLPI_USER_TOKEN = "stress-user-token"
+    config.API_TIMEOUT = 10
+
+    with patch("services.glpi_service.active_config", return_value=config), patch.dict(
+        API_CONFIG, {"TOKEN_STORE": "memory", "SESSION_POOL_SIZE": 1}
+    ), patch.dict(CONCURRENCY_CONFIG, {"ENABLE_ASYNC": False}), patch.dict(
+        SEARCH_OPTIONS_CONFIG, {"BACKGROUND": False, "CACHE_PATH": str(tmp_path / "search_options.json")}
+    ), patch.dict(
+        ROSTER_CONFIG, {"BACKGROUND": False}
+    ):
+        service = GLPIService()
+        yield service
+        service.search_options.stop()
+        service.technician_roster.stop()
+
+
+def _wait_for_swap(glpi, issued_before):
+    deadline = time.monotonic() + SWAP_TIMEOUT
+    while time.monotonic() < deadline:
+        if glpi.issued_count() > issued_before:
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def test_servico_compartilhado_entre_threads(shared_service, fake_glpi):
+    result = StressResult()
+    stop = threading.Event()
+    threads = [
+        threading.Thread(target=worker, args=(index, shared_service, fake_glpi, result, stop), daemon=True)
+        for index in range(THREADS)
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        assert _wait_for_swap(fake_glpi, 0), "nenhuma sessão aberta no GLPI falso"
+        for _ in range(REVOCATIONS):
+            time.sleep(REVOKE_INTERVAL)
+            issued_before = fake_glpi.revoke_current()
+            assert _wait_for_swap(fake_glpi, issued_before), "token revogado não foi renovado"
+        # Deixa as threads que receberam 401 terminarem de trocar o token
+        time.sleep(REVOKE_INTERVAL)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join(timeout=30)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert result.errors == []
+    assert result.violations == []
+    assert set(result.operations) == {"count", "headers", "fields", "cache", "snapshot"}
+    assert fake_glpi.counters["401"] > 0
+
+    # Uma sessão inicial e exatamente uma troca de token por revogação
+    assert fake_glpi.counters["initSession"] == 1 + REVOCATIONS
+    assert shared_service.session_token == fake_glpi.issued[-1]
+
+    assert isinstance(shared_service.field_ids, Mapping)
+    assert not isinstance(shared_service.field_ids, dict)
+    assert shared_service.field_ids["STATUS"] == STATUS_FIELD
+    for index in range(THREADS):
+        cached = shared_service._get_cache_data("dashboard_metrics_filtered", f"stress_{index}")
+        assert cached is None or isinstance(cached, float)
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""Testes do pool de sessões do GLPI"""
+import itertools
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from services.glpi_session_pool import GLPISessionPool
+
+
+class FakeSessions:
+    """initSession/killSession falsos, com registro das sessões abertas e encerradas"""
+
+    def __init__(self):
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.opened = []
+        self.killed = []
+
+    def init_session(self):
+        with self._lock:
+            token = f"pool-token-{next(self._ids)}"
+            self.opened.append(token)
+        return token, time.time() + 3600
+
+    def kill_session(self, token):
+        with self._lock:
+            self.killed.append(token)
+
+
+@pytest.fixture
+def sessions():
+    return FakeSessions()
+
+
+@pytest.fixture
+def pool(sessions):
+    return GLPISessionPool(3, init_session=sessions.init_session, kill_session=sessions.kill_session)
+
+
+def test_requisicoes_simultaneas_recebem_tokens_distintos(pool):
+    leases = [pool.acquire(timeout=1) for _ in range(3)]
+
+    assert len({lease.token for lease in leases}) == 3
+    for lease in leases:
+        pool.release(lease)
+
+
+def test_pool_volta_a_funcionar_depois_de_close(pool, sessions):
+    with pool.lease(timeout=1) as lease:
+        first_token = lease.token
+
+    pool.close()
+    assert sessions.killed == [first_token]
+
+    with pool.lease(timeout=1) as lease:
+        assert lease is not None
+        assert lease.token != first_token
+    assert pool.get_stats()["open_sessions"] == 1
+
+
+def test_sessao_emprestada_durante_close_e_encerrada_na_devolucao(pool, sessions):
+    lease = pool.acquire(timeout=1)
+    token = lease.token
+
+    pool.close()
+    assert sessions.killed == []
+
+    pool.release(lease)
+    assert sessions.killed == [token]
+
+    with pool.lease(timeout=1) as new_lease:
+        assert new_lease.token != token
+
+
+def test_token_invalidado_e_recriado_sem_kill_session(pool, sessions):
+    lease = pool.acquire(timeout=1)
+    token = lease.token
+    lease.invalidate()
+    pool.release(lease)
+
+    with pool.lease(timeout=1) as new_lease:
+        assert new_lease.token != token
+    assert sessions.killed == []
+
+
+def test_close_session_do_servico_nao_inutiliza_o_pool(glpi_service):
+    sessions = FakeSessions()
+    glpi_service.session_pool = GLPISessionPool(
+        2, init_session=sessions.init_session, kill_session=sessions.kill_session
+    )
+    with glpi_service.session_pool.lease(timeout=1):
+        pass
+
+    with patch.object(glpi_service, "_make_authenticated_request", return_value=None):
+        glpi_service.close_session()
+
+    with glpi_service.session_pool.lease(timeout=1) as lease:
+        assert lease is not None
+        assert lease.token == sessions.opened[-1]
+    assert len(sessions.killed) == 1
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""Testes do store compartilhado de Session-Token e da renovação single-flight"""
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from services.glpi_service import GLPIService, SessionToken
+from services.glpi_token_store import InMemorySessionTokenStore, SessionTokenStore, is_record_valid
+
+
+def _record(token, ttl=3600):
+    now = time.time()
+    return {"session_token": token, "created_at": now, "expires_at": now + ttl}
+
+
+@pytest.fixture(params=["memory", "file", "redis"])
+def token_store(request):
+    """Cada implementação passa pelo mesmo contrato"""
+    if request.param == "memory":
+        return InMemorySessionTokenStore()
+    return request.getfixturevalue(f"{request.param}_token_store")
+
+
+@pytest.fixture(params=["file", "redis"])
+def shared_token_store(request):
+    """Stores que atravessam processos (workers)"""
+    return request.getfixturevalue(f"{request.param}_token_store")
+
+
+class TestSessionTokenStoreContract:
+    def test_interface_e_abstrata(self):
+        with pytest.raises(TypeError):
+            SessionTokenStore()
+
+    def test_load_sem_registro(self, token_store):
+        assert token_store.load() is None
+
+    def test_save_e_load(self, token_store):
+        record = _record("token-a")
+        token_store.save(record)
+
+        loaded = token_store.load()
+        assert loaded["session_token"] == "token-a"
+        assert is_record_valid(loaded)
+
+    def test_clear_sem_token_esperado_remove(self, token_store):
+        token_store.save(_record("token-a"))
+        token_store.clear()
+        assert token_store.load() is None
+
+    def test_clear_com_token_atual_remove(self, token_store):
+        token_store.save(_record("token-a"))
+        token_store.clear(expected_token="token-a")
+        assert token_store.load() is None
+
+    def test_clear_preserva_token_mais_novo(self, token_store):
+        token_store.save(_record("token-a"))
+        token_store.save(_record("token-b"))
+
+        # Worker atrasado descarta o token que o GLPI recusou (token-a)
+        token_store.clear(expected_token="token-a")
+
+        assert token_store.load()["session_token"] == "token-b"
+
+    def test_clear_concorrente_com_renovacao_preserva_token_novo(self, token_store):
+        """Outro worker grava o token novo entre a leitura e a remoção feitas pelo ``clear``"""
+        token_store.save(_record("token-a"))
+        original_load = token_store.load
+        renewals = []
+
+        def renew():
+            # Como em _ensure_authenticated: o token novo é gravado sob o lock de renovação
+            with token_store.refresh_lock(timeout=5) as acquired:
+                assert acquired
+                token_store.save(_record("token-b"))
+
+        def load_then_race():
+            record = original_load()
+            if not renewals:
+                renewal = threading.Thread(target=renew)
+                renewals.append(renewal)
+                renewal.start()
+                renewal.join(timeout=0.3)
+            return record
+
+        token_store.load = load_then_race
+        token_store.clear(expected_token="token-a")
+        token_store.load = original_load
+
+        if not renewals:
+            # Store em memória: clear atômico, sem leitura separada
+            renew()
+        for renewal in renewals:
+            renewal.join(timeout=5)
+
+        assert token_store.load()["session_token"] == "token-b"
+
+    def test_refresh_lock_exclusivo(self, token_store):
+        results = []
+
+        def try_lock():
+            with token_store.refresh_lock(timeout=0.1, blocking=False) as acquired:
+                results.append(acquired)
+
+        with token_store.refresh_lock(timeout=1) as acquired:
+            assert acquired
+            other = threading.Thread(target=try_lock)
+            other.start()
+            other.join(timeout=5)
+
+        try_lock()
+        assert results == [False, True]
+
+    def test_registro_expirado_invalido(self, token_store):
+        token_store.save(_record("token-a", ttl=-1))
+        assert not is_record_valid(token_store.load())
+
+
+class TestSingleFlightRefresh:
+    @staticmethod
+    def _worker(mock_glpi_config, store):
+        """GLPIService de um worker, ligado ao store compartilhado"""
+        with patch("services.glpi_service.active_config", return_value=mock_glpi_config):
+            service = GLPIService()
+        service.token_store = store
+        # Token local expirado
+        expired_at = time.time() - 10
+        service._set_token(SessionToken("token-expirado", expired_at - 3600, expired_at))
+        return service
+
+    @staticmethod
+    def _init_session_mock(latency=0.2):
+        """``requests.get`` do initSession: conta as chamadas e demora ``latency`` segundos"""
+        calls = []
+        lock = threading.Lock()
+
+        def init_session(url, **kwargs):
+            with lock:
+                calls.append(url)
+                number = len(calls)
+            time.sleep(latency)
+            response = Mock()
+            response.status_code = 200
+            response.json.return_value = {"session_token": f"token-{number}"}
+            return response
+
+        return init_session, calls
+
+    def test_duas_threads_com_token_expirado_abrem_uma_sessao(self, mock_glpi_config, shared_token_store):
+        shared_token_store.save(_record("token-expirado", ttl=-10))
+        workers = [self._worker(mock_glpi_config, shared_token_store) for _ in range(2)]
+        init_session, calls = self._init_session_mock()
+        barrier = threading.Barrier(len(workers))
+        results = []
+
+        def run(service):
+            barrier.wait()
+            results.append(service._ensure_authenticated())
+
+        with patch("services.glpi_service.requests.get", side_effect=init_session):
+            threads = [threading.Thread(target=run, args=(service,)) for service in workers]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=20)
+
+        assert results == [True, True]
+        assert len(calls) == 1
+        assert calls[0].endswith("/initSession")
+        assert {service.session_token for service in workers} == {"token-1"}
+        assert shared_token_store.load()["session_token"] == "token-1"
+
+    def test_worker_reutiliza_token_valido_do_store(self, mock_glpi_config, shared_token_store):
+        shared_token_store.save(_record("token-compartilhado"))
+        service = self._worker(mock_glpi_config, shared_token_store)
+        init_session, calls = self._init_session_mock(latency=0)
+
+        with patch("services.glpi_service.requests.get", side_effect=init_session):
+            assert service._ensure_authenticated()
+
+        assert calls == []
+        assert service.session_token == "token-compartilhado"
+
+    def test_token_recusado_nao_remove_token_renovado(self, mock_glpi_config, shared_token_store):
+        service = self._worker(mock_glpi_config, shared_token_store)
+        service._set_token(SessionToken("token-a", time.time(), time.time() + 3600))
+        shared_token_store.save(_record("token-b"))
+
+        # 401 para token-a depois que outro worker já gravou token-b
+        service._invalidate_session_token(expected_token="token-a")
+
+        assert shared_token_store.load()["session_token"] == "token-b"
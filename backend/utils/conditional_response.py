@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""Representações JSON com ETag forte e respostas condicionais (``If-None-Match`` -> 304).
+
+As rotas do dashboard guardam aqui o corpo já serializado de cada resposta
+bem-sucedida, por endpoint e parâmetros. O ETag vem do hash do conteúdo sem os
+campos voláteis (``VOLATILE_FIELDS``): quando a rota recalcula e o conteúdo não
+mudou, a representação anterior é reaproveitada, com os mesmos bytes e o mesmo
+ETag. Um cliente que revalida com o ETag recebe 304 sem que o payload seja
+recalculado nem serializado de novo.
+
+Os campos de cada resposta (``RESPONSE_FIELDS``) não fazem parte do corpo
+guardado: as rotas os enviam nos headers ``X-Correlation-ID`` e ``X-Cache``.
+Assim o corpo de um ETag é sempre o mesmo, byte a byte, e o ETag é forte.
+
+Respostas parciais (prazo estourado) e degradadas não são guardadas.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, NamedTuple, Optional
+
+from config.performance import ETAG_CONFIG
+
+# Campos que mudam a cada cálculo sem que os dados mudem
+VOLATILE_FIELDS = frozenset(
+    {"timestamp", "tempo_execucao", "response_time", "response_time_ms", "correlation_id", "cached"}
+)
+
+# Campos da resposta, não da representação: vão nos headers de cada envio
+RESPONSE_FIELDS = ("correlation_id", "cached")
+
+
+def _stable(value: Any) -> Any:
+    """Cópia sem os campos voláteis, para comparar conteúdo entre cálculos"""
+    if isinstance(value, dict):
+        return {key: _stable(item) for key, item in value.items() if key not in VOLATILE_FIELDS}
+    if isinstance(value, list):
+        return [_stable(item) for item in value]
+    return value
+
+
+def fingerprint(data: Any) -> str:
+    """Hash do conteúdo de ``data``, estável entre cálculos com os mesmos dados"""
+    encoded = json.dumps(_stable(data), sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """``If-None-Match`` contém o ETag (ou é ``*``)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(candidate.strip() == etag for candidate in if_none_match.split(","))
+
+
+class Representation(NamedTuple):
+    etag: str
+    body: bytes
+    expires: float
+
+
+class RepresentationCache:
+    """Corpos JSON serializados e ETags por endpoint e parâmetros (LRU)"""
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        max_entries: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.ttls = dict(ttls or ETAG_CONFIG.get("TTLS", {}))
+        self.default_ttl = ETAG_CONFIG.get("DEFAULT_TTL", 120)
+        self.max_entries = max_entries or ETAG_CONFIG.get("MAX_ENTRIES", 500)
+        self.enabled = ETAG_CONFIG.get("ENABLED", True) if enabled is None else enabled
+        self._entries: "OrderedDict[str, Representation]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "reused": 0, "not_modified": 0}
+
+    @staticmethod
+    def key(endpoint: str, args: Mapping[str, Any]) -> str:
+        params = "&".join(f"{k}={v}" for k, v in sorted(args.items()))
+        return f"{endpoint}?{params}"
+
+    def lookup(self, endpoint: str, args: Mapping[str, Any]) -> Optional[Representation]:
+        """Representação ainda válida para a requisição, ou None"""
+        if not self.enabled:
+            return None
+        key = self.key(endpoint, args)
+        with self._lock:
+            representation = self._entries.get(key)
+            if representation is None or representation.expires <= time.time():
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return representation
+
+    def store(self, endpoint: str, args: Mapping[str, Any], payload: Dict[str, Any]) -> Optional[Representation]:
+        """Guarda a resposta completa ``payload`` e devolve sua representação
+
+        Returns:
+            None se desabilitado ou se o payload é parcial/degradado (não cacheável)
+        """
+        if not self.enabled or payload.get("partial") or payload.get("degraded"):
+            return None
+
+        etag = f'"{fingerprint(payload)}"'
+        expires = time.time() + self.ttls.get(endpoint, self.default_ttl)
+        key = self.key(endpoint, args)
+        with self._lock:
+            previous = self._entries.get(key)
+        if previous is not None and previous.etag == etag:
+            # Mesmo conteúdo: mantém os bytes já enviados (ETag forte = corpo idêntico)
+            representation = previous._replace(expires=expires)
+            reused = True
+        else:
+            stored = {field: value for field, value in payload.items() if field not in RESPONSE_FIELDS}
+            body = json.dumps(stored, ensure_ascii=False, default=str, separators=(",", ":")).encode("utf-8")
+            representation = Representation(etag, body, expires)
+            reused = False
+
+        with self._lock:
+            self._entries[key] = representation
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._stats["stores"] += 1
+            if reused:
+                self._stats["reused"] += 1
+        return representation
+
+    def record_not_modified(self) -> None:
+        with self._lock:
+            self._stats["not_modified"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"enabled": self.enabled, "entries": len(self._entries), **self._stats}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Representações compartilhadas pelas rotas Flask e ASGI
+representation_cache = RepresentationCache()
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""Deadlines de ponta a ponta para requisições da API.
+
+A rota define um prazo total para a requisição; o prazo é guardado em uma
+ContextVar e consultado pelo transporte GLPI (timeouts, retries, fila do
+limitador), pela paginação e pelos pools de threads. Quando o prazo acaba o
+trabalho restante é interrompido e o chamador recebe um resultado parcial ou o
+último payload válido.
+"""
+
+import contextvars
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+from config.performance import PERFORMANCE_CONFIG
+
+logger = logging.getLogger("deadline")
+
+
+class Deadline:
+    """Prazo absoluto (relógio monotônico) de uma requisição"""
+
+    def __init__(self, budget_seconds: float, name: str = ""):
+        """Inicializa o prazo
+
+        Args:
+            budget_seconds: Tempo total disponível em segundos
+            name: Identificação da requisição (ex.: endpoint), usada em log
+        """
+        self.name = name
+        self.budget = budget_seconds
+        self.expires_at = time.monotonic() + budget_seconds
+        self.exceeded = False
+        self.cut_points = []
+
+    def remaining(self) -> float:
+        """Segundos restantes (nunca negativo)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Indica se o prazo acabou"""
+        return time.monotonic() >= self.expires_at
+
+    def clamp(self, timeout: Optional[float]) -> float:
+        """Limita um timeout ao tempo restante do prazo"""
+        remaining = self.remaining()
+        if timeout is None:
+            return remaining
+        return min(timeout, remaining)
+
+    def mark_exceeded(self, where: str) -> None:
+        """Registra que um trecho de trabalho foi interrompido pelo prazo"""
+        if not self.exceeded:
+            logger.warning(
+                f"Deadline de {self.budget:.1f}s esgotado em '{where}' ({self.name or 'requisição'})"
+            )
+        self.exceeded = True
+        if where not in self.cut_points:
+            self.cut_points.append(where)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Resumo do prazo para inclusão em respostas e logs"""
+        return {
+            "budget_seconds": self.budget,
+            "remaining_seconds": round(self.remaining(), 3),
+            "exceeded": self.exceeded,
+            "cut_points": list(self.cut_points),
+        }
+
+
+_deadline_var: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar(
+    "request_deadline", default=None
+)
+
+
+def budget_for_endpoint(endpoint: Optional[str]) -> float:
+    """Prazo configurado para o endpoint (segundos)
+
+    Usa ``PERFORMANCE_CONFIG["ENDPOINT_DEADLINES"]`` e, na ausência de um valor
+    específico, ``DEFAULT_REQUEST_DEADLINE``.
+    """
+    deadlines = PERFORMANCE_CONFIG.get("ENDPOINT_DEADLINES", {})
+    name = (endpoint or "").split(".")[-1]
+    return float(deadlines.get(name, PERFORMANCE_CONFIG.get("DEFAULT_REQUEST_DEADLINE", 15)))
+
+
+def start_deadline(budget_seconds: float, name: str = "") -> Deadline:
+    """Define o prazo da requisição no contexto atual"""
+    deadline = Deadline(budget_seconds, name)
+    _deadline_var.set(deadline)
+    return deadline
+
+
+def clear_deadline() -> None:
+    """Remove o prazo do contexto atual"""
+    _deadline_var.set(None)
+
+
+def get_deadline() -> Optional[Deadline]:
+    """Prazo ativo no contexto atual, ou None fora de uma requisição"""
+    return _deadline_var.get()
+
+
+def deadline_expired(where: Optional[str] = None) -> bool:
+    """Indica se o prazo do contexto atual acabou
+
+    Args:
+        where: Se informado e o prazo tiver acabado, registra o ponto de corte
+    """
+    deadline = _deadline_var.get()
+    if deadline is None or not deadline.expired():
+        return False
+    if where:
+        deadline.mark_exceeded(where)
+    return True
+
+
+def deadline_exceeded() -> bool:
+    """Indica se algum trabalho da requisição atual foi interrompido pelo prazo"""
+    deadline = _deadline_var.get()
+    return bool(deadline and deadline.exceeded)
+
+
+def remaining_time(default: Optional[float] = None) -> Optional[float]:
+    """Tempo restante do prazo atual, ou ``default`` se não houver prazo"""
+    deadline = _deadline_var.get()
+    return default if deadline is None else deadline.remaining()
+
+
+def with_current_context(func: Callable) -> Callable:
+    """Envolve ``func`` para executar em uma cópia do contexto atual
+
+    Usado ao submeter tarefas a pools de threads para que o prazo (e demais
+    ContextVars, como o correlation_id) acompanhem a tarefa. Cada submissão
+    deve usar seu próprio wrapper, pois um contexto não pode ser executado em
+    duas threads ao mesmo tempo.
+    """
+    context = contextvars.copy_context()
+
+    def runner(*args, **kwargs):
+        return context.run(func, *args, **kwargs)
+
+    return runner
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""Pools de threads compartilhados pelo processo para o código de fan-out.
+
+Cada chamada de fan-out criava (e destruía) o próprio ``ThreadPoolExecutor``,
+e tarefas que também faziam fan-out criavam pools aninhados. O serviço mantém
+um pool nomeado e limitado por tipo de trabalho (``EXECUTOR_CONFIG["POOLS"]``):
+
+- ``glpi_requests``: requisições individuais ao GLPI (contagens, páginas);
+- ``aggregations``: tarefas que disparam outras (ex.: uma janela de tendência
+  que faz suas próprias contagens).
+
+Cada pool tem no máximo ``MAX_WORKERS`` tarefas em execução e ``MAX_QUEUE`` na
+fila. Com a fila cheia a tarefa roda na thread de quem submeteu (caller-runs),
+o que freia o produtor em vez de acumular trabalho; uma tarefa submetida de
+dentro de uma thread do mesmo pool também roda na própria thread, evitando o
+deadlock de um pool esperando por si mesmo. Toda tarefa roda em uma cópia do
+contexto de quem a submeteu, então prazo, orçamento de retry e correlation_id
+acompanham a tarefa.
+"""
+
+import atexit
+import concurrent.futures
+import contextvars
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from config.performance import EXECUTOR_CONFIG
+
+logger = logging.getLogger("executor_service")
+
+# Pool da thread atual (definido pelo initializer de cada pool)
+_thread_pool = threading.local()
+
+
+def _completed_future(context: contextvars.Context, fn: Callable, *args, **kwargs) -> concurrent.futures.Future:
+    """Executa ``fn`` na thread atual e devolve um Future já resolvido"""
+    future: concurrent.futures.Future = concurrent.futures.Future()
+    try:
+        future.set_result(context.run(fn, *args, **kwargs))
+    except BaseException as e:  # O Future repassa a exceção a quem chamar result()
+        future.set_exception(e)
+    return future
+
+
+class BoundedExecutor:
+    """Pool nomeado com fila limitada, propagação de contexto e métricas de saturação"""
+
+    def __init__(self, name: str, max_workers: int = 4, max_queue: int = 16):
+        """Inicializa o pool (as threads são criadas sob demanda)
+
+        Args:
+            name: Nome do pool (métricas e nome das threads)
+            max_workers: Tarefas em execução simultânea
+            max_queue: Tarefas aguardando na fila antes do caller-runs
+        """
+        self.name = name
+        self.max_workers = max(1, int(max_workers))
+        self.max_queue = max(0, int(max_queue))
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=f"pool-{name}",
+            initializer=self._mark_worker_thread,
+        )
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queue)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._closed = False
+        self._in_flight = 0
+        self._active = 0
+        self._peak_in_flight = 0
+        self._queue_wait_total = 0.0
+        self._queue_wait_max = 0.0
+        self._counters = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "caller_runs": 0,
+            "inline": 0,
+        }
+
+    def _mark_worker_thread(self) -> None:
+        _thread_pool.name = self.name
+
+    def in_worker_thread(self) -> bool:
+        """Indica se a thread atual é uma thread deste pool"""
+        return getattr(_thread_pool, "name", None) == self.name
+
+    def submit(self, fn: Callable, *args, **kwargs) -> concurrent.futures.Future:
+        """Submete ``fn`` ao pool, executando-a em uma cópia do contexto atual
+
+        Com a fila cheia, a partir de uma thread do próprio pool ou após o
+        desligamento, ``fn`` roda na thread atual e o Future volta resolvido.
+        """
+        context = contextvars.copy_context()
+
+        if self.in_worker_thread():
+            self._count("inline")
+            return _completed_future(context, fn, *args, **kwargs)
+
+        if self._closed or not self._slots.acquire(blocking=False):
+            self._count("caller_runs")
+            return _completed_future(context, fn, *args, **kwargs)
+
+        enqueued_at = time.monotonic()
+        with self._lock:
+            self._counters["submitted"] += 1
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+        def task():
+            waited = time.monotonic() - enqueued_at
+            with self._lock:
+                self._active += 1
+                self._queue_wait_total += waited
+                self._queue_wait_max = max(self._queue_wait_max, waited)
+            failed = False
+            try:
+                return context.run(fn, *args, **kwargs)
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                self._slots.release()
+                with self._lock:
+                    self._active -= 1
+                    self._in_flight -= 1
+                    self._counters["failed" if failed else "completed"] += 1
+                    if self._in_flight == 0:
+                        self._idle.notify_all()
+
+        try:
+            return self._executor.submit(task)
+        except RuntimeError:
+            # Pool desligado entre a verificação e a submissão
+            self._slots.release()
+            with self._lock:
+                self._in_flight -= 1
+                self._counters["submitted"] -= 1
+            self._count("caller_runs")
+            return _completed_future(context, fn, *args, **kwargs)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def shutdown(self, timeout: Optional[float] = None) -> bool:
+        """Para de aceitar tarefas e espera as pendentes por até ``timeout`` segundos
+
+        Returns:
+            True se todas as tarefas terminaram dentro do prazo
+        """
+        with self._lock:
+            self._closed = True
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while self._in_flight > 0:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._idle.wait(remaining)
+            finished = self._in_flight == 0
+        self._executor.shutdown(wait=finished)
+        if not finished:
+            logger.warning(f"Pool '{self.name}' desligado com {self._in_flight} tarefa(s) pendente(s)")
+        return finished
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Ocupação atual e contadores do pool"""
+        with self._lock:
+            started = self._counters["completed"] + self._counters["failed"] + self._active
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "active": self._active,
+                "queued": self._in_flight - self._active,
+                "utilization": round(self._active / self.max_workers, 2),
+                "peak_in_flight": self._peak_in_flight,
+                "saturated": self._in_flight >= self.max_workers + self.max_queue,
+                "avg_queue_wait_ms": round(self._queue_wait_total / started * 1000, 2) if started else 0.0,
+                "max_queue_wait_ms": round(self._queue_wait_max * 1000, 2),
+                "closed": self._closed,
+                **self._counters,
+            }
+
+
+class ExecutorService:
+    """Registro dos pools nomeados do processo"""
+
+    def __init__(
+        self,
+        pools: Optional[Dict[str, Dict[str, int]]] = None,
+        default_max_workers: int = 4,
+        default_max_queue: int = 16,
+    ):
+        """Inicializa o serviço (os pools são criados no primeiro uso)
+
+        Args:
+            pools: Tamanhos por nome de pool (``{"MAX_WORKERS", "MAX_QUEUE"}``)
+            default_max_workers: Tarefas simultâneas de um pool não configurado
+            default_max_queue: Fila de um pool não configurado
+        """
+        self._config = dict(pools or {})
+        self.default_max_workers = default_max_workers
+        self.default_max_queue = default_max_queue
+        self._pools: Dict[str, BoundedExecutor] = {}
+        self._lock = threading.Lock()
+
+    def pool(self, name: str) -> BoundedExecutor:
+        """Pool ``name`` (criado com o tamanho configurado no primeiro uso)"""
+        pool = self._pools.get(name)
+        if pool is not None:
+            return pool
+        with self._lock:
+            pool = self._pools.get(name)
+            if pool is None:
+                config = self._config.get(name, {})
+                pool = BoundedExecutor(
+                    name,
+                    max_workers=config.get("MAX_WORKERS", self.default_max_workers),
+                    max_queue=config.get("MAX_QUEUE", self.default_max_queue),
+                )
+                self._pools[name] = pool
+            return pool
+
+    def submit(self, pool_name: str, fn: Callable, *args, **kwargs) -> concurrent.futures.Future:
+        """Atalho para ``pool(pool_name).submit(fn, ...)``"""
+        return self.pool(pool_name).submit(fn, *args, **kwargs)
+
+    def shutdown(self, timeout: Optional[float] = None) -> bool:
+        """Desliga todos os pools, dividindo ``timeout`` entre eles"""
+        with self._lock:
+            pools = list(self._pools.values())
+        deadline = None if timeout is None else time.monotonic() + timeout
+        finished = True
+        for pool in pools:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            finished = pool.shutdown(remaining) and finished
+        return finished
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Métricas de cada pool"""
+        with self._lock:
+            pools = dict(self._pools)
+        return {name: pool.get_stats() for name, pool in sorted(pools.items())}
+
+
+# Pools globais, compartilhados por todo o código de fan-out do processo
+executor_service = ExecutorService(
+    EXECUTOR_CONFIG.get("POOLS"),
+    default_max_workers=EXECUTOR_CONFIG.get("DEFAULT_MAX_WORKERS", 4),
+    default_max_queue=EXECUTOR_CONFIG.get("DEFAULT_MAX_QUEUE", 16),
+)
+atexit.register(executor_service.shutdown, EXECUTOR_CONFIG.get("SHUTDOWN_TIMEOUT", 10))
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""Quantis de latência em janelas deslizantes, com custo O(1) por amostra.
+
+- ``DDSketch``: histograma com buckets logarítmicos (erro relativo
+  ``RELATIVE_ACCURACY`` em qualquer quantil), mesclável;
+- ``SlidingWindowSketch``: anel de sketches de ``SLOT_SECONDS`` segundos que
+  cobre a maior janela de ``LATENCY_CONFIG["WINDOWS"]``; uma amostra só toca o
+  slot corrente e as janelas são montadas mesclando os slots na consulta;
+- ``latency_recorder``: uma série por endpoint da API (``"endpoints"``) e por
+  família de consulta ao GLPI (``"upstream"``, ver ``query_family``).
+"""
+
+import math
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from config.performance import LATENCY_CONFIG
+
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class DDSketch:
+    """Sketch de quantis com erro relativo limitado (buckets em progressão geométrica)"""
+
+    __slots__ = (
+        "relative_accuracy",
+        "gamma",
+        "_log_gamma",
+        "min_value",
+        "bins",
+        "zero_count",
+        "count",
+        "sum",
+        "max",
+    )
+
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-6):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.min_value = min_value
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        if value > self.min_value:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self.bins[index] = self.bins.get(index, 0) + 1
+        else:
+            self.zero_count += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "DDSketch") -> None:
+        """Soma as amostras de ``other`` (mesma precisão) a este sketch"""
+        for index, count in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        if other.max > self.max:
+            self.max = other.max
+
+    def copy(self) -> "DDSketch":
+        clone = DDSketch(self.relative_accuracy, self.min_value)
+        clone.bins = dict(self.bins)
+        clone.zero_count = self.zero_count
+        clone.count = self.count
+        clone.sum = self.sum
+        clone.max = self.max
+        return clone
+
+    def clear(self) -> None:
+        self.bins.clear()
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def quantile(self, q: float) -> float:
+        """Valor do quantil ``q`` (0 a 1); 0.0 sem amostras"""
+        if not self.count:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if seen > rank:
+                # Ponto do bucket com erro relativo de no máximo relative_accuracy
+                return min(2 * self.gamma**index / (self.gamma + 1), self.max)
+        return self.max
+
+    def quantiles(self, qs: Iterable[float]) -> List[float]:
+        """Vários quantis numa única passada pelos buckets ordenados"""
+        qs = list(qs)
+        if not self.count:
+            return [0.0] * len(qs)
+        ranks = sorted((q * (self.count - 1), position) for position, q in enumerate(qs))
+        results = [self.max] * len(qs)
+        pending = 0
+        seen = self.zero_count
+        while pending < len(ranks) and seen > ranks[pending][0]:
+            results[ranks[pending][1]] = 0.0
+            pending += 1
+        if pending == len(ranks):
+            return results
+        bins = self.bins
+        for index in sorted(bins):
+            seen += bins[index]
+            if seen <= ranks[pending][0]:
+                continue
+            value = min(2 * self.gamma**index / (self.gamma + 1), self.max)
+            while pending < len(ranks) and seen > ranks[pending][0]:
+                results[ranks[pending][1]] = value
+                pending += 1
+            if pending == len(ranks):
+                break
+        return results
+
+
+class _Slot:
+    __slots__ = ("epoch", "sketch")
+
+    def __init__(self, relative_accuracy: float):
+        self.epoch = -1
+        self.sketch = DDSketch(relative_accuracy)
+
+
+class SlidingWindowSketch:
+    """Latências das últimas janelas de tempo, num anel de sketches por intervalo"""
+
+    def __init__(
+        self,
+        max_window: Optional[float] = None,
+        slot_seconds: Optional[float] = None,
+        relative_accuracy: Optional[float] = None,
+    ):
+        self.slot_seconds = float(slot_seconds or LATENCY_CONFIG.get("SLOT_SECONDS", 10))
+        max_window = max_window or max(LATENCY_CONFIG.get("WINDOWS", {"5m": 300}).values())
+        self.relative_accuracy = relative_accuracy or LATENCY_CONFIG.get("RELATIVE_ACCURACY", 0.01)
+        self._slots = [_Slot(self.relative_accuracy) for _ in range(math.ceil(max_window / self.slot_seconds))]
+        self._lock = threading.Lock()
+        # Janela (segundos) -> (slot corrente, slots já encerrados mesclados)
+        self._closed: Dict[float, Tuple[int, DDSketch]] = {}
+        self.total = 0
+
+    def add(self, seconds: float, now: Optional[float] = None) -> None:
+        epoch = int((time.monotonic() if now is None else now) // self.slot_seconds)
+        slot = self._slots[epoch % len(self._slots)]
+        with self._lock:
+            if slot.epoch != epoch:
+                slot.epoch = epoch
+                slot.sketch.clear()
+            slot.sketch.add(seconds)
+            self.total += 1
+
+    def window(self, seconds: float, now: Optional[float] = None) -> DDSketch:
+        """Sketch com as amostras dos últimos ``seconds`` segundos (arredondados para slots)"""
+        epoch = int((time.monotonic() if now is None else now) // self.slot_seconds)
+        oldest = epoch - min(len(self._slots), max(1, math.ceil(seconds / self.slot_seconds))) + 1
+        with self._lock:
+            # Slots encerrados não mudam mais: a mescla deles é refeita só quando o slot corrente vira
+            cached = self._closed.get(seconds)
+            if cached is None or cached[0] != epoch:
+                closed = DDSketch(self.relative_accuracy)
+                for slot in self._slots:
+                    if oldest <= slot.epoch < epoch:
+                        closed.merge(slot.sketch)
+                cached = (epoch, closed)
+                self._closed[seconds] = cached
+            merged = cached[1].copy()
+            current = self._slots[epoch % len(self._slots)]
+            if current.epoch == epoch:
+                merged.merge(current.sketch)
+        return merged
+
+    def summary(self, seconds: float, now: Optional[float] = None) -> Dict[str, Any]:
+        """Contagem, média, p50/p95/p99 e máximo da janela, em milissegundos"""
+        sketch = self.window(seconds, now)
+        p50, p95, p99 = sketch.quantiles(DEFAULT_QUANTILES)
+        return {
+            "count": sketch.count,
+            "mean_ms": round(sketch.sum / sketch.count * 1000, 2) if sketch.count else 0.0,
+            "p50_ms": round(p50 * 1000, 2),
+            "p95_ms": round(p95 * 1000, 2),
+            "p99_ms": round(p99 * 1000, 2),
+            "max_ms": round(sketch.max * 1000, 2),
+        }
+
+
+class LatencyRecorder:
+    """Séries de latência por grupo (``"endpoints"``, ``"upstream"``) e nome"""
+
+    OVERFLOW_SERIES = "other"
+
+    def __init__(self, windows: Optional[Dict[str, float]] = None, max_series: Optional[int] = None):
+        self.windows = dict(windows or LATENCY_CONFIG.get("WINDOWS", {"5m": 300}))
+        self.max_series = max_series or LATENCY_CONFIG.get("MAX_SERIES", 100)
+        self.relative_accuracy = LATENCY_CONFIG.get("RELATIVE_ACCURACY", 0.01)
+        self._groups: Dict[str, Dict[str, SlidingWindowSketch]] = {}
+        self._lock = threading.Lock()
+
+    def _series(self, group: str, name: str) -> SlidingWindowSketch:
+        series = self._groups.get(group, {}).get(name)
+        if series is not None:
+            return series
+        with self._lock:
+            members = self._groups.setdefault(group, {})
+            if name not in members and len(members) >= self.max_series:
+                # Cardinalidade limitada: nomes novos além do teto vão para uma série comum
+                name = self.OVERFLOW_SERIES
+            if name not in members:
+                members[name] = SlidingWindowSketch(max(self.windows.values()), relative_accuracy=self.relative_accuracy)
+            return members[name]
+
+    def record(self, group: str, name: str, seconds: float) -> None:
+        """Registra uma latência (segundos); ignora valores inválidos"""
+        if not isinstance(seconds, (int, float)) or seconds < 0:
+            return
+        self._series(group, name or "unknown").add(seconds)
+
+    def summary(self, group: str, name: str, window: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Resumo de uma série numa janela (``LATENCY_CONFIG["DEFAULT_WINDOW"]`` por padrão)"""
+        series = self._groups.get(group, {}).get(name)
+        if series is None:
+            return None
+        window = window or LATENCY_CONFIG.get("DEFAULT_WINDOW", "5m")
+        return series.summary(self.windows[window])
+
+    def get_stats(self, group: Optional[str] = None) -> Dict[str, Any]:
+        """p50/p95/p99 de todas as séries (ou de um grupo) em cada janela configurada"""
+        with self._lock:
+            groups = {
+                name: dict(members)
+                for name, members in self._groups.items()
+                if group is None or name == group
+            }
+        return {
+            name: {
+                series_name: {
+                    "total": series.total,
+                    "windows": {label: series.summary(seconds) for label, seconds in self.windows.items()},
+                }
+                for series_name, series in sorted(members.items())
+            }
+            for name, members in sorted(groups.items())
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._groups.clear()
+
+
+# Séries globais, compartilhadas pelas rotas Flask/ASGI e pelos clientes do GLPI
+latency_recorder = LatencyRecorder()
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""Logging de baixo custo para os caminhos quentes (por requisição e por página).
+
+- ``get_logger(name)``: mesmo uso de ``logging.getLogger``, mas o nível é
+  conferido antes de qualquer trabalho e a mensagem só é formatada se o
+  registro for emitido (``logger.info("Total %s", total)``; ``lazy(fn)`` adia
+  argumentos caros);
+- ``sample="<evento>"``: eventos de alto volume abaixo de WARNING são
+  amostrados pela fração de ``LOGGING_CONFIG["SAMPLE_RATES"]`` (o registro
+  leva ``sample_rate`` para que agregadores possam extrapolar);
+- ``enable_queue_logging()``: cada handler configurado passa a ficar atrás de
+  um ``QueueHandler`` e um único ``QueueListener`` faz a formatação e o I/O
+  fora da thread da requisição. O contexto (correlation_id, operação) viaja
+  com o registro.
+"""
+
+import atexit
+import contextvars
+import copy
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config.performance import LOGGING_CONFIG
+
+
+class lazy:
+    """Argumento de log calculado só quando a mensagem é formatada"""
+
+    __slots__ = ("fn",)
+
+    def __init__(self, fn: Callable[[], Any]):
+        self.fn = fn
+
+    def __str__(self) -> str:
+        return str(self.fn())
+
+    def __repr__(self) -> str:
+        return repr(self.fn())
+
+
+class LogSampler:
+    """Amostragem determinística por evento: 1 a cada ``round(1 / taxa)`` registros"""
+
+    def __init__(self, rates: Optional[Dict[str, float]] = None):
+        self.rates = dict(rates or {})
+        self._seen: Dict[str, int] = {}
+        self._emitted: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def rate(self, event: str) -> float:
+        return float(self.rates.get(event, 1.0))
+
+    def should_log(self, event: str) -> bool:
+        rate = self.rate(event)
+        if rate >= 1.0:
+            return True
+        with self._lock:
+            seen = self._seen.get(event, 0)
+            self._seen[event] = seen + 1
+            if rate <= 0.0 or seen % max(1, round(1 / rate)):
+                return False
+            self._emitted[event] = self._emitted.get(event, 0) + 1
+            return True
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                event: {"rate": self.rate(event), "seen": seen, "emitted": self._emitted.get(event, 0)}
+                for event, seen in self._seen.items()
+            }
+
+
+log_sampler = LogSampler(LOGGING_CONFIG.get("SAMPLE_RATES"))
+
+
+class FastLogger:
+    """Fachada sobre ``logging.Logger`` com verificação de nível e amostragem"""
+
+    __slots__ = ("_logger",)
+
+    def __init__(self, name: str):
+        self._logger = logging.getLogger(name)
+
+    def _log(self, level: int, msg: str, args: Tuple, sample: Optional[str], kwargs: Dict[str, Any]) -> None:
+        if not self._logger.isEnabledFor(level):
+            return
+        if sample is not None and level < logging.WARNING:
+            if not log_sampler.should_log(sample):
+                return
+            kwargs["extra"] = {**(kwargs.get("extra") or {}), "sample_rate": log_sampler.rate(sample)}
+        # funcName/lineno do chamador, não da fachada
+        kwargs.setdefault("stacklevel", 3)
+        self._logger.log(level, msg, *args, **kwargs)
+
+    def debug(self, msg: str, *args, sample: Optional[str] = None, **kwargs) -> None:
+        self._log(logging.DEBUG, msg, args, sample, kwargs)
+
+    def info(self, msg: str, *args, sample: Optional[str] = None, **kwargs) -> None:
+        self._log(logging.INFO, msg, args, sample, kwargs)
+
+    def warning(self, msg: str, *args, sample: Optional[str] = None, **kwargs) -> None:
+        self._log(logging.WARNING, msg, args, sample, kwargs)
+
+    def error(self, msg: str, *args, sample: Optional[str] = None, **kwargs) -> None:
+        self._log(logging.ERROR, msg, args, sample, kwargs)
+
+    def exception(self, msg: str, *args, sample: Optional[str] = None, **kwargs) -> None:
+        kwargs.setdefault("exc_info", True)
+        self._log(logging.ERROR, msg, args, sample, kwargs)
+
+    def critical(self, msg: str, *args, sample: Optional[str] = None, **kwargs) -> None:
+        self._log(logging.CRITICAL, msg, args, sample, kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # isEnabledFor, setLevel, handlers... do logger subjacente
+        return getattr(self._logger, name)
+
+
+def get_logger(name: str) -> FastLogger:
+    """Logger da fachada para ``name``"""
+    return FastLogger(name)
+
+
+# ----------------------------------------------------------------------
+# I/O fora da thread da requisição
+# ----------------------------------------------------------------------
+
+
+class _TargetQueueHandler(QueueHandler):
+    """Coloca na fila os registros destinados a um handler configurado"""
+
+    def __init__(self, log_queue: queue.Queue, target: logging.Handler):
+        super().__init__(log_queue)
+        self.target = target
+        self.setLevel(target.level)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Só a interpolação é feita aqui (os argumentos podem mudar depois);
+        # formatação e exceção ficam para o listener
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record._log_target = self.target
+        record._log_context = contextvars.copy_context()
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _queue_state.dropped += 1
+
+
+class _DispatchHandler(logging.Handler):
+    """Entrega, na thread do listener, cada registro ao handler de destino"""
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        target = record.__dict__.pop("_log_target", None)
+        context = record.__dict__.pop("_log_context", None)
+        if target is None:
+            return False
+        if context is not None:
+            context.run(target.handle, record)
+        else:
+            target.handle(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        pass
+
+
+class _BlockingSentinelListener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # Com a fila cheia, espera espaço em vez de falhar no desligamento
+        self.queue.put(self._sentinel)
+
+
+class _QueueState:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.queue: Optional[queue.Queue] = None
+        self.listener: Optional[QueueListener] = None
+        self.wrapped: List[Tuple[logging.Logger, _TargetQueueHandler]] = []
+        self.dropped = 0
+
+
+_queue_state = _QueueState()
+
+
+def _all_loggers() -> List[logging.Logger]:
+    loggers = [logging.getLogger()]
+    loggers.extend(
+        logger for logger in list(logging.Logger.manager.loggerDict.values()) if isinstance(logger, logging.Logger)
+    )
+    return loggers
+
+
+def enable_queue_logging(queue_size: Optional[int] = None) -> int:
+    """Põe os handlers existentes atrás de ``QueueHandler`` + ``QueueListener``
+
+    Idempotente: chamadas seguintes (ex.: após um novo ``dictConfig``) só
+    envolvem os handlers novos. Handlers adicionados depois disso continuam
+    síncronos até a próxima chamada.
+
+    Returns:
+        Número de handlers envolvidos nesta chamada
+    """
+    state = _queue_state
+    with state.lock:
+        if state.listener is None:
+            size = queue_size if queue_size is not None else LOGGING_CONFIG.get("QUEUE_SIZE", 10000)
+            state.queue = queue.Queue(maxsize=size)
+            state.listener = _BlockingSentinelListener(state.queue, _DispatchHandler())
+            state.listener.start()
+
+        wrapped = 0
+        for logger in _all_loggers():
+            for handler in list(logger.handlers):
+                if isinstance(handler, _TargetQueueHandler):
+                    continue
+                proxy = _TargetQueueHandler(state.queue, handler)
+                logger.removeHandler(handler)
+                logger.addHandler(proxy)
+                state.wrapped.append((logger, proxy))
+                wrapped += 1
+        return wrapped
+
+
+def disable_queue_logging() -> None:
+    """Esvazia a fila, para o listener e devolve os handlers originais aos loggers"""
+    state = _queue_state
+    with state.lock:
+        if state.listener is None:
+            return
+        state.listener.stop()
+        for logger, proxy in state.wrapped:
+            if proxy in logger.handlers:
+                logger.removeHandler(proxy)
+                logger.addHandler(proxy.target)
+        state.wrapped.clear()
+        state.listener = None
+        state.queue = None
+
+
+def get_logging_stats() -> Dict[str, Any]:
+    """Estado da fila de logging e contadores da amostragem"""
+    state = _queue_state
+    log_queue = state.queue
+    return {
+        "queue_enabled": state.listener is not None,
+        "queued": log_queue.qsize() if log_queue is not None else 0,
+        "queue_size": log_queue.maxsize if log_queue is not None else 0,
+        "dropped": state.dropped,
+        "sampling": log_sampler.get_stats(),
+    }
+
+
+atexit.register(disable_queue_logging)
@@ -8,40 +8,45 @@ import hashlib
 import logging
 import time
 from functools import wraps
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Mapping, Optional
 
 from flask import g, request
 
+from config.performance import LATENCY_CONFIG
 from config.settings import active_config
 
 # Import consolidated cache system
 from services.simple_dict_cache import simple_cache
+from utils.latency_sketch import SlidingWindowSketch, latency_recorder
 
 logger = logging.getLogger("performance")
 
 
 class PerformanceMonitor:
-    """Monitor de performance para rastreamento de métricas"""
+    """Monitor de performance para rastreamento de métricas
+
+    Os tempos de resposta ficam num sketch de janela deslizante (custo O(1) por
+    requisição); com ``endpoint`` a amostra também entra na série do endpoint
+    em ``latency_recorder``.
+    """
 
     def __init__(self):
-        self.request_times: List[float] = []
+        self.request_latency = SlidingWindowSketch()
         self.cache_hits = 0
         self.cache_misses = 0
         self.total_requests = 0
 
-    def record_request_time(self, duration: float):
+    def record_request_time(self, duration: float, endpoint: Optional[str] = None):
         """Registra tempo de uma requisição"""
         try:
             if not isinstance(duration, (int, float)) or duration < 0:
                 logger.warning(f"Duração inválida ignorada: {duration}")
                 return
 
-            self.request_times.append(duration)
+            self.request_latency.add(duration)
             self.total_requests += 1
-
-            # Mantém apenas os últimos 1000 registros
-            if len(self.request_times) > 1000:
-                self.request_times = self.request_times[-1000:]
+            if endpoint:
+                latency_recorder.record("endpoints", endpoint, duration)
 
         except Exception as e:
             logger.error(f"Erro ao registrar tempo de requisição: {e}")
@@ -54,26 +59,24 @@ class PerformanceMonitor:
         """Registra um cache miss"""
         self.cache_misses += 1
 
+    def _window(self):
+        window = LATENCY_CONFIG.get("DEFAULT_WINDOW", "5m")
+        return self.request_latency.window(latency_recorder.windows[window])
+
     def get_p95_response_time(self) -> float:
-        """Calcula o P95 dos tempos de resposta"""
+        """Calcula o P95 dos tempos de resposta na janela padrão"""
         try:
-            if not self.request_times:
-                return 0.0
-
-            sorted_times = sorted(self.request_times)
-            p95_index = int(len(sorted_times) * 0.95)
-            return sorted_times[p95_index] if p95_index < len(sorted_times) else sorted_times[-1]
+            return self._window().quantile(0.95)
 
         except Exception as e:
             logger.error(f"Erro ao calcular P95: {e}")
             return 0.0
 
     def get_average_response_time(self) -> float:
-        """Calcula tempo médio de resposta"""
+        """Calcula tempo médio de resposta na janela padrão"""
         try:
-            if not self.request_times:
-                return 0.0
-            return sum(self.request_times) / len(self.request_times)
+            sketch = self._window()
+            return sketch.sum / sketch.count if sketch.count else 0.0
 
         except Exception as e:
             logger.error(f"Erro ao calcular tempo médio: {e}")
@@ -93,10 +96,15 @@ class PerformanceMonitor:
 
     def get_stats(self) -> Dict[str, Any]:
         """Retorna estatísticas completas"""
+        window = LATENCY_CONFIG.get("DEFAULT_WINDOW", "5m")
+        latency = self.request_latency.summary(latency_recorder.windows[window])
         return {
             "total_requests": self.total_requests,
-            "avg_response_time": round(self.get_average_response_time() * 1000, 2),  # em ms
-            "p95_response_time": round(self.get_p95_response_time() * 1000, 2),  # em ms
+            "window": window,
+            "avg_response_time": latency["mean_ms"],  # em ms
+            "p50_response_time": latency["p50_ms"],
+            "p95_response_time": latency["p95_ms"],
+            "p99_response_time": latency["p99_ms"],
             "cache_hits": self.cache_hits,
             "cache_misses": self.cache_misses,
             "cache_hit_rate": round(self.get_cache_hit_rate(), 2),
@@ -147,7 +155,7 @@ def monitor_performance(func):
             return result
         finally:
             duration = time.time() - start_time
-            performance_monitor.record_request_time(duration)
+            performance_monitor.record_request_time(duration, func.__name__)
 
             # Log se exceder target P95 configurado
             try:
@@ -163,8 +171,8 @@ def monitor_performance(func):
     return wrapper
 
 
-def extract_filter_params() -> Dict[str, Any]:
-    """Extrai parâmetros de filtro da requisição atual"""
+def parse_filter_params(args: Mapping[str, Any]) -> Dict[str, Any]:
+    """Parâmetros de filtro de uma query string (rotas Flask e assíncronas)"""
 
     # Função auxiliar para converter para int se possível
     def safe_int(value):
@@ -176,19 +184,24 @@ def extract_filter_params() -> Dict[str, Any]:
             return None
 
     return {
-        "start_date": request.args.get("start_date"),
-        "end_date": request.args.get("end_date"),
-        "filter_type": request.args.get("filter_type", "creation"),
-        "status": request.args.get("status"),
-        "priority": request.args.get("priority"),
-        "level": request.args.get("level"),
-        "technician": request.args.get("technician"),
-        "category": request.args.get("category"),
-        "limit": safe_int(request.args.get("limit")),
-        "entity_id": safe_int(request.args.get("entity_id")),
+        "start_date": args.get("start_date"),
+        "end_date": args.get("end_date"),
+        "filter_type": args.get("filter_type", "creation"),
+        "status": args.get("status"),
+        "priority": args.get("priority"),
+        "level": args.get("level"),
+        "technician": args.get("technician"),
+        "category": args.get("category"),
+        "limit": safe_int(args.get("limit")),
+        "entity_id": safe_int(args.get("entity_id")),
     }
 
 
+def extract_filter_params() -> Dict[str, Any]:
+    """Extrai parâmetros de filtro da requisição atual"""
+    return parse_filter_params(request.args)
+
+
 def make_filtered_cache_key(base_key: str) -> str:
     """Cria chave de cache considerando todos os filtros da requisição"""
     filters = extract_filter_params()
@@ -10,9 +10,19 @@ import time
 import uuid
 from contextvars import ContextVar
 from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Dict, List, Optional, Union
 
+from utils.log_facade import log_sampler
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 # Removed unused import: prometheus_metrics
 
 # Context variables para correlação
@@ -22,19 +32,90 @@ operation_context_var: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
 )
 
 
+# Atributos próprios do LogRecord (e os anexados pela fila de logging): nunca são extras
+_RECORD_ATTRS = frozenset(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {
+    "message",
+    "asctime",
+    "taskName",
+    "_log_target",
+    "_log_context",
+}
+
+SENSITIVE_FIELDS = (
+    "password",
+    "token",
+    "secret",
+    "key",
+    "authorization",
+    "cookie",
+    "session",
+    "csrf",
+    "api_key",
+    "access_token",
+)
+
+
+@lru_cache(maxsize=4096)
+def _is_sensitive_key(key: str) -> bool:
+    """Chave contém algum dos SENSITIVE_FIELDS (o conjunto de chaves dos logs é pequeno e repetido)"""
+    lowered = key.lower()
+    return any(field in lowered for field in SENSITIVE_FIELDS)
+
+
+def _mask(value: Any) -> str:
+    if isinstance(value, str) and len(value) > 8:
+        return f"{value[:4]}***{value[-4:]}"
+    return "***"
+
+
+def _sanitize(value: Any) -> Any:
+    """Cópia de dicts/listas aninhados com os valores de chaves sensíveis mascarados"""
+    if isinstance(value, dict):
+        return {
+            k: _mask(v) if isinstance(k, str) and _is_sensitive_key(k) else _sanitize(v) for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_sanitize(item) for item in value]
+    return value
+
+
 class JSONFormatter(logging.Formatter):
-    """Formatter para logs estruturados em JSON."""
+    """Formatter para logs estruturados em JSON.
+
+    Os atributos ignorados do record são calculados uma vez por formatter, as
+    chaves sensíveis são mascaradas enquanto o dicionário é montado e a
+    serialização é feita numa única passada (orjson quando instalado; valores
+    não serializáveis viram ``str``).
+    """
 
-    def __init__(self, include_extra: bool = True, exclude_fields: Optional[List[str]] = None):
+    def __init__(
+        self,
+        include_extra: bool = True,
+        exclude_fields: Optional[List[str]] = None,
+        use_orjson: Optional[bool] = None,
+    ):
         super().__init__()
         self.include_extra = include_extra
         self.exclude_fields = exclude_fields or []
+        self._skip_fields = _RECORD_ATTRS | frozenset(self.exclude_fields)
+        self.use_orjson = ORJSON_AVAILABLE if use_orjson is None else use_orjson and ORJSON_AVAILABLE
+        # (segundo, "YYYY-MM-DDTHH:MM:SS") do último timestamp formatado
+        self._second_prefix = (None, "")
+
+    def _timestamp(self, created: float) -> str:
+        second = int(created)
+        cached_second, prefix = self._second_prefix
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second_prefix = (second, prefix)
+        return "%s.%06dZ" % (prefix, int((created - second) * 1e6))
 
     def format(self, record: logging.LogRecord) -> str:
         """Formata o log record em JSON estruturado."""
-        # Campos base do log
+        # Campos base do log (timestamp do evento, não da formatação: com a
+        # fila de logging a formatação acontece depois, em outra thread)
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -51,88 +132,48 @@ class JSONFormatter(logging.Formatter):
         # Adicionar contexto da operação
         operation_context = operation_context_var.get()
         if operation_context:
-            log_data["operation"] = operation_context
+            log_data["operation"] = _sanitize(operation_context)
 
         # Adicionar informações de exceção
         if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
             log_data["exception"] = {
                 "type": record.exc_info[0].__name__ if record.exc_info[0] else None,
                 "message": str(record.exc_info[1]) if record.exc_info[1] else None,
-                "traceback": self.formatException(record.exc_info),
+                "traceback": record.exc_text,
             }
 
         # Adicionar campos extras do record
         if self.include_extra:
+            skip = self._skip_fields
             for key, value in record.__dict__.items():
-                if (
-                    key
-                    not in {
-                        "name",
-                        "msg",
-                        "args",
-                        "levelname",
-                        "levelno",
-                        "pathname",
-                        "filename",
-                        "module",
-                        "lineno",
-                        "funcName",
-                        "created",
-                        "msecs",
-                        "relativeCreated",
-                        "thread",
-                        "threadName",
-                        "processName",
-                        "process",
-                        "getMessage",
-                        "exc_info",
-                        "exc_text",
-                        "stack_info",
-                    }
-                    and key not in self.exclude_fields
-                ):
-                    try:
-                        # Tentar serializar o valor
-                        json.dumps(value)
-                        log_data[key] = value
-                    except (TypeError, ValueError):
-                        # Se não conseguir serializar, converter para string
-                        log_data[key] = str(value)
-
-        # Sanitizar dados sensíveis
-        log_data = self._sanitize_sensitive_data(log_data)
-
-        return json.dumps(log_data, ensure_ascii=False, separators=(",", ":"))
-
-    def _sanitize_sensitive_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Remove ou anonimiza dados sensíveis dos logs."""
-        sensitive_fields = {
-            "password",
-            "token",
-            "secret",
-            "key",
-            "authorization",
-            "cookie",
-            "session",
-            "csrf",
-            "api_key",
-            "access_token",
-        }
-
-        def sanitize_value(key: str, value: Any) -> Any:
-            if isinstance(key, str) and any(field in key.lower() for field in sensitive_fields):
-                if isinstance(value, str) and len(value) > 8:
-                    return f"{value[:4]}***{value[-4:]}"
-                return "***"
-
-            if isinstance(value, dict):
-                return {k: sanitize_value(k, v) for k, v in value.items()}
-            elif isinstance(value, list):
-                return [sanitize_value(f"item_{i}", item) for i, item in enumerate(value)]
-
+                if key in skip:
+                    continue
+                if _is_sensitive_key(key):
+                    log_data[key] = _mask(value)
+                elif isinstance(value, (dict, list)):
+                    log_data[key] = _sanitize(value)
+                else:
+                    log_data[key] = value
+
+        try:
+            return self._dumps(log_data)
+        except (TypeError, ValueError, RecursionError):
+            # Chaves não textuais, referências circulares...: converte por campo
+            return self._dumps({key: self._serializable(value) for key, value in log_data.items()})
+
+    def _dumps(self, data: Dict[str, Any]) -> str:
+        if self.use_orjson:
+            return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+
+    def _serializable(self, value: Any) -> Any:
+        try:
+            self._dumps({"value": value})
             return value
-
-        return {k: sanitize_value(k, v) for k, v in data.items()}
+        except (TypeError, ValueError, RecursionError):
+            return str(value)
 
 
 class StructuredLogger:
@@ -252,7 +293,10 @@ class StructuredLogger:
     ):
         """Registra uma métrica de performance."""
         self.logger.info(
-            f"Métrica de performance: {metric_name} = {value} {unit}",
+            "Métrica de performance: %s = %s %s",
+            metric_name,
+            value,
+            unit,
             extra={
                 "metric_type": "performance",
                 "metric_name": metric_name,
@@ -391,7 +435,13 @@ def log_api_request(method: str, endpoint: str, status_code: int, duration: floa
 
 
 def log_glpi_request(endpoint: str, status_code: int, duration: float, **kwargs):
-    """Log estruturado para requisições ao GLPI."""
+    """Log estruturado para requisições ao GLPI (sucessos amostrados, erros sempre)."""
+    if not glpi_logger.logger.isEnabledFor(logging.INFO):
+        return
+    if status_code < 400:
+        if not log_sampler.should_log("glpi_request"):
+            return
+        kwargs["sample_rate"] = log_sampler.rate("glpi_request")
     glpi_logger.log_performance_metric(
         "glpi_request_duration",
         duration,
@@ -5,6 +5,7 @@ import { PremiumLevelCard } from './PremiumLevelCard';
 import { ProfessionalTicketsList } from './ProfessionalTicketsList';
 import { ProfessionalRankingTable } from './ProfessionalRankingTable';
 import { useDashboardFormatters } from '@/hooks/useFormatters';
+import { DASHBOARD_TICKETS_LIMIT } from '@/services/api';
 
 // Componentes lazy centralizados
 
@@ -369,7 +370,11 @@ export const ModernDashboard = React.memo<ModernDashboardProps>(function ModernD
             <h3 id='tickets-heading' className='sr-only'>
               Lista de Tickets Recentes
             </h3>
-            <ProfessionalTicketsList className='h-full' limit={10} onTicketClick={onTicketClick} />
+            <ProfessionalTicketsList
+              className='h-full'
+              limit={DASHBOARD_TICKETS_LIMIT}
+              onTicketClick={onTicketClick}
+            />
           </div>
         </div>
       </section>
@@ -7,6 +7,7 @@ import { AlertCircle, Clock, User, Calendar, RefreshCw, ExternalLink } from 'luc
 import { NewTicket, Ticket } from '@/types';
 import { cn, formatRelativeTime, formatDate } from '@/lib/utils';
 import { apiService } from '@/services/api';
+import { subscribeDashboardTickets } from '@/services/dashboardStream';
 import { useThrottledCallback } from '@/hooks/useDebounce';
 import { SkeletonTickets } from '@/utils/loadingUtils';
 
@@ -235,6 +236,20 @@ export const ProfessionalTicketsList = React.memo<ProfessionalTicketsListProps>(
       fetchTickets();
     }, [fetchTickets]);
 
+    // Tickets novos enviados pelo servidor (SSE) quando a lista muda
+    useEffect(
+      () =>
+        subscribeDashboardTickets(limit, data => {
+          startTransition(() => {
+            setTickets(data || []);
+            setLastUpdate(new Date());
+          });
+          setError(null);
+          setIsLoading(false);
+        }),
+      [limit]
+    );
+
     const ticketsCount = useMemo(() => tickets.length, [tickets.length]);
     const hasTickets = useMemo(() => tickets.length > 0, [tickets.length]);
     const formattedLastUpdate = useMemo(
@@ -1,5 +1,6 @@
 import { useState, useEffect, useCallback } from 'react';
-import { apiService } from '../services/api';
+import { apiService, DASHBOARD_TICKETS_LIMIT } from '../services/api';
+import { subscribeDashboardStream } from '../services/dashboardStream';
 import type { DashboardMetrics, FilterParams, NiveisMetrics, TechnicianRanking } from '../types/api';
 import { SystemStatus, NotificationData, DateRange } from '../types';
 
@@ -92,59 +93,75 @@ export const useDashboard = (initialFilters: FilterParams = {}): UseDashboardRet
           apiService.clearAllCaches();
         }
 
-        // Fazer chamadas paralelas para todos os endpoints
-
-        const [metricsResult, systemStatusResult, technicianRankingResult] = await Promise.all([
-          apiService.getMetrics(
-            filtersToUse.dateRange
-              ? {
-                  startDate: filtersToUse.dateRange.startDate,
-                  endDate: filtersToUse.dateRange.endDate,
-                  label: filtersToUse.dateRange.label || 'Período personalizado',
-                }
-              : undefined
-          ),
-          (async () => {
-            return await apiService.getSystemStatus();
-          })(),
-          (async () => {
-            // Preparar filtros para o ranking de técnicos
-            // NOTA: Ranking de técnicos não deve ser filtrado por data pois pode não ter dados históricos
-            const rankingFilters: Record<string, unknown> = {
-              limit: 50, // Aumentar limite para mostrar mais técnicos
-            };
-
-            // Aplicar filtros de data apenas se especificamente solicitado
-            // Por padrão, buscar ranking sem filtros de data para garantir dados
-            if (filtersToUse.dateRange?.startDate && filtersToUse.dateRange?.endDate) {
-              // Só aplicar filtros de data se ambos startDate e endDate estiverem definidos
-              // e se não for um período muito restritivo (menos de 30 dias)
-              const startDate = new Date(filtersToUse.dateRange.startDate);
-              const endDate = new Date(filtersToUse.dateRange.endDate);
-              const daysDiff = (endDate.getTime() - startDate.getTime()) / (1000 * 60 * 60 * 24);
-
-              if (daysDiff >= 30) {
-                // Só aplicar filtros se período for >= 30 dias
-                rankingFilters.start_date = filtersToUse.dateRange.startDate;
-                rankingFilters.end_date = filtersToUse.dateRange.endDate;
-              }
-            }
+        // Preparar filtros para o ranking de técnicos
+        // NOTA: Ranking de técnicos não deve ser filtrado por data pois pode não ter dados históricos
+        const rankingFilters: Record<string, unknown> = {
+          limit: 50, // Aumentar limite para mostrar mais técnicos
+        };
+
+        // Aplicar filtros de data apenas se especificamente solicitado
+        // Por padrão, buscar ranking sem filtros de data para garantir dados
+        if (filtersToUse.dateRange?.startDate && filtersToUse.dateRange?.endDate) {
+          // Só aplicar filtros de data se ambos startDate e endDate estiverem definidos
+          // e se não for um período muito restritivo (menos de 30 dias)
+          const startDate = new Date(filtersToUse.dateRange.startDate);
+          const endDate = new Date(filtersToUse.dateRange.endDate);
+          const daysDiff = (endDate.getTime() - startDate.getTime()) / (1000 * 60 * 60 * 24);
+
+          if (daysDiff >= 30) {
+            // Só aplicar filtros se período for >= 30 dias
+            rankingFilters.start_date = filtersToUse.dateRange.startDate;
+            rankingFilters.end_date = filtersToUse.dateRange.endDate;
+          }
+        }
 
-            try {
-              const result = await apiService.getTechnicianRanking(rankingFilters);
+        const metricsDateRange = filtersToUse.dateRange
+          ? {
+              startDate: filtersToUse.dateRange.startDate,
+              endDate: filtersToUse.dateRange.endDate,
+              label: filtersToUse.dateRange.label || 'Período personalizado',
+            }
+          : undefined;
+        const hasDates = Boolean(metricsDateRange?.startDate && metricsDateRange?.endDate);
+        // O ranking só vem junto com /dashboard quando usa o mesmo período das métricas
+        const rankingInSnapshot = !hasDates || Boolean(rankingFilters.start_date);
 
-              // Se não retornou dados com filtros, tentar sem filtros
-              if (result.length === 0 && (rankingFilters.start_date || rankingFilters.end_date)) {
-                const fallbackResult = await apiService.getTechnicianRanking({ limit: 50 });
-                return fallbackResult;
-              }
+        const loadRanking = async () => {
+          try {
+            const result = await apiService.getTechnicianRanking(rankingFilters);
 
-              return result;
-            } catch (error) {
-              console.error('❌ useDashboard - Erro em getTechnicianRanking:', error);
-              throw error;
+            // Se não retornou dados com filtros, tentar sem filtros
+            if (result.length === 0 && (rankingFilters.start_date || rankingFilters.end_date)) {
+              const fallbackResult = await apiService.getTechnicianRanking({ limit: 50 });
+              return fallbackResult;
             }
-          })(),
+
+            return result;
+          } catch (error) {
+            console.error('❌ useDashboard - Erro em getTechnicianRanking:', error);
+            throw error;
+          }
+        };
+
+        // Métricas, ranking e tickets recentes em uma requisição (/dashboard); o status do
+        // sistema segue em paralelo pela rota própria
+        const [snapshot, systemStatusResult] = await Promise.all([
+          apiService.getDashboard(
+            {
+              start_date: hasDates ? metricsDateRange?.startDate : undefined,
+              end_date: hasDates ? metricsDateRange?.endDate : undefined,
+              ranking_limit: 50,
+              tickets_limit: DASHBOARD_TICKETS_LIMIT,
+            },
+            rankingInSnapshot ? ['metrics', 'ranking', 'tickets'] : ['metrics', 'tickets']
+          ),
+          apiService.getSystemStatus(),
+        ]);
+
+        // Seções que falharam no servidor (ou fora do snapshot) vêm pelas rotas individuais
+        const [metricsResult, technicianRankingResult] = await Promise.all([
+          snapshot.metrics || apiService.getMetrics(metricsDateRange),
+          snapshot.ranking && snapshot.ranking.length > 0 ? snapshot.ranking : loadRanking(),
         ]);
 
         // console.log('✅ useDashboard - Todas as chamadas paralelas concluídas');
@@ -200,6 +217,35 @@ export const useDashboard = (initialFilters: FilterParams = {}): UseDashboardRet
     loadData();
   }, []);
 
+  // Atualizações enviadas pelo servidor (SSE): métricas e ranking chegam quando mudam,
+  // sem timers por aba; o status do sistema continua vindo do loadData
+  const streamStartDate = filters.dateRange?.startDate;
+  const streamEndDate = filters.dateRange?.endDate;
+  useEffect(() => {
+    const hasDates = Boolean(streamStartDate && streamEndDate);
+    // Mesmo critério do loadData: o ranking só usa o período quando ele tem 30 dias ou mais
+    const rankingUsesDates =
+      hasDates &&
+      (new Date(streamEndDate as string).getTime() - new Date(streamStartDate as string).getTime()) /
+        (1000 * 60 * 60 * 24) >=
+        30;
+
+    return subscribeDashboardStream(
+      {
+        start_date: hasDates ? streamStartDate : undefined,
+        end_date: hasDates ? streamEndDate : undefined,
+        ranking_limit: 50,
+      },
+      {
+        metrics: metrics => setData(prev => (prev ? { ...prev, ...metrics } : prev)),
+        ranking: ranking => {
+          if ((hasDates && !rankingUsesDates) || ranking.length === 0) return;
+          setData(prev => (prev ? { ...prev, technicianRanking: ranking } : prev));
+        },
+      }
+    );
+  }, [streamStartDate, streamEndDate]);
+
   // Função para buscar tipos de filtro disponíveis
   const fetchFilterTypes = useCallback(async () => {
     try {
@@ -20,13 +20,195 @@ interface ApiResponse<T> {
   error?: string;
 }
 
+// Parâmetros de cache de cada seção, compartilhados com o stream do dashboard (dashboardStream.ts)
+export const metricsCacheParams = (dateRange?: DateRange) => ({
+  endpoint: 'metrics',
+  dateRange: dateRange ? { startDate: dateRange.startDate, endDate: dateRange.endDate } : null,
+});
+
+export const rankingCacheParams = (filters?: {
+  start_date?: string;
+  end_date?: string;
+  level?: string;
+  limit?: number;
+}) => ({
+  endpoint: 'technicians/ranking',
+  start_date: filters?.start_date || 'none',
+  end_date: filters?.end_date || 'none',
+  level: filters?.level || 'none',
+  limit: filters?.limit?.toString() || '10',
+});
+
+export const newTicketsCacheParams = (limit: number) => ({
+  endpoint: 'tickets/recent',
+  limit: limit.toString(),
+});
+
+// Tickets recentes do dashboard principal (ModernDashboard), carregados junto com /dashboard
+export const DASHBOARD_TICKETS_LIMIT = 10;
+
+export type DashboardSection = 'metrics' | 'ranking' | 'tickets';
+
+export interface DashboardFilters {
+  start_date?: string;
+  end_date?: string;
+  ranking_limit?: number;
+  tickets_limit?: number;
+}
+
+export interface DashboardSnapshot {
+  metrics?: DashboardMetrics;
+  ranking?: any[];
+  tickets?: any[];
+  // Seções que o servidor não conseguiu calcular: buscar pelas rotas individuais
+  failedSections: DashboardSection[];
+}
+
+// Requisições /dashboard em andamento que incluem tickets, por limite: getNewTickets espera
+// por elas em vez de disparar /tickets/recent em paralelo
+const pendingDashboardTickets = new Map<number, Promise<DashboardSnapshot>>();
+
+/**
+ * Converte o payload de /metrics (ou do evento "metrics" do stream) em DashboardMetrics,
+ * com os totais por nível calculados
+ */
+export function processMetricsData(rawData: any): DashboardMetrics {
+  // Verificar se há filtros aplicados (estrutura diferente)
+  let processedNiveis: import('../types/api').NiveisMetrics;
+
+  if (rawData.general || rawData.by_level) {
+    // Estrutura com filtros aplicados
+    processedNiveis = {
+      n1: { novos: 0, progresso: 0, pendentes: 0, resolvidos: 0, total: 0 },
+      n2: { novos: 0, progresso: 0, pendentes: 0, resolvidos: 0, total: 0 },
+      n3: { novos: 0, progresso: 0, pendentes: 0, resolvidos: 0, total: 0 },
+      n4: { novos: 0, progresso: 0, pendentes: 0, resolvidos: 0, total: 0 },
+    };
+
+    // Processar dados da estrutura by_level
+    if (rawData.by_level) {
+      Object.entries(rawData.by_level).forEach(([level, data]: [string, any]) => {
+        const levelKey = level.toLowerCase() as keyof typeof processedNiveis;
+        if (processedNiveis[levelKey]) {
+          const novos = data['Novo'] || 0;
+          const progresso =
+            (data['Processando (atribuído)'] || 0) + (data['Processando (planejado)'] || 0);
+          const pendentes = data['Pendente'] || 0;
+          const resolvidos = (data['Solucionado'] || 0) + (data['Fechado'] || 0);
+          processedNiveis[levelKey] = {
+            novos,
+            progresso,
+            pendentes,
+            resolvidos,
+            total: novos + progresso + pendentes + resolvidos,
+          };
+        }
+      });
+    }
+  } else {
+    // Estrutura normal
+
+    // Processar dados dos níveis
+    if (rawData.niveis) {
+      // Calcular total para cada nível
+      processedNiveis = {
+        n1: {
+          ...rawData.niveis.n1,
+          total:
+            (rawData.niveis.n1.novos || 0) +
+            (rawData.niveis.n1.pendentes || 0) +
+            (rawData.niveis.n1.progresso || 0) +
+            (rawData.niveis.n1.resolvidos || 0),
+        },
+        n2: {
+          ...rawData.niveis.n2,
+          total:
+            (rawData.niveis.n2.novos || 0) +
+            (rawData.niveis.n2.pendentes || 0) +
+            (rawData.niveis.n2.progresso || 0) +
+            (rawData.niveis.n2.resolvidos || 0),
+        },
+        n3: {
+          ...rawData.niveis.n3,
+          total:
+            (rawData.niveis.n3.novos || 0) +
+            (rawData.niveis.n3.pendentes || 0) +
+            (rawData.niveis.n3.progresso || 0) +
+            (rawData.niveis.n3.resolvidos || 0),
+        },
+        n4: {
+          ...rawData.niveis.n4,
+          total:
+            (rawData.niveis.n4.novos || 0) +
+            (rawData.niveis.n4.pendentes || 0) +
+            (rawData.niveis.n4.progresso || 0) +
+            (rawData.niveis.n4.resolvidos || 0),
+        },
+      };
+    } else if (rawData.levels) {
+      // Caso os dados venham como 'levels' ao invés de 'niveis'
+      processedNiveis = {
+        n1: {
+          ...rawData.levels.n1,
+          total:
+            (rawData.levels.n1.novos || 0) +
+            (rawData.levels.n1.pendentes || 0) +
+            (rawData.levels.n1.progresso || 0) +
+            (rawData.levels.n1.resolvidos || 0),
+        },
+        n2: {
+          ...rawData.levels.n2,
+          total:
+            (rawData.levels.n2.novos || 0) +
+            (rawData.levels.n2.pendentes || 0) +
+            (rawData.levels.n2.progresso || 0) +
+            (rawData.levels.n2.resolvidos || 0),
+        },
+        n3: {
+          ...rawData.levels.n3,
+          total:
+            (rawData.levels.n3.novos || 0) +
+            (rawData.levels.n3.pendentes || 0) +
+            (rawData.levels.n3.progresso || 0) +
+            (rawData.levels.n3.resolvidos || 0),
+        },
+        n4: {
+          ...rawData.levels.n4,
+          total:
+            (rawData.levels.n4.novos || 0) +
+            (rawData.levels.n4.pendentes || 0) +
+            (rawData.levels.n4.progresso || 0) +
+            (rawData.levels.n4.resolvidos || 0),
+        },
+      };
+    } else {
+      // Fallback com zeros
+      processedNiveis = {
+        n1: { novos: 0, pendentes: 0, progresso: 0, resolvidos: 0, total: 0 },
+        n2: { novos: 0, pendentes: 0, progresso: 0, resolvidos: 0, total: 0 },
+        n3: { novos: 0, pendentes: 0, progresso: 0, resolvidos: 0, total: 0 },
+        n4: { novos: 0, pendentes: 0, progresso: 0, resolvidos: 0, total: 0 },
+      };
+    }
+  }
+
+  // Usar totais gerais diretamente da API (mais confiável)
+  return {
+    // Totais gerais da API
+    novos: rawData.novos || 0,
+    pendentes: rawData.pendentes || 0,
+    progresso: rawData.progresso || 0,
+    resolvidos: rawData.resolvidos || 0,
+    total: rawData.total || 0,
+    // Estrutura por níveis
+    niveis: processedNiveis,
+  };
+}
+
 export const apiService = {
   // Get metrics data with optional date filter
   async getMetrics(dateRange?: DateRange): Promise<DashboardMetrics> {
-    const cacheParams = {
-      endpoint: 'metrics',
-      dateRange: dateRange || null,
-    };
+    const cacheParams = metricsCacheParams(dateRange);
 
     // Verificar cache primeiro
     const cachedData = unifiedCache.get('metrics', cacheParams);
@@ -60,136 +242,7 @@ export const apiService = {
         if (response.data && response.data.success && response.data.data) {
           const rawData = response.data.data;
 
-          // Verificar se há filtros aplicados (estrutura diferente)
-          let processedNiveis: import('../types/api').NiveisMetrics;
-
-          if (rawData.general || rawData.by_level) {
-            // Estrutura com filtros aplicados
-            processedNiveis = {
-              n1: { novos: 0, progresso: 0, pendentes: 0, resolvidos: 0, total: 0 },
-              n2: { novos: 0, progresso: 0, pendentes: 0, resolvidos: 0, total: 0 },
-              n3: { novos: 0, progresso: 0, pendentes: 0, resolvidos: 0, total: 0 },
-              n4: { novos: 0, progresso: 0, pendentes: 0, resolvidos: 0, total: 0 },
-            };
-
-            // Processar dados da estrutura by_level
-            if (rawData.by_level) {
-              Object.entries(rawData.by_level).forEach(([level, data]: [string, any]) => {
-                const levelKey = level.toLowerCase() as keyof typeof processedNiveis;
-                if (processedNiveis[levelKey]) {
-                  const novos = data['Novo'] || 0;
-                  const progresso =
-                    (data['Processando (atribuído)'] || 0) + (data['Processando (planejado)'] || 0);
-                  const pendentes = data['Pendente'] || 0;
-                  const resolvidos = (data['Solucionado'] || 0) + (data['Fechado'] || 0);
-                  processedNiveis[levelKey] = {
-                    novos,
-                    progresso,
-                    pendentes,
-                    resolvidos,
-                    total: novos + progresso + pendentes + resolvidos,
-                  };
-                }
-              });
-            }
-          } else {
-            // Estrutura normal
-
-            // Processar dados dos níveis
-            if (rawData.niveis) {
-              // Calcular total para cada nível
-              processedNiveis = {
-                n1: {
-                  ...rawData.niveis.n1,
-                  total:
-                    (rawData.niveis.n1.novos || 0) +
-                    (rawData.niveis.n1.pendentes || 0) +
-                    (rawData.niveis.n1.progresso || 0) +
-                    (rawData.niveis.n1.resolvidos || 0),
-                },
-                n2: {
-                  ...rawData.niveis.n2,
-                  total:
-                    (rawData.niveis.n2.novos || 0) +
-                    (rawData.niveis.n2.pendentes || 0) +
-                    (rawData.niveis.n2.progresso || 0) +
-                    (rawData.niveis.n2.resolvidos || 0),
-                },
-                n3: {
-                  ...rawData.niveis.n3,
-                  total:
-                    (rawData.niveis.n3.novos || 0) +
-                    (rawData.niveis.n3.pendentes || 0) +
-                    (rawData.niveis.n3.progresso || 0) +
-                    (rawData.niveis.n3.resolvidos || 0),
-                },
-                n4: {
-                  ...rawData.niveis.n4,
-                  total:
-                    (rawData.niveis.n4.novos || 0) +
-                    (rawData.niveis.n4.pendentes || 0) +
-                    (rawData.niveis.n4.progresso || 0) +
-                    (rawData.niveis.n4.resolvidos || 0),
-                },
-              };
-            } else if (rawData.levels) {
-              // Caso os dados venham como 'levels' ao invés de 'niveis'
-              processedNiveis = {
-                n1: {
-                  ...rawData.levels.n1,
-                  total:
-                    (rawData.levels.n1.novos || 0) +
-                    (rawData.levels.n1.pendentes || 0) +
-                    (rawData.levels.n1.progresso || 0) +
-                    (rawData.levels.n1.resolvidos || 0),
-                },
-                n2: {
-                  ...rawData.levels.n2,
-                  total:
-                    (rawData.levels.n2.novos || 0) +
-                    (rawData.levels.n2.pendentes || 0) +
-                    (rawData.levels.n2.progresso || 0) +
-                    (rawData.levels.n2.resolvidos || 0),
-                },
-                n3: {
-                  ...rawData.levels.n3,
-                  total:
-                    (rawData.levels.n3.novos || 0) +
-                    (rawData.levels.n3.pendentes || 0) +
-                    (rawData.levels.n3.progresso || 0) +
-                    (rawData.levels.n3.resolvidos || 0),
-                },
-                n4: {
-                  ...rawData.levels.n4,
-                  total:
-                    (rawData.levels.n4.novos || 0) +
-                    (rawData.levels.n4.pendentes || 0) +
-                    (rawData.levels.n4.progresso || 0) +
-                    (rawData.levels.n4.resolvidos || 0),
-                },
-              };
-            } else {
-              // Fallback com zeros
-              processedNiveis = {
-                n1: { novos: 0, pendentes: 0, progresso: 0, resolvidos: 0, total: 0 },
-                n2: { novos: 0, pendentes: 0, progresso: 0, resolvidos: 0, total: 0 },
-                n3: { novos: 0, pendentes: 0, progresso: 0, resolvidos: 0, total: 0 },
-                n4: { novos: 0, pendentes: 0, progresso: 0, resolvidos: 0, total: 0 },
-              };
-            }
-          }
-
-          // Usar totais gerais diretamente da API (mais confiável)
-          const data: DashboardMetrics = {
-            // Totais gerais da API
-            novos: rawData.novos || 0,
-            pendentes: rawData.pendentes || 0,
-            progresso: rawData.progresso || 0,
-            resolvidos: rawData.resolvidos || 0,
-            total: rawData.total || 0,
-            // Estrutura por níveis
-            niveis: processedNiveis,
-          };
+          const data = processMetricsData(rawData);
 
           // Armazenar no cache
           unifiedCache.set('metrics', cacheParams, data);
@@ -222,6 +275,85 @@ export const apiService = {
     );
   },
 
+  // Métricas, ranking e tickets recentes em uma única requisição (/dashboard)
+  async getDashboard(
+    filters: DashboardFilters = {},
+    sections: DashboardSection[] = ['metrics', 'ranking', 'tickets']
+  ): Promise<DashboardSnapshot> {
+    const hasDates = Boolean(filters.start_date && filters.end_date);
+    const rankingLimit = filters.ranking_limit || 50;
+    const ticketsLimit = filters.tickets_limit || 8;
+
+    const params = new URLSearchParams({
+      sections: sections.join(','),
+      ranking_limit: rankingLimit.toString(),
+      tickets_limit: ticketsLimit.toString(),
+    });
+    if (hasDates) {
+      params.append('start_date', filters.start_date as string);
+      params.append('end_date', filters.end_date as string);
+    }
+
+    const request = (async (): Promise<DashboardSnapshot> => {
+      const startTime = Date.now();
+      try {
+        const response = await api.get(`/dashboard?${params.toString()}`);
+        unifiedCache.recordRequestTime('dashboard', params.toString(), Date.now() - startTime);
+
+        const payload = response.data;
+        if (!payload || !payload.success || !payload.data) {
+          console.error('API returned unsuccessful response:', payload);
+          return { failedSections: sections };
+        }
+
+        const failedSections = (payload.failed_sections || []) as DashboardSection[];
+        const snapshot: DashboardSnapshot = { failedSections };
+        // Mesmos parâmetros de cache das rotas individuais: chamadas seguintes não repetem a busca
+        if (payload.data.metrics) {
+          snapshot.metrics = processMetricsData(payload.data.metrics);
+          const dateRange = hasDates
+            ? {
+                startDate: filters.start_date as string,
+                endDate: filters.end_date as string,
+                label: '',
+              }
+            : undefined;
+          unifiedCache.set('metrics', metricsCacheParams(dateRange), snapshot.metrics);
+        }
+        if (Array.isArray(payload.data.ranking)) {
+          snapshot.ranking = payload.data.ranking;
+          unifiedCache.set(
+            'technicianRanking',
+            rankingCacheParams({
+              start_date: hasDates ? filters.start_date : undefined,
+              end_date: hasDates ? filters.end_date : undefined,
+              limit: rankingLimit,
+            }),
+            snapshot.ranking
+          );
+        }
+        if (Array.isArray(payload.data.tickets)) {
+          snapshot.tickets = payload.data.tickets;
+          unifiedCache.set('newTickets', newTicketsCacheParams(ticketsLimit), snapshot.tickets);
+        }
+        return snapshot;
+      } catch (error) {
+        console.error('Error fetching dashboard:', error);
+        return { failedSections: sections };
+      }
+    })();
+
+    if (sections.includes('tickets')) {
+      pendingDashboardTickets.set(ticketsLimit, request);
+      request.finally(() => {
+        if (pendingDashboardTickets.get(ticketsLimit) === request) {
+          pendingDashboardTickets.delete(ticketsLimit);
+        }
+      });
+    }
+    return request;
+  },
+
   // Get system status - usando endpoint /health/glpi disponível
   async getSystemStatus(): Promise<SystemStatus> {
     const cacheParams = { endpoint: 'systemStatus' };
@@ -314,13 +446,7 @@ export const apiService = {
     const startTime = Date.now();
 
     // Criar parâmetros para o cache incluindo filtros
-    const cacheParams = {
-      endpoint: 'technicians/ranking',
-      start_date: filters?.start_date || 'none',
-      end_date: filters?.end_date || 'none',
-      level: filters?.level || 'none',
-      limit: filters?.limit?.toString() || '10',
-    };
+    const cacheParams = rankingCacheParams(filters);
 
     // Verificar cache primeiro
     const cachedData = unifiedCache.get('technicianRanking', cacheParams);
@@ -391,7 +517,16 @@ export const apiService = {
   // Get new tickets
   async getNewTickets(limit: number = 5): Promise<any[]> {
     const startTime = Date.now();
-    const cacheParams = { endpoint: 'tickets/recent', limit: limit.toString() };
+    const cacheParams = newTicketsCacheParams(limit);
+
+    // Tickets já a caminho em uma requisição /dashboard
+    const pendingDashboard = pendingDashboardTickets.get(limit);
+    if (pendingDashboard) {
+      const snapshot = await pendingDashboard;
+      if (snapshot.tickets) {
+        return snapshot.tickets;
+      }
+    }
 
     // Verificar cache primeiro
     const cachedData = unifiedCache.get('newTickets', cacheParams);
@@ -606,6 +741,9 @@ export const getTechnicianRanking = async (filters?: {
   return apiService.getTechnicianRanking(filters);
 };
 
+export const getDashboard = async (filters?: DashboardFilters, sections?: DashboardSection[]) => {
+  return apiService.getDashboard(filters, sections);
+};
 export const getNewTickets = async (limit?: number) => {
   return apiService.getNewTickets(limit);
 };
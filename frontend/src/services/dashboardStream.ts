@@ -0,0 +1,194 @@
+import { API_CONFIG } from './httpClient';
+import {
+  metricsCacheParams,
+  newTicketsCacheParams,
+  processMetricsData,
+  rankingCacheParams,
+} from './api';
+import { unifiedCache } from './unifiedCache';
+import type { DashboardMetrics } from '../types/api';
+
+/**
+ * Atualizações do dashboard por Server-Sent Events (/api/stream/dashboard).
+ *
+ * Uma única conexão EventSource por combinação de filtros, compartilhada por
+ * todos os componentes da aba (contagem de referências). Cada evento atualiza
+ * o unifiedCache com os mesmos parâmetros das chamadas REST, de modo que um
+ * recarregamento manual não volta a dados mais antigos que os recebidos.
+ */
+
+export type DashboardStreamSection = 'metrics' | 'ranking' | 'tickets';
+
+export interface DashboardStreamFilters {
+  start_date?: string;
+  end_date?: string;
+  ranking_limit?: number;
+  tickets_limit?: number;
+}
+
+export interface DashboardStreamListener {
+  metrics?: (data: DashboardMetrics, updatedAt: string) => void;
+  ranking?: (data: any[], updatedAt: string) => void;
+  tickets?: (data: any[], updatedAt: string) => void;
+  // Stream recusado (desabilitado, limite de conexões) ou sem suporte a EventSource
+  unavailable?: () => void;
+}
+
+interface StreamEvent {
+  data: any;
+  updatedAt: string;
+}
+
+interface Channel {
+  source: EventSource;
+  filters: Required<DashboardStreamFilters>;
+  listeners: Set<DashboardStreamListener>;
+  // Último evento de cada seção: o servidor só manda o snapshot ao conectar
+  last: Map<DashboardStreamSection, StreamEvent>;
+}
+
+const SECTIONS: DashboardStreamSection[] = ['metrics', 'ranking', 'tickets'];
+const channels = new Map<string, Channel>();
+
+const normalizeFilters = (filters: DashboardStreamFilters): Required<DashboardStreamFilters> => ({
+  start_date: filters.start_date || '',
+  end_date: filters.end_date || '',
+  ranking_limit: filters.ranking_limit || 50,
+  tickets_limit: filters.tickets_limit || 8,
+});
+
+const channelKey = (filters: Required<DashboardStreamFilters>) =>
+  [filters.start_date, filters.end_date, filters.ranking_limit, filters.tickets_limit].join('|');
+
+export const isDashboardStreamSupported = (): boolean => typeof EventSource !== 'undefined';
+
+const updateCache = (
+  section: DashboardStreamSection,
+  filters: Required<DashboardStreamFilters>,
+  data: any
+) => {
+  const hasDates = Boolean(filters.start_date && filters.end_date);
+  if (section === 'metrics') {
+    const dateRange = hasDates
+      ? { startDate: filters.start_date, endDate: filters.end_date, label: '' }
+      : undefined;
+    unifiedCache.set('metrics', metricsCacheParams(dateRange), data);
+  } else if (section === 'ranking') {
+    unifiedCache.set(
+      'technicianRanking',
+      rankingCacheParams({
+        start_date: hasDates ? filters.start_date : undefined,
+        end_date: hasDates ? filters.end_date : undefined,
+        limit: filters.ranking_limit,
+      }),
+      data
+    );
+  } else {
+    unifiedCache.set('newTickets', newTicketsCacheParams(filters.tickets_limit), data);
+  }
+};
+
+const notify = (
+  listener: DashboardStreamListener,
+  section: DashboardStreamSection,
+  event: StreamEvent
+) => {
+  const callback = listener[section] as ((data: any, updatedAt: string) => void) | undefined;
+  if (callback) {
+    callback(event.data, event.updatedAt);
+  }
+};
+
+const openChannel = (key: string, filters: Required<DashboardStreamFilters>): Channel => {
+  const params = new URLSearchParams({
+    ranking_limit: filters.ranking_limit.toString(),
+    tickets_limit: filters.tickets_limit.toString(),
+  });
+  if (filters.start_date && filters.end_date) {
+    params.append('start_date', filters.start_date);
+    params.append('end_date', filters.end_date);
+  }
+
+  const source = new EventSource(`${API_CONFIG.BASE_URL}/stream/dashboard?${params.toString()}`);
+  const channel: Channel = { source, filters, listeners: new Set(), last: new Map() };
+
+  SECTIONS.forEach(section => {
+    source.addEventListener(section, (message: MessageEvent) => {
+      try {
+        const payload = JSON.parse(message.data);
+        if (!payload.success) return;
+        const data = section === 'metrics' ? processMetricsData(payload.data) : payload.data;
+        const event: StreamEvent = { data, updatedAt: payload.updated_at };
+        channel.last.set(section, event);
+        updateCache(section, filters, data);
+        channel.listeners.forEach(listener => notify(listener, section, event));
+      } catch (error) {
+        console.error(`Erro ao processar evento ${section} do stream:`, error);
+      }
+    });
+  });
+
+  source.onerror = () => {
+    // Quedas de conexão são reconectadas pelo próprio EventSource (campo retry);
+    // CLOSED significa resposta diferente de 200 (stream desabilitado ou 503)
+    if (source.readyState === EventSource.CLOSED) {
+      console.warn('Stream do dashboard indisponível, mantendo os dados atuais');
+      channels.delete(key);
+      channel.listeners.forEach(listener => listener.unavailable?.());
+      channel.listeners.clear();
+    }
+  };
+
+  channels.set(key, channel);
+  return channel;
+};
+
+/**
+ * Assina as atualizações do dashboard para os filtros informados.
+ *
+ * @returns Função que cancela a assinatura (a conexão é fechada com o último assinante)
+ */
+export function subscribeDashboardStream(
+  filters: DashboardStreamFilters,
+  listener: DashboardStreamListener
+): () => void {
+  if (!isDashboardStreamSupported()) {
+    listener.unavailable?.();
+    return () => {};
+  }
+
+  const normalized = normalizeFilters(filters);
+  const key = channelKey(normalized);
+  const channel = channels.get(key) || openChannel(key, normalized);
+  channel.listeners.add(listener);
+
+  // Assinante tardio recebe o último estado sem esperar a próxima mudança
+  channel.last.forEach((event, section) => notify(listener, section, event));
+
+  return () => {
+    channel.listeners.delete(listener);
+    if (channel.listeners.size === 0 && channels.get(key) === channel) {
+      channel.source.close();
+      channels.delete(key);
+    }
+  };
+}
+
+/**
+ * Assina só os tickets novos, reaproveitando a conexão de outro componente com o
+ * mesmo limite de tickets (a lista não depende dos filtros de data).
+ */
+export function subscribeDashboardTickets(
+  ticketsLimit: number,
+  onTickets: (data: any[], updatedAt: string) => void,
+  onUnavailable?: () => void
+): () => void {
+  const limit = ticketsLimit || 8;
+  const shared = Array.from(channels.values()).find(
+    channel => channel.filters.tickets_limit === limit
+  );
+  return subscribeDashboardStream(shared ? shared.filters : { tickets_limit: limit }, {
+    tickets: onTickets,
+    unavailable: onUnavailable,
+  });
+}
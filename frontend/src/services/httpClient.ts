@@ -58,6 +58,26 @@ export const httpClient: AxiosInstance = axios.create({
   },
 });
 
+// Revalidação por ETag: respostas GET com ETag ficam guardadas e a próxima requisição à mesma URL
+// envia If-None-Match; um 304 reaproveita o corpo anterior sem baixar nem processar o JSON de novo.
+// O store guarda e entrega cópias: quem altera response.data não altera o corpo guardado
+const ETAG_STORE_MAX_ENTRIES = 100;
+const etagStore = new Map<string, { etag: string; data: unknown }>();
+
+const isGetRequest = (config?: AxiosRequestConfig) =>
+  !!config && (config.method || 'get').toLowerCase() === 'get';
+
+const etagKey = (config: AxiosRequestConfig) => httpClient.getUri(config);
+
+const rememberEtag = (key: string, etag: string, data: unknown) => {
+  etagStore.delete(key);
+  etagStore.set(key, { etag, data: structuredClone(data) });
+  if (etagStore.size > ETAG_STORE_MAX_ENTRIES) {
+    const oldestKey = etagStore.keys().next().value;
+    if (oldestKey !== undefined) etagStore.delete(oldestKey);
+  }
+};
+
 // Log da configuração inicial (apenas em desenvolvimento)
 if (import.meta.env.DEV) {
   console.log('🌐 HTTP Client configurado:', {
@@ -88,6 +108,16 @@ httpClient.interceptors.request.use(
       (config.headers as any)['Session-Token'] = authConfig.userToken;
     }
 
+    if (isGetRequest(config)) {
+      const stored = config.__skipEtag ? undefined : etagStore.get(etagKey(config));
+      if (stored) {
+        (config.headers as any)['If-None-Match'] = stored.etag;
+      } else {
+        delete (config.headers as any)['If-None-Match'];
+      }
+      config.validateStatus = (status: number) => (status >= 200 && status < 300) || status === 304;
+    }
+
     // Log da requisição (apenas em desenvolvimento com debug habilitado)
     if (import.meta.env.DEV && getEnvVar('VITE_SHOW_API_CALLS') === 'true') {
       console.log(`🚀 ${config.method?.toUpperCase()} ${config.url}`, {
@@ -118,6 +148,22 @@ httpClient.interceptors.response.use(
       });
     }
 
+    if (isGetRequest(response.config)) {
+      const key = etagKey(response.config);
+      if (response.status === 304) {
+        const stored = etagStore.get(key);
+        if (!stored) {
+          // Corpo anterior descartado entre a requisição e a resposta: buscar completo
+          return httpClient.request({ ...response.config, __skipEtag: true });
+        }
+        response.data = structuredClone(stored.data);
+        response.status = 200;
+        response.statusText = 'OK (Not Modified)';
+      } else if (response.headers?.etag) {
+        rememberEtag(key, response.headers.etag, response.data);
+      }
+    }
+
     return response;
   },
   async (error: AxiosError) => {
@@ -253,6 +299,7 @@ function dispatchAuthError() {
 declare module 'axios' {
   interface AxiosRequestConfig {
     __retryCount?: number;
+    __skipEtag?: boolean;
     cache?: boolean;
     retry?: number;
   }
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark da carga inicial do dashboard: três rotas separadas x ``/api/dashboard``.
+
+Compara, para cada cenário, o tempo até métricas, ranking e tickets recentes
+estarem disponíveis e as chamadas feitas ao GLPI:
+
+- ``separado``: três requisições em paralelo, como o frontend fazia
+  (``/api/metrics``, ``/api/technicians/ranking`` e ``/api/tickets/recent``),
+  cada uma com seu custo de requisição HTTP, sua autenticação e sua chamada;
+- ``combinado``: uma requisição que passa por ``DashboardSnapshot.collect``
+  (uma autenticação, seções em paralelo).
+
+Cenários: ``frio`` (Session-Token expirado), ``quente`` (token válido) e
+``stream`` (um wallboard conectado com os mesmos filtros mantém as seções no
+``DashboardStream``, que ``/api/dashboard`` reaproveita).
+
+O serviço é um GLPI falso em memória que conta logins e chamadas e responde
+com ``--latency-ms`` de atraso. Com ``--url`` as requisições vão a um backend
+de verdade e as chamadas ao GLPI são lidas dos totais ``upstream`` de
+``/api/performance``.
+
+Uso:
+    python scripts/benchmark_dashboard_bootstrap.py --repeat 20
+    python scripts/benchmark_dashboard_bootstrap.py --latency-ms 120 --login-ms 400 --request-ms 30
+    python scripts/benchmark_dashboard_bootstrap.py --url http://localhost:8000/api --repeat 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+# Permite importar os módulos do backend (services, config, utils)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from services.glpi_dashboard_snapshot import DashboardSnapshot  # noqa: E402
+from services.glpi_dashboard_stream import SECTIONS, DashboardStream, ThreadSubscription, topic_from_args  # noqa: E402
+
+SEPARATE_ROUTES = ("/metrics", "/technicians/ranking", "/tickets/recent")
+
+
+class FakeDashboardService:
+    """Métodos do GLPIService usados pelas seções, com contagem de logins e chamadas"""
+
+    async_client = None
+
+    def __init__(self, latency: float, login_latency: float):
+        self.latency = latency
+        self.login_latency = login_latency
+        self.lock = threading.Lock()
+        self.login_lock = threading.Lock()
+        self.token_valid = False
+        self.calls = 0
+        self.logins = 0
+
+    def reset(self, token_valid: bool) -> None:
+        with self.lock:
+            self.token_valid = token_valid
+            self.calls = 0
+            self.logins = 0
+
+    def _ensure_authenticated(self) -> bool:
+        # Login single-flight, como o GLPIService: quem chega durante o login espera por ele
+        with self.login_lock:
+            if not self.token_valid:
+                time.sleep(self.login_latency)
+                with self.lock:
+                    self.logins += 1
+                self.token_valid = True
+        return True
+
+    def _call(self) -> None:
+        with self.lock:
+            self.calls += 1
+        time.sleep(self.latency)
+
+    def get_dashboard_metrics(self) -> Dict[str, Any]:
+        self._call()
+        level = {"novos": 3, "pendentes": 7, "progresso": 12, "resolvidos": 40}
+        return {
+            "success": True,
+            "data": {
+                "novos": 12,
+                "pendentes": 28,
+                "progresso": 48,
+                "resolvidos": 160,
+                "total": 248,
+                "niveis": {"n1": level, "n2": level, "n3": level, "n4": level},
+                "timestamp": time.time(),
+            },
+            "tempo_execucao": self.latency * 1000,
+        }
+
+    def get_technician_ranking(self, limit: int = 50) -> List[Dict[str, Any]]:
+        self._call()
+        return [{"id": str(i), "name": f"Técnico {i}", "total": 100 - i, "level": "N2"} for i in range(limit)]
+
+    def get_new_tickets(self, limit: int = 8) -> List[Dict[str, Any]]:
+        self._call()
+        return [{"id": str(1000 + i), "title": f"Ticket {i}", "priority": "Média"} for i in range(limit)]
+
+
+def run_separate(service: FakeDashboardService, stream: DashboardStream, request_cost: float) -> None:
+    """Três requisições HTTP em paralelo, cada rota autenticando e calculando sua seção"""
+    topic = topic_from_args({})
+
+    def route(section: str) -> Any:
+        time.sleep(request_cost)
+        service._ensure_authenticated()
+        return stream.fetch_section(section, topic)
+
+    with ThreadPoolExecutor(max_workers=len(SECTIONS)) as pool:
+        list(pool.map(route, SECTIONS))
+
+
+def run_combined(service: FakeDashboardService, snapshot: DashboardSnapshot, request_cost: float) -> None:
+    """Uma requisição a ``/api/dashboard``"""
+    time.sleep(request_cost)
+    snapshot.collect(topic_from_args({}))
+
+
+def _wait_for_stream(stream: DashboardStream, timeout: float = 10.0) -> None:
+    topic = topic_from_args({})
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if all(stream.latest(topic, section) is not None for section in SECTIONS):
+            return
+        time.sleep(0.01)
+    raise RuntimeError("O stream não calculou as seções a tempo")
+
+
+def measure(
+    service: FakeDashboardService, token_valid: bool, runner: Callable[[], None], repeat: int
+) -> Dict[str, float]:
+    durations = []
+    calls = logins = 0
+    for _ in range(repeat):
+        service.reset(token_valid)
+        started = time.perf_counter()
+        runner()
+        durations.append((time.perf_counter() - started) * 1000)
+        calls += service.calls
+        logins += service.logins
+    return {
+        "median_ms": statistics.median(durations),
+        "max_ms": max(durations),
+        "calls": calls / repeat,
+        "logins": logins / repeat,
+    }
+
+
+def run_local(args: argparse.Namespace) -> None:
+    service = FakeDashboardService(args.latency_ms / 1000, args.login_ms / 1000)
+    request_cost = args.request_ms / 1000
+    print(
+        f"GLPI falso com {args.latency_ms:.0f} ms por chamada, login de {args.login_ms:.0f} ms, "
+        f"{args.request_ms:.0f} ms por requisição HTTP, {args.repeat} repetições\n"
+    )
+    header = f"{'cenário':<8} {'modo':<10} {'mediana ms':>11} {'máx ms':>9} {'chamadas GLPI':>14} {'logins':>7}"
+    print(header)
+    print("-" * len(header))
+
+    for scenario in ("frio", "quente", "stream"):
+        stream = DashboardStream(service, section_intervals={section: 3600 for section in SECTIONS})
+        snapshot = DashboardSnapshot(service, stream)
+        subscription = None
+        if scenario == "stream":
+            service.reset(True)
+            subscription = stream.subscribe(topic_from_args({}), ThreadSubscription(stream.max_pending))
+            _wait_for_stream(stream)
+
+        token_valid = scenario != "frio"
+        modes = (
+            ("separado", lambda: run_separate(service, stream, request_cost)),
+            ("combinado", lambda: run_combined(service, snapshot, request_cost)),
+        )
+        for label, runner in modes:
+            result = measure(service, token_valid, runner, args.repeat)
+            print(
+                f"{scenario:<8} {label:<10} {result['median_ms']:>11.1f} {result['max_ms']:>9.1f} "
+                f"{result['calls']:>14.1f} {result['logins']:>7.1f}"
+            )
+
+        if subscription is not None:
+            stream.unsubscribe(subscription)
+        stream.stop()
+
+
+def _get(url: str) -> Dict[str, Any]:
+    with urllib.request.urlopen(url, timeout=120) as response:
+        return json.load(response)
+
+
+def _upstream_total(base_url: str) -> int:
+    stats = _get(f"{base_url}/performance?group=upstream")
+    return sum(series["total"] for series in stats.get("latency", {}).get("upstream", {}).values())
+
+
+def run_remote(args: argparse.Namespace) -> None:
+    """Requisições reais; ``nocache`` distinto a cada rodada para não medir respostas em cache"""
+    base_url = args.url.rstrip("/")
+    print(f"Backend {base_url}, {args.repeat} repetições\n")
+    header = f"{'modo':<10} {'mediana ms':>11} {'máx ms':>9} {'chamadas GLPI':>14}"
+    print(header)
+    print("-" * len(header))
+
+    def separate(tag: str) -> None:
+        urls = [f"{base_url}{route}?nocache={tag}" for route in SEPARATE_ROUTES]
+        with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+            list(pool.map(_get, urls))
+
+    def combined(tag: str) -> None:
+        _get(f"{base_url}/dashboard?nocache={tag}")
+
+    for label, runner in (("separado", separate), ("combinado", combined)):
+        durations = []
+        calls = 0
+        for index in range(args.repeat):
+            before = _upstream_total(base_url)
+            started = time.perf_counter()
+            runner(f"{label}-{index}-{time.time()}")
+            durations.append((time.perf_counter() - started) * 1000)
+            calls += _upstream_total(base_url) - before
+        print(
+            f"{label:<10} {statistics.median(durations):>11.1f} {max(durations):>9.1f} "
+            f"{calls / args.repeat:>14.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=10, help="Repetições por cenário")
+    parser.add_argument("--latency-ms", type=float, default=80.0, help="Latência de cada chamada ao GLPI falso")
+    parser.add_argument("--login-ms", type=float, default=300.0, help="Latência do initSession do GLPI falso")
+    parser.add_argument("--request-ms", type=float, default=20.0, help="Custo de cada requisição HTTP do navegador")
+    parser.add_argument("--url", help="Base da API de um backend em execução (ex.: http://localhost:8000/api)")
+    args = parser.parse_args()
+
+    if args.url:
+        run_remote(args)
+    else:
+        run_local(args)
+
+
+if __name__ == "__main__":
+    main()
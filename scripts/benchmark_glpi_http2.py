@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark do transporte do AsyncGLPIClient: HTTP/1.1 (pool) x HTTP/2 (multiplexado).
+
+Sobe um stand-in local do GLPI (Hypercorn, HTTP/1.1 e h2c por prior knowledge)
+que responde ``search/Ticket`` com ``Content-Range`` após uma latência
+simulada, e dispara o mesmo fan-out de contagens (``range=0-0``) com os dois
+transportes criados por ``create_async_http_client``. Com ``--url`` o
+benchmark aponta para um proxy real (em HTTPS o HTTP/2 é negociado via ALPN).
+
+Uso:
+    pip install "httpx[http2]" hypercorn
+    python scripts/benchmark_glpi_http2.py --requests 400 --concurrency 64 --latency-ms 20
+    python scripts/benchmark_glpi_http2.py --url https://glpi.exemplo/apirest.php \\
+        --app-token ... --session-token ...
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+# Permite importar os módulos do backend (services, config, utils)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from services.glpi_async_client import H2_AVAILABLE, HTTPX_AVAILABLE, create_async_http_client  # noqa: E402
+from services.glpi_queries import build_status_count_params  # noqa: E402
+
+
+class GLPIStandIn:
+    """Aplicação ASGI que imita ``GET search/Ticket`` do GLPI"""
+
+    def __init__(self, latency: float, total: int = 42):
+        self.latency = latency
+        self.total = total
+        self.connections = set()
+        self.http_versions: Dict[str, int] = {}
+
+    def reset(self) -> None:
+        self.connections.clear()
+        self.http_versions.clear()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        # Cada conexão TCP tem uma porta de origem distinta
+        self.connections.add(tuple(scope.get("client") or ()))
+        version = scope.get("http_version", "?")
+        self.http_versions[version] = self.http_versions.get(version, 0) + 1
+
+        await asyncio.sleep(self.latency)
+        body = json.dumps({"totalcount": self.total, "count": 0, "data": []}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-range", f"0-0/{self.total}".encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def run_fan_out(
+    client, search_url: str, headers: Dict[str, str], total: int, concurrency: int
+) -> Dict[str, Any]:
+    """Dispara ``total`` contagens com no máximo ``concurrency`` em andamento"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    versions: Dict[str, int] = {}
+    errors = 0
+
+    async def one(index: int) -> None:
+        nonlocal errors
+        params = build_status_count_params("12", index % 6 + 1)
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await client.get(search_url, params=params, headers=headers)
+            except Exception:
+                errors += 1
+                return
+            latencies.append((time.perf_counter() - start) * 1000)
+            versions[response.http_version] = versions.get(response.http_version, 0) + 1
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    wall = time.perf_counter() - start
+
+    return {
+        "wall_s": wall,
+        "rps": total / wall if wall else 0.0,
+        "p50_ms": _percentile(latencies, 50) if latencies else 0.0,
+        "p95_ms": _percentile(latencies, 95) if latencies else 0.0,
+        "errors": errors,
+        "versions": versions,
+    }
+
+
+async def benchmark(args) -> None:
+    stand_in: Optional[GLPIStandIn] = None
+    shutdown = asyncio.Event()
+    server_task = None
+    headers: Dict[str, str] = {}
+
+    if args.url:
+        base_url = args.url.rstrip("/")
+        if args.app_token:
+            headers["App-Token"] = args.app_token
+        if args.session_token:
+            headers["Session-Token"] = args.session_token
+    else:
+        try:
+            from hypercorn.asyncio import serve
+            from hypercorn.config import Config
+        except ImportError:
+            sys.exit("Stand-in local requer o pacote 'hypercorn' (pip install hypercorn)")
+
+        stand_in = GLPIStandIn(args.latency_ms / 1000)
+        port = _free_port()
+        config = Config()
+        config.bind = [f"127.0.0.1:{port}"]
+        config.loglevel = "WARNING"
+        config.accesslog = None
+        server_task = asyncio.create_task(serve(stand_in, config, shutdown_trigger=shutdown.wait))
+        await asyncio.sleep(0.5)
+        base_url = f"http://127.0.0.1:{port}/apirest.php"
+
+    search_url = f"{base_url}/search/Ticket"
+    modes = [("HTTP/1.1 pool", False), ("HTTP/2", True)]
+
+    print(
+        f"Fan-out: {args.requests} contagens, {args.concurrency} simultâneas, "
+        f"pool de {args.max_connections} conexões, {args.rounds} rodadas"
+    )
+    print(f"Alvo: {search_url}\n")
+    header = f"{'transporte':<15} {'wall (s)':>9} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'conexões':>9} {'erros':>6}  versões"
+    print(header)
+    print("-" * len(header))
+
+    try:
+        for label, http2 in modes:
+            rounds = []
+            connections = []
+            for _ in range(args.rounds):
+                if stand_in is not None:
+                    stand_in.reset()
+                # Cliente novo por rodada: o custo de abrir conexões entra na medida
+                client = create_async_http_client(
+                    args.max_connections,
+                    http2=http2,
+                    http2_prior_knowledge=http2 and search_url.startswith("http://"),
+                )
+                async with client:
+                    rounds.append(
+                        await run_fan_out(
+                            client, search_url, headers, args.requests, args.concurrency
+                        )
+                    )
+                if stand_in is not None:
+                    connections.append(len(stand_in.connections))
+
+            result = min(rounds, key=lambda r: r["wall_s"])
+            conns = str(int(statistics.median(connections))) if connections else "-"
+            print(
+                f"{label:<15} {statistics.median(r['wall_s'] for r in rounds):>9.3f} "
+                f"{statistics.median(r['rps'] for r in rounds):>9.1f} "
+                f"{statistics.median(r['p50_ms'] for r in rounds):>8.1f} "
+                f"{statistics.median(r['p95_ms'] for r in rounds):>8.1f} "
+                f"{conns:>9} {sum(r['errors'] for r in rounds):>6}  {result['versions']}"
+            )
+    finally:
+        shutdown.set()
+        if server_task is not None:
+            await server_task
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=400, help="Contagens por rodada")
+    parser.add_argument("--concurrency", type=int, default=64, help="Requisições simultâneas")
+    parser.add_argument(
+        "--max-connections", type=int, default=32, help="Limite do pool (ASYNC_MAX_CONNECTIONS)"
+    )
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Latência do stand-in")
+    parser.add_argument("--rounds", type=int, default=3, help="Rodadas por transporte (mediana)")
+    parser.add_argument("--url", help="URL base da API de um GLPI/proxy real (apirest.php)")
+    parser.add_argument("--app-token", help="App-Token para --url")
+    parser.add_argument("--session-token", help="Session-Token para --url")
+    args = parser.parse_args()
+
+    if not HTTPX_AVAILABLE:
+        sys.exit("Benchmark requer o pacote 'httpx'")
+    if not H2_AVAILABLE:
+        sys.exit("Benchmark requer o suporte a HTTP/2 do httpx (pip install 'httpx[http2]')")
+
+    asyncio.run(benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark do JSONFormatter: formatter anterior x esquema pré-calculado (json e orjson).
+
+Formata registros típicos das requisições ao GLPI, na proporção em que
+aparecem nos logs de uma rota de métricas:
+
+- ``metric``: ``log_glpi_request`` (métrica de performance com
+  ``metric_context`` e ``sample_rate``);
+- ``info``: parâmetros/resultado de uma contagem de tickets;
+- ``session``: renovação de sessão com ``session_token`` nos extras (mascarado);
+- ``error``: falha de requisição com ``exc_info``.
+
+Modos medidos:
+
+- ``anterior``: cópia do formatter antigo (conjunto de chaves ignoradas
+  montado por registro, ``json.dumps`` de teste em cada extra, segunda
+  passada para mascarar dados sensíveis);
+- ``json``: ``JSONFormatter(use_orjson=False)``;
+- ``orjson``: ``JSONFormatter()`` com orjson instalado.
+
+Antes de medir, as saídas são comparadas com as do formatter anterior
+(ignorando o timestamp).
+
+Uso:
+    python scripts/benchmark_json_formatter.py --records 50000
+    python scripts/benchmark_json_formatter.py --records 20000 --repeat 5 --correlation-id
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+# Permite importar os módulos do backend (services, config, utils)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from utils.structured_logging import (  # noqa: E402
+    ORJSON_AVAILABLE,
+    JSONFormatter,
+    correlation_id_var,
+    operation_context_var,
+)
+
+
+class LegacyJSONFormatter(logging.Formatter):
+    """Formatter anterior, mantido aqui só como referência de desempenho"""
+
+    def __init__(self):
+        super().__init__()
+        self.exclude_fields: List[str] = []
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_data = {
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+        }
+        correlation_id = correlation_id_var.get()
+        if correlation_id:
+            log_data["correlation_id"] = correlation_id
+        operation_context = operation_context_var.get()
+        if operation_context:
+            log_data["operation"] = operation_context
+        if record.exc_info:
+            log_data["exception"] = {
+                "type": record.exc_info[0].__name__ if record.exc_info[0] else None,
+                "message": str(record.exc_info[1]) if record.exc_info[1] else None,
+                "traceback": self.formatException(record.exc_info),
+            }
+        for key, value in record.__dict__.items():
+            if (
+                key
+                not in {
+                    "name",
+                    "msg",
+                    "args",
+                    "levelname",
+                    "levelno",
+                    "pathname",
+                    "filename",
+                    "module",
+                    "lineno",
+                    "funcName",
+                    "created",
+                    "msecs",
+                    "relativeCreated",
+                    "thread",
+                    "threadName",
+                    "processName",
+                    "process",
+                    "getMessage",
+                    "exc_info",
+                    "exc_text",
+                    "stack_info",
+                    "taskName",
+                }
+                and key not in self.exclude_fields
+            ):
+                try:
+                    json.dumps(value)
+                    log_data[key] = value
+                except (TypeError, ValueError):
+                    log_data[key] = str(value)
+        log_data = self._sanitize_sensitive_data(log_data)
+        return json.dumps(log_data, ensure_ascii=False, separators=(",", ":"))
+
+    def _sanitize_sensitive_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        sensitive_fields = {
+            "password",
+            "token",
+            "secret",
+            "key",
+            "authorization",
+            "cookie",
+            "session",
+            "csrf",
+            "api_key",
+            "access_token",
+        }
+
+        def sanitize_value(key: str, value: Any) -> Any:
+            if isinstance(key, str) and any(field in key.lower() for field in sensitive_fields):
+                if isinstance(value, str) and len(value) > 8:
+                    return f"{value[:4]}***{value[-4:]}"
+                return "***"
+            if isinstance(value, dict):
+                return {k: sanitize_value(k, v) for k, v in value.items()}
+            elif isinstance(value, list):
+                return [sanitize_value(f"item_{i}", item) for i, item in enumerate(value)]
+            return value
+
+        return {k: sanitize_value(k, v) for k, v in data.items()}
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def _record(name: str, level: int, msg: str, args: tuple, extra: Dict[str, Any], exc_info=None) -> logging.LogRecord:
+    record = logging.LogRecord(name, level, "services/glpi_service.py", 812, msg, args, exc_info, "_count_search")
+    record.__dict__.update(extra)
+    return record
+
+
+def typical_records() -> Dict[str, logging.LogRecord]:
+    """Um registro de cada tipo, como emitidos pelo glpi_service e pelo structured_logging"""
+    try:
+        raise ConnectionError("HTTPSConnectionPool(host='glpi.local', port=443): Read timed out.")
+    except ConnectionError:
+        exc_info = sys.exc_info()
+
+    return {
+        "metric": _record(
+            "glpi.external",
+            logging.INFO,
+            "Métrica de performance: %s = %s %s",
+            ("glpi_request_duration", 0.183, "seconds"),
+            {
+                "metric_type": "performance",
+                "metric_name": "glpi_request_duration",
+                "metric_value": 0.183,
+                "metric_unit": "seconds",
+                "metric_context": {"endpoint": "GET search/Ticket", "status_code": 200},
+                "sample_rate": 0.1,
+            },
+        ),
+        "info": _record(
+            "glpi_service",
+            logging.INFO,
+            "GLPI Query Result - group_id: %s, status_id: %s, ticket_count: %s, source: content-range_header",
+            (89, 2, 147),
+            {"sample_rate": 0.1},
+        ),
+        "session": _record(
+            "glpi_service",
+            logging.INFO,
+            "Sessão GLPI renovada (pool %s/%s)",
+            (3, 6),
+            {"session_token": "k3j4h5g6f7d8s9a0q1w2e3r4", "glpi_url": "https://glpi.local/apirest.php"},
+        ),
+        "error": _record(
+            "glpi_service",
+            logging.ERROR,
+            "Erro na requisição %s: %s",
+            ("GET search/Ticket", "Read timed out."),
+            {"retry_attempt": 2, "endpoint": "search/Ticket"},
+            exc_info,
+        ),
+    }
+
+
+# Proporção de cada tipo numa rota de métricas típica
+MIX = ["metric"] * 4 + ["info"] * 4 + ["session"] + ["error"]
+
+
+def check_equivalent(formatter: logging.Formatter, baseline: logging.Formatter, records) -> int:
+    """Quantos registros diferem do formatter anterior (fora o timestamp)"""
+    differences = 0
+    for record in records.values():
+        new, old = json.loads(formatter.format(record)), json.loads(baseline.format(record))
+        new.pop("timestamp"), old.pop("timestamp")
+        if new != old:
+            differences += 1
+            print(f"  diferença em {record.name}: {new} != {old}")
+    return differences
+
+
+def run(formatter: logging.Formatter, records, count: int, repeat: int) -> Dict[str, float]:
+    sequence = [records[kind] for kind in MIX]
+    per_record: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for i in range(count):
+            record = sequence[i % len(sequence)]
+            record.exc_text = None  # Cada registro real formata o próprio traceback
+            formatter.format(record)
+        per_record.append((time.perf_counter() - start) / count * 1e6)
+    return {
+        "mean_us": statistics.fmean(per_record),
+        "p50_us": _percentile(per_record, 50),
+        "best_us": min(per_record),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--records", type=int, default=50000, help="Registros formatados por rodada")
+    parser.add_argument("--repeat", type=int, default=3, help="Rodadas por modo")
+    parser.add_argument("--correlation-id", action="store_true", help="Formatar com correlation_id e operação no contexto")
+    args = parser.parse_args()
+
+    if args.correlation_id:
+        correlation_id_var.set("6f1c2a9e-4b7d-4e4b-9a51-0d7c5e8b2f13")
+        operation_context_var.set({"operation": "get_metrics", "filters": {"start_date": "2025-01-01"}})
+
+    records = typical_records()
+    baseline = LegacyJSONFormatter()
+    modes = [("anterior", baseline), ("json", JSONFormatter(use_orjson=False))]
+    if ORJSON_AVAILABLE:
+        modes.append(("orjson", JSONFormatter()))
+    else:
+        print("orjson não instalado: modo orjson ignorado")
+
+    for label, formatter in modes[1:]:
+        differences = check_equivalent(formatter, baseline, records)
+        print(f"Saída {label}: {'equivalente' if not differences else f'{differences} diferença(s)'} ao formatter anterior")
+
+    print(f"\n{args.records} registros x {args.repeat} rodadas, mistura {MIX}\n")
+    header = f"{'modo':<10} {'média µs':>10} {'p50 µs':>9} {'melhor µs':>10} {'ganho':>7}"
+    print(header)
+    print("-" * len(header))
+    reference = None
+    for label, formatter in modes:
+        result = run(formatter, records, args.records, args.repeat)
+        reference = reference or result["mean_us"]
+        print(
+            f"{label:<10} {result['mean_us']:>10.2f} {result['p50_us']:>9.2f} {result['best_us']:>10.2f} "
+            f"{reference / result['mean_us']:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
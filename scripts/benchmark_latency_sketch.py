@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark dos quantis de latência: lista ordenada a cada P95 x sketch em janela deslizante.
+
+Alimenta com latências log-normais (parecidas com as do GLPI: mediana de
+~130 ms e cauda longa) as duas abordagens:
+
+- ``lista``: o PerformanceMonitor anterior (últimos 1000 tempos numa lista
+  recortada por fatiamento e ``sorted`` a cada consulta do P95);
+- ``sketch``: ``SlidingWindowSketch`` de ``utils.latency_sketch`` (DDSketch por
+  slot de ``SLOT_SECONDS``), consultado na janela padrão.
+
+Mede o custo de registrar uma amostra e de consultar p50/p95/p99 a cada
+``--query-every`` amostras, e o erro relativo dos quantis do sketch em
+relação aos valores exatos das mesmas amostras.
+
+Uso:
+    python scripts/benchmark_latency_sketch.py --samples 200000
+    python scripts/benchmark_latency_sketch.py --samples 50000 --query-every 100 --threads 8
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from typing import Dict, List
+
+# Permite importar os módulos do backend (services, config, utils)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from config.performance import LATENCY_CONFIG  # noqa: E402
+from utils.latency_sketch import SlidingWindowSketch  # noqa: E402
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+class ListMonitor:
+    """Abordagem anterior: lista dos últimos 1000 tempos, ordenada a cada consulta"""
+
+    def __init__(self):
+        self.request_times: List[float] = []
+
+    def add(self, duration: float) -> None:
+        self.request_times.append(duration)
+        if len(self.request_times) > 1000:
+            self.request_times = self.request_times[-1000:]
+
+    def quantiles(self) -> List[float]:
+        ordered = sorted(self.request_times)
+        return [ordered[min(int(len(ordered) * q), len(ordered) - 1)] for q in QUANTILES]
+
+
+class SketchMonitor:
+    def __init__(self):
+        self.window_seconds = LATENCY_CONFIG["WINDOWS"][LATENCY_CONFIG["DEFAULT_WINDOW"]]
+        self.sketch = SlidingWindowSketch()
+
+    def add(self, duration: float) -> None:
+        self.sketch.add(duration)
+
+    def quantiles(self) -> List[float]:
+        return self.sketch.window(self.window_seconds).quantiles(QUANTILES)
+
+
+def run(monitor, samples: List[float], query_every: int, threads: int) -> Dict[str, float]:
+    add_times: List[float] = []
+    query_times: List[float] = []
+    lock = threading.Lock()
+    chunk = len(samples) // threads
+
+    def work(part: List[float]) -> None:
+        local_add: List[float] = []
+        local_query: List[float] = []
+        for position, value in enumerate(part, 1):
+            start = time.perf_counter()
+            monitor.add(value)
+            local_add.append((time.perf_counter() - start) * 1e6)
+            if position % query_every == 0:
+                start = time.perf_counter()
+                monitor.quantiles()
+                local_query.append((time.perf_counter() - start) * 1e6)
+        with lock:
+            add_times.extend(local_add)
+            query_times.extend(local_query)
+
+    workers = [threading.Thread(target=work, args=(samples[i * chunk : (i + 1) * chunk],)) for i in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    wall = time.perf_counter() - start
+    return {
+        "wall_s": wall,
+        "add_p50_us": _percentile(add_times, 50),
+        "add_p99_us": _percentile(add_times, 99),
+        "query_p50_us": _percentile(query_times, 50) if query_times else 0.0,
+        "query_p99_us": _percentile(query_times, 99) if query_times else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--samples", type=int, default=200000, help="Latências registradas por modo")
+    parser.add_argument("--query-every", type=int, default=50, help="Consulta de p50/p95/p99 a cada N amostras")
+    parser.add_argument("--threads", type=int, default=1, help="Threads registrando ao mesmo tempo")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    samples = [rng.lognormvariate(-2.0, 0.9) for _ in range(args.samples)]
+
+    print(
+        f"{args.samples} amostras, consulta a cada {args.query_every}, {args.threads} thread(s), "
+        f"precisão relativa {LATENCY_CONFIG['RELATIVE_ACCURACY']:.0%}\n"
+    )
+    header = f"{'modo':<8} {'wall (s)':>9} {'add p50 µs':>11} {'add p99 µs':>11} {'P95 p50 µs':>11} {'P95 p99 µs':>11}"
+    print(header)
+    print("-" * len(header))
+    sketch = SketchMonitor()
+    for label, monitor in (("lista", ListMonitor()), ("sketch", sketch)):
+        result = run(monitor, samples, args.query_every, args.threads)
+        print(
+            f"{label:<8} {result['wall_s']:>9.3f} {result['add_p50_us']:>11.2f} {result['add_p99_us']:>11.2f} "
+            f"{result['query_p50_us']:>11.1f} {result['query_p99_us']:>11.1f}"
+        )
+
+    # Precisão: o sketch cobre todas as amostras (a lista só as últimas 1000)
+    ordered = sorted(samples)
+    estimates = sketch.quantiles()
+    print("\nQuantil   exato (ms)   sketch (ms)   erro")
+    for q, estimate in zip(QUANTILES, estimates):
+        exact = ordered[int(q * (len(ordered) - 1))]
+        print(f"p{q * 100:<7g} {exact * 1000:>10.2f} {estimate * 1000:>13.2f} {abs(estimate - exact) / exact:>6.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark do custo de logging por requisição: f-strings síncronas x fachada de log.
+
+Cada "requisição" simulada registra o que uma rota de métricas registra hoje:
+``--counts`` contagens (parâmetros e resultado de cada uma, em INFO) e uma
+métrica de performance por requisição ao GLPI. Os registros vão para um
+arquivo temporário com o ``JSONFormatter`` do projeto. Modos medidos:
+
+- ``f-string``: mensagens montadas com f-string e ``datetime.now().isoformat()``,
+  tudo escrito na thread da requisição (comportamento anterior);
+- ``fachada``: ``utils.log_facade.get_logger`` com formatação adiada e
+  amostragem de ``LOGGING_CONFIG["SAMPLE_RATES"]``, I/O ainda síncrono;
+- ``fachada+fila``: a mesma fachada com ``enable_queue_logging()`` (formatação
+  e I/O na thread do ``QueueListener``).
+
+O tempo medido é o da thread da requisição. Com ``--level WARNING`` os INFO
+são descartados e a diferença mostra o custo de montar mensagens não emitidas.
+
+Uso:
+    python scripts/benchmark_logging_overhead.py --requests 2000 --counts 24
+    python scripts/benchmark_logging_overhead.py --threads 8 --level WARNING
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+# Permite importar os módulos do backend (services, config, utils)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from utils.log_facade import disable_queue_logging, enable_queue_logging, get_logger, get_logging_stats  # noqa: E402
+from utils.structured_logging import JSONFormatter, log_glpi_request  # noqa: E402
+
+LOGGER_NAME = "benchmark.glpi_service"
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def request_fstring(counts: int) -> None:
+    """Registros de uma requisição no estilo anterior (f-string, sem amostragem)"""
+    logger = logging.getLogger(LOGGER_NAME)
+    metrics = logging.getLogger("glpi.external")
+    for status_id in range(counts):
+        logger.info(
+            f"[{datetime.now(tz=timezone.utc).isoformat()}] GLPI Query Parameters - group_id: 89, "
+            f"status_id: {status_id}, GROUP_field: 8, STATUS_field: 12, date_range: None to None"
+        )
+        logger.info(
+            f"[{datetime.now(tz=timezone.utc).isoformat()}] GLPI Query Result - group_id: 89, "
+            f"status_id: {status_id}, ticket_count: {status_id * 7}, source: content-range_header"
+        )
+        metrics.info(
+            f"Métrica de performance: glpi_request_duration = {0.05} seconds",
+            extra={
+                "metric_type": "performance",
+                "metric_name": "glpi_request_duration",
+                "metric_value": 0.05,
+                "metric_unit": "seconds",
+                "metric_context": {"endpoint": "GET search/Ticket", "status_code": 200},
+            },
+        )
+
+
+def request_facade(counts: int) -> None:
+    """Os mesmos registros pela fachada (formatação adiada e amostragem)"""
+    logger = get_logger(LOGGER_NAME)
+    for status_id in range(counts):
+        logger.info(
+            "GLPI Query Parameters - group_id: %s, status_id: %s, GROUP_field: %s, STATUS_field: %s, "
+            "date_range: %s to %s",
+            89,
+            status_id,
+            "8",
+            "12",
+            None,
+            None,
+            sample="ticket_count",
+        )
+        logger.info(
+            "GLPI Query Result - group_id: %s, status_id: %s, ticket_count: %s, source: content-range_header",
+            89,
+            status_id,
+            status_id * 7,
+            sample="ticket_count",
+        )
+        log_glpi_request("GET search/Ticket", 200, 0.05)
+
+
+def run(request: Callable[[int], None], args) -> Dict[str, float]:
+    latencies: List[float] = []
+    lock = threading.Lock()
+    per_thread = max(1, args.requests // args.threads)
+
+    def work() -> None:
+        local = []
+        for _ in range(per_thread):
+            start = time.perf_counter()
+            request(args.counts)
+            local.append((time.perf_counter() - start) * 1e6)
+        with lock:
+            latencies.extend(local)
+
+    workers = [threading.Thread(target=work) for _ in range(args.threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    wall = time.perf_counter() - start
+    return {
+        "wall_s": wall,
+        "mean_us": statistics.fmean(latencies),
+        "p50_us": _percentile(latencies, 50),
+        "p95_us": _percentile(latencies, 95),
+    }
+
+
+def configure(path: str, level: str) -> logging.Handler:
+    """Handler de arquivo com o JSONFormatter nos loggers usados pelo benchmark"""
+    handler = logging.FileHandler(path, encoding="utf-8")
+    handler.setFormatter(JSONFormatter())
+    for name in (LOGGER_NAME, "glpi.external"):
+        logger = logging.getLogger(name)
+        for existing in list(logger.handlers):
+            logger.removeHandler(existing)
+        logger.addHandler(handler)
+        logger.setLevel(level)
+        logger.propagate = False
+    return handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=2000, help="Requisições simuladas por modo")
+    parser.add_argument("--counts", type=int, default=24, help="Contagens por requisição")
+    parser.add_argument("--threads", type=int, default=4, help="Threads de requisição")
+    parser.add_argument("--level", default="INFO", choices=["DEBUG", "INFO", "WARNING"], help="Nível dos loggers")
+    args = parser.parse_args()
+
+    log_dir = tempfile.mkdtemp(prefix="glpi_log_bench_")
+    modes = [
+        ("f-string", request_fstring, False),
+        ("fachada", request_facade, False),
+        ("fachada+fila", request_facade, True),
+    ]
+
+    print(
+        f"{args.requests} requisições x {args.counts} contagens, {args.threads} threads, nível {args.level}\n"
+        f"Logs em {log_dir}\n"
+    )
+    header = f"{'modo':<14} {'wall (s)':>9} {'média µs':>10} {'p50 µs':>9} {'p95 µs':>9} {'linhas':>8}"
+    print(header)
+    print("-" * len(header))
+
+    for label, request, queued in modes:
+        path = os.path.join(log_dir, f"{label.replace('+', '_')}.log")
+        handler = configure(path, args.level)
+        if queued:
+            enable_queue_logging()
+        result = run(request, args)
+        if queued:
+            disable_queue_logging()  # Esvazia a fila antes de contar as linhas
+        handler.close()
+        with open(path, encoding="utf-8") as file:
+            written = sum(1 for _ in file)
+        print(
+            f"{label:<14} {result['wall_s']:>9.3f} {result['mean_us']:>10.1f} "
+            f"{result['p50_us']:>9.1f} {result['p95_us']:>9.1f} {written:>8}"
+        )
+
+    print(f"\nAmostragem: {get_logging_stats()['sampling']}")
+
+
+if __name__ == "__main__":
+    main()
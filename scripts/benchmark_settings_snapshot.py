@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark do custo de configuração por requisição: snapshot memorizado x Config novo.
+
+Repete o acesso que as rotas fazem a cada requisição
+(``active_config().PERFORMANCE_TARGET_P95``) de duas formas:
+
+- ``Config novo``: instancia a classe de configuração a cada chamada (relê
+  ``config/system.yaml`` e revalida tudo), como antes do snapshot;
+- ``snapshot``: ``active_config()``, que só confere a data de modificação do
+  arquivo a cada ``CONFIG_CHECK_INTERVAL`` segundos.
+
+Com ``--threads`` as chamadas são repartidas entre várias threads, como nos
+workers do servidor.
+
+Uso:
+    python scripts/benchmark_settings_snapshot.py --calls 2000
+    python scripts/benchmark_settings_snapshot.py --calls 20000 --threads 8 --check-interval 0
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from typing import Callable, Dict, List
+
+# Permite importar os módulos do backend (services, config, utils)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from config import settings  # noqa: E402
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def run(label: str, access: Callable[[], object], calls: int, threads: int) -> Dict[str, float]:
+    """Executa ``calls`` acessos repartidos em ``threads`` threads"""
+    latencies: List[float] = []
+    lock = threading.Lock()
+    per_thread = max(1, calls // threads)
+
+    def work() -> None:
+        local: List[float] = []
+        for _ in range(per_thread):
+            start = time.perf_counter()
+            access()
+            local.append((time.perf_counter() - start) * 1e6)
+        with lock:
+            latencies.extend(local)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    wall = time.perf_counter() - start
+
+    return {
+        "label": label,
+        "calls": len(latencies),
+        "wall_s": wall,
+        "mean_us": statistics.fmean(latencies),
+        "p50_us": _percentile(latencies, 50),
+        "p99_us": _percentile(latencies, 99),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=2000, help="Acessos por modo")
+    parser.add_argument("--threads", type=int, default=1, help="Threads concorrentes")
+    parser.add_argument(
+        "--check-interval",
+        type=float,
+        default=settings.CONFIG_CHECK_INTERVAL,
+        help="CONFIG_CHECK_INTERVAL do snapshot (0 = stat em toda chamada)",
+    )
+    args = parser.parse_args()
+
+    settings._settings.check_interval = args.check_interval
+    config_class = settings.active_config_class
+    settings.active_config()  # Primeira carga fora da medida
+
+    results = [
+        run(
+            "Config novo",
+            lambda: config_class().PERFORMANCE_TARGET_P95,
+            args.calls,
+            args.threads,
+        ),
+        run(
+            "snapshot",
+            lambda: settings.active_config().PERFORMANCE_TARGET_P95,
+            args.calls,
+            args.threads,
+        ),
+    ]
+
+    print(
+        f"{args.calls} acessos, {args.threads} thread(s), arquivo: {settings.CONFIG_PATH} "
+        f"(YAML {'ativo' if settings.YAML_AVAILABLE else 'indisponível'})\n"
+    )
+    header = f"{'modo':<12} {'wall (s)':>9} {'média µs':>10} {'p50 µs':>9} {'p99 µs':>9}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        print(
+            f"{result['label']:<12} {result['wall_s']:>9.3f} {result['mean_us']:>10.1f} "
+            f"{result['p50_us']:>9.1f} {result['p99_us']:>9.1f}"
+        )
+
+    baseline, snapshot = results
+    speedup = baseline["mean_us"] / snapshot["mean_us"] if snapshot["mean_us"] else float("inf")
+    print(f"\nSnapshot {speedup:.0f}x mais rápido; recargas: {settings._settings.get_stats()['reloads']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Teste de carga do stream SSE do dashboard: chamadas ao GLPI x número de clientes.
+
+Para cada quantidade de clientes em ``--clients`` compara, durante
+``--seconds`` segundos:
+
+- ``polling``: cada cliente repete métricas, ranking e tickets a cada
+  ``--interval`` segundos, como os timers por aba (sem os caches de rota e de
+  serviço, isto é, o custo depois que o TTL expira);
+- ``sse``: os clientes assinam o ``DashboardStream`` com os mesmos filtros; a
+  thread do hub recalcula cada seção uma vez por intervalo e só difunde as
+  que mudaram.
+
+O serviço é um GLPI falso em memória que conta as chamadas, responde com
+``--latency-ms`` de atraso e muda as métricas a cada ``--change-every``
+segundos. Com ``--url`` os clientes SSE se conectam a um backend de verdade
+(``/api/stream/dashboard``) e as chamadas ao GLPI são lidas dos totais
+``upstream`` de ``/api/performance``.
+
+Uso:
+    python scripts/loadtest_dashboard_stream.py --clients 1,10,100,500 --seconds 10
+    python scripts/loadtest_dashboard_stream.py --url http://localhost:8000/api --clients 10,50 --seconds 60
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import urllib.request
+from typing import Any, Dict, List
+
+# Permite importar os módulos do backend (services, config, utils)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from services.glpi_dashboard_stream import DashboardStream, ThreadSubscription, topic_from_args  # noqa: E402
+
+
+class FakeDashboardService:
+    """Métodos do GLPIService usados pelo stream, com contagem de chamadas"""
+
+    def __init__(self, latency: float, change_every: float):
+        self.latency = latency
+        self.change_every = change_every
+        self.started = time.monotonic()
+        self.lock = threading.Lock()
+        self.calls = 0
+
+    def _call(self) -> int:
+        with self.lock:
+            self.calls += 1
+        time.sleep(self.latency)
+        return int((time.monotonic() - self.started) // self.change_every)
+
+    def get_dashboard_metrics(self) -> Dict[str, Any]:
+        version = self._call()
+        level = {"novos": 3 + version, "pendentes": 7, "progresso": 12, "resolvidos": 40}
+        return {
+            "success": True,
+            "data": {
+                "novos": 12 + version,
+                "pendentes": 28,
+                "progresso": 48,
+                "resolvidos": 160,
+                "total": 248 + version,
+                "niveis": {"n1": level, "n2": level, "n3": level, "n4": level},
+                "timestamp": time.time(),
+            },
+            "tempo_execucao": self.latency * 1000,
+        }
+
+    def get_technician_ranking(self, limit: int = 50) -> List[Dict[str, Any]]:
+        self._call()
+        return [{"id": str(i), "name": f"Técnico {i}", "total": 100 - i, "level": "N2"} for i in range(limit)]
+
+    def get_new_tickets(self, limit: int = 8) -> List[Dict[str, Any]]:
+        version = self._call()
+        return [{"id": str(1000 + version + i), "title": f"Ticket {i}", "priority": "Média"} for i in range(limit)]
+
+
+def run_polling(service: FakeDashboardService, clients: int, seconds: float, interval: float) -> Dict[str, Any]:
+    stop = threading.Event()
+    responses = [0]
+    lock = threading.Lock()
+
+    def client() -> None:
+        while not stop.is_set():
+            service.get_dashboard_metrics()
+            service.get_technician_ranking(50)
+            service.get_new_tickets(8)
+            with lock:
+                responses[0] += 3
+            stop.wait(interval)
+
+    threads = [threading.Thread(target=client, daemon=True) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join(timeout=5)
+    return {"upstream_calls": service.calls, "events": responses[0], "bytes": 0}
+
+
+def run_sse(service: FakeDashboardService, clients: int, seconds: float, interval: float) -> Dict[str, Any]:
+    hub = DashboardStream(
+        service,
+        section_intervals={"metrics": interval, "ranking": interval, "tickets": interval},
+        max_subscribers=clients + 1,
+        keepalive=1.0,
+    )
+    totals = {"events": 0, "bytes": 0}
+    lock = threading.Lock()
+    deadline = time.monotonic() + seconds
+    subscriptions = [hub.subscribe(topic_from_args({}), ThreadSubscription(hub.max_pending)) for _ in range(clients)]
+
+    def client(subscription: ThreadSubscription) -> None:
+        events = size = 0
+        for chunk in subscription.events(0.5):
+            if chunk.startswith(b"id:"):
+                events += 1
+                size += len(chunk)
+            if time.monotonic() >= deadline:
+                break
+        with lock:
+            totals["events"] += events
+            totals["bytes"] += size
+
+    threads = [threading.Thread(target=client, args=(sub,), daemon=True) for sub in subscriptions]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=seconds + 5)
+    hub.stop()
+    stats = hub.get_stats()
+    return {
+        "upstream_calls": service.calls,
+        "events": totals["events"],
+        "bytes": totals["bytes"],
+        "unchanged": stats["unchanged"],
+        "slow_clients_dropped": stats["slow_clients_dropped"],
+    }
+
+
+def _upstream_total(base_url: str) -> int:
+    with urllib.request.urlopen(f"{base_url}/performance?group=upstream", timeout=10) as response:
+        stats = json.load(response)
+    return sum(series["total"] for series in stats.get("latency", {}).get("upstream", {}).values())
+
+
+def run_remote(base_url: str, clients: int, seconds: float) -> Dict[str, Any]:
+    """Clientes SSE reais contra ``base_url``; chamadas ao GLPI pela diferença em /performance"""
+    before = _upstream_total(base_url)
+    totals = {"events": 0, "bytes": 0, "errors": 0}
+    lock = threading.Lock()
+    deadline = time.monotonic() + seconds
+
+    def client() -> None:
+        events = size = 0
+        try:
+            with urllib.request.urlopen(f"{base_url}/stream/dashboard", timeout=seconds + 30) as response:
+                for line in response:
+                    if line.startswith(b"id:"):
+                        events += 1
+                    size += len(line)
+                    if time.monotonic() >= deadline:
+                        break
+        except Exception:
+            with lock:
+                totals["errors"] += 1
+        with lock:
+            totals["events"] += events
+            totals["bytes"] += size
+
+    threads = [threading.Thread(target=client, daemon=True) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=seconds + 60)
+    return {"upstream_calls": _upstream_total(base_url) - before, **totals}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--clients", default="1,10,100,500", help="Quantidades de clientes, separadas por vírgula")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Duração de cada rodada")
+    parser.add_argument("--interval", type=float, default=2.0, help="Intervalo de atualização das seções (s)")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Latência do GLPI falso")
+    parser.add_argument("--change-every", type=float, default=4.0, help="Mudança das métricas falsas (s)")
+    parser.add_argument("--url", help="Base da API de um backend em execução (ex.: http://localhost:8000/api)")
+    args = parser.parse_args()
+
+    counts = [int(value) for value in args.clients.split(",") if value.strip()]
+
+    if args.url:
+        print(f"Backend {args.url}, {args.seconds:.0f}s por rodada\n")
+        header = f"{'clientes':>8} {'chamadas GLPI':>14} {'eventos':>9} {'KiB':>9} {'erros':>6}"
+        print(header)
+        print("-" * len(header))
+        for clients in counts:
+            result = run_remote(args.url.rstrip("/"), clients, args.seconds)
+            print(
+                f"{clients:>8} {result['upstream_calls']:>14} {result['events']:>9} "
+                f"{result['bytes'] / 1024:>9.1f} {result['errors']:>6}"
+            )
+        return
+
+    print(
+        f"{args.seconds:.0f}s por rodada, seções a cada {args.interval}s, GLPI falso com "
+        f"{args.latency_ms:.0f} ms, métricas mudam a cada {args.change_every}s\n"
+    )
+    header = f"{'clientes':>8} {'modo':<8} {'chamadas GLPI':>14} {'por minuto':>11} {'eventos':>9} {'KiB':>9}"
+    print(header)
+    print("-" * len(header))
+    for clients in counts:
+        for label, runner in (("polling", run_polling), ("sse", run_sse)):
+            service = FakeDashboardService(args.latency_ms / 1000, args.change_every)
+            result = runner(service, clients, args.seconds, args.interval)
+            print(
+                f"{clients:>8} {label:<8} {result['upstream_calls']:>14} "
+                f"{result['upstream_calls'] / args.seconds * 60:>11.0f} {result['events']:>9} "
+                f"{result['bytes'] / 1024:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()